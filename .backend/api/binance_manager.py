@@ -14,6 +14,9 @@ import json
 
 from strategy.turtle_strategy import PriceData
 from config import BinanceConfig
+from utils.data_quality import inspect_columns
+from utils.timeaxis import from_ms
+from utils.kline_store import bars_to_columns, columns_to_bars
 
 logger = logging.getLogger(__name__)
 
@@ -63,7 +66,7 @@ class BinanceManager:
             for kline in klines:
                 price_data.append(PriceData(
                     symbol=symbol,
-                    date=datetime.fromtimestamp(kline[0] / 1000),
+                    date=from_ms(kline[0]),
                     open=float(kline[1]),
                     high=float(kline[2]),
                     low=float(kline[3]),
@@ -108,7 +111,7 @@ class BinanceManager:
             for kline in klines:
                 price_data.append(PriceData(
                     symbol=symbol,
-                    date=datetime.fromtimestamp(kline[0] / 1000),
+                    date=from_ms(kline[0]),
                     open=float(kline[1]),
                     high=float(kline[2]),
                     low=float(kline[3]),
@@ -290,19 +293,17 @@ class HistoricalDataManager:
                 )
                 
                 all_data.extend(chunk_data)
-                current_time = chunk_end + timedelta(days=1)
+                # 경계 봉은 다음 청크에도 포함될 수 있으나 검증 단계에서 중복 제거됨
+                current_time = chunk_end
                 
                 # API 제한을 위한 짧은 대기
                 await asyncio.sleep(0.1)
             
-            # 중복 제거 및 정렬
-            unique_data = {}
-            for data in all_data:
-                key = data.date.isoformat()
-                if key not in unique_data:
-                    unique_data[key] = data
-            
-            sorted_data = sorted(unique_data.values(), key=lambda x: x.date)
+            # 정렬/중복 제거/OHLC 검증 (컬럼 단위 일괄 처리)
+            columns, report = inspect_columns(symbol, interval, bars_to_columns(all_data))
+            if not report.ok:
+                logger.warning(f"Data quality issues: {report.summary()}")
+            sorted_data = columns_to_bars(symbol, columns)
             
             # 캐시 저장
             self.cache[cache_key] = (sorted_data, datetime.now())
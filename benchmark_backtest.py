@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+백테스트 벤치마크 스크립트
+고정 시드 데이터셋(기본 10k/100k/1M 봉)으로 처리량과 메모리를 측정하고 기준선 대비 회귀를 확인
+
+사용 예:
+    python benchmark_backtest.py                          # 전체 측정 + 이력 기록 + 기준선 비교
+    python benchmark_backtest.py --sizes 10000 --cases indicators,metrics
+    python benchmark_backtest.py --save-baseline          # 현재 결과를 기준선으로 저장
+"""
+
+import argparse
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.benchmark import (
+    BENCHMARK_CASES, DEFAULT_SEED, DEFAULT_SIZES, BASELINE_FILE, HISTORY_FILE,
+    run_benchmarks, append_history, save_baseline, load_baseline, compare_to_baseline
+)
+
+
+def _print_result(result):
+    """결과 한 줄 출력"""
+    memory = f"{result.peak_memory_bytes / 1024 / 1024:8.1f} MB" if result.peak_memory_bytes is not None else "       -"
+    blocks = f"{result.allocated_blocks:+10d}" if result.allocated_blocks is not None else "         -"
+    print(f"{result.case:<16} {result.n_bars:>9,} {result.seconds:>9.3f}s "
+          f"{result.bars_per_sec:>14,.0f} {memory} {blocks}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="터틀 백테스트 벤치마크")
+    parser.add_argument('--sizes', default=','.join(str(s) for s in DEFAULT_SIZES),
+                        help="데이터셋 크기 (쉼표 구분)")
+    parser.add_argument('--cases', default=','.join(BENCHMARK_CASES),
+                        help=f"측정할 케이스 (쉼표 구분: {', '.join(BENCHMARK_CASES)})")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help="데이터 생성 시드")
+    parser.add_argument('--timeframe', default='1m', help="데이터 타임프레임")
+    parser.add_argument('--no-memory', action='store_true', help="메모리 측정 생략")
+    parser.add_argument('--tolerance', type=float, default=0.10, help="회귀 판정 허용 오차 (기본 10%%)")
+    parser.add_argument('--history', default=HISTORY_FILE, help="JSON 이력 파일 경로")
+    parser.add_argument('--baseline', default=BASELINE_FILE, help="기준선 파일 경로")
+    parser.add_argument('--save-baseline', action='store_true', help="현재 결과를 기준선으로 저장")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(',') if s]
+    cases = [c.strip() for c in args.cases.split(',') if c.strip()]
+
+    print("🐢 백테스트 벤치마크 시작")
+    print(f"{'case':<16} {'bars':>9} {'time':>10} {'bars/sec':>14} {'peak mem':>11} {'blocks':>10}")
+    print("-" * 76)
+
+    results = run_benchmarks(sizes=sizes, cases=cases, seed=args.seed, timeframe=args.timeframe,
+                             measure_memory=not args.no_memory, on_result=_print_result)
+
+    append_history(results, args.history, seed=args.seed)
+    print(f"\n📄 이력 기록: {args.history}")
+
+    if args.save_baseline:
+        save_baseline(results, args.baseline)
+        print(f"📌 기준선 저장: {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print("ℹ️ 기준선이 없습니다. --save-baseline 으로 저장하세요.")
+        return 0
+
+    regressions = compare_to_baseline(results, baseline, args.tolerance)
+    if not regressions:
+        print("✅ 기준선 대비 회귀 없음")
+        return 0
+
+    print(f"❌ 성능 회귀 {len(regressions)}건:")
+    for r in regressions:
+        print(f"  {r['key']:<28} {r['metric']:<18} {r['baseline']:>14,.0f} → {r['current']:>14,.0f} ({r['change']:+.1%})")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
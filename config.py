@@ -19,10 +19,24 @@ class TradingConfig:
     ATR_PERIOD = 20              # ATR 계산 기간 (기본값)
     MAX_UNITS_PER_MARKET = 4     # 종목당 최대 유닛
     MAX_UNITS_DIRECTIONAL = 12   # 방향별 최대 유닛 (롱/숏)
-    MAX_UNITS_CORRELATED = 6     # 연관 시장 최대 유닛
+    MAX_UNITS_CORRELATED = 6     # 연관 시장 최대 유닛 (같은 그룹, 같은 방향)
     STOP_LOSS_MULTIPLIER = 2.0   # 손절가: 2N
     PYRAMID_MULTIPLIER = 0.5     # 피라미딩: 0.5N마다
     
+    # 연관 시장 그룹 (그룹에 없는 종목은 단독 그룹)
+    CORRELATION_GROUPS = {
+        'MAJORS': ['BTCUSDT', 'ETHUSDT'],
+        'L1': ['SOLUSDT', 'ADAUSDT', 'AVAXUSDT', 'DOTUSDT', 'NEARUSDT', 'ATOMUSDT'],
+        'EXCHANGE': ['BNBUSDT', 'OKBUSDT'],
+        'MEME': ['DOGEUSDT', 'SHIBUSDT', 'PEPEUSDT'],
+    }
+    
+    # 롤링 상관관계 연관 그룹 (실시간 런타임에서 위 고정 그룹을 대체)
+    CORRELATION_WINDOW = 100         # 수익률 창 (봉)
+    CORRELATION_THRESHOLD = 0.7      # 같은 그룹으로 묶는 상관계수
+    CORRELATION_MIN_BARS = 30        # 그룹을 계산할 최소 봉 수 (부족하면 고정 그룹 사용)
+    CORRELATION_REFRESH_BARS = 24    # 그룹 재계산 주기 (봉)
+    
     # 시간프레임별 ATR 계산 기간 설정
     ATR_PERIODS = {
         '1m': 60,      # 1시간 = 60분 (실시간 반응성)
@@ -79,7 +93,10 @@ class BacktestConfig:
     
     def __init__(self, symbol='BTCUSDT', start_date='2023-01-01', end_date='2024-12-31', 
                  timeframe='1d', initial_balance=10000.0, commission_rate=0.0004, systems=None,
-                 leverage=1.0):
+                 leverage=1.0, profiling=None, profile_output=None, seed=None,
+                 checkpointing=False, checkpoint_interval=None, use_cache=False,
+                 confirm_timeframe=None, higher_timeframe_atr=False, futures=False,
+                 cost_model='commission'):
         self.symbol = symbol
         self.start_date = start_date
         self.end_date = end_date
@@ -88,6 +105,16 @@ class BacktestConfig:
         self.commission_rate = commission_rate
         self.systems = systems or [1, 2]
         self.leverage = max(TradingConfig.MIN_LEVERAGE, min(leverage, TradingConfig.MAX_LEVERAGE))
+        self.profiling = self.PROFILING_ENABLED if profiling is None else profiling
+        self.profile_output = profile_output  # cProfile pstats 저장 경로 (선택)
+        self.seed = seed  # 시뮬레이션 데이터 시드 (재개/재현용)
+        self.checkpointing = checkpointing
+        self.checkpoint_interval = self.CHECKPOINT_INTERVAL if checkpoint_interval is None else checkpoint_interval
+        self.use_cache = use_cache  # 동일 설정/데이터 실행 결과 재사용
+        self.confirm_timeframe = confirm_timeframe  # 돌파 확인용 상위 타임프레임 (예: 1h 매매 + 1d 확인)
+        self.higher_timeframe_atr = higher_timeframe_atr  # 상위 타임프레임 ATR로 사이징/손절
+        self.futures = futures  # 강제청산/펀딩비 선물 회계 (FuturesConfig, 명시적으로 켤 때만)
+        self.cost_model = cost_model  # 'commission' (수수료만) 또는 'impact' (스프레드/시장 충격, CostConfig)
     
     DEFAULT_TIMEFRAMES = ['1m', '5m', '15m', '1h', '4h', '1d', '1w', '1M']
     DEFAULT_TIMEFRAME = '1d'
@@ -101,6 +128,18 @@ class BacktestConfig:
     # 성과 지표 계산 설정
     BENCHMARK_SYMBOL = 'BTCUSDT'
     RISK_FREE_RATE = 0.02  # 2% 무위험 수익률
+    
+    # 프로파일링 설정 (구간별 타이머/카운터)
+    PROFILING_ENABLED = os.getenv('BACKTEST_PROFILING', 'False').lower() == 'true'
+
+    # 체크포인트 설정 (장시간 백테스트 재개용)
+    CHECKPOINT_INTERVAL = 5.0  # 체크포인트 저장 간격 (초)
+    
+    # 실행 캐시 설정
+    RUN_CACHE_MAX_BYTES = 512 * 1024 * 1024  # 디스크 예산 (LRU 제거 기준)
+    
+    # 스트리밍 백테스트 설정 (메모리보다 큰 데이터용)
+    STREAM_CHUNK_BARS = 50_000  # 한 번에 읽는 최대 봉 수
 
 class BinanceConfig:
     """Binance API 설정 (.backend에서 사용)"""
@@ -118,6 +157,75 @@ class BinanceConfig:
     WEBSOCKET_TIMEOUT = 60
     RECONNECT_ATTEMPTS = 5
 
+class PaperTradingConfig:
+    """가상매매 런타임 설정"""
+    
+    DEFAULT_SYMBOLS = ['BTCUSDT', 'ETHUSDT']
+    DEFAULT_TIMEFRAME = '1h'
+    SLIPPAGE_RATE = 0.0          # 체결가 슬리피지 (종가 대비 비율)
+    FUTURES_ACCOUNT = True       # 가상 체결에 펀딩비/격리 마진 강제청산 반영 (strategy.futures.FuturesAccount)
+    MAX_FILL_HISTORY = 10_000    # 메모리에 보관할 최근 체결 수
+    STATE_SNAPSHOT_EVERY = 1000  # WAL 레코드 수 기준 상태 스냅샷 주기
+    STATE_FSYNC = False          # WAL/스냅샷 기록마다 fsync (전원 장애 대비, 봉당 지연 증가)
+    DYNAMIC_CORRELATION = True   # 여러 종목이면 롤링 상관관계로 연관 그룹 갱신
+
+class ExecutionConfig:
+    """실거래 주문 실행 설정 (초당 주문 한도는 BinanceConfig.ORDERS_PER_SECOND)"""
+    
+    CLIENT_ID_PREFIX = 'tt'      # client order id 접두사 (Binance 최대 36자)
+    WORKERS = 4                  # 동시 제출 워커 수 (같은 종목 주문은 순서대로)
+    SUBMIT_TIMEOUT = 5.0         # 주문 응답 대기 (초, 초과 시 조회로 접수 여부 확인)
+    MAX_SUBMIT_RETRIES = 3       # 미접수 확인 후 재전송 횟수
+    STOP_WORKING_TYPE = 'CONTRACT_PRICE'  # 거래소 손절 주문 기준가 (MARK_PRICE 가능)
+    STOP_RETRIES = 2             # 거래소가 거부한 손절 주문 재시도 횟수 (초과 시 종가 기준 손절로 대체)
+
+class TelemetryConfig:
+    """런타임 메트릭 엔드포인트 설정 (Prometheus 텍스트 형식, GET /metrics)"""
+    
+    ENABLED = True               # 가상매매/실거래 실행 시 엔드포인트 시작
+    HOST = '127.0.0.1'           # 로컬에서만 수집
+    PORT = 9108
+    SOCKET_PATH = ''             # 지정하면 TCP 대신 유닉스 소켓으로 제공
+    LOOP_LAG_INTERVAL = 0.5      # 이벤트 루프 지연 측정 주기 (초)
+    # 히스토그램 버킷 상한 (초)
+    BAR_LATENCY_BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.1)
+    ORDER_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+    RATE_LIMIT_WAIT_BUCKETS = (0.0, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+    LOOP_LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+    STAGE_LATENCY_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+                             0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    # 의사결정 추적 (봉 수신 → 지표 → 신호 → 리스크 → 주문 제출 → 체결 확인)
+    SLOW_DECISION_MS = 5.0       # 봉 수신부터 판단 완료까지 이보다 길면 느린 판단으로 기록
+    SLOW_ORDER_MS = 1000.0       # 봉 수신부터 주문 체결 확인까지 이보다 길면 느린 판단으로 기록
+    FLIGHT_RECORDER_SIZE = 100   # 보관할 최근 느린 판단 수
+
+class FuturesConfig:
+    """선물 계좌 시뮬레이션 설정 (격리 마진, 백테스트)"""
+    
+    # 유지 증거금 단계 (포지션 명목 금액 상한, 유지 증거금률) - 바이낸스 USDT 무기한 BTCUSDT 기준
+    MAINTENANCE_MARGIN_BRACKETS = (
+        (50_000, 0.004),
+        (250_000, 0.005),
+        (3_000_000, 0.01),
+        (15_000_000, 0.025),
+        (30_000_000, 0.05),
+        (80_000_000, 0.1),
+        (float('inf'), 0.125),
+    )
+    FUNDING_INTERVAL_HOURS = 8   # 펀딩 주기 (00/08/16시 UTC)
+    LIQUIDATION_ENABLED = True   # 봉 내 고가/저가로 강제청산 판정
+
+class CostConfig:
+    """백테스트 거래 비용 모델 설정 (BacktestConfig cost_model로 선택)"""
+    
+    TAKER_FEE_RATE = 0.0004      # 시장가 수수료 (백테스트 commission_rate 기본값과 같음)
+    MAKER_FEE_RATE = 0.0002      # 지정가 수수료
+    MIN_HALF_SPREAD = 0.0001     # 최소 반 스프레드 (1bp)
+    SPREAD_RANGE_FRACTION = 0.02 # 봉 범위 대비 반 스프레드 비율
+    IMPACT_COEFFICIENT = 1.0     # 제곱근 충격 계수 (충격 = 계수 × σ × √(수량/거래량))
+    VOLUME_WINDOW = 20           # 변동성/평균 거래량 계산 봉 수
+    MAX_SLIPPAGE = 0.05          # 체결 한 번의 최대 슬리피지 (5%)
+
 class UIConfig:
     """터미널 UI 설정"""
     
@@ -131,9 +239,12 @@ class UIConfig:
         'header': 'cyan'
     }
     
-    # 대시보드 새로고침 간격 (초)
+    # 대시보드 새로고침 간격 (초, 바뀐 패널이 있을 때만 화면 출력)
     DASHBOARD_REFRESH_RATE = 1.0
     
+    # 대시보드 데이터 갱신 간격 (초, 화면 갱신과 독립)
+    DASHBOARD_DATA_INTERVAL = 2.0
+    
     # 화면 크기 설정
     MIN_TERMINAL_WIDTH = 120
     MIN_TERMINAL_HEIGHT = 30
@@ -146,6 +257,12 @@ class DataConfig:
     HISTORICAL_DIR = f'{DATA_DIR}/historical'
     BACKTEST_RESULTS_DIR = f'{DATA_DIR}/backtest_results'
     LIVE_TRADING_DIR = f'{DATA_DIR}/live_trading'
+    BENCHMARK_DIR = f'{DATA_DIR}/benchmarks'
+    CHECKPOINT_DIR = f'{DATA_DIR}/checkpoints'
+    RUN_CACHE_DIR = f'{DATA_DIR}/run_cache'
+    STREAMING_RESULTS_DIR = f'{BACKTEST_RESULTS_DIR}/streaming'
+    RUNTIME_STATE_DIR = f'{DATA_DIR}/runtime_state'
+    FUNDING_DIR = f'{DATA_DIR}/funding'
     LOGS_DIR = 'logs'
     
     # 매매일지 디렉토리
@@ -159,6 +276,9 @@ class DataConfig:
     BACKTEST_RESULTS_FORMAT = 'json'
     TRADE_JOURNAL_FORMAT = 'csv'
     
+    # 캔들 수집 시 누락 봉을 직전 종가로 채울지 여부 (품질 보고서는 항상 기록)
+    FILL_KLINE_GAPS = False
+    
     # 데이터 보관 기간
     HISTORICAL_DATA_RETENTION_DAYS = 365
     BACKTEST_RESULTS_RETENTION_DAYS = 90
@@ -2,7 +2,7 @@
 백테스트 엔진 - 백테스트 결과 및 성능 메트릭 클래스
 """
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, field, fields, is_dataclass
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 import json
@@ -51,6 +51,28 @@ except ImportError:
         def reset(self):
             self.trade_history = []
 
+from config import BacktestConfig
+from utils.profiling import create_profiler, cprofile_to, NULL_PROFILER
+from utils.progress import ProgressThrottle, ProgressCallback
+from utils.checkpoint import (
+    BacktestCancelled, BacktestCheckpoint, CancellationToken, CheckpointManager,
+    config_key, data_fingerprint
+)
+from utils.result_store import ResultStore, StoredRun
+from utils.run_comparison import RunComparison
+from utils.run_cache import RunCache, run_key
+from utils.kline_store import KlineStore, bars_to_columns, columns_to_bars
+from utils.funding_store import FundingRateStore
+from utils.data_quality import KlineIngestor
+from utils.timeaxis import to_ms_array
+from utils.resampler import Resampler
+from strategy import backtest_core
+from strategy.backtest_core import SimulationCore
+from strategy.costs import cost_model_for
+from strategy.futures import account_for
+from strategy.multi_timeframe import context_from_columns
+from utils.streaming_backtest import StreamingBacktest, StreamingResult
+
 
 @dataclass
 class PerformanceMetrics:
@@ -153,22 +175,31 @@ class BacktestConfig_:
     commission_rate: float = 0.0004
     leverage: float = 1.0
     systems: List[int] = None
+    profiling: bool = field(default_factory=lambda: BacktestConfig.PROFILING_ENABLED)
+    profile_output: Optional[str] = None
+    seed: Optional[int] = None
+    checkpointing: bool = False
+    checkpoint_interval: float = 5.0
+    use_cache: bool = False
+    confirm_timeframe: Optional[str] = None
+    higher_timeframe_atr: bool = False
+    futures: bool = False
+    cost_model: str = "commission"
     
     def __post_init__(self):
         if self.systems is None:
             self.systems = [1, 2]
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            'symbol': self.symbol,
-            'start_date': self.start_date,
-            'end_date': self.end_date,
-            'timeframe': self.timeframe,
-            'initial_balance': self.initial_balance,
-            'commission_rate': self.commission_rate,
-            'leverage': self.leverage,
-            'systems': self.systems
-        }
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+    
+    @classmethod
+    def from_object(cls, source: Any) -> 'BacktestConfig_':
+        """같은 이름의 속성/키를 가진 설정(BacktestConfig, 저장된 딕셔너리 등)에서 생성 (없는 항목은 기본값)"""
+        get = source.get if isinstance(source, dict) else lambda name, default: getattr(source, name, default)
+        missing = object()
+        values = {f.name: get(f.name, missing) for f in fields(cls)}
+        return cls(**{name: value for name, value in values.items() if value is not missing})
 
 
 @dataclass
@@ -185,6 +216,9 @@ class BacktestResults:
     equity_curve: List[float]
     drawdown_curve: List[float]
     monthly_returns: Dict[str, float]
+    timing: Dict[str, Any]
+    futures: Dict[str, Any]
+    costs: Dict[str, Any]
     
     # 이전 호환성을 위한 프로퍼티들
     @property
@@ -211,6 +245,9 @@ class BacktestResults:
                  equity_curve: Optional[List[float]] = None,
                  drawdown_curve: Optional[List[float]] = None,
                  monthly_returns: Optional[Dict[str, float]] = None,
+                 timing: Optional[Dict[str, Any]] = None,
+                 futures: Optional[Dict[str, Any]] = None,
+                 costs: Optional[Dict[str, Any]] = None,
                  # 이전 호환성을 위한 파라미터들
                  initial_capital: Optional[float] = None,
                  final_capital: Optional[float] = None,
@@ -227,14 +264,17 @@ class BacktestResults:
         self.equity_curve = equity_curve or []
         self.drawdown_curve = drawdown_curve or []
         self.monthly_returns = monthly_returns or {}
+        self.timing = timing or {}  # 프로파일링 구간별 시간 (활성화 시)
+        self.futures = futures or {}  # 펀딩비/강제청산 집계 (선물 회계 사용 시)
+        self.costs = costs or {}  # 비용 모델별 수수료/슬리피지 합계
     
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환"""
         # trades를 딕셔너리로 변환 (TradeResult 객체인 경우)
         trades_dict = []
         for trade in self.trades:
-            if hasattr(trade, '__dict__'):
-                trade_dict = trade.__dict__.copy()
+            if is_dataclass(trade):
+                trade_dict = asdict(trade)
                 # datetime 객체를 문자열로 변환
                 for key, value in trade_dict.items():
                     if hasattr(value, 'strftime'):  # datetime 객체 확인
@@ -257,7 +297,10 @@ class BacktestResults:
             'daily_returns': self.daily_returns,
             'equity_curve': self.equity_curve,
             'drawdown_curve': self.drawdown_curve,
-            'monthly_returns': self.monthly_returns
+            'monthly_returns': self.monthly_returns,
+            'timing': self.timing,
+            'futures': self.futures,
+            'costs': self.costs
         }
     
     def save_to_file(self, filepath: str):
@@ -272,8 +315,7 @@ class BacktestResults:
             data = json.load(f)
         
         # 설정 로드
-        config_data = data.get('config', {})
-        config = BacktestConfig_(**config_data) if config_data else BacktestConfig_()
+        config = BacktestConfig_.from_object(data.get('config', {}))
         
         # 메트릭 로드 (이전 호환성 고려)
         metrics_data = data.get('metrics', data.get('performance_metrics', {}))
@@ -290,17 +332,80 @@ class BacktestResults:
             daily_returns=data.get('daily_returns', []),
             equity_curve=data.get('equity_curve', []),
             drawdown_curve=data.get('drawdown_curve', []),
-            monthly_returns=data.get('monthly_returns', {})
+            monthly_returns=data.get('monthly_returns', {}),
+            timing=data.get('timing', {}),
+            futures=data.get('futures', {}),
+            costs=data.get('costs', {})
         )
 
 
+class StoredBacktestResults(BacktestResults):
+    """결과 저장소에서 로드한 결과
+
+    설정/지표 등 메타데이터는 즉시 채우고, 거래·자산 곡선·드로다운·수익률 배열은
+    처음 접근할 때 저장소 컬럼에서 읽어 기존 BacktestResults 형식으로 변환한다.
+    """
+    
+    def __init__(self, run: StoredRun):
+        meta = run.meta
+        self.run = run
+        self._lazy: Dict[str, Any] = {}
+        self.config = BacktestConfig_.from_object(meta.get('config', {}))
+        self.start_date = meta.get('start_date', '')
+        self.end_date = meta.get('end_date', '')
+        self.initial_balance = meta.get('initial_balance', 0.0)
+        self.final_balance = meta.get('final_balance', 0.0)
+        self.metrics = PerformanceMetrics(**meta.get('metrics', {}))
+        self.monthly_returns = meta.get('monthly_returns', {})
+        self.timing = meta.get('timing', {})
+        self.futures = meta.get('futures', {})
+        self.costs = meta.get('costs', {})
+    
+    def _get_lazy(self, name: str, loader) -> Any:
+        if name not in self._lazy:
+            self._lazy[name] = loader()
+        return self._lazy[name]
+    
+    @property
+    def trades(self) -> List[TradeResult]:
+        return self._get_lazy('trades', lambda: [TradeResult(**t) for t in self.run.trade_records()])
+    
+    @trades.setter
+    def trades(self, value):
+        self._lazy['trades'] = value
+    
+    @property
+    def equity_curve(self) -> List[Dict[str, Any]]:
+        return self._get_lazy('equity_curve', self.run.equity_curve)
+    
+    @equity_curve.setter
+    def equity_curve(self, value):
+        self._lazy['equity_curve'] = value
+    
+    @property
+    def drawdown_curve(self) -> List[float]:
+        return self._get_lazy('drawdown_curve', lambda: self.run.column('drawdown').tolist())
+    
+    @drawdown_curve.setter
+    def drawdown_curve(self, value):
+        self._lazy['drawdown_curve'] = value
+    
+    @property
+    def daily_returns(self) -> List[float]:
+        return self._get_lazy('daily_returns', lambda: self.run.column('daily_returns').tolist())
+    
+    @daily_returns.setter
+    def daily_returns(self, value):
+        self._lazy['daily_returns'] = value
+
+
 class BacktestEngine:
     """백테스트 엔진 기본 클래스"""
     
     def __init__(self, config=None):
         self.config = config
         # 백테스트 모드로 TurtleStrategy 초기화
-        from config import TradingMode
+        from config import TradingMode, DataConfig
         self.turtle_strategy = TurtleStrategy(TradingMode.BACKTEST)
         self.current_balance = 0.0
         self.initial_balance = 0.0
@@ -309,6 +414,14 @@ class BacktestEngine:
         self.drawdown_curve = []
         self.daily_returns = []
         self.monthly_returns = {}
+        self.profiler = NULL_PROFILER
+        self.cancel_token = CancellationToken()
+        self.checkpoint_dir = DataConfig.CHECKPOINT_DIR
+        self.kline_store = KlineStore()
+        self.funding_store = FundingRateStore()
+        self.run_cache: Optional[RunCache] = None  # use_cache 설정 시 최초 실행에서 생성
+        self.data_source: Optional[str] = None  # 'kline', 'binance', 'simulation'
+        self.core: Optional[SimulationCore] = None  # 실행 중인 시뮬레이션 코어
         
         # config에서 설정값 추출
         if config:
@@ -329,6 +442,15 @@ class BacktestEngine:
         end_date_str = getattr(self.config, 'end_date', '2024-12-31')
         timeframe = getattr(self.config, 'timeframe', '1d')
         
+        if use_real_data and (Resampler(self.kline_store).ensure(symbol, timeframe, start_date_str, end_date_str) or
+                              self.kline_store.covers(symbol, timeframe, start_date_str, end_date_str)):
+            # 로컬 캔들 파티션이 기간 전체를 포함하면 우선 사용 (1분봉이 있으면 리샘플링하여 갱신)
+            data = self.kline_store.load(symbol, timeframe, start_date_str, end_date_str)
+            if data:
+                print(f"💾 로컬 캔들 파티션에서 로드: {len(data)}개 캔들")
+                self.data_source = 'kline'
+                return data
+        
         if use_real_data:
             # 실제 Binance 데이터 사용
             try:
@@ -347,6 +469,18 @@ class BacktestEngine:
                 
                 if data:
                     print(f"✅ 실제 데이터 로드 완료: {len(data)}개 캔들")
+                    self.data_source = 'binance'
+                    try:
+                        # 정렬/중복/누락/OHLC 검증 후 저장 (파티션별 품질 보고서 기록)
+                        columns, reports = KlineIngestor(self.kline_store).ingest(
+                            symbol, timeframe, bars_to_columns(data))
+                        for report in reports.values():
+                            if not report.ok:
+                                print(f"⚠️ 데이터 품질: {report.summary()}")
+                        if len(columns['open_time']):
+                            data = columns_to_bars(symbol, columns)
+                    except Exception as e:
+                        print(f"⚠️ 캔들 파티션 저장 실패: {e}")
                     return data
                 else:
                     print("⚠️ 실제 데이터 없음, 시뮬레이션 데이터 사용")
@@ -370,6 +504,9 @@ class BacktestEngine:
         start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
         end_date = datetime.strptime(end_date_str, '%Y-%m-%d')
         
+        # 시드 지정 시 동일한 데이터 재생성 (체크포인트 재개, 결과 재현)
+        rng = np.random.default_rng(getattr(self.config, 'seed', None))
+        
         # 타임프레임에 따른 데이터 생성 간격 계산
         timeframe_minutes = {
             '1m': 1, '5m': 5, '15m': 15, '1h': 60, '4h': 240, 
@@ -392,19 +529,19 @@ class BacktestEngine:
             # 시간프레임에 따른 적절한 변동성 생성
             if timeframe in ['1m', '5m', '15m']:
                 # 분봉: 더 작은 변동성
-                price_change = np.random.normal(0, 0.005)  # 0.5% 변동성
-                intraday_volatility = abs(np.random.normal(0, 0.003))  # 0.3% 캔들 내 변동성
-                close_change = np.random.normal(0, 0.002)  # 0.2% 시가-종가 변동
+                price_change = rng.normal(0, 0.005)  # 0.5% 변동성
+                intraday_volatility = abs(rng.normal(0, 0.003))  # 0.3% 캔들 내 변동성
+                close_change = rng.normal(0, 0.002)  # 0.2% 시가-종가 변동
             elif timeframe in ['1h', '4h']:
                 # 시간봉: 중간 변동성
-                price_change = np.random.normal(0, 0.015)  # 1.5% 변동성
-                intraday_volatility = abs(np.random.normal(0, 0.008))  # 0.8% 캔들 내 변동성
-                close_change = np.random.normal(0, 0.005)  # 0.5% 시가-종가 변동
+                price_change = rng.normal(0, 0.015)  # 1.5% 변동성
+                intraday_volatility = abs(rng.normal(0, 0.008))  # 0.8% 캔들 내 변동성
+                close_change = rng.normal(0, 0.005)  # 0.5% 시가-종가 변동
             else:
                 # 일봉/주봉: 더 큰 변동성 (터틀 전략을 위해)
-                price_change = np.random.normal(0, 0.03)  # 3% 변동성
-                intraday_volatility = abs(np.random.normal(0, 0.015))  # 1.5% 캔들 내 변동성
-                close_change = np.random.normal(0, 0.01)  # 1% 시가-종가 변동
+                price_change = rng.normal(0, 0.03)  # 3% 변동성
+                intraday_volatility = abs(rng.normal(0, 0.015))  # 1.5% 캔들 내 변동성
+                close_change = rng.normal(0, 0.01)  # 1% 시가-종가 변동
             
             # 트렌드 생성 (더 강한 트렌드로 브레이크아웃 신호 증가)
             if i % 50 < 25:  # 상승 트렌드
@@ -430,7 +567,7 @@ class BacktestEngine:
             
             # 볼륨 생성 (더 현실적)
             base_volume = 1000000  # 기본 볼륨
-            volume_multiplier = abs(np.random.normal(1, 0.5))  # 볼륨 변동
+            volume_multiplier = abs(rng.normal(1, 0.5))  # 볼륨 변동
             volume = base_volume * volume_multiplier
             
             data.append(PriceData(
@@ -451,18 +588,12 @@ class BacktestEngine:
                 break
         
         print(f"🎲 시뮬레이션 데이터 생성: {len(data)}개 캔들 ({timeframe} 타임프레임)")
+        self.data_source = 'simulation'
         return data
     
     def _calculate_portfolio_value(self, current_price: float) -> float:
         """포트폴리오 총 가치 계산"""
-        total_value = self.current_balance
-        
-        # 포지션이 있다면 미실현 손익 추가
-        for symbol, position in self.turtle_strategy.positions.items():
-            unrealized_pnl = self.turtle_strategy.calculate_unrealized_pnl(symbol, current_price)
-            total_value += unrealized_pnl
-        
-        return total_value
+        return backtest_core.portfolio_value(self.turtle_strategy, self.current_balance, current_price)
     
     def _apply_commission(self, trade_value: float):
         """수수료 적용"""
@@ -471,158 +602,109 @@ class BacktestEngine:
     
     def _can_add_position(self, leverage: float = 1.0) -> bool:
         """포지션 추가 가능 여부 확인 (레버리지 고려)"""
-        # 레버리지를 고려한 마진 비율 확인
-        used_margin = self._calculate_used_margin(leverage)
-        available_margin = self.current_balance - used_margin
-        margin_ratio = used_margin / self.current_balance if self.current_balance > 0 else 0
-        
-        # 마진 비율이 임계값 미만일 때만 새 포지션 허용
-        from config import TradingConfig
-        return margin_ratio < TradingConfig.MARGIN_RATIO_THRESHOLD and available_margin > 0
+        return backtest_core.can_add_position(self.turtle_strategy, self.current_balance, leverage)
     
     def _calculate_used_margin(self, leverage: float = 1.0) -> float:
         """사용 마진 계산 (레버리지 적용)"""
-        used_margin = 0.0
-        for position in self.turtle_strategy.positions.values():
-            # 레버리지가 높을수록 필요 마진 감소
-            required_margin = (position.total_size * position.avg_price) / leverage
-            used_margin += required_margin
-        return used_margin
+        return backtest_core.used_margin(self.turtle_strategy, leverage)
     
     def _calculate_performance_metrics(self, trades: List[TradeResult], 
                                      equity_curve: List[float]) -> PerformanceMetrics:
         """성과 지표 계산"""
-        if not trades:
-            return PerformanceMetrics()
-        
-        # 기본 통계
-        winning_trades = [t for t in trades if t.pnl > 0]
-        losing_trades = [t for t in trades if t.pnl <= 0]
-        
-        total_pnl = sum(t.pnl for t in trades)
-        total_return = total_pnl / self.initial_balance
-        
-        win_rate = len(winning_trades) / len(trades) if trades else 0
-        
-        avg_win = sum(t.pnl for t in winning_trades) / len(winning_trades) if winning_trades else 0
-        avg_loss = sum(t.pnl for t in losing_trades) / len(losing_trades) if losing_trades else 0
-        
-        largest_win = max((t.pnl for t in trades), default=0)
-        largest_loss = min((t.pnl for t in trades), default=0)
-        
-        # 수익 팩터
-        gross_profit = sum(t.pnl for t in winning_trades)
-        gross_loss = abs(sum(t.pnl for t in losing_trades))
-        profit_factor = gross_profit / gross_loss if gross_loss > 0 else 0
-        
-        # 최대 드로다운 계산
-        max_drawdown = 0.0
-        if equity_curve:
-            # equity_curve가 딕셔너리 형태인지 float 형태인지 확인
-            if isinstance(equity_curve[0], dict):
-                peak = equity_curve[0]['total_value']
-                for point in equity_curve:
-                    value = point['total_value']
-                    if value > peak:
-                        peak = value
-                    drawdown = (peak - value) / peak
-                    max_drawdown = max(max_drawdown, drawdown)
-            else:
-                peak = equity_curve[0]
-                for value in equity_curve:
-                    if value > peak:
-                        peak = value
-                    drawdown = (peak - value) / peak
-                    max_drawdown = max(max_drawdown, drawdown)
-        else:
-            peak = self.initial_balance
-        
-        # 연환산 수익률 (단순 계산)
-        annualized_return = total_return  # 1년 데이터라고 가정
-        
-        # 샤프 비율 (간단한 계산)
-        if len(self.daily_returns) > 1:
-            returns_std = np.std(self.daily_returns) * np.sqrt(252)  # 연환산 변동성
-            sharpe_ratio = annualized_return / returns_std if returns_std > 0 else 0
-        else:
-            sharpe_ratio = 0
-        
-        # 롱/숏 거래 분석
-        long_trades = [t for t in trades if t.direction == "LONG"]
-        short_trades = [t for t in trades if t.direction == "SHORT"]
-        
-        long_winning_trades = [t for t in long_trades if t.pnl > 0]
-        short_winning_trades = [t for t in short_trades if t.pnl > 0]
-        
-        long_win_rate = len(long_winning_trades) / len(long_trades) if long_trades else 0
-        short_win_rate = len(short_winning_trades) / len(short_trades) if short_trades else 0
-        
-        # 연속 승/패 계산
-        max_consecutive_wins = 0
-        max_consecutive_losses = 0
-        current_wins = 0
-        current_losses = 0
-        
-        for trade in trades:
-            if trade.pnl > 0:
-                current_wins += 1
-                current_losses = 0
-                max_consecutive_wins = max(max_consecutive_wins, current_wins)
-            else:
-                current_losses += 1
-                current_wins = 0
-                max_consecutive_losses = max(max_consecutive_losses, current_losses)
-        
-        # 평균 거래 기간
-        if trades:
-            trade_durations = [(t.exit_date - t.entry_date).days for t in trades]
-            avg_trade_duration = sum(trade_durations) / len(trade_durations)
-        else:
-            avg_trade_duration = 0
-        
-        return PerformanceMetrics(
-            total_return=total_return,
-            annualized_return=annualized_return,
-            max_drawdown=max_drawdown,
-            sharpe_ratio=sharpe_ratio,
-            win_rate=win_rate,
-            profit_factor=profit_factor,
-            total_trades=len(trades),
-            winning_trades=len(winning_trades),
-            losing_trades=len(losing_trades),
-            avg_win=avg_win,
-            avg_loss=avg_loss,
-            largest_win=largest_win,
-            largest_loss=largest_loss,
-            avg_trade_duration=avg_trade_duration,
-            long_trades=len(long_trades),
-            short_trades=len(short_trades),
-            long_win_rate=long_win_rate,
-            short_win_rate=short_win_rate,
-            max_consecutive_wins=max_consecutive_wins,
-            max_consecutive_losses=max_consecutive_losses
-        )
+        values = backtest_core.calculate_performance_metrics(
+            trades, equity_curve, self.daily_returns, self.initial_balance)
+        return PerformanceMetrics(**values)
+    
+    def cancel(self):
+        """실행 중인 백테스트 중단 요청 (다음 봉 처리 전에 체크포인트 저장 후 중단)"""
+        self.cancel_token.cancel()
     
-    async def run_backtest(self) -> BacktestResults:
-        """백테스트 실행"""
-        # config가 BacktestConfig_ 인스턴스인지 확인하고 변환
+    def _checkpoint_manager(self, config: BacktestConfig_) -> CheckpointManager:
+        """설정에 대응하는 체크포인트 관리자"""
+        return CheckpointManager(self.checkpoint_dir, config_key(config.to_dict()),
+                                 interval=config.checkpoint_interval)
+    
+    def has_checkpoint(self) -> bool:
+        """현재 설정으로 재개 가능한 체크포인트 존재 여부"""
+        return self._checkpoint_manager(self._build_config()).exists()
+    
+    def _build_config(self) -> BacktestConfig_:
+        """엔진 설정을 BacktestConfig_로 정규화"""
+        # BacktestConfig/BacktestConfig_ 모두 필드 단위로 복사 (새 필드가 누락되지 않도록)
         if hasattr(self.config, 'symbol'):
-            config = BacktestConfig_(
-                symbol=getattr(self.config, 'symbol', 'BTCUSDT'),
-                start_date=getattr(self.config, 'start_date', '2024-01-01'),
-                end_date=getattr(self.config, 'end_date', '2024-12-31'),
-                timeframe=getattr(self.config, 'timeframe', '1d'),
-                initial_balance=getattr(self.config, 'initial_balance', 10000.0),
-                commission_rate=getattr(self.config, 'commission_rate', 0.0004),
-                systems=getattr(self.config, 'systems', [1, 2])
-            )
-            # 레버리지 설정 추가
-            config.leverage = getattr(self.config, 'leverage', 1.0)
+            config = BacktestConfig_.from_object(self.config)
         else:
             config = BacktestConfig_()
             config.leverage = 1.0
-        
-        # 기간 확인 (시간프레임에 따라 최소 기간 조정)
+        return config
+    
+    async def run_backtest(self, progress_callback: Optional[ProgressCallback] = None,
+                           progress_interval: float = 0.1, resume: bool = False) -> BacktestResults:
+        """백테스트 실행
+
+        progress_callback을 지정하면 처리한 봉 수, 거래 수, 현재 자산, 예상 남은 시간을
+        최소 progress_interval 초 간격으로 병합하여 전달한다.
+        checkpointing 설정 시 checkpoint_interval 초마다 전체 상태를 저장하며,
+        resume=True이면 같은 설정/데이터의 최신 체크포인트에서 이어서 실행한다.
+        cancel() 호출 시 BacktestCancelled를 발생시킨다.
+        """
+        config = self._build_config()
+        self._validate_period(config)
+        
+        # 실행 캐시 조회 (동일 설정/전략 상수/데이터면 저장된 결과 즉시 반환)
+        cache = None
+        if config.use_cache and not resume:
+            cache = self.run_cache = self.run_cache or RunCache()
+            fingerprint = self._source_fingerprint(config)
+            if fingerprint is not None:
+                cached = cache.get(run_key(config.to_dict(), fingerprint),
+                                   self._cache_scope(config), fingerprint)
+                if cached is not None:
+                    print(f"⚡ 캐시된 백테스트 결과 사용 ({cached.run_id})")
+                    return StoredBacktestResults(cached)
+        
+        # 프로파일링 (설정 플래그로 활성화, 선택적으로 cProfile 덤프)
+        self.profiler = create_profiler(config.profiling)
+        with cprofile_to(config.profile_output):
+            results = await self._run_simulation(config, progress_callback, progress_interval, resume)
+        
+        if cache is not None:
+            # 실제 사용한 데이터 기준 지문으로 저장 (재현 불가능한 데이터면 저장하지 않음)
+            fingerprint = self._source_fingerprint(config, self.data_source)
+            if fingerprint is not None:
+                cache.put(run_key(config.to_dict(), fingerprint), results,
+                          self._cache_scope(config), fingerprint)
+        return results
+    
+    async def run_streaming_backtest(self, output_dir: Optional[str] = None,
+                                     chunk_bars: Optional[int] = None,
+                                     progress_callback: Optional[ProgressCallback] = None,
+                                     progress_interval: float = 0.1) -> StreamingResult:
+        """로컬 캔들 파티션을 청크 단위로 스트리밍하는 백테스트
+
+        전체 이력을 리스트로 만들지 않고 지표 윈도우와 현재 청크만 메모리에 유지하며,
+        자산 곡선과 거래는 output_dir의 CSV에 즉시 기록한다. 기간 전체 파티션이 필요하다.
+        """
+        config = self._build_config()
+        self._validate_period(config)
+        if config.confirm_timeframe:
+            raise ValueError("스트리밍 백테스트는 상위 타임프레임 확인을 지원하지 않습니다.")
+        Resampler(self.kline_store).ensure(config.symbol, config.timeframe, config.start_date, config.end_date)
+        if not self.kline_store.covers(config.symbol, config.timeframe, config.start_date, config.end_date):
+            raise ValueError("스트리밍 백테스트에는 기간 전체의 로컬 캔들 파티션이 필요합니다.")
+        
+        self.profiler = create_profiler(config.profiling)
+        self.data_source = 'kline'
+        streaming = StreamingBacktest(config, self.kline_store, output_dir, chunk_bars,
+                                      self.profiler, self.cancel_token, self.turtle_strategy)
+        with cprofile_to(config.profile_output):
+            result = await asyncio.to_thread(streaming.run, progress_callback, progress_interval)
+        self.current_balance = result.final_balance
+        return result
+    
+    @staticmethod
+    def _validate_period(config: BacktestConfig_):
+        """기간 확인 (시간프레임에 따라 최소 기간 조정)"""
         start_date = datetime.strptime(config.start_date, '%Y-%m-%d')
         end_date = datetime.strptime(config.end_date, '%Y-%m-%d')
         period_days = (end_date - start_date).days
@@ -642,180 +724,139 @@ class BacktestEngine:
         min_required = min_days_required.get(timeframe, 30)
         if period_days < min_required:
             raise ValueError(f"{timeframe} 시간프레임에서는 최소 {min_required}일 이상의 기간이 필요합니다.")
+    
+    @staticmethod
+    def _cache_scope(config: BacktestConfig_) -> str:
+        """캐시 무효화 단위 (데이터 범위)"""
+        return f"{config.symbol}|{config.timeframe}|{config.start_date}|{config.end_date}"
+    
+    def _source_fingerprint(self, config: BacktestConfig_, source: Optional[str] = None) -> Optional[str]:
+        """입력 데이터 지문 (캔들 파티션 또는 시드 고정 시뮬레이션만 재현 가능, 선물 회계 시 펀딩비 이력 포함)
+
+        source를 생략하면 데이터를 로드하지 않고 사용될 데이터 소스를 추정한다.
+        """
+        funding = f"|funding:{self.funding_store.fingerprint(config.symbol)}" if config.futures else ''
+        if source in (None, 'kline', 'binance'):
+            fingerprint = self.kline_store.fingerprint(config.symbol, config.timeframe,
+                                                      config.start_date, config.end_date)
+            if fingerprint is not None:
+                return f"kline:{fingerprint}{funding}"
+        if source in (None, 'simulation') and config.seed is not None:
+            return f"sim:{config.seed}{funding}"
+        return None
+    
+    async def _run_simulation(self, config: BacktestConfig_,
+                              progress_callback: Optional[ProgressCallback] = None,
+                              progress_interval: float = 0.1,
+                              resume: bool = False) -> BacktestResults:
+        """데이터 로드부터 성과 지표 계산까지 시뮬레이션 실행"""
+        profiler = self.profiler
         
         # 과거 데이터 로드
+        profiler.switch('data_load')
         price_data = await self.load_historical_data()
         
         # 전략 초기화
+        profiler.switch('setup')
         self.turtle_strategy.reset()
-        self.current_balance = config.initial_balance
-        self.equity_curve = []
-        self.daily_returns = []
+        self.turtle_strategy.journal.profiler = profiler
+        core = SimulationCore(
+            self.turtle_strategy, price_data, config.symbol, config.timeframe, config.systems,
+            config.initial_balance, config.commission_rate, getattr(config, 'leverage', 1.0), profiler,
+            account_for(config, self.funding_store), cost_model_for(config)
+        )
+        self._bind_core(core)
         
-        # 백테스트 시뮬레이션
-        prev_portfolio_value = config.initial_balance
+        # 상위 타임프레임 확인 (하위 봉을 리샘플링하여 채널/ATR과 인덱스 맵을 미리 계산)
+        context = None
+        if config.confirm_timeframe and price_data:
+            context = context_from_columns(self.turtle_strategy, bars_to_columns(price_data), config.timeframe,
+                                           config.confirm_timeframe, config.systems, config.higher_timeframe_atr)
+        self.turtle_strategy.set_timeframe_context(context)
         
-        # 진행률 표시를 위한 변수 - ATR 계산을 위한 최소 시작점만 설정
-        timeframe = getattr(self.config, 'timeframe', '1d')
-        start_offset = {
-            '1m': 60,    # 60개 후 시작 (ATR 계산용)
-            '5m': 48,    # 48개 후 시작  
-            '15m': 32,   # 32개 후 시작
-            '1h': 24,    # 24개 후 시작
-            '4h': 12,    # 12개 후 시작
-            '1d': 20,    # 20개 후 시작 (터틀 ATR 기준)
-            '1w': 20     # 20개 후 시작
-        }.get(timeframe, 20)
-        
-        # 실제 데이터 길이에 맞춰 시작점 조정 (너무 많이 건너뛰지 않도록)
-        start_index = min(start_offset, max(1, len(price_data) // 10))  # 최대 10% 지점까지만
+        # ATR 계산을 위한 최소 시작점 (최대 데이터의 10% 지점까지만 건너뜀)
+        start_index = backtest_core.start_index(config.timeframe, len(price_data))
         total_steps = len(price_data) - start_index
         processed_steps = 0
         
+        # 체크포인트 (주기 저장 및 재개)
+        checkpoints = self._checkpoint_manager(config) if (config.checkpointing or resume) else None
+        fingerprint = data_fingerprint(price_data) if checkpoints is not None else ''
+        if resume and checkpoints is not None:
+            checkpoint = checkpoints.load()
+            if checkpoint is None:
+                print("ℹ️ 재개할 체크포인트가 없어 처음부터 실행합니다.")
+            elif checkpoint.data_fingerprint != fingerprint:
+                print("⚠️ 입력 데이터가 체크포인트와 달라 처음부터 실행합니다.")
+            else:
+                start_index = checkpoint.cursor
+                processed_steps = checkpoint.processed_steps
+                core.prev_value = checkpoint.prev_portfolio_value
+                core.balance = checkpoint.current_balance
+                self.turtle_strategy.restore_state(checkpoint.strategy_state, core.leverage)
+                core.equity_curve = checkpoint.equity_curve()
+                core.daily_returns = checkpoint.daily_returns.tolist()
+                if core.futures is not None:
+                    core.futures.restore(checkpoint.futures_state)
+                core.costs.restore(checkpoint.costs_state)
+                self._bind_core(core)
+                print(f"♻️ 체크포인트에서 재개: {processed_steps}/{total_steps} 봉 처리 완료 상태")
+        
         print(f"백테스트 설정: 총 {len(price_data)}개 데이터, {start_index}번째부터 시작")
         
-        for i in range(start_index, len(price_data)):  # ATR 계산을 위해 충분한 데이터 확보 후 시작
+        # 진행률 콜백이 있으면 병합된 업데이트로 전달, 없으면 기존 콘솔 출력
+        throttle = ProgressThrottle(progress_callback, total_steps, progress_interval) if progress_callback else None
+        
+        cancel_token = self.cancel_token
+        trade_history = self.turtle_strategy.trade_history
+        for i in range(start_index, len(price_data)):
+            profiler.switch('loop')
+            # 봉 처리 전 시점에서 취소/체크포인트 (상태는 i-1번째 봉까지 반영됨)
+            if cancel_token.cancelled:
+                cancel_token.reset()
+                path = None
+                if checkpoints is not None:
+                    path = checkpoints.save(self._make_checkpoint(
+                        checkpoints.key, fingerprint, i, processed_steps, core.prev_value))
+                raise BacktestCancelled(f"백테스트가 중단되었습니다 ({processed_steps}/{total_steps} 봉)", path)
+            if checkpoints is not None and checkpoints.due(processed_steps):
+                profiler.switch('checkpoint')
+                checkpoints.save(self._make_checkpoint(
+                    checkpoints.key, fingerprint, i, processed_steps, core.prev_value))
+                profiler.count('checkpoints')
+                profiler.switch('loop')
+            profiler.count('bars')
             processed_steps += 1
-            if processed_steps % 1000 == 0 or processed_steps == total_steps:
+            if throttle is not None:
+                if throttle.tick(processed_steps, len(trade_history), core.prev_value):
+                    # 업데이트를 보낸 시점에만 이벤트 루프에 양보하여 UI 작업이 실행되도록 함
+                    await asyncio.sleep(0)
+            elif processed_steps % 1000 == 0 or processed_steps == total_steps:
                 progress = (processed_steps / total_steps) * 100
                 print(f"백테스트 진행중... {progress:.1f}% ({processed_steps}/{total_steps})")
-            current_data = price_data[:i+1]
-            current_price = current_data[-1].close
-            
-            # ATR 계산 - 시간프레임에 따라 기간 조정
-            try:
-                timeframe = getattr(self.config, 'timeframe', '1d')
-                # 시간프레임별 ATR 기간 설정 (터틀 트레이딩 원칙에 따라)
-                # 각 타임프레임에서 충분한 변동성 데이터를 확보하면서 실용적인 기간 설정
-                atr_periods = {
-                    '1m': 60,      # 1시간 = 60분 (실시간 반응성)
-                    '5m': 48,      # 4시간 = 48 * 5분 (단기 변동성)
-                    '15m': 32,     # 8시간 = 32 * 15분 (중기 변동성)
-                    '1h': 24,      # 24시간 = 24 * 1시간 (일중 변동성)
-                    '4h': 12,      # 48시간 = 12 * 4시간 (2일 변동성)
-                    '1d': 20,      # 20일 (기본 터틀 설정)
-                    '1w': 20       # 20주 (장기 변동성)
-                }
-                atr_period = atr_periods.get(timeframe, 20)
-                
-                # 사용 가능한 데이터에 따라 ATR 기간 조정
-                available_period = min(atr_period, len(current_data) - 1)
-                if available_period < 2:
-                    continue
-                atr = self.turtle_strategy.indicators.calculate_atr(current_data[-available_period-1:], available_period)
-            except:
-                continue
-            
-            # 포트폴리오 가치 계산
-            portfolio_value = self._calculate_portfolio_value(current_price)
-            self.equity_curve.append({
-                'date': current_data[-1].date.strftime('%Y-%m-%d'),
-                'total_value': portfolio_value
-            })
-            
-            # 일일 수익률 계산
-            if prev_portfolio_value > 0:
-                daily_return = (portfolio_value - prev_portfolio_value) / prev_portfolio_value
-                self.daily_returns.append(daily_return)
-            
-            prev_portfolio_value = portfolio_value
-            
-            # 청산 신호 확인 (먼저 처리)
-            positions_to_close = []
-            timeframe = getattr(self.config, 'timeframe', '1d')
-            for symbol, position in self.turtle_strategy.positions.items():
-                # 손절 확인
-                if self.turtle_strategy.check_stop_loss(position, current_price):
-                    positions_to_close.append((symbol, 'STOP_LOSS'))
-                # 시그널 청산 확인
-                elif self.turtle_strategy.check_exit_signal(position, current_data, timeframe):
-                    positions_to_close.append((symbol, 'SIGNAL'))
-            
-            # 청산 실행
-            leverage = getattr(config, 'leverage', 1.0)
-            for symbol, reason in positions_to_close:
-                trade_result = self.turtle_strategy.execute_exit(
-                    symbol, current_price, reason, self.current_balance, leverage
-                )
-                if trade_result:
-                    self.current_balance += trade_result.pnl
-                    # 청산시 수수료는 거래 금액에 적용
-                    trade_value = trade_result.size * trade_result.exit_price
-                    self._apply_commission(trade_value)
             
-            # 진입 신호 확인 (새로운 포지션)
-            symbol = config.symbol
-            leverage = getattr(config, 'leverage', 1.0)
-            if not self.turtle_strategy.has_position(symbol) and self._can_add_position(leverage):
-                entered = False
-                for system in config.systems:
-                    if entered:
-                        break
-                    # 롱 진입 신호 확인
-                    if self.turtle_strategy.check_entry_signal(symbol, current_data, system, "LONG", timeframe):
-                        unit = self.turtle_strategy.execute_entry(
-                            symbol, "LONG", current_price, atr, self.current_balance, system, leverage
-                        )
-                        if unit:
-                            trade_value = unit.size * current_price
-                            self._apply_commission(trade_value)
-                            entered = True
-                    # 숏 진입 신호 확인 (독립적으로 체크)
-                    if not entered and self.turtle_strategy.check_entry_signal(symbol, current_data, system, "SHORT", timeframe):
-                        unit = self.turtle_strategy.execute_entry(
-                            symbol, "SHORT", current_price, atr, self.current_balance, system, leverage
-                        )
-                        if unit:
-                            trade_value = unit.size * current_price
-                            self._apply_commission(trade_value)
-                            entered = True
-            
-            # 피라미딩 신호 확인
-            elif self.turtle_strategy.has_position(symbol):
-                position = self.turtle_strategy.get_position(symbol)
-                if self.turtle_strategy.check_pyramid_signal(position, current_price, atr):
-                    unit = self.turtle_strategy.execute_entry(
-                        symbol, position.direction, current_price, atr, self.current_balance, 
-                        position.units[0].system, leverage
-                    )
-                    if unit:
-                        trade_value = unit.size * current_price
-                        self._apply_commission(trade_value)
+            core.step(i)
         
         # 최종 청산 (백테스트 종료)
-        if price_data:
-            final_price = price_data[-1].close
-            leverage = getattr(config, 'leverage', 1.0)
-            for symbol in list(self.turtle_strategy.positions.keys()):
-                trade_result = self.turtle_strategy.execute_exit(
-                    symbol, final_price, 'BACKTEST_END', self.current_balance, leverage
-                )
-                if trade_result:
-                    self.current_balance += trade_result.pnl
-                    # 최종 청산시에도 수수료 적용
-                    trade_value = trade_result.size * trade_result.exit_price
-                    self._apply_commission(trade_value)
+        profiler.switch('exits')
+        core.close_all('BACKTEST_END')
+        self.current_balance = core.balance
+        
+        if checkpoints is not None:
+            checkpoints.clear()
+        
+        if throttle is not None:
+            throttle.finish(processed_steps, len(trade_history), self.current_balance)
         
         print(f"백테스트 완료! 총 {len(self.turtle_strategy.get_trade_history())}개의 거래가 실행되었습니다.")
         
-        # 드로다운 곡선 계산
-        peak = self.initial_balance
-        for point in self.equity_curve:
-            value = point['total_value'] if isinstance(point, dict) else point
-            if value > peak:
-                peak = value
-            drawdown = (peak - value) / peak
-            self.drawdown_curve.append(drawdown)
-        
-        # 월별 수익률 계산 (간단한 예시)
-        monthly_returns = {
-            '2024-01': 0.05,
-            '2024-02': 0.08, 
-            '2024-03': 0.07
-        }
+        # 드로다운 곡선 및 월별 수익률 계산
+        profiler.switch('metrics')
+        self.drawdown_curve = backtest_core.drawdown_curve(self.equity_curve, self.initial_balance)
+        monthly_returns = backtest_core.monthly_returns(self.equity_curve)
         
         # 성과 지표 계산
-        trades = self.turtle_strategy.get_trade_history()
+        trades = list(self.turtle_strategy.get_trade_history())  # 결과 객체는 TradeResult 리스트를 보관
         metrics = self._calculate_performance_metrics(trades, self.equity_curve)
         
         return BacktestResults(
@@ -829,9 +870,38 @@ class BacktestEngine:
             daily_returns=self.daily_returns,
             equity_curve=self.equity_curve,
             drawdown_curve=self.drawdown_curve,
-            monthly_returns=monthly_returns
+            monthly_returns=monthly_returns,
+            timing=profiler.summary(),
+            futures=core.futures.summary() if core.futures is not None else {},
+            costs=core.costs.summary()
         )
+    
+    def _bind_core(self, core: SimulationCore):
+        """엔진 상태 속성이 시뮬레이션 코어의 리스트를 가리키도록 연결"""
+        self.core = core
+        self.current_balance = core.balance
+        self.equity_curve = core.equity_curve
+        self.daily_returns = core.daily_returns
+        self.drawdown_curve = []
 
+    def _make_checkpoint(self, key: str, fingerprint: str, cursor: int,
+                         processed_steps: int, prev_portfolio_value: float) -> BacktestCheckpoint:
+        """현재 시뮬레이션 상태 스냅샷 생성"""
+        return BacktestCheckpoint(
+            config_key=key,
+            data_fingerprint=fingerprint,
+            cursor=cursor,
+            processed_steps=processed_steps,
+            current_balance=self.core.balance,
+            prev_portfolio_value=prev_portfolio_value,
+            strategy_state=self.turtle_strategy.get_state(),
+            equity_times=to_ms_array([p['date'] for p in self.equity_curve]),
+            equity_values=np.fromiter((p['total_value'] for p in self.equity_curve),
+                                      dtype=np.float64, count=len(self.equity_curve)),
+            daily_returns=np.asarray(self.daily_returns, dtype=np.float64),
+            futures_state=self.core.futures.get_state() if self.core.futures is not None else {},
+            costs_state=self.core.costs.get_state()
+        )
 
 
 class BacktestResultsManager:
@@ -861,4 +931,26 @@ class BacktestResultsManager:
             with open(filepath, 'r', encoding='utf-8') as f:
                 return json.load(f)
         except Exception:
-            return None
\ No newline at end of file
+            return None
+    
+    @staticmethod
+    def save_to_store(results: BacktestResults, store: Optional[ResultStore] = None) -> str:
+        """결과를 컬럼형 결과 저장소에 저장하고 실행 ID 반환"""
+        return (store or ResultStore()).save(results)
+    
+    @staticmethod
+    def list_runs(store: Optional[ResultStore] = None) -> List[Dict[str, Any]]:
+        """저장된 실행 목록 (인덱스만 읽음)"""
+        return (store or ResultStore()).list_runs()
+    
+    @staticmethod
+    def load_run(run_id: str, store: Optional[ResultStore] = None) -> Optional[StoredBacktestResults]:
+        """저장된 실행 로드 (무거운 배열은 지연 로드)"""
+        run = (store or ResultStore()).load(run_id)
+        return StoredBacktestResults(run) if run is not None else None
+    
+    @staticmethod
+    def compare_runs(run_ids: Optional[List[str]] = None, store: Optional[ResultStore] = None,
+                     unit: str = 'D', baseline: Optional[str] = None) -> RunComparison:
+        """저장된 실행 비교 (자산 곡선만 로드, run_ids 생략 시 전체)"""
+        return RunComparison.from_store(store or ResultStore(), run_ids, unit, baseline)
@@ -7,11 +7,13 @@ from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
-from rich.prompt import Prompt
-from typing import List, Dict, Any
+from rich.prompt import Prompt, Confirm
+from typing import List, Dict, Any, Callable, Optional
 from datetime import datetime
 from dataclasses import dataclass
 
+from utils.trade_view import SORT_KEYS, TradeView
+
 @dataclass
 class DetailedTradeAnalysis:
     """상세 거래 분석 결과"""
@@ -59,8 +61,8 @@ class DetailedTradeAnalysis:
     worst_day_pnl: float
     avg_trade_duration: float
     
-    # 상세 거래 내역
-    detailed_trades: List[Dict[str, Any]]
+    # 상세 거래 내역 (정렬/필터/페이지 뷰)
+    trade_view: Optional[TradeView]
 
 class DetailedTradeAnalyzer:
     """상세 거래 분석기"""
@@ -68,8 +70,8 @@ class DetailedTradeAnalyzer:
     def __init__(self):
         self.console = Console()
     
-    def analyze_trades(self, trades: List[Any]) -> DetailedTradeAnalysis:
-        """거래 내역을 상세 분석"""
+    def analyze_trades(self, trades: List[Any], view: Optional[TradeView] = None) -> DetailedTradeAnalysis:
+        """거래 내역을 상세 분석 (view를 주면 상세 거래 내역에 그대로 사용)"""
         if not trades:
             return self._get_empty_analysis()
         
@@ -127,8 +129,8 @@ class DetailedTradeAnalyzer:
         else:
             avg_trade_duration = 0
         
-        # 상세 거래 내역 생성
-        detailed_trades = self._create_detailed_trade_list(trades)
+        # 상세 거래 내역 뷰 (컬럼 배열 한 번 변환, 페이지는 필요할 때만 디코딩)
+        trade_view = view if view is not None else TradeView.from_trades(trades, page_size=15)
         
         return DetailedTradeAnalysis(
             total_trades=total_trades,
@@ -161,7 +163,7 @@ class DetailedTradeAnalyzer:
             best_day_pnl=best_day_pnl,
             worst_day_pnl=worst_day_pnl,
             avg_trade_duration=avg_trade_duration,
-            detailed_trades=detailed_trades
+            trade_view=trade_view
         )
     
     def display_detailed_analysis(self, analysis: DetailedTradeAnalysis):
@@ -191,7 +193,7 @@ class DetailedTradeAnalyzer:
         Prompt.ask("\n[dim]엔터를 눌러 상세 거래 내역을 보세요...[/dim]", default="")
         
         # 7. 상세 거래 내역 (페이지네이션)
-        self._show_detailed_trades(analysis.detailed_trades)
+        self._show_detailed_trades(analysis.trade_view)
     
     def _show_overall_statistics(self, analysis: DetailedTradeAnalysis):
         """전체 통계 표시"""
@@ -411,81 +413,99 @@ class DetailedTradeAnalyzer:
         self.console.print(table)
         self.console.print()
     
-    def _show_detailed_trades(self, detailed_trades: List[Dict[str, Any]]):
+    def _show_detailed_trades(self, view: Optional[TradeView]):
         """상세 거래 내역 표시 (페이지네이션)"""
-        if not detailed_trades:
+        if view is None or not len(view):
             self.console.print("[yellow]거래 내역이 없습니다.[/yellow]")
             return
+        self.browse_trades(view, "📋 상세 거래 내역", self._detailed_trades_table)
+    
+    def _detailed_trades_table(self, view: TradeView, page: int) -> Table:
+        """상세 거래 내역 한 페이지"""
+        trades_table = Table(title=f"페이지 {page}/{view.page_count}")
+        trades_table.add_column("#", style="dim", width=4)
+        trades_table.add_column("진입일", style="cyan", width=10)
+        trades_table.add_column("청산일", style="cyan", width=10)
+        trades_table.add_column("방향", style="white", width=5)
+        trades_table.add_column("진입가", style="blue", width=10)
+        trades_table.add_column("청산가", style="blue", width=10)
+        trades_table.add_column("기간", style="yellow", width=5)
+        trades_table.add_column("손익", style="bold", width=10)
+        trades_table.add_column("S", style="purple", width=3)
+        trades_table.add_column("사유", style="dim", width=8)
+        
+        for trade in view.page(page):
+            pnl_color = "green" if trade['pnl'] > 0 else "red"
+            direction_color = "green" if trade['direction'] == "LONG" else "red"
+            
+            trades_table.add_row(
+                str(trade['number']),
+                trade['entry_date'],
+                trade['exit_date'],
+                f"[{direction_color}]{trade['direction'][:1]}[/{direction_color}]",
+                f"${trade['entry_price']:,.0f}",
+                f"${trade['exit_price']:,.0f}",
+                f"{trade['duration']}일",
+                f"[{pnl_color}]{trade['pnl']:+.0f}[/{pnl_color}]",
+                str(trade['system']),
+                trade['exit_reason'][:6]
+            )
+        return trades_table
+    
+    def browse_trades(self, view: TradeView, title: str, render: Callable[[TradeView, int], Table]):
+        """거래 뷰 페이지 탐색 (이전/다음, 페이지 이동, 정렬, 필터)
         
-        self.console.clear()
-        self.console.print(Panel(f"📋 상세 거래 내역 ({len(detailed_trades)}건)", style="cyan"))
-        
-        page_size = 15
-        total_pages = (len(detailed_trades) + page_size - 1) // page_size
+        render(view, page)가 한 페이지 테이블을 만들며, 정렬/필터 변경은 뷰의 캐시된 인덱스로 처리한다.
+        """
         current_page = 1
         
         while True:
-            start_idx = (current_page - 1) * page_size
-            end_idx = min(start_idx + page_size, len(detailed_trades))
-            page_trades = detailed_trades[start_idx:end_idx]
+            totals = view.totals()
+            self.console.clear()
+            self.console.print(Panel(
+                f"{title} ({totals['count']:,}/{len(view):,}건, 손익 ${totals['pnl']:+,.0f}, "
+                f"승률 {totals['win_rate']:.1%})\n[dim]{view.describe()}[/dim]", style="cyan"))
+            self.console.print(render(view, current_page))
             
-            trades_table = Table(title=f"페이지 {current_page}/{total_pages}")
-            trades_table.add_column("#", style="dim", width=4)
-            trades_table.add_column("진입일", style="cyan", width=10)
-            trades_table.add_column("청산일", style="cyan", width=10)
-            trades_table.add_column("방향", style="white", width=5)
-            trades_table.add_column("진입가", style="blue", width=10)
-            trades_table.add_column("청산가", style="blue", width=10)
-            trades_table.add_column("기간", style="yellow", width=5)
-            trades_table.add_column("손익", style="bold", width=10)
-            trades_table.add_column("S", style="purple", width=3)
-            trades_table.add_column("사유", style="dim", width=8)
-            
-            for i, trade in enumerate(page_trades, start_idx + 1):
-                pnl_color = "green" if trade['pnl'] > 0 else "red"
-                direction_color = "green" if trade['direction'] == "LONG" else "red"
-                
-                trades_table.add_row(
-                    str(i),
-                    trade['entry_date'],
-                    trade['exit_date'],
-                    f"[{direction_color}]{trade['direction'][:1]}[/{direction_color}]",
-                    f"${trade['entry_price']:,.0f}",
-                    f"${trade['exit_price']:,.0f}",
-                    f"{trade['duration']}일",
-                    f"[{pnl_color}]{trade['pnl']:+.0f}[/{pnl_color}]",
-                    str(trade['system']),
-                    trade['exit_reason'][:6]
-                )
+            # 네비게이션
+            nav_options = []
+            nav_text = "["
+            if current_page > 1:
+                nav_options.extend(['p', 'prev'])
+                nav_text += "P)이전 페이지 "
+            if current_page < view.page_count:
+                nav_options.extend(['n', 'next'])
+                nav_text += "N)다음 페이지 "
+            if view.page_count > 1:
+                nav_options.append('g')
+                nav_text += "G)페이지 이동 "
+            nav_options.extend(['s', 'f', 'r', 'q'])
+            nav_text += "S)정렬 F)필터 R)초기화 Q)돌아가기]"
             
-            self.console.print(trades_table)
+            choice = Prompt.ask(nav_text, choices=nav_options, default='q')
             
-            # 네비게이션
-            if total_pages > 1:
-                nav_options = []
-                if current_page > 1:
-                    nav_options.extend(['p', 'prev'])
-                if current_page < total_pages:
-                    nav_options.extend(['n', 'next'])
-                nav_options.append('q')
-                
-                nav_text = "["
-                if current_page > 1:
-                    nav_text += "P)이전 페이지 "
-                if current_page < total_pages:
-                    nav_text += "N)다음 페이지 "
-                nav_text += "Q)돌아가기]"
-                
-                choice = Prompt.ask(nav_text, choices=nav_options, default='q')
-                
-                if choice in ['p', 'prev']:
-                    current_page -= 1
-                elif choice in ['n', 'next']:
-                    current_page += 1
-                else:
-                    break
+            if choice in ['p', 'prev']:
+                current_page -= 1
+            elif choice in ['n', 'next']:
+                current_page += 1
+            elif choice == 'g':
+                page = Prompt.ask(f"이동할 페이지 (1-{view.page_count})", default=str(current_page))
+                if page.isdigit():
+                    current_page = min(max(1, int(page)), view.page_count)
+            elif choice == 's':
+                key = Prompt.ask("정렬 기준", choices=list(SORT_KEYS), default=view.sort_key)
+                view.sort(key, Confirm.ask("내림차순으로 정렬할까요?", default=key == 'pnl'))
+                current_page = 1
+            elif choice == 'f':
+                name = Prompt.ask("필터 항목", choices=['direction', 'system', 'outcome', 'exit_reason'],
+                                  default='direction')
+                value = Prompt.ask("값 (all: 해제)", choices=view.filter_values(name) + ['all'], default='all')
+                view.filter(**{name: None if value == 'all' else value})
+                current_page = 1
+            elif choice == 'r':
+                view.reset()
+                current_page = 1
             else:
-                Prompt.ask("\n[dim]엔터를 눌러 돌아가세요...[/dim]", default="")
                 break
     
     def _analyze_consecutive_trades(self, trades: List[Any]) -> tuple:
@@ -525,29 +545,6 @@ class DetailedTradeAnalyzer:
         
         return max_wins, max_losses, current_streak, current_streak_type
     
-    def _create_detailed_trade_list(self, trades: List[Any]) -> List[Dict[str, Any]]:
-        """상세 거래 내역 리스트 생성"""
-        detailed_trades = []
-        
-        for trade in trades:
-            duration = (trade.exit_date - trade.entry_date).days
-            
-            detailed_trades.append({
-                'entry_date': trade.entry_date.strftime('%Y-%m-%d'),
-                'exit_date': trade.exit_date.strftime('%Y-%m-%d'),
-                'direction': trade.direction,
-                'entry_price': trade.entry_price,
-                'exit_price': trade.exit_price,
-                'duration': duration,
-                'pnl': trade.pnl,
-                'system': trade.system,
-                'exit_reason': trade.exit_reason,
-                'size': trade.size,
-                'symbol': trade.symbol
-            })
-        
-        return detailed_trades
-    
     def _get_empty_analysis(self) -> DetailedTradeAnalysis:
         """빈 분석 결과 반환"""
         return DetailedTradeAnalysis(
@@ -559,7 +556,7 @@ class DetailedTradeAnalyzer:
             signal_exits=0, stop_loss_exits=0, backtest_end_exits=0,
             max_consecutive_wins=0, max_consecutive_losses=0, current_streak=0, current_streak_type="None",
             best_day_pnl=0.0, worst_day_pnl=0.0, avg_trade_duration=0.0,
-            detailed_trades=[]
+            trade_view=None
         )
     
     def _evaluate_win_rate(self, win_rate: float) -> str:
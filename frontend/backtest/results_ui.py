@@ -13,10 +13,17 @@ from rich.prompt import Prompt, Confirm
 import matplotlib.pyplot as plt
 from datetime import datetime
 from typing import Dict, Any, List, Optional
+import asyncio
+import csv
 import json
 import os
+import signal
 
-from .backend.engines.backtest_engine import BacktestResults, PerformanceMetrics
+from .backend.engines.backtest_engine import BacktestResults, PerformanceMetrics, BacktestResultsManager
+from utils.progress import BacktestProgress
+from utils.checkpoint import BacktestCancelled
+from utils.run_comparison import RunComparison
+from utils.trade_view import TradeView
 from .detailed_trade_analysis import DetailedTradeAnalyzer
 
 class BacktestResultsUI:
@@ -26,22 +33,61 @@ class BacktestResultsUI:
         self.console = Console()
         self.detailed_analyzer = DetailedTradeAnalyzer()
     
-    def show_progress(self, total_days: int):
-        """백테스트 진행률 표시"""
+    async def run_with_progress(self, engine, resume: bool = False) -> Optional[BacktestResults]:
+        """백테스트를 실행하며 진행률을 실시간 표시 (Ctrl+C로 중단, 중단 시 None 반환)"""
+        # Ctrl+C는 엔진에 협조적 취소를 요청 (체크포인트 저장 후 중단)
+        loop = asyncio.get_running_loop()
+        try:
+            loop.add_signal_handler(signal.SIGINT, engine.cancel)
+            sigint_handled = True
+        except (NotImplementedError, RuntimeError):
+            sigint_handled = False  # Windows 등 시그널 핸들러 미지원 환경
+        
+        try:
+            return await self._run_with_progress(engine, resume)
+        except BacktestCancelled as e:
+            self.console.print(f"\n[yellow]⏹️ {e}[/yellow]")
+            if e.checkpoint_path:
+                self.console.print(f"[dim]체크포인트 저장됨: {e.checkpoint_path} (같은 설정으로 다시 실행하면 이어서 진행)[/dim]")
+            return None
+        finally:
+            if sigint_handled:
+                loop.remove_signal_handler(signal.SIGINT)
+    
+    async def _run_with_progress(self, engine, resume: bool) -> BacktestResults:
+        """Rich 진행률 표시와 함께 엔진 실행"""
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
             TaskProgressColumn(),
-            console=self.console
+            TextColumn("[cyan]{task.fields[bars]}[/cyan] bars"),
+            TextColumn("거래 [yellow]{task.fields[trades]}[/yellow]"),
+            TextColumn("자산 [green]${task.fields[equity]:,.0f}[/green]"),
+            TextColumn("ETA [dim]{task.fields[eta]}[/dim]"),
+            console=self.console,
+            refresh_per_second=10
         ) as progress:
-            task = progress.add_task("백테스트 실행 중...", total=total_days)
+            task = progress.add_task("백테스트 실행 중...", total=None,
+                                     bars="0", trades=0, equity=0.0, eta="-")
             
-            for day in range(total_days):
-                # 실제 백테스트에서는 yield나 callback으로 진행률 업데이트
-                progress.update(task, advance=1)
+            def on_progress(update: BacktestProgress):
+                # 렌더링은 Progress 자체 갱신 스레드가 담당하므로 필드만 갱신
+                eta = "-" if update.eta_seconds is None else f"{update.eta_seconds:,.0f}s"
+                progress.update(
+                    task,
+                    total=update.total_bars,
+                    completed=update.bars_processed,
+                    bars=f"{update.bars_processed:,}/{update.total_bars:,}",
+                    trades=update.trades,
+                    equity=update.equity,
+                    eta=eta
+                )
             
+            results = await engine.run_backtest(progress_callback=on_progress, resume=resume)
             progress.update(task, description="백테스트 완료!")
+        
+        return results
     
     def display_results(self, results: BacktestResults) -> str:
         """백테스트 결과 표시"""
@@ -327,11 +373,14 @@ class BacktestResultsUI:
         # 리스크 분석
         self._show_risk_analysis(results)
         
+        # 실행 시간 분석 (프로파일링 활성화 시)
+        self._show_timing_breakdown(results)
+        
         Prompt.ask("\n[dim]엔터를 눌러 계속하세요...[/dim]", default="")
     
     def show_detailed_trade_analysis(self, results: BacktestResults):
         """상세 거래 분석 표시"""
-        analysis = self.detailed_analyzer.analyze_trades(results.trades)
+        analysis = self.detailed_analyzer.analyze_trades(results.trades, TradeView.for_results(results, page_size=15))
         self.detailed_analyzer.display_detailed_analysis(analysis)
     
     def _show_portfolio_analysis(self, results: BacktestResults):
@@ -461,84 +510,136 @@ class BacktestResultsUI:
         self.console.print(risk_table)
         self.console.print()
     
+    def _show_timing_breakdown(self, results: BacktestResults):
+        """구간별 실행 시간 표시"""
+        timing = getattr(results, 'timing', None)
+        if not timing or not timing.get('phases'):
+            return
+        
+        phase_labels = {
+            'data_load': '데이터 로드',
+            'setup': '초기화',
+            'loop': '루프 오버헤드',
+            'indicators': '지표 계산',
+            'equity': '자산 평가',
+            'signal_checks': '신호 확인',
+            'exits': '청산',
+            'entries': '진입',
+            'pyramiding': '피라미딩',
+            'journal_io': '매매일지 I/O',
+            'metrics': '성과 지표',
+        }
+        
+        timing_table = Table(title=f"⏱️ 실행 시간 분석 (총 {timing['total_seconds']:.3f}초)")
+        timing_table.add_column("구간", style="cyan")
+        timing_table.add_column("시간", style="white", justify="right")
+        timing_table.add_column("비율", style="yellow", justify="right")
+        timing_table.add_column("호출", style="dim", justify="right")
+        
+        for name, phase in timing['phases'].items():
+            timing_table.add_row(
+                phase_labels.get(name, name),
+                f"{phase['seconds'] * 1000:,.1f}ms",
+                f"{phase['share']:.1%}",
+                f"{phase['calls']:,}"
+            )
+        
+        self.console.print(timing_table)
+        
+        counters = timing.get('counters', {})
+        if counters:
+            bars = counters.get('bars', 0)
+            counter_text = "  ".join(f"{name}: {value:,}" for name, value in counters.items())
+            if bars and timing['total_seconds'] > 0:
+                counter_text += f"  |  처리 속도: {bars / timing['total_seconds']:,.0f} bars/sec"
+            self.console.print(f"[dim]{counter_text}[/dim]")
+        self.console.print()
+    
     def show_all_trades(self, results: BacktestResults):
-        """전체 거래 내역 표시"""
-        trades = results.trades
+        """전체 거래 내역 표시 (컬럼형 거래 뷰로 정렬/필터/페이지 탐색)"""
+        view = TradeView.for_results(results, page_size=10)
         
-        if not trades:
+        if not len(view):
             self.console.print("[yellow]거래 내역이 없습니다.[/yellow]")
             return
         
-        self.console.clear()
-        self.console.print(Panel(f"📋 전체 거래 내역 ({len(trades)}건)", style="cyan"))
-        
-        # 페이지네이션으로 표시 (10개씩)
-        page_size = 10
-        total_pages = (len(trades) + page_size - 1) // page_size
-        current_page = 1
-        
-        while True:
-            start_idx = (current_page - 1) * page_size
-            end_idx = min(start_idx + page_size, len(trades))
-            page_trades = trades[start_idx:end_idx]
-            
-            # 거래 테이블
-            trades_table = Table(title=f"페이지 {current_page}/{total_pages}")
-            trades_table.add_column("번호", style="dim", width=5)
-            trades_table.add_column("날짜", style="cyan", width=12)
-            trades_table.add_column("방향", style="white", width=6)
-            trades_table.add_column("진입가", style="blue", width=10)
-            trades_table.add_column("청산가", style="blue", width=10)
-            trades_table.add_column("수량", style="white", width=8)
-            trades_table.add_column("손익", style="bold", width=10)
-            trades_table.add_column("시스템", style="yellow", width=6)
-            trades_table.add_column("사유", style="dim", width=8)
-            
-            for i, trade in enumerate(page_trades, start_idx + 1):
-                pnl_color = "green" if trade.pnl > 0 else "red"
-                direction_color = "green" if trade.direction == "LONG" else "red"
-                
-                trades_table.add_row(
-                    str(i),
-                    trade.exit_date.strftime("%Y-%m-%d"),
-                    f"[{direction_color}]{trade.direction[:4]}[/{direction_color}]",
-                    f"${trade.entry_price:,.0f}",
-                    f"${trade.exit_price:,.0f}",
-                    f"{trade.size:.3f}",
-                    f"[{pnl_color}]{trade.pnl:+.0f}[/{pnl_color}]",
-                    f"S{trade.system}",
-                    trade.exit_reason[:6]
-                )
-            
-            self.console.print(trades_table)
+        self.detailed_analyzer.browse_trades(view, "📋 전체 거래 내역", self._trade_page_table)
+    
+    def _trade_page_table(self, view: TradeView, page: int) -> Table:
+        """전체 거래 내역 한 페이지"""
+        trades_table = Table(title=f"페이지 {page}/{view.page_count}")
+        trades_table.add_column("번호", style="dim", width=5)
+        trades_table.add_column("날짜", style="cyan", width=12)
+        trades_table.add_column("방향", style="white", width=6)
+        trades_table.add_column("진입가", style="blue", width=10)
+        trades_table.add_column("청산가", style="blue", width=10)
+        trades_table.add_column("수량", style="white", width=8)
+        trades_table.add_column("손익", style="bold", width=10)
+        trades_table.add_column("시스템", style="yellow", width=6)
+        trades_table.add_column("사유", style="dim", width=8)
+        
+        for trade in view.page(page):
+            pnl_color = "green" if trade['pnl'] > 0 else "red"
+            direction_color = "green" if trade['direction'] == "LONG" else "red"
             
-            # 네비게이션
-            if total_pages > 1:
-                nav_options = []
-                if current_page > 1:
-                    nav_options.extend(['p', 'prev'])
-                if current_page < total_pages:
-                    nav_options.extend(['n', 'next'])
-                nav_options.append('q')
-                
-                nav_text = "["
-                if current_page > 1:
-                    nav_text += "P)이전 페이지 "
-                if current_page < total_pages:
-                    nav_text += "N)다음 페이지 "
-                nav_text += "Q)돌아가기]"
-                
-                choice = Prompt.ask(nav_text, choices=nav_options, default='q')
-                
-                if choice in ['p', 'prev']:
-                    current_page -= 1
-                elif choice in ['n', 'next']:
-                    current_page += 1
-                else:
-                    break
-            else:
-                Prompt.ask("\n[dim]엔터를 눌러 돌아가세요...[/dim]", default="")
-                break
+            trades_table.add_row(
+                str(trade['number']),
+                trade['exit_date'],
+                f"[{direction_color}]{trade['direction'][:4]}[/{direction_color}]",
+                f"${trade['entry_price']:,.0f}",
+                f"${trade['exit_price']:,.0f}",
+                f"{trade['size']:.3f}",
+                f"[{pnl_color}]{trade['pnl']:+.0f}[/{pnl_color}]",
+                f"S{trade['system']}",
+                trade['exit_reason'][:6]
+            )
+        return trades_table
+    
+    def show_run_comparison(self, comparison: RunComparison, by: str = 'sharpe', limit: int = 30):
+        """여러 실행의 순위 비교표 (기준 실행 대비 초과 수익/상관계수 포함)"""
+        rows = comparison.ranked(by, limit)
+        baseline = comparison.run_ids[comparison.baseline]
+        
+        table = Table(title=f"📊 실행 비교 ({len(comparison)}개, 기준: {by}, 상위 {len(rows)}개)",
+                      show_header=True, header_style="bold cyan")
+        table.add_column("순위", justify="right")
+        table.add_column("실행 ID", style="dim")
+        table.add_column("심볼/TF")
+        table.add_column("레버리지", justify="right")
+        table.add_column("총 수익률", justify="right")
+        table.add_column("샤프", justify="right")
+        table.add_column("최대 DD", justify="right")
+        table.add_column("변동성", justify="right")
+        table.add_column("초과 수익", justify="right")
+        table.add_column("정보 비율", justify="right")
+        table.add_column("상관계수", justify="right")
+        table.add_column("거래", justify="right")
+        
+        def fmt(value: float, spec: str) -> str:
+            return "-" if value != value else format(value, spec)  # NaN 표시
+        
+        for row in rows:
+            color = "green" if row['total_return'] >= 0 else "red"
+            marker = " ★" if row['baseline'] else ""
+            table.add_row(
+                f"{row['rank']}",
+                f"{row['run_id']}{marker}",
+                f"{row['symbol']} {row['timeframe']}",
+                f"{row['leverage']}x",
+                f"[{color}]{fmt(row['total_return'], '+.2%')}[/{color}]",
+                fmt(row['sharpe'], '.2f'),
+                fmt(row['max_drawdown'], '.2%'),
+                fmt(row['volatility'], '.2%'),
+                fmt(row['excess_return'], '+.2%'),
+                fmt(row['information_ratio'], '.2f'),
+                fmt(row['correlation'], '.2f'),
+                f"{row['total_trades']:,}"
+            )
+        
+        self.console.print(table)
+        self.console.print(f"[dim]★ 기준 실행: {baseline} (초과 수익/정보 비율/상관계수 기준, "
+                           f"{comparison.unit} 단위 {len(comparison.times)}개 구간 정렬)[/dim]")
+        self.console.print()
     
     def export_results(self, results: BacktestResults):
         """결과 내보내기"""
@@ -559,30 +660,25 @@ class BacktestResultsUI:
                 'exit_reason': trade.exit_reason
             })
         
-        # 간단한 CSV 생성 (pandas 없이)
+        # CSV 생성 (csv 모듈로 한 번에 기록)
         csv_filename = f"data/backtest_results/trades_{timestamp}.csv"
         os.makedirs("data/backtest_results", exist_ok=True)
         
-        with open(csv_filename, 'w') as f:
+        with open(csv_filename, 'w', newline='', encoding='utf-8') as f:
             if trades_data:
-                # 헤더
-                headers = list(trades_data[0].keys())
-                f.write(','.join(headers) + '\n')
-                
-                # 데이터
-                for trade in trades_data:
-                    values = [str(trade[header]) for header in headers]
-                    f.write(','.join(values) + '\n')
-        
-        # JSON 결과도 저장
-        json_filename = f"data/backtest_results/backtest_{timestamp}.json"
-        with open(json_filename, 'w', encoding='utf-8') as f:
-            json.dump(results.to_dict(), f, indent=2, ensure_ascii=False, default=str)
+                writer = csv.DictWriter(f, fieldnames=list(trades_data[0].keys()))
+                writer.writeheader()
+                writer.writerows(trades_data)
+        
+        # 전체 결과는 컬럼형 결과 저장소에 저장 (지표는 JSON, 배열은 압축 바이너리)
+        # 저장소에서 불러온 결과는 이미 저장되어 있으므로 다시 저장하지 않음
+        stored_run = getattr(results, 'run', None)
+        run_id = stored_run.run_id if stored_run is not None else BacktestResultsManager.save_to_store(results)
         
         self.console.print(Panel(
             f"[green]✅ 결과가 성공적으로 내보내졌습니다![/green]\n\n"
             f"[cyan]거래 내역 CSV:[/cyan] {csv_filename}\n"
-            f"[cyan]전체 결과 JSON:[/cyan] {json_filename}",
+            f"[cyan]전체 결과 저장소:[/cyan] {run_id}",
             title="내보내기 완료",
             style="green"
         ))
@@ -20,8 +20,9 @@ from frontend.dashboard.components.account import AccountComponent
 from frontend.dashboard.components.positions import PositionsComponent
 from frontend.dashboard.components.metrics import MetricsComponent
 from frontend.dashboard.components.trades import TradesComponent
+from frontend.dashboard.render_scheduler import RenderScheduler
 from strategy.turtle_strategy import TurtleStrategy, Position
-from config import UIConfig, TradingMode
+from config import UIConfig, TradingMode, PaperTradingConfig, BinanceConfig, TelemetryConfig
 
 class TradingDashboard:
     """실시간 트레이딩 대시보드"""
@@ -46,36 +47,68 @@ class TradingDashboard:
         self.current_prices = {"BTCUSDT": 67500.0}
         self.market_data = {}
         
+        # 가상매매 런타임 (연결 시 전략과 가격을 런타임에서 가져옴)
+        self.runtime = None
+        
+        # 패널별 렌더 캐시 (의존 데이터 키가 바뀐 패널만 다시 생성)
+        self.scheduler = RenderScheduler()
+        self.scheduler.register("header", self._create_header_panel, self._header_key)
+        self.scheduler.register("account", self._create_account_panel, self._account_key)
+        self.scheduler.register("positions", self._create_positions_panel, self._positions_key)
+        self.scheduler.register("metrics", self._create_metrics_panel, self._metrics_key)
+        self.scheduler.register("trades", self._create_trades_panel, self._trades_key)
+        self.scheduler.register("footer", self._create_footer_panel)
+    
+    def attach_runtime(self, runtime):
+        """가상매매 런타임 연결 (전략 객체 공유)"""
+        self.runtime = runtime
+        self.strategy = runtime.strategy
+        self.current_prices = runtime.last_prices
+        
     async def start(self):
-        """대시보드 시작"""
+        """대시보드 시작
+        
+        데이터 갱신(UIConfig.DASHBOARD_DATA_INTERVAL)과 화면 갱신(UIConfig.DASHBOARD_REFRESH_RATE)을
+        각자의 주기로 돌리고, 화면 갱신 시점에는 바뀐 패널만 다시 만들어 바뀐 것이 있을 때만 출력한다.
+        """
         self.is_running = True
+        self.layout = self._create_layout()
         
         with Live(
-            self._create_layout(),
+            self.layout,
             console=self.console,
-            refresh_per_second=1,
+            auto_refresh=False,
             screen=True
         ) as live:
             try:
-                while self.is_running:
-                    # 데이터 업데이트
-                    await self._update_data()
-                    
-                    # 레이아웃 새로고침
-                    live.update(self._create_layout())
-                    
-                    await asyncio.sleep(UIConfig.DASHBOARD_REFRESH_RATE)
-                    
+                await self._run_loop(live)
             except KeyboardInterrupt:
                 self.is_running = False
                 self.console.print("\n[yellow]대시보드를 종료합니다...[/yellow]")
     
+    async def _run_loop(self, live: Live):
+        """데이터/화면 갱신 루프 (두 주기 중 가까운 시점까지 대기)"""
+        loop = asyncio.get_running_loop()
+        next_data = next_draw = loop.time()
+        
+        while self.is_running:
+            now = loop.time()
+            if now >= next_data:
+                await self._update_data()
+                next_data = now + UIConfig.DASHBOARD_DATA_INTERVAL
+            if now >= next_draw:
+                if self.scheduler.render(self.layout):
+                    live.refresh()
+                next_draw = now + UIConfig.DASHBOARD_REFRESH_RATE
+            
+            await asyncio.sleep(max(0.0, min(next_data, next_draw) - loop.time()))
+    
     def stop(self):
         """대시보드 중지"""
         self.is_running = False
     
     def _create_layout(self) -> Layout:
-        """대시보드 레이아웃 생성"""
+        """대시보드 레이아웃 생성 (영역 구조는 한 번만 만들고 패널은 스케줄러가 채움)"""
         layout = Layout()
         
         # 상단 헤더
@@ -88,7 +121,7 @@ class TradingDashboard:
         # 메인 영역을 좌우로 분할
         layout["main"].split_row(
             Layout(name="left", ratio=2),
-            Layout(name="right", ratio=1)
+            Layout(name="trades", ratio=1)
         )
         
         # 좌측을 상하로 분할
@@ -104,15 +137,37 @@ class TradingDashboard:
         )
         
         # 각 패널에 컴포넌트 할당
-        layout["header"].update(self._create_header_panel())
-        layout["account"].update(self._create_account_panel())
-        layout["positions"].update(self._create_positions_panel())
-        layout["metrics"].update(self._create_metrics_panel())
-        layout["right"].update(self._create_trades_panel())
-        layout["footer"].update(self._create_footer_panel())
+        self.scheduler.invalidate()
+        self.scheduler.render(layout)
         
         return layout
     
+    # 패널별 의존 데이터 키 (키가 같으면 캐시된 패널을 그대로 사용)
+    def _header_key(self):
+        return self.mode, self.is_running, datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    
+    def _account_key(self):
+        account = self.account
+        return account.current_balance, account.unrealized_pnl, account.margin_used
+    
+    def _positions_key(self):
+        return tuple(
+            (symbol, position.direction, position.total_size, position.avg_price,
+             self.current_prices.get(symbol))
+            for symbol, position in self.strategy.positions.items()
+        )
+    
+    def _trades_key(self):
+        history = self.strategy.trade_history
+        return id(history), history.revision
+    
+    def _metrics_key(self):
+        # 지표 컴포넌트가 마지막 데이터 갱신 때 받은 거래 뷰 기준
+        metrics = self.metrics
+        balances = metrics.daily_balances
+        return len(metrics.trade_history), len(balances), balances[-1]['balance'] if balances else None, \
+            metrics.peak_balance
+    
     def _create_header_panel(self) -> Panel:
         """헤더 패널 생성"""
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -333,12 +388,13 @@ class TradingDashboard:
         # 실제 구현에서는 여기서 API 호출
         current_time = datetime.now()
         
-        # 가격 시뮬레이션 (더미 데이터)
-        import random
-        for symbol in self.current_prices:
-            # 약간의 랜덤 가격 변동
-            change_pct = random.uniform(-0.005, 0.005)  # ±0.5%
-            self.current_prices[symbol] *= (1 + change_pct)
+        # 가격 시뮬레이션 (더미 데이터, 런타임 연결 시 마감 봉 가격 사용)
+        if self.runtime is None:
+            import random
+            for symbol in self.current_prices:
+                # 약간의 랜덤 가격 변동
+                change_pct = random.uniform(-0.005, 0.005)  # ±0.5%
+                self.current_prices[symbol] *= (1 + change_pct)
         
         # 컴포넌트 데이터 업데이트
         await self.account.update_data(self.current_prices, self.strategy.get_all_positions())
@@ -355,6 +411,7 @@ class TradingDashboard:
         elif key.upper() == 'R':
             self.strategy.reset()
             self.account.reset()
+            self.scheduler.invalidate()
         # 추가 단축키 처리...
 
 class LiveTradingManager:
@@ -373,6 +430,10 @@ class LiveTradingManager:
             # 설정 표시
             self._show_trading_config(config)
             
+            if self.mode in (TradingMode.PAPER, TradingMode.LIVE):
+                await self._run_runtime(config)
+                return
+            
             # 대시보드 시작
             await self.dashboard.start()
             
@@ -380,6 +441,51 @@ class LiveTradingManager:
             self.console.print(f"[red]트레이딩 중 오류 발생: {e}[/red]")
             raise
     
+    async def _run_runtime(self, config: Dict[str, Any]):
+        """가상매매/실거래 런타임과 대시보드를 함께 실행 (대시보드 종료 시 런타임도 중지)"""
+        from utils.paper_trading import BinanceKlineFeed, PaperTradingRuntime
+        from utils.runtime_state import RuntimeStateStore
+        
+        symbols = config.get('symbols') or [config.get('symbol', 'BTCUSDT')]
+        params = dict(
+            timeframe=config.get('timeframe', PaperTradingConfig.DEFAULT_TIMEFRAME),
+            initial_balance=config.get('initial_balance', 10000),
+            leverage=config.get('leverage', 1.0),
+            systems=config.get('systems', [1, 2]),
+            strategy=TurtleStrategy(self.mode),
+            state_store=RuntimeStateStore(name=self.mode),
+        )
+        testnet = config.get('testnet', self.mode == TradingMode.LIVE and BinanceConfig.TESTNET)
+        executor = None
+        if self.mode == TradingMode.LIVE:
+            from utils.live_trading import LiveTradingRuntime
+            from utils.order_execution import BinanceFuturesGateway, OrderExecutor
+            executor = OrderExecutor(BinanceFuturesGateway(testnet=testnet))
+            await executor.start()
+            runtime = LiveTradingRuntime(symbols, executor, **params)
+        else:
+            runtime = PaperTradingRuntime(symbols, **params)
+        if runtime.restore_state():
+            self.console.print(f"[green]저장된 상태 복원: 포지션 {len(runtime.strategy.positions)}개[/green]")
+        self.trading_engine = runtime
+        self.dashboard.attach_runtime(runtime)
+        
+        feed = BinanceKlineFeed(testnet=testnet)
+        if TelemetryConfig.ENABLED:
+            await runtime.telemetry.start()
+        runtime_task = asyncio.create_task(runtime.run(feed))
+        try:
+            await self.dashboard.start()
+        finally:
+            runtime.stop()
+            await runtime.telemetry.stop()
+            runtime_task.cancel()
+            await asyncio.gather(runtime_task, return_exceptions=True)
+            await feed.close()
+            if executor is not None:
+                await executor.stop()
+                await executor.gateway.close()
+    
     def _show_trading_config(self, config: Dict[str, Any]):
         """트레이딩 설정 표시"""
         config_panel = Panel(
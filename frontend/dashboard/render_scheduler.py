@@ -0,0 +1,76 @@
+"""
+대시보드 렌더 스케줄러 - 패널별 렌더 캐시와 변경 추적
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from rich.console import RenderableType
+from rich.layout import Layout
+
+_UNSET = object()  # 아직 그린 적 없음
+
+
+@dataclass
+class PanelSpec:
+    """패널 하나의 빌더와 의존 데이터 키"""
+    name: str
+    build: Callable[[], RenderableType]
+    key: Callable[[], Hashable]
+    renderable: Optional[RenderableType] = None
+    last_key: Any = _UNSET
+    builds: int = 0
+
+
+class RenderScheduler:
+    """변경된 패널만 다시 만드는 렌더 스케줄러
+
+    패널마다 표시에 쓰는 데이터를 작은 해시 가능한 키(잔고 값, 포지션 수량/가격, 거래 로그 리비전 등)로
+    요약하는 함수를 등록해 두고, render()는 키가 바뀐 패널만 빌더를 호출해 레이아웃 영역을 교체한다.
+    키가 그대로인 패널은 캐시된 렌더러블을 그대로 두므로 Rich 객체 생성 비용이 들지 않으며,
+    바뀐 패널이 없으면 호출 측이 화면 갱신 자체를 건너뛸 수 있다.
+    """
+
+    def __init__(self):
+        self.panels: Dict[str, PanelSpec] = {}
+        self.frames = 0   # render() 호출 수
+        self.redraws = 0  # 패널이 하나 이상 바뀐 render() 수
+
+    def register(self, name: str, build: Callable[[], RenderableType],
+                 key: Callable[[], Hashable] = lambda: None):
+        """패널 등록 (key를 생략하면 한 번만 그리는 정적 패널)"""
+        self.panels[name] = PanelSpec(name, build, key)
+
+    def invalidate(self, name: Optional[str] = None):
+        """패널(생략 시 전체)을 다음 render()에서 다시 만들도록 표시"""
+        for spec in ([self.panels[name]] if name is not None else self.panels.values()):
+            spec.last_key = _UNSET
+
+    def dirty(self) -> List[str]:
+        """키가 바뀐 패널 이름"""
+        return [spec.name for spec in self.panels.values() if spec.key() != spec.last_key]
+
+    def render(self, layout: Layout) -> List[str]:
+        """키가 바뀐 패널만 다시 만들어 layout에 반영하고 다시 만든 패널 이름 반환"""
+        self.frames += 1
+        rebuilt = []
+        for spec in self.panels.values():
+            key = spec.key()
+            if key == spec.last_key:
+                continue
+            spec.renderable = spec.build()
+            spec.last_key = key
+            spec.builds += 1
+            layout[spec.name].update(spec.renderable)
+            rebuilt.append(spec.name)
+        if rebuilt:
+            self.redraws += 1
+        return rebuilt
+
+    def stats(self) -> Dict[str, Any]:
+        """렌더 통계 (프레임 수, 실제 갱신 수, 패널별 빌드 수)"""
+        return {
+            'frames': self.frames,
+            'redraws': self.redraws,
+            'builds': {name: spec.builds for name, spec in self.panels.items()},
+        }
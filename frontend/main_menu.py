@@ -5,16 +5,17 @@
 import asyncio
 from rich.console import Console
 from rich.panel import Panel
+from rich.table import Table
 from rich.prompt import Prompt, Confirm
 from rich.text import Text
 from rich.align import Align
 from rich.layout import Layout
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 from frontend.backtest.setup_ui import BacktestSetupUI
 from frontend.backtest.results_ui import BacktestResultsUI
 from frontend.dashboard.main_dashboard import TradingDashboard
-from frontend.backtest.backend.engines.backtest_engine import BacktestEngine
+from frontend.backtest.backend.engines.backtest_engine import BacktestEngine, BacktestResultsManager
 from config import validate_config, BacktestConfig
 
 class MainMenuUI:
@@ -153,14 +154,23 @@ class MainMenuUI:
                 timeframe=config['timeframe'],
                 initial_balance=config['initial_balance'],
                 commission_rate=config['commission_rate'],
-                systems=config['systems']
+                systems=config['systems'],
+                checkpointing=True,
+                use_cache=True
+            )
+            
+            engine = BacktestEngine(backtest_config)
+            resume = engine.has_checkpoint() and Confirm.ask(
+                "[cyan]이전에 중단된 백테스트 체크포인트가 있습니다. 이어서 실행하시겠습니까?[/cyan]", default=True
             )
             
             # 백테스트 실행
-            self.console.print("\n[yellow]백테스트를 실행 중입니다...[/yellow]")
+            self.console.print("\n[yellow]백테스트를 실행 중입니다... (Ctrl+C: 중단 후 체크포인트 저장)[/yellow]")
             
-            engine = BacktestEngine(backtest_config)
-            results = await engine.run_backtest()
+            results = await self.backtest_results.run_with_progress(engine, resume=resume)
+            if results is None:
+                self.console.input("[dim]엔터를 눌러 계속하세요...[/dim]")
+                return
             
             # 결과 표시
             while True:
@@ -258,28 +268,78 @@ class MainMenuUI:
             self.console.input("[dim]엔터를 눌러 메인 메뉴로 돌아가세요...[/dim]")
     
     def _handle_view_results(self):
-        """결과 보기 처리"""
-        self.console.print("[yellow]이전 결과 조회 기능을 구현 중입니다...[/yellow]")
+        """결과 보기 처리 (저장소 인덱스로 목록 표시, 선택한 실행만 로드)"""
+        runs = BacktestResultsManager.list_runs()
         
-        # 백테스트 결과 파일 목록 표시
-        import os
-        results_dir = "data/backtest_results"
+        if not runs:
+            self.console.print("[dim]저장된 백테스트 결과가 없습니다.[/dim]")
+            self.console.input("[dim]엔터를 눌러 계속하세요...[/dim]")
+            return
+        
+        shown = runs[:20]  # 최근 20개만 표시
+        table = Table(title=f"📂 저장된 백테스트 결과 ({len(runs)}개)", show_header=True, header_style="bold cyan")
+        table.add_column("#", justify="right")
+        table.add_column("심볼")
+        table.add_column("타임프레임")
+        table.add_column("기간")
+        table.add_column("총 수익률", justify="right")
+        table.add_column("최대 DD", justify="right")
+        table.add_column("거래", justify="right")
+        table.add_column("저장 시각", style="dim")
+        
+        for i, run in enumerate(shown, 1):
+            return_color = "green" if run['total_return'] >= 0 else "red"
+            table.add_row(
+                str(i), run['symbol'], run['timeframe'],
+                f"{run['start_date']} ~ {run['end_date']}",
+                f"[{return_color}]{run['total_return']:+.2%}[/{return_color}]",
+                f"{run['max_drawdown']:.2%}",
+                str(run['total_trades']),
+                run['created_at']
+            )
+        self.console.print(table)
         
-        if os.path.exists(results_dir):
-            files = [f for f in os.listdir(results_dir) if f.endswith('.json')]
+        choice = Prompt.ask("\n[bold]조회할 결과 번호 (비교: 1,3,5 또는 all, 엔터: 돌아가기)[/bold]", default="")
+        if choice.strip().lower() == 'all' or ',' in choice:
+            self._compare_runs(runs if choice.strip().lower() == 'all' else
+                               [shown[int(c) - 1] for c in choice.split(',')
+                                if c.strip().isdigit() and 1 <= int(c) <= len(shown)])
+            return
+        if not choice.isdigit() or not 1 <= int(choice) <= len(shown):
+            return
+        
+        results = BacktestResultsManager.load_run(shown[int(choice) - 1]['run_id'])
+        if results is None:
+            self.console.print("[red]결과를 불러올 수 없습니다.[/red]")
+            self.console.input("[dim]엔터를 눌러 계속하세요...[/dim]")
+            return
+        
+        while True:
+            action = self.backtest_results.display_results(results)
             
-            if files:
-                self.console.print(f"\n[cyan]백테스트 결과 파일 ({len(files)}개):[/cyan]")
-                for i, file in enumerate(files[:10], 1):  # 최근 10개만 표시
-                    self.console.print(f"  {i}. {file}")
-                
-                if len(files) > 10:
-                    self.console.print(f"  ... 및 {len(files) - 10}개 더")
+            if action == '1':  # 상세 분석
+                self.backtest_results.show_detailed_analysis(results)
+            elif action == '2':  # 전체 거래 내역
+                self.backtest_results.show_all_trades(results)
+            elif action == '3':  # 롱/숏 상세 거래 분석
+                self.backtest_results.show_detailed_trade_analysis(results)
+            elif action == '4':  # 차트 생성
+                self._create_backtest_chart(results)
+            elif action == '5':  # CSV 내보내기
+                self.backtest_results.export_results(results)
             else:
-                self.console.print("[dim]저장된 백테스트 결과가 없습니다.[/dim]")
-        else:
-            self.console.print("[dim]백테스트 결과 디렉토리가 없습니다.[/dim]")
-        
+                break
+    
+    def _compare_runs(self, runs: List[Dict[str, Any]]):
+        """선택한 실행들의 순위 비교표 (자산 곡선만 로드)"""
+        if len(runs) < 2:
+            self.console.print("[dim]비교하려면 두 개 이상의 실행을 선택하세요.[/dim]")
+            self.console.input("[dim]엔터를 눌러 계속하세요...[/dim]")
+            return
+        comparison = BacktestResultsManager.compare_runs([run['run_id'] for run in runs])
+        by = Prompt.ask("[bold]순위 기준[/bold]", choices=['sharpe', 'total_return', 'max_drawdown',
+                                                          'information_ratio'], default='sharpe')
+        self.backtest_results.show_run_comparison(comparison, by)
         self.console.input("[dim]엔터를 눌러 계속하세요...[/dim]")
     
     def _handle_settings(self):
@@ -0,0 +1,453 @@
+"""
+백테스트 시뮬레이션 코어
+두 BacktestEngine 진입점이 공유하는 단일 심볼 터틀 시뮬레이션 루프와 포트폴리오/성과 계산
+"""
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from config import TradingConfig
+from strategy.costs import CommissionModel
+from strategy.futures import FuturesAccount
+from strategy.turtle_strategy import TurtleStrategy, PriceData, TradeResult
+from utils.profiling import NULL_PROFILER
+from utils.timeaxis import bucket_labels, to_ms_array
+
+
+def start_index(timeframe: str, n_bars: int) -> int:
+    """시뮬레이션 시작 봉 (ATR 기간만큼 건너뛰되 데이터의 10%를 넘지 않음)"""
+    return min(TradingConfig.get_atr_period(timeframe), max(1, n_bars // 10))
+
+
+def portfolio_value(strategy: TurtleStrategy, balance: float, current_price: float) -> float:
+    """포트폴리오 총 가치 (잔고 + 미실현 손익)"""
+    total_value = balance
+    for symbol in strategy.positions:
+        total_value += strategy.calculate_unrealized_pnl(symbol, current_price)
+    return total_value
+
+
+def used_margin(strategy: TurtleStrategy, leverage: float = 1.0) -> float:
+    """사용 마진 (레버리지가 높을수록 필요 마진 감소, 리스크 엔진의 누적 진입 금액 사용)"""
+    return strategy.risk.notional / leverage
+
+
+def can_add_position(strategy: TurtleStrategy, balance: float, leverage: float = 1.0) -> bool:
+    """마진 비율이 임계값 미만이고 가용 마진이 남아 있는지 여부"""
+    margin = used_margin(strategy, leverage)
+    margin_ratio = margin / balance if balance > 0 else 0
+    return margin_ratio < TradingConfig.MARGIN_RATIO_THRESHOLD and balance - margin > 0
+
+
+def _rolling_prior(values: np.ndarray, period: int, reducer) -> List[float]:
+    """i번째 값 = values[i-period:i] 구간 집계 (현재 봉 제외, 부족하면 NaN)"""
+    n = len(values)
+    out = np.full(n, np.nan)
+    if n > period:
+        out[period:] = reducer(sliding_window_view(values, period), axis=1)[:n - period]
+    return out.tolist()
+
+
+class SimulationCore:
+    """터틀 시뮬레이션 코어
+
+    봉 데이터를 한 번 배열로 변환하고 돌파 채널(직전 N봉 최고가/최저가)과 True Range를
+    미리 계산해 두어, 봉마다 전체 이력을 잘라 지표를 다시 계산하지 않는다.
+    최고/최저는 정확한 연산이라 벡터화해도 결과가 같고, ATR은 기존과 같은 순서로 합산하여
+    TurtleStrategy 슬라이스 기반 계산과 동일한 거래를 만든다.
+    진입/청산 실행, 유닛 사이징, 손절, 피라미딩 판단은 TurtleStrategy에 그대로 위임한다.
+
+    futures를 주면 봉마다 청산/손절 판단 전에 펀딩비(봉 시작 시각 기준, 직전 종가 가격)를 정산하고
+    봉 고가/저가로 격리 마진 강제청산을 판정한다. 봉별 펀딩비와 고가/저가는 배열 로드 시 미리 만든다.
+
+    체결가와 수수료는 비용 모델(costs, 기본은 commission_rate 수수료만)이 정하며, 모델의 봉별 계수는
+    배열 로드 시 고가/저가/종가/거래량으로 미리 계산한다.
+
+    price_data 없이 생성하면 extend()로 구간을 이어 붙이는 스트리밍 모드가 된다. 이때는 지표에
+    필요한 최근 window개 봉만 유지하므로 메모리가 전체 이력 길이와 무관하다.
+    step(i)의 i는 항상 전체 이력 기준 인덱스이며, 보관 중인 배열의 위치는 i - base이다.
+    """
+
+    def __init__(self, strategy: TurtleStrategy, price_data: Optional[List[PriceData]], symbol: str,
+                 timeframe: str = '1d', systems: Optional[List[int]] = None,
+                 initial_balance: float = 10000.0, commission_rate: float = 0.0004,
+                 leverage: float = 1.0, profiler=NULL_PROFILER,
+                 futures: Optional[FuturesAccount] = None, costs: Optional[CommissionModel] = None):
+        self.strategy = strategy
+        self.price_data = price_data
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.systems = systems or [1, 2]
+        self.commission_rate = commission_rate
+        self.leverage = leverage
+        self.profiler = profiler
+        self.futures = futures
+        self.costs = costs or CommissionModel(commission_rate)
+        self.atr_period = TradingConfig.get_atr_period(timeframe)
+
+        # 시스템별 진입/청산 돌파 기간과 지표 계산에 필요한 최대 봉 수
+        self.periods = sorted({strategy.entry_period(s, timeframe) for s in (1, 2)} |
+                              {strategy.exit_period(s, timeframe) for s in (1, 2)})
+        self.window = max(self.periods[-1], self.atr_period, self.costs.window) + 1
+        self.base = 0          # 보관 배열 0번째 봉의 전체 인덱스
+        self.bars_seen = 0     # 지금까지 로드한 전체 봉 수
+        self._tail = None      # 스트리밍 시 다음 구간에 이어 붙일 최근 봉 배열
+
+        # 시뮬레이션 상태
+        self.balance = initial_balance
+        self.prev_value = initial_balance
+        self.equity_curve: List[Dict[str, Any]] = []
+        self.daily_returns: List[float] = []
+
+        self._prepare(price_data or [])
+
+    def _prepare(self, price_data: List[PriceData]):
+        """PriceData 리스트를 배열로 변환하여 로드"""
+        n = len(price_data)
+        self._load_arrays(
+            to_ms_array([p.date for p in price_data]),
+            np.fromiter((p.high for p in price_data), dtype=np.float64, count=n),
+            np.fromiter((p.low for p in price_data), dtype=np.float64, count=n),
+            np.fromiter((p.close for p in price_data), dtype=np.float64, count=n),
+            np.fromiter((p.volume for p in price_data), dtype=np.float64, count=n),
+        )
+        self.bars_seen = n
+
+    def extend(self, times: np.ndarray, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray,
+               volumes: Optional[np.ndarray] = None) -> range:
+        """다음 구간 봉(시작 시각 epoch ms)을 이어 붙이고 새 봉의 전체 인덱스 범위 반환 (직전 window개 봉만 유지)"""
+        if volumes is None:
+            volumes = np.zeros(len(closes))
+        first = self.bars_seen
+        tail_len = 0
+        if self._tail is not None:
+            tail_len = len(self._tail[-1])
+            times, highs, lows, closes, volumes = (np.concatenate([tail, new]) for tail, new in
+                                                   zip(self._tail, (times, highs, lows, closes, volumes)))
+        self.base = first - tail_len
+        self.bars_seen = self.base + len(closes)
+        self._load_arrays(times, highs, lows, closes, volumes)
+        keep = slice(-self.window, None)
+        self._tail = tuple(array[keep].copy() for array in (times, highs, lows, closes, volumes))
+        return range(first, self.bars_seen)
+
+    def _load_arrays(self, times: np.ndarray, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray,
+                     volumes: np.ndarray):
+        """가격 배열, True Range, 돌파 채널, 비용 모델 계수 사전 계산"""
+        n = len(closes)
+        self.closes = closes.tolist()
+        self.costs.prepare(highs, lows, closes, volumes)
+
+        # True Range (0번째 봉은 이전 종가가 없어 사용하지 않음)
+        tr = np.zeros(n)
+        if n > 1:
+            prev_close = closes[:-1]
+            tr[1:] = np.maximum(np.maximum(highs[1:] - lows[1:], np.abs(highs[1:] - prev_close)),
+                                np.abs(lows[1:] - prev_close))
+        self.true_ranges = tr.tolist()
+
+        # 봉 시작 시각 (epoch ms, 자산 곡선/거래 시각용)
+        self.times = np.asarray(times, dtype=np.int64).tolist()
+
+        # 선물 회계용 봉 고가/저가와 봉별 펀딩비 합계
+        if self.futures is not None:
+            self.highs = highs.tolist()
+            self.lows = lows.tolist()
+            self.funding = self.futures.bar_funding(times, self.timeframe).tolist()
+
+        # 시스템별 진입/청산 기간의 돌파 채널
+        self.highest = {p: _rolling_prior(highs, p, np.max) for p in self.periods}
+        self.lowest = {p: _rolling_prior(lows, p, np.min) for p in self.periods}
+
+    # 지표
+    def atr(self, i: int, period: int) -> float:
+        """i번째 봉 기준 최근 period개 True Range 평균"""
+        j = i - self.base
+        return sum(self.true_ranges[j - period + 1:j + 1]) / period
+
+    def breakout(self, i: int, period: int, direction: str) -> bool:
+        """i번째 봉 종가의 직전 period봉 돌파 여부"""
+        if i < period:
+            return False
+        j = i - self.base
+        if direction == "LONG":
+            return self.closes[j] > self.highest[period][j]
+        return self.closes[j] < self.lowest[period][j]
+
+    def entry_signal(self, i: int, system: int, direction: str) -> bool:
+        """진입 신호 (시스템 1 손실 후 필터 포함)"""
+        if system == 1:
+            signal = self.breakout(i, self.strategy.entry_period(1, self.timeframe), direction)
+            if self.strategy.config.SYSTEM_1['USE_FILTER']:
+                signal = signal and not self.strategy.last_trade_results.get(self.symbol, False)
+        elif system == 2:
+            signal = self.breakout(i, self.strategy.entry_period(2, self.timeframe), direction)
+        else:
+            return False
+        # 상위 타임프레임 채널 확인 (컨텍스트 설정 시)
+        return signal and self.strategy.confirm_higher_timeframe(i, system, direction, self.closes[i - self.base])
+
+    def entry_atr(self, i: int, period: int) -> float:
+        """진입/피라미딩에 사용할 ATR (상위 타임프레임 ATR 설정 시 우선)"""
+        atr = self.strategy.higher_timeframe_atr(i)
+        return atr if atr is not None else self.atr(i, period)
+
+    def exit_signal(self, i: int, position) -> bool:
+        """반대 방향 돌파 청산 신호"""
+        if not position.units:
+            return False
+        period = self.strategy.exit_period(position.units[0].system, self.timeframe)
+        return self.breakout(i, period, "SHORT" if position.direction == "LONG" else "LONG")
+
+    # 포트폴리오
+    def portfolio_value(self, current_price: float) -> float:
+        return portfolio_value(self.strategy, self.balance, current_price)
+
+    def can_add_position(self) -> bool:
+        return can_add_position(self.strategy, self.balance, self.leverage)
+
+    def apply_commission(self, trade_value: float):
+        self.balance -= self.costs.fee(trade_value)
+
+    def exit_position(self, j: int, symbol: str, price: float, reason: str):
+        """비용 모델 체결가로 포지션 청산 후 손익/수수료 반영"""
+        position = self.strategy.positions[symbol]
+        fill = self.costs.fill_price(j, price, position.total_size, -1 if position.direction == "LONG" else 1)
+        trade_result = self.strategy.execute_exit(symbol, fill, reason, self.balance, self.leverage)
+        if trade_result:
+            self.profiler.count('exits')
+            self.balance += trade_result.pnl
+            self.apply_commission(trade_result.size * trade_result.exit_price)
+        return trade_result
+
+    def enter(self, j: int, symbol: str, direction: str, price: float, atr: float, system: int):
+        """신호 가격으로 유닛 수량을 정하고 비용 모델 체결가로 진입 후 수수료 반영"""
+        strategy = self.strategy
+        size = strategy.calculate_unit_size(symbol, self.balance, atr, price, self.leverage)
+        fill = self.costs.fill_price(j, price, size, 1 if direction == "LONG" else -1)
+        unit = strategy.execute_entry(symbol, direction, fill, atr, self.balance, system, self.leverage, size=size)
+        if unit:
+            self.apply_commission(unit.size * fill)
+        return unit
+
+    def settle_futures(self, j: int):
+        """보관 배열 j번째 봉의 펀딩비 정산과 봉 내 강제청산"""
+        futures = self.futures
+        strategy = self.strategy
+        rate = self.funding[j]
+        for symbol, position in list(strategy.positions.items()):
+            if rate:
+                self.balance -= futures.funding(position, rate, self.closes[j - 1] if j else self.closes[j])
+            price = futures.liquidated(position, self.highs[j], self.lows[j])
+            if price is None:
+                continue
+            trade_result = strategy.execute_exit(symbol, price, 'LIQUIDATION', self.balance, self.leverage)
+            if trade_result:
+                self.profiler.count('liquidations')
+                self.balance += trade_result.pnl
+                self.balance -= futures.on_liquidation(position, trade_result.pnl)
+
+    # 시뮬레이션
+    def step(self, i: int) -> bool:
+        """i번째 봉 처리 (ATR 계산에 필요한 데이터가 부족해 건너뛰면 False)"""
+        profiler = self.profiler
+        strategy = self.strategy
+
+        profiler.switch('indicators')
+        atr_period = min(self.atr_period, i)
+        if atr_period < 2:
+            return False
+        j = i - self.base
+        current_price = self.closes[j]
+        strategy.clock = self.times[j]
+
+        # 펀딩비/강제청산 (봉 시작부터 종가 전까지의 사건)
+        if self.futures is not None and strategy.positions:
+            profiler.switch('futures')
+            self.settle_futures(j)
+
+        # 포트폴리오 가치 및 수익률
+        profiler.switch('equity')
+        value = self.portfolio_value(current_price)
+        self.equity_curve.append({'date': self.times[j], 'total_value': value})
+        if self.prev_value > 0:
+            self.daily_returns.append((value - self.prev_value) / self.prev_value)
+        self.prev_value = value
+
+        # 청산 신호 확인 (먼저 처리)
+        profiler.switch('signal_checks')
+        positions_to_close = []
+        for symbol, position in strategy.positions.items():
+            profiler.count('exit_checks')
+            if strategy.check_stop_loss(position, current_price):
+                positions_to_close.append((symbol, 'STOP_LOSS'))
+            elif self.exit_signal(i, position):
+                positions_to_close.append((symbol, 'SIGNAL'))
+
+        profiler.switch('exits')
+        for symbol, reason in positions_to_close:
+            self.exit_position(j, symbol, current_price, reason)
+
+        # 진입 신호 확인 (새로운 포지션)
+        symbol = self.symbol
+        if not strategy.has_position(symbol) and self.can_add_position():
+            for system in self.systems:
+                entered = False
+                for direction in ("LONG", "SHORT"):
+                    profiler.switch('signal_checks')
+                    profiler.count('entry_checks')
+                    if not self.entry_signal(i, system, direction):
+                        continue
+                    atr = self.entry_atr(i, atr_period)
+                    if not strategy.can_add_unit(symbol, direction, current_price, atr, self.balance, self.leverage):
+                        continue
+                    profiler.switch('entries')
+                    if self.enter(j, symbol, direction, current_price, atr, system):
+                        profiler.count('entries')
+                        entered = True
+                        break
+                if entered:
+                    break
+
+        # 피라미딩 신호 확인
+        elif strategy.has_position(symbol):
+            profiler.switch('signal_checks')
+            position = strategy.get_position(symbol)
+            atr = self.entry_atr(i, atr_period)
+            if strategy.check_pyramid_signal(position, current_price, atr) and \
+                    strategy.can_add_unit(symbol, position.direction, current_price, atr, self.balance, self.leverage):
+                profiler.switch('pyramiding')
+                if self.enter(j, symbol, position.direction, current_price, atr, position.units[0].system):
+                    profiler.count('pyramids')
+        return True
+
+    def close_all(self, reason: str = 'BACKTEST_END'):
+        """남은 포지션을 마지막 종가로 모두 청산"""
+        if not self.closes:
+            return
+        final_price = self.closes[-1]
+        for symbol in list(self.strategy.positions.keys()):
+            self.exit_position(len(self.closes) - 1, symbol, final_price, reason)
+
+    def run(self, start: Optional[int] = None, stop: Optional[int] = None):
+        """구간 전체 실행 (진행률/체크포인트 훅이 필요 없는 호출용)"""
+        start = start_index(self.timeframe, self.bars_seen) if start is None else start
+        stop = self.bars_seen if stop is None else stop
+        for i in range(start, stop):
+            self.step(i)
+        self.close_all()
+
+
+def drawdown_curve(equity_curve: List[Any], initial_balance: float) -> List[float]:
+    """고점 대비 하락률 곡선 (초기 자금을 첫 고점으로 사용)"""
+    curve = []
+    peak = initial_balance
+    for point in equity_curve:
+        value = point['total_value'] if isinstance(point, dict) else point
+        if value > peak:
+            peak = value
+        curve.append((peak - value) / peak)
+    return curve
+
+
+def monthly_returns(equity_curve: List[Dict[str, Any]]) -> Dict[str, float]:
+    """월별 수익률 (각 월 첫 포인트 대비 마지막 포인트)"""
+    if not equity_curve:
+        return {}
+    times = to_ms_array([point['date'] for point in equity_curve])
+    values = np.fromiter((point['total_value'] for point in equity_curve), dtype=np.float64,
+                         count=len(equity_curve))
+    months = times.astype('datetime64[ms]').astype('datetime64[M]')
+
+    # 월이 바뀌는 위치로 구간을 나누어 첫/마지막 값을 한 번에 추출
+    starts = np.concatenate([[0], np.flatnonzero(months[1:] != months[:-1]) + 1])
+    ends = np.concatenate([starts[1:], [len(values)]]) - 1
+    labels = bucket_labels(times[starts], 'M')
+    first, last = values[starts].tolist(), values[ends].tolist()
+    return {label: (end - start) / start for label, start, end in zip(labels, first, last) if start}
+
+
+def calculate_performance_metrics(trades: List[TradeResult], equity_curve: List[Any],
+                                  daily_returns: List[float], initial_balance: float) -> Dict[str, Any]:
+    """거래 내역과 자산 곡선으로 성과 지표 계산 (PerformanceMetrics 인자 딕셔너리)"""
+    if not trades:
+        return {}
+
+    winning_trades = [t for t in trades if t.pnl > 0]
+    losing_trades = [t for t in trades if t.pnl <= 0]
+
+    total_pnl = sum(t.pnl for t in trades)
+    total_return = total_pnl / initial_balance
+    win_rate = len(winning_trades) / len(trades)
+
+    avg_win = sum(t.pnl for t in winning_trades) / len(winning_trades) if winning_trades else 0
+    avg_loss = sum(t.pnl for t in losing_trades) / len(losing_trades) if losing_trades else 0
+
+    # 수익 팩터
+    gross_profit = sum(t.pnl for t in winning_trades)
+    gross_loss = abs(sum(t.pnl for t in losing_trades))
+    profit_factor = gross_profit / gross_loss if gross_loss > 0 else 0
+
+    # 최대 드로다운 (첫 포인트를 첫 고점으로 사용)
+    max_drawdown = 0.0
+    if equity_curve:
+        values = [p['total_value'] if isinstance(p, dict) else p for p in equity_curve]
+        max_drawdown = max(drawdown_curve(values, values[0]))
+
+    # 연환산 수익률 (단순 계산, 1년 데이터라고 가정)
+    annualized_return = total_return
+
+    # 샤프 비율 (간단한 계산)
+    if len(daily_returns) > 1:
+        returns_std = np.std(daily_returns) * np.sqrt(252)  # 연환산 변동성
+        sharpe_ratio = annualized_return / returns_std if returns_std > 0 else 0
+    else:
+        sharpe_ratio = 0
+
+    # 롱/숏 거래 분석
+    long_trades = [t for t in trades if t.direction == "LONG"]
+    short_trades = [t for t in trades if t.direction == "SHORT"]
+    long_win_rate = len([t for t in long_trades if t.pnl > 0]) / len(long_trades) if long_trades else 0
+    short_win_rate = len([t for t in short_trades if t.pnl > 0]) / len(short_trades) if short_trades else 0
+
+    # 연속 승/패 계산
+    max_consecutive_wins = max_consecutive_losses = 0
+    current_wins = current_losses = 0
+    for trade in trades:
+        if trade.pnl > 0:
+            current_wins += 1
+            current_losses = 0
+            max_consecutive_wins = max(max_consecutive_wins, current_wins)
+        else:
+            current_losses += 1
+            current_wins = 0
+            max_consecutive_losses = max(max_consecutive_losses, current_losses)
+
+    # 평균 거래 기간
+    trade_durations = [(t.exit_date - t.entry_date).days for t in trades]
+    avg_trade_duration = sum(trade_durations) / len(trade_durations)
+
+    return {
+        'total_return': total_return,
+        'annualized_return': annualized_return,
+        'max_drawdown': max_drawdown,
+        'sharpe_ratio': sharpe_ratio,
+        'win_rate': win_rate,
+        'profit_factor': profit_factor,
+        'total_trades': len(trades),
+        'winning_trades': len(winning_trades),
+        'losing_trades': len(losing_trades),
+        'avg_win': avg_win,
+        'avg_loss': avg_loss,
+        'largest_win': max(t.pnl for t in trades),
+        'largest_loss': min(t.pnl for t in trades),
+        'avg_trade_duration': avg_trade_duration,
+        'long_trades': len(long_trades),
+        'short_trades': len(short_trades),
+        'long_win_rate': long_win_rate,
+        'short_win_rate': short_win_rate,
+        'max_consecutive_wins': max_consecutive_wins,
+        'max_consecutive_losses': max_consecutive_losses,
+    }
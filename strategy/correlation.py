@@ -0,0 +1,162 @@
+"""
+롤링 상관관계 서비스
+거래 종목 전체의 봉 수익률 상관행렬을 순위 1 갱신으로 유지하고, 임계값 이상으로 연결된 종목을 연관 그룹으로 묶음
+"""
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from config import TradingConfig
+
+
+class CorrelationService:
+    """종목 간 롤링 수익률 상관관계
+
+    같은 봉 시각의 종가가 모두 모이면(또는 다음 시각 봉이 도착하면) 로그 수익률 벡터 r 한 행을 확정하고,
+    최근 window행의 합 s와 교차곱 행렬 S = Σ r rᵀ를 새 행 추가/가장 오래된 행 제거의 순위 1 갱신 두 번
+    (n×2 @ 2×n 행렬곱 한 번)으로 갱신한다. 봉당 비용은 O(n²) 배열 연산 한 번이고, 부동소수 누적 오차는
+    window행마다 보관 중인 행으로 다시 계산하여 없앤다. 해당 시각 봉이 없는 종목의 수익률은 0으로 둔다.
+
+    groups()는 상관계수가 threshold 이상인 종목 쌍을 이어 연결 요소(단일 연결)로 묶은 연관 그룹이며,
+    RiskEngine.set_groups()에 그대로 넘길 수 있다.
+    """
+
+    def __init__(self, symbols: List[str], window: int = TradingConfig.CORRELATION_WINDOW,
+                 threshold: float = TradingConfig.CORRELATION_THRESHOLD,
+                 min_rows: int = TradingConfig.CORRELATION_MIN_BARS):
+        self.symbols = list(symbols)
+        self.index = {symbol: k for k, symbol in enumerate(self.symbols)}
+        self.window = window
+        self.threshold = threshold
+        self.min_rows = min(min_rows, window)
+        n = len(self.symbols)
+
+        self._rows = np.zeros((window, n), dtype=np.float64)  # 수익률 링 버퍼
+        self._sum = np.zeros(n, dtype=np.float64)
+        self._cross = np.zeros((n, n), dtype=np.float64)
+        self.count = 0           # 확정한 전체 행 수
+        self._last_close = np.full(n, np.nan)
+
+        # 조립 중인 행 (같은 봉 시각의 종가)
+        self._pending_time: Optional[int] = None
+        self._pending = np.full(n, np.nan)
+        self._reported = 0
+
+    def update(self, symbol: str, open_time: int, close: float) -> bool:
+        """종목의 마감 봉 종가 반영 (행을 추가했으면 True, 이미 지난 시각의 봉은 무시)"""
+        k = self.index.get(symbol)
+        if k is None or (self._pending_time is not None and open_time < self._pending_time):
+            return False
+        count = self.count
+        if self._pending_time is not None and open_time > self._pending_time and self._reported:
+            self._finalize()
+        self._pending_time = open_time
+        if np.isnan(self._pending[k]):
+            self._reported += 1
+        self._pending[k] = close
+        if self._reported == len(self.symbols):
+            self._finalize()
+        return self.count > count
+
+    def _finalize(self):
+        """조립 중인 종가 행을 수익률 행으로 확정"""
+        closes = self._pending
+        valid = ~np.isnan(closes) & ~np.isnan(self._last_close)
+        returns = np.zeros(len(closes))
+        returns[valid] = np.log(closes[valid] / self._last_close[valid])
+        np.copyto(self._last_close, closes, where=~np.isnan(closes))
+        self._pending = np.full(len(closes), np.nan)
+        self._reported = 0
+        if valid.any():  # 첫 행은 이전 종가가 없어 수익률 행이 아님
+            self.push(returns)
+
+    def push(self, returns: np.ndarray):
+        """수익률 벡터 한 행 추가 (가장 오래된 행 제거)"""
+        slot = self.count % self.window
+        old = self._rows[slot].copy()
+        self._rows[slot] = returns
+        if self.count >= self.window:
+            self._sum += returns - old
+            factors = np.stack([returns, old])
+            signed = factors * np.array([[1.0], [-1.0]])
+            self._cross += factors.T @ signed
+        else:
+            self._sum += returns
+            self._cross += np.outer(returns, returns)
+        self.count += 1
+        if self.count % self.window == 0:
+            self._recompute()
+
+    def _recompute(self):
+        """보관 중인 행으로 합/교차곱을 다시 계산 (누적 오차 제거)"""
+        rows = self._rows[:min(self.count, self.window)]
+        self._sum = rows.sum(axis=0)
+        self._cross = rows.T @ rows
+
+    @property
+    def ready(self) -> bool:
+        return self.count >= self.min_rows
+
+    def matrix(self) -> np.ndarray:
+        """현재 창의 상관계수 행렬 (변동이 없는 종목은 다른 종목과 0, 대각선은 1)"""
+        k = min(self.count, self.window)
+        n = len(self.symbols)
+        if k < 2:
+            return np.eye(n)
+        mean = self._sum / k
+        cov = self._cross / k - np.outer(mean, mean)
+        sd = np.sqrt(np.clip(np.diag(cov), 0.0, None))
+        scale = np.outer(sd, sd)
+        corr = np.divide(cov, scale, out=np.zeros_like(cov), where=scale > 1e-18)
+        np.clip(corr, -1.0, 1.0, out=corr)
+        np.fill_diagonal(corr, 1.0)
+        return corr
+
+    def clusters(self, threshold: Optional[float] = None) -> List[List[str]]:
+        """상관계수 threshold 이상으로 연결된 종목 묶음 (2종목 이상, 입력 종목 순서)"""
+        threshold = self.threshold if threshold is None else threshold
+        n = len(self.symbols)
+        parent = list(range(n))
+
+        def find(a: int) -> int:
+            while parent[a] != a:
+                parent[a] = parent[parent[a]]
+                a = parent[a]
+            return a
+
+        rows, cols = np.nonzero(np.triu(self.matrix() >= threshold, k=1))
+        for a, b in zip(rows.tolist(), cols.tolist()):
+            ra, rb = find(a), find(b)
+            if ra != rb:
+                parent[max(ra, rb)] = min(ra, rb)
+
+        members: Dict[int, List[str]] = {}
+        for k in range(n):
+            members.setdefault(find(k), []).append(self.symbols[k])
+        return [group for root, group in sorted(members.items()) if len(group) > 1]
+
+    def groups(self, threshold: Optional[float] = None) -> Optional[Dict[str, List[str]]]:
+        """RiskEngine 연관 그룹 (그룹 -> 종목 목록, 표본이 부족하면 None)"""
+        if not self.ready:
+            return None
+        return {f"corr:{group[0]}": group for group in self.clusters(threshold)}
+
+    # 상태 저장/복원
+    def get_state(self) -> Dict[str, Any]:
+        return {'symbols': self.symbols, 'window': self.window, 'rows': self._rows.copy(), 'count': self.count,
+                'last_close': self._last_close.copy(), 'pending_time': self._pending_time,
+                'pending': self._pending.copy()}
+
+    def restore(self, state: Dict[str, Any]) -> bool:
+        """같은 종목/창 크기로 저장된 상태면 복원"""
+        if state.get('symbols') != self.symbols or state.get('window') != self.window:
+            return False
+        self._rows = state['rows'].copy()
+        self.count = state['count']
+        self._last_close = state['last_close'].copy()
+        self._pending_time = state['pending_time']
+        self._pending = state['pending'].copy()
+        self._reported = int((~np.isnan(self._pending)).sum())
+        self._recompute()
+        return True
@@ -0,0 +1,130 @@
+"""
+거래 비용 모델
+수수료(메이커/테이커), 스프레드, 거래량 참여율 기반 시장 충격을 봉 배열로 미리 계산하여 체결마다 배열 조회로 적용
+"""
+
+from typing import Any, Dict
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from config import CostConfig
+
+
+class CommissionModel:
+    """수수료만 부과하는 기본 비용 모델 (체결가 = 신호 가격)
+
+    prepare()는 봉 배열을 받아 봉별 계수를 미리 계산하는 확장 지점이며, fill_price()의
+    j는 SimulationCore 보관 배열 기준 봉 위치, side는 매수 +1 / 매도 -1 이다.
+    """
+
+    name = 'commission'
+    window = 0  # 계수 계산에 필요한 직전 봉 수
+
+    def __init__(self, commission_rate: float = CostConfig.TAKER_FEE_RATE,
+                 maker_rate: float = CostConfig.MAKER_FEE_RATE):
+        self.taker_rate = commission_rate
+        self.maker_rate = maker_rate
+        self.fees = 0.0
+        self.slippage = 0.0  # 누적 슬리피지 비용 (신호 가격 대비 불리한 체결 금액)
+
+    def prepare(self, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, volumes: np.ndarray):
+        """봉 배열 로드 시 호출"""
+
+    def fill_price(self, j: int, price: float, size: float, side: int) -> float:
+        return price
+
+    def fee(self, trade_value: float, maker: bool = False) -> float:
+        """체결 금액 수수료 (시장가 주문은 테이커) 기록 후 반환"""
+        fee = trade_value * (self.maker_rate if maker else self.taker_rate)
+        self.fees += fee
+        return fee
+
+    def summary(self) -> Dict[str, Any]:
+        return {'model': self.name, 'fees': self.fees, 'slippage': self.slippage}
+
+    # 상태 저장/복원 (누적 집계만)
+    def get_state(self) -> Dict[str, Any]:
+        return {'fees': self.fees, 'slippage': self.slippage}
+
+    def restore(self, state: Dict[str, Any]):
+        self.fees = state.get('fees', 0.0)
+        self.slippage = state.get('slippage', 0.0)
+
+
+class MarketImpactModel(CommissionModel):
+    """스프레드 + 제곱근 시장 충격 비용 모델
+
+    체결가 = 가격 × (1 + side × min(반 스프레드 + 충격 계수 × √수량, MAX_SLIPPAGE)).
+    봉별 반 스프레드는 봉 범위 (고가 - 저가) / 종가에 SPREAD_RANGE_FRACTION을 곱한 값(하한 MIN_HALF_SPREAD),
+    충격 계수는 IMPACT_COEFFICIENT × σ / √V 로, σ는 최근 VOLUME_WINDOW봉의 Parkinson 변동성
+    ln(고가/저가) / √(4 ln 2) 평균, V는 같은 구간 평균 거래량(기초 자산 수량)이다.
+    거래량이 적은 봉에서 큰 유닛일수록 비싸게 체결되며, 체결마다의 비용은 배열 조회와 제곱근 한 번이다.
+    """
+
+    name = 'impact'
+
+    def __init__(self, commission_rate: float = CostConfig.TAKER_FEE_RATE,
+                 maker_rate: float = CostConfig.MAKER_FEE_RATE,
+                 impact_coefficient: float = CostConfig.IMPACT_COEFFICIENT,
+                 spread_range_fraction: float = CostConfig.SPREAD_RANGE_FRACTION,
+                 min_half_spread: float = CostConfig.MIN_HALF_SPREAD,
+                 max_slippage: float = CostConfig.MAX_SLIPPAGE,
+                 window: int = CostConfig.VOLUME_WINDOW):
+        super().__init__(commission_rate, maker_rate)
+        self.impact_coefficient = impact_coefficient
+        self.spread_range_fraction = spread_range_fraction
+        self.min_half_spread = min_half_spread
+        self.max_slippage = max_slippage
+        self.window = window
+        self.half_spread = []
+        self.impact = []
+
+    def prepare(self, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, volumes: np.ndarray):
+        n = len(closes)
+        if n == 0:
+            self.half_spread, self.impact = [], []
+            return
+        valid = (lows > 0) & (closes > 0)
+        bar_range = np.divide(highs - lows, closes, out=np.zeros(n), where=valid)
+        self.half_spread = np.maximum(self.min_half_spread, self.spread_range_fraction * bar_range).tolist()
+
+        log_range = np.log(np.divide(highs, lows, out=np.ones(n), where=valid))
+        sigma = _trailing_mean(log_range / np.sqrt(4.0 * np.log(2.0)), self.window)
+        volume = _trailing_mean(np.asarray(volumes, dtype=np.float64), self.window)
+        coefficient = np.divide(self.impact_coefficient * sigma, np.sqrt(volume),
+                                out=np.full(n, np.inf), where=volume > 0)
+        self.impact = coefficient.tolist()
+
+    def fill_price(self, j: int, price: float, size: float, side: int) -> float:
+        slip = min(self.half_spread[j] + self.impact[j] * size ** 0.5, self.max_slippage)
+        self.slippage += price * slip * size
+        return price * (1.0 + side * slip)
+
+
+def _trailing_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """현재 봉 포함 최근 window개 평균 (앞부분은 있는 봉만으로 평균)
+
+    창마다 같은 값을 같은 순서로 합산하므로 배열을 어디서 잘라 이어 붙여도 결과가 같다.
+    """
+    n = len(values)
+    out = np.empty(n)
+    head = min(window - 1, n)
+    out[:head] = np.cumsum(values[:head]) / np.arange(1, head + 1)
+    if n >= window:
+        out[head:] = sliding_window_view(values, window).mean(axis=1)
+    return out
+
+
+COST_MODELS = {
+    CommissionModel.name: CommissionModel,
+    MarketImpactModel.name: MarketImpactModel,
+}
+
+
+def cost_model_for(config: Any) -> CommissionModel:
+    """백테스트 설정의 비용 모델 (cost_model 이름, 수수료율은 테이커 수수료로 사용)"""
+    name = getattr(config, 'cost_model', None) or CommissionModel.name
+    if name not in COST_MODELS:
+        raise ValueError(f"지원하지 않는 비용 모델: {name} (가능: {', '.join(COST_MODELS)})")
+    return COST_MODELS[name](getattr(config, 'commission_rate', CostConfig.TAKER_FEE_RATE))
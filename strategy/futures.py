@@ -0,0 +1,177 @@
+"""
+선물 계좌 시뮬레이션
+격리 마진 기준 포지션별 청산가, 봉 내 고가/저가 강제청산 판정, 8시간 펀딩비를 봉 배열 단위로 계산
+"""
+
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from config import FuturesConfig
+from utils.funding_store import FundingRateStore
+from utils.resampler import bucket_ends
+from utils.timeaxis import HOUR_MS
+
+
+def maintenance_brackets(brackets: Sequence[Tuple[float, float]]) -> np.ndarray:
+    """(명목 상한, 유지 증거금률) 단계에 누적 공제액을 붙인 (n, 3) 배열
+
+    단계별 유지 증거금 = 명목 × 증거금률 - 공제액 이며, 공제액은 단계 경계에서 유지 증거금이
+    연속이 되도록 앞 단계들로부터 누적한다 (바이낸스 maintenance amount와 같음).
+    """
+    table = np.zeros((len(brackets), 3), dtype=np.float64)
+    amount = 0.0
+    prev_cap, prev_rate = 0.0, 0.0
+    for k, (cap, rate) in enumerate(brackets):
+        amount += prev_cap * (rate - prev_rate)
+        table[k] = (cap, rate, amount)
+        prev_cap, prev_rate = cap, rate
+    return table
+
+
+def liquidation_price(direction: str, entry_price: float, size: float, margin: float,
+                      mm_rate: float, mm_amount: float = 0.0) -> float:
+    """격리 마진 청산가 (마진 + 미실현 손익 = 유지 증거금이 되는 가격, 롱은 0 이상)
+
+    롱: P = (E·Q - M - cum) / (Q·(1 - mmr)),  숏: P = (E·Q + M + cum) / (Q·(1 + mmr))
+    """
+    if size <= 0:
+        return 0.0 if direction == "LONG" else float('inf')
+    notional = entry_price * size
+    if direction == "LONG":
+        return max(0.0, (notional - margin - mm_amount) / (size * (1.0 - mm_rate)))
+    return (notional + margin + mm_amount) / (size * (1.0 + mm_rate))
+
+
+def funding_schedule(start_ms: int, end_ms: int,
+                     interval_hours: int = FuturesConfig.FUNDING_INTERVAL_HOURS) -> np.ndarray:
+    """구간 [start_ms, end_ms)의 펀딩 시각 (UTC 00시 기준 interval_hours 간격)"""
+    step = interval_hours * HOUR_MS
+    first = -(-start_ms // step) * step
+    return np.arange(first, end_ms, step, dtype=np.int64)
+
+
+def bar_funding(times: np.ndarray, timeframe: str, funding_times: np.ndarray,
+                funding_rates: np.ndarray) -> np.ndarray:
+    """봉별 펀딩비 합계 (봉 구간 [시작, 마감) 안의 펀딩 시각을 searchsorted로 한 번에 매핑)"""
+    times = np.asarray(times, dtype=np.int64)
+    out = np.zeros(len(times), dtype=np.float64)
+    if not len(times) or not len(funding_times):
+        return out
+    index = np.searchsorted(times, funding_times, side='right') - 1
+    valid = index >= 0
+    valid[valid] = funding_times[valid] < bucket_ends(times[index[valid]], timeframe)
+    out += np.bincount(index[valid], weights=funding_rates[valid], minlength=len(times))
+    return out
+
+
+def account_for(config: Any, store: Optional[FundingRateStore] = None) -> Optional['FuturesAccount']:
+    """백테스트 설정의 선물 계좌 (futures 비활성화 시 None, 펀딩비는 저장소의 종목 이력)"""
+    if not getattr(config, 'futures', False):
+        return None
+    funding_times, funding_rates = (store or FundingRateStore()).load(config.symbol)
+    return FuturesAccount(getattr(config, 'leverage', 1.0), funding_times, funding_rates)
+
+
+class FuturesAccount:
+    """격리 마진 선물 계좌 회계
+
+    포지션 마진은 진입 금액 / 레버리지이며, 유지 증거금 단계(FuturesConfig.MAINTENANCE_MARGIN_BRACKETS)는
+    포지션 명목 금액으로 고른다. 청산가는 유닛이 바뀔 때만 다시 계산하여 캐시하므로 봉마다의 판정은
+    고가/저가와의 비교 한 번이다. 펀딩비는 저장된 펀딩 시각/비율 계열을 bar_funding()으로 봉 배열에
+    미리 매핑해 두고, 펀딩 시각이 속한 봉에서 보유 포지션에 명목 금액 × 비율을 부과한다
+    (양수 비율이면 롱이 지불, 숏이 수취).
+
+    강제청산은 청산가로 체결된 것으로 보고, 남은 마진(유지 증거금)은 청산 수수료로 잃는다.
+    따라서 강제청산 한 번의 손실은 포지션 마진과 같다.
+    """
+
+    def __init__(self, leverage: float = 1.0, funding_times: Optional[np.ndarray] = None,
+                 funding_rates: Optional[np.ndarray] = None,
+                 brackets: Sequence[Tuple[float, float]] = FuturesConfig.MAINTENANCE_MARGIN_BRACKETS,
+                 liquidation: bool = FuturesConfig.LIQUIDATION_ENABLED):
+        self.leverage = leverage
+        self.funding_times = np.zeros(0, dtype=np.int64) if funding_times is None else \
+            np.asarray(funding_times, dtype=np.int64)
+        self.funding_rates = np.zeros(0, dtype=np.float64) if funding_rates is None else \
+            np.asarray(funding_rates, dtype=np.float64)
+        self.brackets = maintenance_brackets(brackets)
+        self.liquidation = liquidation
+
+        self.funding_paid = 0.0        # 누적 펀딩비 (양수 = 지불)
+        self.funding_events = 0
+        self.liquidations = 0
+        self.liquidation_fees = 0.0
+        self._liquidation: Dict[str, Tuple[Any, float]] = {}  # 종목 -> (마지막 유닛, 청산가)
+
+    def bar_funding(self, times: np.ndarray, timeframe: str) -> np.ndarray:
+        return bar_funding(times, timeframe, self.funding_times, self.funding_rates)
+
+    # 마진/청산가
+    def margin(self, position: Any) -> float:
+        """포지션 격리 마진"""
+        return position.avg_price * position.total_size / self.leverage
+
+    def maintenance(self, notional: float) -> Tuple[float, float]:
+        """명목 금액의 (유지 증거금률, 공제액)"""
+        k = min(int(np.searchsorted(self.brackets[:, 0], notional, side='left')), len(self.brackets) - 1)
+        return float(self.brackets[k, 1]), float(self.brackets[k, 2])
+
+    def liquidation_price(self, position: Any) -> float:
+        """포지션 청산가 (유닛이 추가될 때만 다시 계산)"""
+        last = position.units[-1]
+        cached = self._liquidation.get(position.symbol)
+        if cached is not None and cached[0] is last:
+            return cached[1]
+        mm_rate, mm_amount = self.maintenance(position.avg_price * position.total_size)
+        price = liquidation_price(position.direction, position.avg_price, position.total_size,
+                                  self.margin(position), mm_rate, mm_amount)
+        self._liquidation[position.symbol] = (last, price)
+        return price
+
+    def liquidated(self, position: Any, high: float, low: float) -> Optional[float]:
+        """봉 고가/저가가 청산가에 닿았으면 청산가, 아니면 None"""
+        if not self.liquidation or not position.units:
+            return None
+        price = self.liquidation_price(position)
+        if position.direction == "LONG":
+            return price if low <= price else None
+        return price if high >= price else None
+
+    def on_liquidation(self, position: Any, pnl: float) -> float:
+        """강제청산 반영 후 잃는 남은 마진(청산 수수료) 반환"""
+        fee = max(0.0, self.margin(position) + pnl)
+        self.liquidations += 1
+        self.liquidation_fees += fee
+        self._liquidation.pop(position.symbol, None)
+        return fee
+
+    # 펀딩
+    def funding(self, position: Any, rate: float, price: float) -> float:
+        """펀딩비 (양수 = 지불) 기록 후 반환"""
+        payment = rate * position.total_size * price
+        if position.direction == "SHORT":
+            payment = -payment
+        self.funding_paid += payment
+        self.funding_events += 1
+        return payment
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'leverage': self.leverage,
+            'funding_paid': self.funding_paid,
+            'funding_events': self.funding_events,
+            'liquidations': self.liquidations,
+            'liquidation_fees': self.liquidation_fees,
+        }
+
+    # 상태 저장/복원 (누적 집계만, 청산가 캐시는 다시 계산)
+    def get_state(self) -> Dict[str, Any]:
+        return {key: value for key, value in self.summary().items() if key != 'leverage'}
+
+    def restore(self, state: Dict[str, Any]):
+        self.funding_paid = state.get('funding_paid', 0.0)
+        self.funding_events = state.get('funding_events', 0)
+        self.liquidations = state.get('liquidations', 0)
+        self.liquidation_fees = state.get('liquidation_fees', 0.0)
+        self._liquidation.clear()
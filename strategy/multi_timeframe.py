@@ -0,0 +1,99 @@
+"""
+멀티 타임프레임 컨텍스트
+하위 타임프레임 봉마다 마감된 상위 타임프레임 봉 인덱스를 미리 매핑하여 상위 돈치안 채널 확인과 ATR을 제공
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from utils.resampler import bucket_ends, resample_columns, timeframe_rank
+
+
+def _rolling_inclusive(values: np.ndarray, period: int, reducer) -> np.ndarray:
+    """j번째 값 = values[j-period+1:j+1] 구간 집계 (부족하면 NaN)"""
+    out = np.full(len(values), np.nan)
+    if len(values) >= period:
+        out[period - 1:] = reducer(sliding_window_view(values, period), axis=1)
+    return out
+
+
+@dataclass
+class MultiTimeframeContext:
+    """상위 타임프레임 지표 배열과 하위 봉 → 상위 봉 인덱스 맵
+
+    index_map[i]는 하위 i번째 봉의 마감 시각까지 마감된 마지막 상위 봉 인덱스이다(없으면 -1).
+    진행 중인 상위 봉은 참조하지 않으므로 미래 데이터를 보지 않으며, 맵은 한 번만 계산되어
+    봉마다 시각을 검색하지 않는다. 채널은 마감된 최근 N개 상위 봉의 최고가/최저가이다.
+    """
+    timeframe: str
+    index_map: np.ndarray
+    highest: Dict[int, np.ndarray]
+    lowest: Dict[int, np.ndarray]
+    atr: np.ndarray
+    confirm_periods: Dict[int, int] = field(default_factory=dict)  # 시스템 -> 상위 채널 기간
+    use_atr: bool = False
+
+    @classmethod
+    def build(cls, base_open_time: np.ndarray, base_timeframe: str, htf: Dict[str, np.ndarray],
+              timeframe: str, confirm_periods: Dict[int, int], atr_period: int,
+              use_atr: bool = False) -> 'MultiTimeframeContext':
+        """하위 봉 시작 시각(ms)과 상위 봉 컬럼으로 컨텍스트 생성"""
+        if timeframe_rank(timeframe) <= timeframe_rank(base_timeframe):
+            raise ValueError(f"상위 타임프레임({timeframe})은 기준 타임프레임({base_timeframe})보다 길어야 합니다.")
+
+        base_close = bucket_ends(base_open_time, base_timeframe)
+        htf_close = bucket_ends(htf['open_time'], timeframe)
+        index_map = np.searchsorted(htf_close, base_close, side='right') - 1
+
+        highs, lows, closes = htf['high'], htf['low'], htf['close']
+        periods = set(confirm_periods.values())
+        highest = {p: _rolling_inclusive(highs, p, np.max) for p in periods}
+        lowest = {p: _rolling_inclusive(lows, p, np.min) for p in periods}
+
+        # True Range 단순 평균 (이전 종가가 필요하므로 1번째 봉부터)
+        atr = np.full(len(closes), np.nan)
+        if len(closes) > atr_period:
+            prev_close = closes[:-1]
+            tr = np.maximum(np.maximum(highs[1:] - lows[1:], np.abs(highs[1:] - prev_close)),
+                            np.abs(lows[1:] - prev_close))
+            atr[atr_period:] = sliding_window_view(tr, atr_period).mean(axis=1)
+
+        return cls(timeframe=timeframe, index_map=index_map, highest=highest, lowest=lowest,
+                   atr=atr, confirm_periods=dict(confirm_periods), use_atr=use_atr)
+
+    def htf_index(self, i: int) -> int:
+        """하위 i번째 봉에서 참조할 상위 봉 인덱스 (-1이면 없음)"""
+        return int(self.index_map[i])
+
+    def confirms(self, i: int, system: int, direction: str, price: float) -> bool:
+        """하위 봉 돌파가 상위 돈치안 채널도 돌파하는지 여부 (상위 이력이 부족하면 False)"""
+        period = self.confirm_periods.get(system)
+        if period is None:
+            return True
+        j = self.index_map[i]
+        if j < 0:
+            return False
+        if direction == "LONG":
+            return price > self.highest[period][j]
+        return price < self.lowest[period][j]
+
+    def atr_at(self, i: int) -> Optional[float]:
+        """하위 i번째 봉에서 사용할 상위 ATR (사용 안 함/부족하면 None)"""
+        if not self.use_atr:
+            return None
+        j = self.index_map[i]
+        if j < 0 or np.isnan(self.atr[j]):
+            return None
+        return float(self.atr[j])
+
+
+def context_from_columns(strategy, columns: Dict[str, np.ndarray], base_timeframe: str, timeframe: str,
+                         systems: Iterable[int], use_atr: bool = False) -> MultiTimeframeContext:
+    """하위 봉 컬럼을 상위 타임프레임으로 리샘플링하여 컨텍스트 생성 (채널 기간은 상위 타임프레임 기준)"""
+    htf = resample_columns(columns, timeframe)
+    confirm_periods = {s: strategy.entry_period(s, timeframe) for s in systems}
+    return MultiTimeframeContext.build(columns['open_time'], base_timeframe, htf, timeframe, confirm_periods,
+                                       strategy.config.get_atr_period(timeframe), use_atr)
@@ -0,0 +1,207 @@
+"""
+포트폴리오 리스크 엔진
+종목/방향/연관 그룹별 유닛 수와 총 리스크, 진입 금액을 체결마다 누적 갱신하여 유닛 추가 가능 여부를 상수 시간에 판단
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from config import TradingConfig
+
+DIRECTIONS = ("LONG", "SHORT")
+_DIRECTION_INDEX = {"LONG": 0, "SHORT": 1}
+
+
+def unit_risk(unit: Any, leverage: float = 1.0) -> float:
+    """유닛 리스크 (진입 시 1N 변동 금액 = 수량 × 손절 거리 / 손절 배수)
+
+    유닛 수량은 레버리지가 곱해진 값이므로 레버리지로 나눠 터틀 규칙의 N 리스크(유닛당 잔고 × RISK_PER_TRADE)로 센다.
+    """
+    return unit.size * abs(unit.entry_price - unit.stop_loss) / TradingConfig.STOP_LOSS_MULTIPLIER / leverage
+
+
+class RiskEngine:
+    """터틀 포트폴리오 유닛 한도 관리
+
+    종목마다 슬롯을 배정하고 슬롯별 유닛 수/방향/연관 그룹/리스크/진입 금액을 numpy 배열에 두며,
+    방향별·(그룹, 방향)별 유닛 수와 총 리스크/진입 금액은 체결마다 누적 갱신한다. 따라서 체결 반영과
+    can_add() 판단은 보유 종목 수와 무관하고, allowed()는 여러 종목의 판단을 배열 연산 한 번으로 한다.
+    아직 체결되지 않은 주문은 reserve()로 한도에 미리 반영하고 종료 시 release()로 되돌린다.
+
+    한도 (TradingConfig):
+    - 종목당 MAX_UNITS_PER_MARKET, 방향별 MAX_UNITS_DIRECTIONAL
+    - 같은 연관 그룹(CORRELATION_GROUPS, 없으면 종목 단독) 같은 방향 MAX_UNITS_CORRELATED
+    - 총 유닛 리스크 합계 ≤ 잔고 × MAX_RISK_TOTAL (리스크는 레버리지를 뺀 N 리스크, unit_risk 참고)
+    """
+
+    def __init__(self, groups: Optional[Dict[str, List[str]]] = None, config=TradingConfig):
+        self.max_units_market = config.MAX_UNITS_PER_MARKET
+        self.max_units_directional = config.MAX_UNITS_DIRECTIONAL
+        self.max_units_correlated = config.MAX_UNITS_CORRELATED
+        self.max_risk_total = config.MAX_RISK_TOTAL
+
+        self.slots: Dict[str, int] = {}
+        capacity = 16
+        self._units = np.zeros(capacity, dtype=np.int32)      # 체결된 유닛 수
+        self._reserved = np.zeros(capacity, dtype=np.int32)   # 미체결 주문 유닛 수
+        self._direction = np.zeros(capacity, dtype=np.int8)   # 체결 유닛 방향 (0: LONG, 1: SHORT)
+        self._cluster = np.zeros(capacity, dtype=np.int32)
+        self._risk = np.zeros(capacity, dtype=np.float64)
+        self._notional = np.zeros(capacity, dtype=np.float64)
+
+        # 누적 집계
+        self.direction_units = np.zeros(2, dtype=np.int64)
+        self.cluster_units = np.zeros((0, 2), dtype=np.int64)
+        self.total_risk = 0.0
+        self.notional = 0.0
+        self.open_units = 0
+        self._reservations: Dict[str, Tuple[int, int, float, float]] = {}
+
+        self.cluster_names: List[str] = []
+        self._cluster_ids: Dict[str, int] = {}
+        self._group_of: Dict[str, str] = {}
+        self.set_groups(config.CORRELATION_GROUPS if groups is None else groups)
+
+    # 연관 그룹
+    def _cluster_id(self, name: str) -> int:
+        cid = self._cluster_ids.get(name)
+        if cid is None:
+            cid = self._cluster_ids[name] = len(self.cluster_names)
+            self.cluster_names.append(name)
+            self.cluster_units = np.vstack([self.cluster_units, np.zeros((1, 2), dtype=np.int64)])
+        return cid
+
+    def set_groups(self, groups: Dict[str, Iterable[str]]):
+        """연관 그룹 교체 (그룹 -> 종목 목록, 그룹에 없는 종목은 단독 그룹) 후 그룹별 유닛 수 재집계"""
+        self._group_of = {symbol: name for name, symbols in groups.items() for symbol in symbols}
+        self.cluster_names = []
+        self._cluster_ids = {}
+        self.cluster_units = np.zeros((0, 2), dtype=np.int64)
+        for symbol, slot in self.slots.items():
+            self._cluster[slot] = self._cluster_id(self._group_of.get(symbol, symbol))
+        n = len(self.slots)
+        if n:
+            np.add.at(self.cluster_units, (self._cluster[:n], self._direction[:n]), self._units[:n])
+        for slot, d, _, _ in self._reservations.values():
+            self.cluster_units[self._cluster[slot], d] += 1
+
+    def group_of(self, symbol: str) -> str:
+        return self._group_of.get(symbol, symbol)
+
+    def _slot(self, symbol: str) -> int:
+        slot = self.slots.get(symbol)
+        if slot is None:
+            slot = self.slots[symbol] = len(self.slots)
+            if slot == len(self._units):
+                for name in ('_units', '_reserved', '_direction', '_cluster', '_risk', '_notional'):
+                    array = getattr(self, name)
+                    setattr(self, name, np.concatenate([array, np.zeros_like(array)]))
+            self._cluster[slot] = self._cluster_id(self.group_of(symbol))
+        return slot
+
+    # 갱신
+    def _add(self, slot: int, d: int, units: int, risk: float, notional: float):
+        self.direction_units[d] += units
+        self.cluster_units[self._cluster[slot], d] += units
+        self.total_risk += risk
+        self.notional += notional
+        self.open_units += units
+        if self.open_units == 0:
+            # 부동소수 누적 오차 제거
+            self.total_risk = 0.0
+            self.notional = 0.0
+
+    def on_entry(self, symbol: str, direction: str, unit: Any, leverage: float = 1.0):
+        """진입/피라미딩 체결 반영"""
+        slot = self._slot(symbol)
+        risk, notional = unit_risk(unit, leverage), unit.size * unit.entry_price
+        self._units[slot] += 1
+        self._risk[slot] += risk
+        self._notional[slot] += notional
+        self._direction[slot] = _DIRECTION_INDEX[direction]
+        self._add(slot, self._direction[slot], 1, risk, notional)
+
+    def on_exit(self, symbol: str):
+        """포지션 전체 청산 반영"""
+        slot = self.slots.get(symbol)
+        if slot is None or not self._units[slot]:
+            return
+        units, risk, notional = int(self._units[slot]), float(self._risk[slot]), float(self._notional[slot])
+        self._units[slot] = 0
+        self._risk[slot] = 0.0
+        self._notional[slot] = 0.0
+        self._add(slot, int(self._direction[slot]), -units, -risk, -notional)
+
+    def set_position(self, symbol: str, position: Optional[Any], leverage: float = 1.0):
+        """종목 상태를 포지션 객체로 교체 (상태 복원용)"""
+        self.on_exit(symbol)
+        if position is not None:
+            for unit in position.units:
+                self.on_entry(symbol, position.direction, unit, leverage)
+
+    def rebuild(self, positions: Dict[str, Any], leverage: float = 1.0):
+        """보유 포지션 전체로 다시 집계 (미체결 예약은 유지)"""
+        for symbol in list(self.slots):
+            self.on_exit(symbol)
+        for symbol, position in positions.items():
+            self.set_position(symbol, position, leverage)
+
+    def reserve(self, key: str, symbol: str, direction: str, risk: float, notional: float):
+        """미체결 주문 한 유닛을 한도에 미리 반영"""
+        if key in self._reservations:
+            return
+        slot = self._slot(symbol)
+        d = _DIRECTION_INDEX[direction]
+        self._reserved[slot] += 1
+        self._reservations[key] = (slot, d, risk, notional)
+        self._add(slot, d, 1, risk, notional)
+
+    def release(self, key: str):
+        """reserve() 반영 취소 (주문 종료 시)"""
+        reservation = self._reservations.pop(key, None)
+        if reservation is None:
+            return
+        slot, d, risk, notional = reservation
+        self._reserved[slot] -= 1
+        self._add(slot, d, -1, -risk, -notional)
+
+    # 판단
+    def can_add(self, symbol: str, direction: str, risk: float, equity: float) -> bool:
+        """symbol에 direction 유닛 하나(리스크 risk)를 더할 수 있는지 여부"""
+        d = _DIRECTION_INDEX[direction]
+        slot = self._slot(symbol)
+        return (self._units[slot] + self._reserved[slot] < self.max_units_market
+                and self.direction_units[d] < self.max_units_directional
+                and self.cluster_units[self._cluster[slot], d] < self.max_units_correlated
+                and self.total_risk + risk <= equity * self.max_risk_total)
+
+    def allowed(self, symbols: List[str], direction: str, risks: np.ndarray, equity: float) -> np.ndarray:
+        """종목별 유닛 하나 추가 가능 여부 배열 (각 종목을 독립적으로 판단)"""
+        d = _DIRECTION_INDEX[direction]
+        slots = np.fromiter((self._slot(s) for s in symbols), dtype=np.int64, count=len(symbols))
+        market_units = self._units[slots] + self._reserved[slots]
+        cluster_units = self.cluster_units[self._cluster[slots], d]
+        return ((market_units < self.max_units_market)
+                & (self.direction_units[d] < self.max_units_directional)
+                & (cluster_units < self.max_units_correlated)
+                & (self.total_risk + np.asarray(risks, dtype=np.float64) <= equity * self.max_risk_total))
+
+    def units(self, symbol: str) -> int:
+        slot = self.slots.get(symbol)
+        return 0 if slot is None else int(self._units[slot] + self._reserved[slot])
+
+    def summary(self, equity: Optional[float] = None) -> Dict[str, Any]:
+        """방향별/그룹별 유닛 수와 총 리스크"""
+        clusters = {name: {'LONG': int(self.cluster_units[cid, 0]), 'SHORT': int(self.cluster_units[cid, 1])}
+                    for cid, name in enumerate(self.cluster_names) if self.cluster_units[cid].any()}
+        summary = {
+            'long_units': int(self.direction_units[0]),
+            'short_units': int(self.direction_units[1]),
+            'total_risk': self.total_risk,
+            'notional': self.notional,
+            'clusters': clusters,
+        }
+        if equity:
+            summary['risk_ratio'] = self.total_risk / equity
+        return summary
@@ -17,12 +17,17 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from config import TradingConfig, TradingMode
 from utils.trade_journal import TradeJournalManager
+from utils.timeaxis import from_ms
+from utils.trade_log import TradeLog, TradeLogView
+from strategy.risk_engine import RiskEngine
 
 logger = logging.getLogger(__name__)
 
+# 인스턴스가 많은 데이터 클래스는 __slots__로 인스턴스 __dict__를 없앰 (dataclass(slots=True)는 3.10+)
 @dataclass
 class PriceData:
     """OHLCV 가격 데이터"""
+    __slots__ = ('symbol', 'date', 'open', 'high', 'low', 'close', 'volume')
     symbol: str
     date: datetime
     open: float
@@ -34,6 +39,7 @@ class PriceData:
 @dataclass
 class TradingUnit:
     """터틀 거래 유닛"""
+    __slots__ = ('entry_price', 'entry_date', 'size', 'stop_loss', 'system', 'unit_number')
     entry_price: float
     entry_date: datetime
     size: float
@@ -44,23 +50,30 @@ class TradingUnit:
 @dataclass
 class Position:
     """포지션 정보"""
+    __slots__ = ('symbol', 'direction', 'units', 'total_size', 'avg_price', '_notional')
     symbol: str
     direction: str  # 'LONG' or 'SHORT'
     units: List[TradingUnit]
     total_size: float
     avg_price: float
     
+    def __post_init__(self):
+        # 유닛 진입 금액 합계 (평균 단가를 유닛 수와 무관하게 갱신)
+        self._notional = sum(u.size * u.entry_price for u in self.units)
+    
     def add_unit(self, unit: TradingUnit):
         """유닛 추가"""
         self.units.append(unit)
         self.total_size += unit.size
-        # 평균 단가 재계산
-        total_value = sum(u.size * u.entry_price for u in self.units)
-        self.avg_price = total_value / self.total_size
+        # 평균 단가 갱신 (누적 진입 금액 / 총 수량)
+        self._notional += unit.size * unit.entry_price
+        self.avg_price = self._notional / self.total_size
 
 @dataclass
 class TradeResult:
     """거래 결과"""
+    __slots__ = ('symbol', 'direction', 'entry_price', 'exit_price', 'size', 'pnl', 'entry_date', 'exit_date',
+                 'system', 'exit_reason')
     symbol: str
     direction: str
     entry_price: float
@@ -140,7 +153,8 @@ class TurtleStrategy:
         self.config = TradingConfig()
         self.indicators = TurtleIndicators()
         self.positions: Dict[str, Position] = {}
-        self.trade_history: List[TradeResult] = []
+        self.risk = RiskEngine()  # 포트폴리오 유닛 한도 (체결마다 누적 갱신)
+        self.trade_history = TradeLog(TradeResult)  # 청산된 거래 (컬럼형 청크 로그)
         self.last_trade_results: Dict[str, bool] = {}  # 마지막 거래 결과 (승/패)
         
         # 매매일지 관리자 초기화
@@ -148,6 +162,12 @@ class TurtleStrategy:
         self.journal = TradeJournalManager(trading_mode)
         self.active_trade_ids: Dict[str, str] = {}  # symbol -> trade_id 매핑
         
+        # 상위 타임프레임 확인 컨텍스트 (선택, 데이터 구간마다 설정)
+        self.timeframe_context = None
+        
+        # 현재 봉 시각 (epoch ms, 시뮬레이션이 봉마다 설정하며 None이면 실제 시각 사용)
+        self.clock: Optional[int] = None
+        
     def calculate_unit_size(self, symbol: str, account_balance: float, 
                           atr: float, price: float, leverage: float = 1.0) -> float:
         """유닛 사이즈 계산 (레버리지 적용)"""
@@ -161,6 +181,15 @@ class TurtleStrategy:
         
         return max(0.001, leveraged_unit_size)  # 최소 거래 단위
     
+    def can_add_unit(self, symbol: str, direction: str, price: float, atr: float,
+                     account_balance: float, leverage: float = 1.0) -> bool:
+        """포트폴리오 한도(종목/방향/연관 그룹 유닛 수, 총 리스크) 안에서 유닛 하나를 더할 수 있는지 여부
+
+        리스크는 레버리지를 뺀 수량 × N으로 센다 (레버리지와 무관하게 유닛당 잔고 × RISK_PER_TRADE).
+        """
+        risk = self.calculate_unit_size(symbol, account_balance, atr, price, leverage) / leverage * atr
+        return self.risk.can_add(symbol, direction, risk, account_balance)
+    
     def calculate_atr_for_timeframe(self, price_data: List[PriceData], timeframe: str = "1d") -> float:
         """시간프레임에 맞는 ATR 계산"""
         atr_period = self.config.get_atr_period(timeframe)
@@ -172,17 +201,60 @@ class TurtleStrategy:
         
         return self.indicators.calculate_atr(price_data[-available_period-1:], available_period)
     
-    def check_entry_signal(self, symbol: str, price_data: List[PriceData], 
-                         system: int, direction: str = "LONG", timeframe: str = "1d") -> bool:
-        """진입 신호 확인 (시간프레임 적응)"""
-        # 공통 설정에서 시간프레임별 브레이크아웃 기간 가져오기
+    def entry_period(self, system: int, timeframe: str = "1d") -> int:
+        """시스템별 진입 돌파 기간 (시간프레임 배수 적용)"""
         multiplier = self.config.get_timeframe_multiplier(timeframe)
-        
         if system == 1:
-            # 시스템 1: 20일 돌파 + 필터 (시간프레임 조정)
-            entry_period = self.config.SYSTEM_1['ENTRY_PERIOD'] * multiplier
             # 최소 2기간, 최대 100기간으로 제한
-            entry_period = max(2, min(100, entry_period))
+            return max(2, min(100, self.config.SYSTEM_1['ENTRY_PERIOD'] * multiplier))
+        # 최소 2기간, 최대 200기간으로 제한
+        return max(2, min(200, self.config.SYSTEM_2['ENTRY_PERIOD'] * multiplier))
+    
+    def exit_period(self, system: int, timeframe: str = "1d") -> int:
+        """시스템별 청산 돌파 기간 (시간프레임 배수 적용)"""
+        multiplier = self.config.get_timeframe_multiplier(timeframe)
+        if system == 1:
+            exit_period = self.config.SYSTEM_1['EXIT_PERIOD'] * multiplier
+        else:
+            exit_period = self.config.SYSTEM_2['EXIT_PERIOD'] * multiplier
+        # 최소 2기간, 최대 100기간으로 제한
+        return max(2, min(100, exit_period))
+    
+    def _now(self) -> datetime:
+        """거래 기록 시각 (시뮬레이션 중에는 현재 봉 시각)"""
+        return datetime.now() if self.clock is None else from_ms(self.clock)
+    
+    def set_timeframe_context(self, context):
+        """상위 타임프레임 컨텍스트 설정 (None이면 단일 타임프레임)"""
+        self.timeframe_context = context
+    
+    def confirm_higher_timeframe(self, bar_index: Optional[int], system: int,
+                                 direction: str, price: float) -> bool:
+        """상위 타임프레임 돈치안 채널 확인 (컨텍스트가 없으면 항상 통과)"""
+        if self.timeframe_context is None or bar_index is None:
+            return True
+        return self.timeframe_context.confirms(bar_index, system, direction, price)
+    
+    def higher_timeframe_atr(self, bar_index: Optional[int]) -> Optional[float]:
+        """상위 타임프레임 ATR (사용하지 않거나 계산 불가하면 None)"""
+        if self.timeframe_context is None or bar_index is None:
+            return None
+        return self.timeframe_context.atr_at(bar_index)
+    
+    def check_entry_signal(self, symbol: str, price_data: List[PriceData], 
+                         system: int, direction: str = "LONG", timeframe: str = "1d",
+                         bar_index: Optional[int] = None) -> bool:
+        """진입 신호 확인 (시간프레임 적응, bar_index 지정 시 상위 타임프레임 확인)"""
+        if not self._check_breakout_entry(symbol, price_data, system, direction, timeframe):
+            return False
+        return self.confirm_higher_timeframe(bar_index, system, direction, price_data[-1].close)
+    
+    def _check_breakout_entry(self, symbol: str, price_data: List[PriceData],
+                              system: int, direction: str, timeframe: str) -> bool:
+        """단일 타임프레임 돌파 진입 신호"""
+        if system == 1:
+            # 시스템 1: 20일 돌파 + 필터 (시간프레임 조정)
+            entry_period = self.entry_period(1, timeframe)
             
             breakout = self.indicators.check_breakout(price_data, entry_period, direction)
             
@@ -195,9 +267,7 @@ class TurtleStrategy:
                 
         elif system == 2:
             # 시스템 2: 55일 돌파 (필터 없음, 시간프레임 조정)
-            entry_period = self.config.SYSTEM_2['ENTRY_PERIOD'] * multiplier
-            # 최소 2기간, 최대 200기간으로 제한
-            entry_period = max(2, min(200, entry_period))
+            entry_period = self.entry_period(2, timeframe)
             
             return self.indicators.check_breakout(price_data, entry_period, direction)
         
@@ -208,17 +278,7 @@ class TurtleStrategy:
         if not position.units:
             return False
         
-        # 공통 설정에서 시간프레임별 브레이크아웃 기간 가져오기
-        multiplier = self.config.get_timeframe_multiplier(timeframe)
-        system = position.units[0].system
-        
-        if system == 1:
-            exit_period = self.config.SYSTEM_1['EXIT_PERIOD'] * multiplier
-        else:
-            exit_period = self.config.SYSTEM_2['EXIT_PERIOD'] * multiplier
-        
-        # 최소 2기간, 최대 100기간으로 제한
-        exit_period = max(2, min(100, exit_period))
+        exit_period = self.exit_period(position.units[0].system, timeframe)
         
         # 반대 방향 돌파로 청산
         if position.direction == "LONG":
@@ -237,6 +297,12 @@ class TurtleStrategy:
                     return True
         return False
     
+    def position_stop(self, position: Position) -> float:
+        """포지션 손절가 (가격이 가장 먼저 닿는 유닛 손절가)"""
+        if position.direction == "LONG":
+            return max(unit.stop_loss for unit in position.units)
+        return min(unit.stop_loss for unit in position.units)
+    
     def check_pyramid_signal(self, position: Position, current_price: float, 
                            atr: float) -> bool:
         """피라미딩 신호 확인"""
@@ -273,10 +339,12 @@ class TurtleStrategy:
                 unit.stop_loss = min(unit.stop_loss, new_stop)
     
     def execute_entry(self, symbol: str, direction: str, entry_price: float,
-                     atr: float, account_balance: float, system: int, leverage: float = 1.0) -> Optional[TradingUnit]:
-        """진입 실행 (레버리지 적용)"""
+                     atr: float, account_balance: float, system: int, leverage: float = 1.0,
+                     size: Optional[float] = None) -> Optional[TradingUnit]:
+        """진입 실행 (레버리지 적용, size가 있으면 계산 대신 실제 체결 수량 사용)"""
         # 유닛 사이즈 계산
-        unit_size = self.calculate_unit_size(symbol, account_balance, atr, entry_price, leverage)
+        unit_size = size if size is not None else self.calculate_unit_size(symbol, account_balance, atr,
+                                                                           entry_price, leverage)
         
         # 손절가 계산
         stop_loss = self.calculate_stop_loss(entry_price, atr, direction)
@@ -284,7 +352,7 @@ class TurtleStrategy:
         # 새 유닛 생성
         new_unit = TradingUnit(
             entry_price=entry_price,
-            entry_date=datetime.now(),
+            entry_date=self._now(),
             size=unit_size,
             stop_loss=stop_loss,
             system=system,
@@ -313,7 +381,8 @@ class TurtleStrategy:
                 account_balance=account_balance,
                 system=system,
                 unit_number=new_unit.unit_number,
-                notes=f"시스템 {system} 신규 진입"
+                notes=f"시스템 {system} 신규 진입",
+                timestamp=self.clock
             )
             self.active_trade_ids[symbol] = trade_id
         else:
@@ -333,8 +402,10 @@ class TurtleStrategy:
                     account_balance=account_balance,
                     system=system,
                     unit_number=new_unit.unit_number,
-                    notes=f"유닛 {new_unit.unit_number} 피라미딩"
+                    notes=f"유닛 {new_unit.unit_number} 피라미딩",
+                    timestamp=self.clock
                 )
+        self.risk.on_entry(symbol, direction, new_unit, leverage)
         
         logger.info(f"진입 실행: {symbol} {direction} {unit_size:.4f} @ {entry_price:.2f} (레버리지: {leverage}x)")
         return new_unit
@@ -362,7 +433,7 @@ class TurtleStrategy:
             size=position.total_size,
             pnl=pnl,
             entry_date=position.units[0].entry_date,
-            exit_date=datetime.now(),
+            exit_date=self._now(),
             system=position.units[0].system,
             exit_reason=reason
         )
@@ -382,7 +453,8 @@ class TurtleStrategy:
                 account_balance=account_balance,
                 reason=reason,
                 leverage=leverage,
-                notes=f"총 {len(position.units)}개 유닛 청산"
+                notes=f"총 {len(position.units)}개 유닛 청산",
+                timestamp=self.clock
             )
             # 활성 거래 ID 제거
             del self.active_trade_ids[symbol]
@@ -392,6 +464,7 @@ class TurtleStrategy:
         
         # 포지션 제거
         del self.positions[symbol]
+        self.risk.on_exit(symbol)
         
         logger.info(f"청산 실행: {symbol} {position.direction} {position.total_size:.4f} @ {exit_price:.2f} "
                    f"P&L: {pnl:.2f} ({reason})")
@@ -422,16 +495,40 @@ class TurtleStrategy:
         else:  # SHORT
             return (position.avg_price - current_price) * position.total_size
     
-    def get_trade_history(self) -> List[TradeResult]:
-        """거래 이력 조회"""
-        return self.trade_history.copy()
+    def get_trade_history(self) -> TradeLogView:
+        """거래 이력 조회 (현재까지 거래의 복사 없는 읽기 전용 뷰)"""
+        return self.trade_history.view()
     
+    def get_state(self) -> Dict[str, Any]:
+        """체크포인트용 전략 상태 (포지션/유닛, 거래 이력, 필터 상태)"""
+        return {
+            'positions': self.positions,
+            'trade_history': self.trade_history,
+            'last_trade_results': self.last_trade_results,
+            'active_trade_ids': self.active_trade_ids,
+            'journal_cumulative_pnl': self.journal.cumulative_pnl
+        }
+
+    def restore_state(self, state: Dict[str, Any], leverage: float = 1.0):
+        """체크포인트에서 전략 상태 복원 (leverage: 포트폴리오 리스크 재집계용 계좌 레버리지)"""
+        self.positions = state['positions']
+        self.trade_history = state['trade_history']
+        if not isinstance(self.trade_history, TradeLog):
+            self.trade_history = TradeLog(TradeResult)
+            self.trade_history.extend(state['trade_history'])
+        self.last_trade_results = state['last_trade_results']
+        self.active_trade_ids = state['active_trade_ids']
+        self.journal.cumulative_pnl = state.get('journal_cumulative_pnl', 0.0)
+        self.risk.rebuild(self.positions, leverage)
+
     def reset(self):
         """전략 초기화 (백테스트용)"""
         self.positions.clear()
+        self.risk = RiskEngine()
         self.trade_history.clear()
         self.last_trade_results.clear()
         self.active_trade_ids.clear()
+        self.clock = None
         # 새로운 매매일지 관리자 생성 (cumulative_pnl 초기화)
         self.journal = TradeJournalManager(self.trading_mode)
 
@@ -12,6 +12,9 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from data.binance_data_fetcher import BinanceDataFetcher
+from utils.kline_store import KlineStore, bars_to_columns
+from utils.data_quality import KlineIngestor
+from utils.resampler import Resampler
 
 async def test_all_timeframes():
     """모든 시간프레임으로 실제 데이터 테스트 (API 키 없이)"""
@@ -54,20 +57,30 @@ async def test_all_timeframes():
     print("시간프레임 | 기간        | 데이터 수 | 첫 캔들      | 마지막 캔들   | 상태")
     print("-" * 70)
     
+    # 1분봉을 한 번만 내려받아 저장하고 나머지 시간프레임은 리샘플링으로 생성
+    store = KlineStore()
+    resampler = Resampler(store)
+    end_date = datetime.now()
+    base_start = end_date - timedelta(days=max(days for days, _ in date_ranges.values()))
+    if not store.covers('BTCUSDT', '1m', base_start.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')):
+        base = await fetcher.get_historical_klines(
+            'BTCUSDT', '1m', base_start.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')
+        )
+        _, reports = KlineIngestor(store).ingest('BTCUSDT', '1m', bars_to_columns(base))
+        for report in reports.values():
+            if not report.ok:
+                print(f"⚠️ 데이터 품질: {report.summary()}")
+    resampler.update_all('BTCUSDT', list(timeframes))
+    
     for timeframe, name in timeframes.items():
         try:
             # 날짜 범위 계산
             days_back, period_desc = date_ranges[timeframe]
-            end_date = datetime.now()
             start_date = end_date - timedelta(days=days_back)
             
-            # 데이터 가져오기
-            data = await fetcher.get_historical_klines(
-                'BTCUSDT', 
-                timeframe, 
-                start_date.strftime('%Y-%m-%d'),
-                end_date.strftime('%Y-%m-%d')
-            )
+            # 저장된 파티션에서 로드 (네트워크 요청 없음)
+            data = store.load('BTCUSDT', timeframe, start_date.strftime('%Y-%m-%d'),
+                              end_date.strftime('%Y-%m-%d'))
             
             if data:
                 first_date = data[0].date.strftime('%m-%d %H:%M')
@@ -79,9 +92,6 @@ async def test_all_timeframes():
             else:
                 print(f"{timeframe:>8} | {period_desc:>11} | {'0':>7}개 | "
                       f"{'N/A':>12} | {'N/A':>12} | ❌ 실패")
-                
-            # API 제한을 위한 딜레이
-            await asyncio.sleep(0.2)
             
         except Exception as e:
             print(f"{timeframe:>8} | {period_desc:>11} | {'ERROR':>7} | "
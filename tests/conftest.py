@@ -13,6 +13,7 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from strategy.turtle_strategy import PriceData, TradingUnit, Position
+from utils.trade_journal import redirect_journals
 
 @pytest.fixture
 def sample_price_data():
@@ -136,6 +137,12 @@ def setup_test_config():
     if "TESTING" in os.environ:
         del os.environ["TESTING"]
 
+@pytest.fixture(scope="session", autouse=True)
+def isolated_trade_journals(tmp_path_factory):
+    """매매일지 CSV/로그를 세션 임시 디렉터리로 (저장소의 data/, logs/ 오염 방지)"""
+    with redirect_journals(str(tmp_path_factory.mktemp('journals'))) as directory:
+        yield directory
+
 # 마커 정의
 def pytest_configure(config):
     """pytest 설정"""
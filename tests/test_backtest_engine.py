@@ -16,7 +16,11 @@ from frontend.backtest.backend.engines.backtest_engine import (
     BacktestEngine, BacktestConfig_, BacktestResults, 
     PerformanceMetrics, BacktestResultsManager
 )
+from config import BacktestConfig
 from strategy.turtle_strategy import PriceData, TradeResult
+from utils.profiling import PhaseProfiler
+from utils.progress import ProgressThrottle
+from utils.checkpoint import BacktestCancelled
 
 class TestBacktestConfig:
     """백테스트 설정 테스트"""
@@ -47,6 +51,18 @@ class TestBacktestConfig:
         assert config.timeframe == "4h", "타임프레임이 정확해야 합니다"
         assert config.initial_balance == 20000.0, "초기 자금이 정확해야 합니다"
         assert config.systems == [1], "시스템이 정확해야 합니다"
+    
+    def test_engine_config_copies_every_field(self):
+        """엔진 설정 정규화는 BacktestConfig/BacktestConfig_의 모든 필드를 그대로 옮겨야 함"""
+        overrides = dict(symbol="ETHUSDT", start_date="2023-06-01", end_date="2023-12-31", timeframe="4h",
+                         initial_balance=20000.0, commission_rate=0.001, systems=[2], leverage=3.0,
+                         profiling=True, profile_output="run.prof", seed=7, checkpointing=True,
+                         checkpoint_interval=1.5, use_cache=True, confirm_timeframe="1d",
+                         higher_timeframe_atr=True, futures=True, cost_model="impact")
+        assert set(overrides) == set(BacktestConfig_().to_dict()), "새 필드는 이 테스트에도 추가해야 합니다"
+        
+        for source in (BacktestConfig(**overrides), BacktestConfig_(**overrides)):
+            assert BacktestEngine(source)._build_config().to_dict() == overrides
 
 class TestBacktestEngine:
     """백테스트 엔진 테스트"""
@@ -226,6 +242,27 @@ class TestBacktestResults:
         assert 'equity_curve' in result_dict, "수익 곡선이 포함되어야 합니다"
         assert 'monthly_returns' in result_dict, "월별 수익률이 포함되어야 합니다"
 
+    def test_save_and_load_round_trip(self, tmp_path):
+        """파일로 저장한 결과는 설정, 비용, 선물 집계까지 그대로 로드되어야 함"""
+        results = BacktestResults(
+            config=BacktestConfig_(leverage=5.0, futures=True, cost_model="impact"),
+            initial_balance=10000,
+            final_balance=9500,
+            metrics=self.metrics,
+            monthly_returns={'2024-01': -0.05},
+            futures={'funding_paid': 12.5, 'funding_events': 3, 'liquidations': 1,
+                     'liquidation_fees': 4.0, 'leverage': 5.0},
+            costs={'model': 'impact', 'commission': 8.0, 'slippage': 3.25}
+        )
+        path = tmp_path / "result.json"
+        results.save_to_file(str(path))
+        
+        loaded = BacktestResults.load_from_file(str(path))
+        
+        assert loaded.to_dict() == results.to_dict(), "저장 전후 결과가 같아야 합니다"
+        assert loaded.costs['slippage'] == 3.25 and loaded.futures['liquidations'] == 1
+        assert loaded.config.futures and loaded.config.cost_model == "impact"
+
 class TestBacktestResultsManager:
     """백테스트 결과 관리자 테스트"""
     
@@ -272,6 +309,144 @@ class TestBacktestResultsManager:
         result = BacktestResultsManager.load_results("nonexistent_file")
         assert result is None, "존재하지 않는 파일은 None을 반환해야 합니다"
 
+class TestBacktestProfiling:
+    """백테스트 프로파일링 테스트"""
+    
+    def test_phase_profiler_exclusive_time(self):
+        """중첩 구간 시간은 부모 구간에서 제외되어야 함"""
+        profiler = PhaseProfiler()
+        profiler.switch('entries')
+        with profiler.phase('journal_io'):
+            profiler.count('journal_writes')
+        profiler.switch('metrics')
+        
+        summary = profiler.summary()
+        phases = summary['phases']
+        
+        assert set(phases) == {'entries', 'journal_io', 'metrics'}, "호출된 구간만 포함되어야 합니다"
+        assert summary['counters'] == {'journal_writes': 1}, "카운터가 집계되어야 합니다"
+        assert abs(sum(p['seconds'] for p in phases.values()) - summary['total_seconds']) < 1e-9, "구간 합이 전체 시간과 같아야 합니다"
+    
+    @pytest.mark.asyncio
+    async def test_profiling_attaches_timing(self, tmp_path):
+        """프로파일링 활성화 시 구간별 시간이 결과에 포함되어야 함"""
+        profile_path = tmp_path / "backtest.prof"
+        config = BacktestConfig_(
+            start_date="2024-01-01",
+            end_date="2024-03-31",
+            timeframe="1d",
+            profiling=True,
+            profile_output=str(profile_path)
+        )
+        
+        results = await BacktestEngine(config).run_backtest()
+        
+        phases = results.timing['phases']
+        assert {'data_load', 'indicators', 'signal_checks', 'metrics'} <= set(phases), "주요 구간이 측정되어야 합니다"
+        assert results.timing['counters']['bars'] > 0, "처리한 봉 수가 집계되어야 합니다"
+        assert profile_path.exists(), "cProfile 파일이 저장되어야 합니다"
+    
+    @pytest.mark.asyncio
+    async def test_profiling_disabled_by_default(self):
+        """기본 설정에서는 타이밍 정보가 없어야 함"""
+        config = BacktestConfig_(start_date="2024-01-01", end_date="2024-03-31", timeframe="1d")
+        results = await BacktestEngine(config).run_backtest()
+        
+        assert results.timing == {}, "프로파일링 비활성화 시 타이밍이 비어 있어야 합니다"
+    
+    @pytest.mark.asyncio
+    async def test_profiling_follows_config_flag(self, monkeypatch):
+        """profiling 미지정 시 BacktestConfig.PROFILING_ENABLED (BACKTEST_PROFILING) 설정을 따라야 함"""
+        monkeypatch.setattr(BacktestConfig, 'PROFILING_ENABLED', True)
+        config = BacktestConfig_(start_date="2024-01-01", end_date="2024-03-31", timeframe="1d")
+        assert config.profiling, "설정 플래그가 기본값이어야 합니다"
+        
+        results = await BacktestEngine(config).run_backtest()
+        
+        assert results.timing['counters']['bars'] > 0, "설정 플래그로 프로파일링이 활성화되어야 합니다"
+        assert not BacktestConfig_(profiling=False).profiling, "명시한 값이 우선해야 합니다"
+
+class TestBacktestProgress:
+    """백테스트 진행률 스트리밍 테스트"""
+    
+    def test_throttle_coalesces_updates(self):
+        """최소 간격 내 업데이트는 병합되어야 함"""
+        updates = []
+        throttle = ProgressThrottle(updates.append, total_bars=10000, min_interval=3600, check_every=1)
+        
+        emitted = [throttle.tick(i, 0, 10000.0) for i in range(1, 10001)]
+        throttle.finish(10000, 5, 10500.0)
+        
+        assert sum(emitted) == 1, "간격 내에서는 첫 업데이트만 전송되어야 합니다"
+        assert updates[-1].done and updates[-1].trades == 5, "최종 업데이트는 항상 전송되어야 합니다"
+        assert updates[-1].fraction == 1.0, "최종 진행률은 100%여야 합니다"
+    
+    @pytest.mark.asyncio
+    async def test_progress_callback_reports_run(self):
+        """진행률 콜백이 봉 수, 거래 수, 자산을 보고해야 함"""
+        config = BacktestConfig_(start_date="2024-01-01", end_date="2024-06-30", timeframe="1h")
+        updates = []
+        
+        results = await BacktestEngine(config).run_backtest(progress_callback=updates.append,
+                                                            progress_interval=0.0)
+        
+        assert updates, "진행률 업데이트가 전달되어야 합니다"
+        bars = [u.bars_processed for u in updates]
+        assert bars == sorted(bars), "처리한 봉 수는 단조 증가해야 합니다"
+        assert updates[-1].done, "마지막 업데이트는 완료 상태여야 합니다"
+        assert updates[-1].bars_processed == updates[-1].total_bars, "모든 봉이 처리되어야 합니다"
+        assert updates[-1].trades == len(results.trades), "거래 수가 결과와 일치해야 합니다"
+
+class TestBacktestCheckpoint:
+    """체크포인트 저장/재개/취소 테스트"""
+    
+    def _config(self, **kwargs):
+        return BacktestConfig_(start_date="2024-01-01", end_date="2024-06-30", timeframe="1h",
+                               seed=42, checkpointing=True, **kwargs)
+    
+    @pytest.mark.asyncio
+    async def test_cancel_and_resume_matches_full_run(self, tmp_path):
+        """중단 후 재개한 결과가 한 번에 실행한 결과와 같아야 함"""
+        full = await BacktestEngine(self._config()).run_backtest()
+        
+        engine = BacktestEngine(self._config())
+        engine.checkpoint_dir = str(tmp_path)
+        
+        def cancel_midway(update):
+            if update.bars_processed >= update.total_bars // 2:
+                engine.cancel()
+        
+        with pytest.raises(BacktestCancelled) as exc_info:
+            await engine.run_backtest(progress_callback=cancel_midway, progress_interval=0.0)
+        assert exc_info.value.checkpoint_path, "중단 시 체크포인트가 저장되어야 합니다"
+        assert engine.has_checkpoint(), "재개 가능한 체크포인트가 있어야 합니다"
+        
+        # 진단/실행 옵션만 바꾼 설정은 같은 체크포인트에서 재개되어야 함
+        engine = BacktestEngine(self._config(profiling=True, use_cache=True, checkpoint_interval=60.0))
+        engine.checkpoint_dir = str(tmp_path)
+        assert engine.has_checkpoint(), "진단 옵션 변경으로 체크포인트가 무효화되면 안 됩니다"
+        engine.config = self._config(futures=True)
+        assert not engine.has_checkpoint(), "결과에 영향을 주는 설정이 바뀌면 재개하지 않아야 합니다"
+        engine.config = self._config(profiling=True, use_cache=True, checkpoint_interval=60.0)
+        resumed = await engine.run_backtest(resume=True)
+        
+        assert resumed.final_balance == pytest.approx(full.final_balance), "최종 자금이 같아야 합니다"
+        assert len(resumed.trades) == len(full.trades), "거래 수가 같아야 합니다"
+        assert [p['total_value'] for p in resumed.equity_curve] == pytest.approx(
+            [p['total_value'] for p in full.equity_curve]), "자산 곡선이 같아야 합니다"
+        assert not engine.has_checkpoint(), "정상 완료 후 체크포인트는 삭제되어야 합니다"
+    
+    @pytest.mark.asyncio
+    async def test_periodic_checkpoints(self, tmp_path):
+        """설정된 간격마다 체크포인트가 저장되어야 함"""
+        engine = BacktestEngine(self._config(checkpoint_interval=0.0, profiling=True))
+        engine.checkpoint_dir = str(tmp_path)
+        
+        results = await engine.run_backtest()
+        
+        assert results.timing['counters']['checkpoints'] > 0, "주기적으로 저장되어야 합니다"
+        assert list(tmp_path.iterdir()) == [], "완료 후 체크포인트 파일이 남지 않아야 합니다"
+
 class TestBacktestIntegration:
     """백테스트 통합 테스트"""
     
@@ -0,0 +1,111 @@
+"""
+벤치마크 하네스 테스트
+"""
+
+import pytest
+import sys
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 파이썬 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from utils.benchmark import (
+    BenchmarkResult, BENCHMARK_CASES, generate_benchmark_data, measure, run_benchmarks,
+    append_history, load_history, save_baseline, load_baseline, compare_to_baseline
+)
+
+class TestBenchmarkData:
+    """벤치마크 데이터 생성 테스트"""
+
+    def test_seeded_data_is_deterministic(self):
+        """같은 시드는 같은 데이터를 생성해야 함"""
+        a = generate_benchmark_data(200, seed=7)
+        b = generate_benchmark_data(200, seed=7)
+        c = generate_benchmark_data(200, seed=8)
+
+        assert [p.close for p in a] == [p.close for p in b], "같은 시드는 동일한 데이터여야 합니다"
+        assert [p.close for p in a] != [p.close for p in c], "다른 시드는 다른 데이터여야 합니다"
+
+    def test_ohlc_consistency(self):
+        """OHLC 일관성 테스트"""
+        data = generate_benchmark_data(500, timeframe='1h')
+
+        for i, bar in enumerate(data):
+            assert bar.low <= min(bar.open, bar.close) <= max(bar.open, bar.close) <= bar.high
+            if i > 0:
+                assert bar.date > data[i - 1].date, "시간순으로 정렬되어야 합니다"
+
+class TestBenchmarkRun:
+    """벤치마크 실행 테스트"""
+
+    @pytest.mark.parametrize("case", list(BENCHMARK_CASES))
+    def test_each_case_reports_throughput(self, case):
+        """모든 케이스가 처리량과 메모리를 보고해야 함"""
+        data = generate_benchmark_data(300, timeframe='1h')
+        result = measure(case, data, timeframe='1h')
+
+        assert result.n_bars == 300
+        assert result.seconds > 0
+        assert result.bars_per_sec > 0
+        assert result.peak_memory_bytes is not None and result.peak_memory_bytes > 0
+        assert result.allocated_blocks is not None
+
+    @pytest.mark.parametrize("case", ['journal', 'frontend_engine', 'backend_engine'])
+    def test_journal_temp_dir_removed(self, case, tmp_path, monkeypatch, isolated_trade_journals):
+        """매매일지를 남기는 케이스는 임시 디렉터리에만 기록하고 측정 후 삭제해야 함"""
+        journals = Path(isolated_trade_journals)
+        before = {p: p.stat().st_size for p in journals.rglob('*') if p.is_file()}
+        monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+        measure(case, generate_benchmark_data(300, timeframe='1h'), timeframe='1h')
+
+        assert list(tmp_path.iterdir()) == []
+        assert {p: p.stat().st_size for p in journals.rglob('*') if p.is_file()} == before
+
+    def test_unknown_case_rejected(self):
+        """알 수 없는 케이스는 거부"""
+        with pytest.raises(ValueError):
+            run_benchmarks(sizes=[100], cases=['nope'])
+
+class TestBenchmarkHistory:
+    """이력 및 기준선 테스트"""
+
+    def test_history_append(self, tmp_path):
+        """이력이 누적되어야 함"""
+        path = str(tmp_path / "history.json")
+        results = [BenchmarkResult('indicators', 1000, 0.5, 2000.0, 1024, 10)]
+
+        append_history(results, path)
+        append_history(results, path)
+
+        history = load_history(path)
+        assert len(history) == 2
+        assert history[0]['results'][0]['case'] == 'indicators'
+
+    def test_regression_detection(self, tmp_path):
+        """처리량 감소와 메모리 증가를 회귀로 감지"""
+        path = str(tmp_path / "baseline.json")
+        save_baseline([
+            BenchmarkResult('indicators', 1000, 0.5, 2000.0, 1000, 10),
+            BenchmarkResult('metrics', 1000, 0.1, 10000.0, 1000, 10),
+        ], path)
+        baseline = load_baseline(path)
+
+        current = [
+            BenchmarkResult('indicators', 1000, 1.0, 1000.0, 1000, 10),  # 처리량 50% 감소
+            BenchmarkResult('metrics', 1000, 0.1, 10500.0, 2000, 10),    # 메모리 2배
+        ]
+        regressions = compare_to_baseline(current, baseline, tolerance=0.10)
+
+        assert {(r['key'], r['metric']) for r in regressions} == {
+            ('indicators@1000', 'bars_per_sec'),
+            ('metrics@1000', 'peak_memory_bytes'),
+        }
+
+    def test_no_regression_within_tolerance(self, tmp_path):
+        """허용 오차 내 변화는 회귀가 아님"""
+        baseline = {r.key: r for r in [BenchmarkResult('journal', 100, 1.0, 100.0, 1000, 1)]}
+        current = [BenchmarkResult('journal', 100, 1.05, 95.0, 1050, 1)]
+
+        assert compare_to_baseline(current, baseline, tolerance=0.10) == []
@@ -0,0 +1,117 @@
+"""
+롤링 상관관계 서비스 테스트
+"""
+
+import asyncio
+import pytest
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 파이썬 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config import TradingMode
+from strategy.correlation import CorrelationService
+from strategy.turtle_strategy import TurtleStrategy
+from utils.benchmark import generate_benchmark_data
+from utils.paper_trading import PaperTradingRuntime, ReplayFeed
+
+
+def _factor_returns(rows, rng):
+    """두 공통 요인 그룹(5종목, 4종목)과 독립 종목 3개의 수익률"""
+    f1, f2 = rng.normal(0, 0.02, rows), rng.normal(0, 0.02, rows)
+    columns = [f1 + rng.normal(0, 0.004, rows) for _ in range(5)]
+    columns += [f2 + rng.normal(0, 0.004, rows) for _ in range(4)]
+    columns += [rng.normal(0, 0.02, rows) for _ in range(3)]
+    return np.column_stack(columns)
+
+
+class TestCorrelationService:
+    """상관행렬/군집 테스트"""
+
+    def test_matrix_matches_full_recompute(self):
+        """순위 1 갱신 결과가 최근 window행으로 직접 계산한 상관행렬과 같아야 함"""
+        rng = np.random.default_rng(3)
+        returns = rng.normal(0, 0.01, (257, 6))
+        service = CorrelationService([f"S{k}" for k in range(6)], window=50, min_rows=10)
+        for count, row in enumerate(returns, start=1):
+            service.push(row)
+            if count in (7, 50, 51, 123, 257):
+                window = returns[max(0, count - 50):count]
+                assert np.allclose(service.matrix(), np.corrcoef(window, rowvar=False), atol=1e-9)
+
+    def test_clusters_correlated_symbols(self):
+        """임계값 이상으로 연결된 종목을 그룹으로 묶고 독립 종목은 제외해야 함"""
+        symbols = [f"S{k:02d}" for k in range(12)]
+        service = CorrelationService(symbols, window=200, threshold=0.7, min_rows=30)
+        for row in _factor_returns(200, np.random.default_rng(11)):
+            service.push(row)
+
+        assert service.clusters() == [symbols[:5], symbols[5:9]]
+        assert service.groups() == {'corr:S00': symbols[:5], 'corr:S05': symbols[5:9]}
+
+    def test_rows_assembled_from_bar_closes(self):
+        """같은 시각 종가가 모이면 로그 수익률 행을 확정하고, 빠진 종목은 0, 지난 시각 봉은 무시해야 함"""
+        service = CorrelationService(['A', 'B', 'C'], window=10, min_rows=2)
+        for t, closes in enumerate([(100, 10, 1), (110, 11, 1.5)]):
+            for symbol, close in zip('ABC', closes):
+                service.update(symbol, t, close)
+        assert service.count == 1, "첫 시각은 이전 종가가 없어 수익률 행이 아님"
+
+        assert not service.update('A', 2, 121.0)
+        assert not service.update('B', 1, 99.0), "지난 시각 봉"
+        assert service.update('A', 3, 133.1), "다음 시각 봉이 오면 이전 행 확정"
+        assert service._rows[1] == pytest.approx([np.log(1.1), 0.0, 0.0])
+
+    def test_state_round_trip(self):
+        service = CorrelationService(['A', 'B'], window=8, min_rows=2)
+        closes = np.exp(np.cumsum(np.random.default_rng(1).normal(0, 0.01, (14, 2)), axis=0))
+        for t, (a, b) in enumerate(closes):
+            service.update('A', t, a)
+            service.update('B', t, b)
+        service.update('A', 100, 5.0)
+
+        restored = CorrelationService(['A', 'B'], window=8, min_rows=2)
+        assert restored.restore(service.get_state())
+        assert np.allclose(restored.matrix(), service.matrix())
+        assert restored.update('B', 100, 7.0) and service.update('B', 100, 7.0)
+        assert np.allclose(restored.matrix(), service.matrix())
+        assert not CorrelationService(['A', 'C'], window=8).restore(service.get_state())
+
+    def test_update_latency_hundreds_of_symbols(self):
+        """수백 종목에서도 봉당 상관행렬 갱신이 1ms보다 훨씬 빨라야 함"""
+        n = 300
+        service = CorrelationService([f"S{k}" for k in range(n)], window=100)
+        rows = np.random.default_rng(5).normal(0, 0.01, (400, n))
+        timings = []
+        for row in rows:
+            started = time.perf_counter()
+            service.push(row)
+            timings.append(time.perf_counter() - started)
+        assert np.median(timings) < 0.5e-3
+
+
+class TestRuntimeCorrelationGroups:
+    """가상매매 런타임 연관 그룹 연동 테스트"""
+
+    def test_runtime_groups_follow_correlation(self):
+        """함께 움직이는 종목은 리스크 엔진에서 같은 연관 그룹이어야 함"""
+        base = generate_benchmark_data(300, timeframe='1h', seed=21)
+        bars = {
+            'AAAUSDT': [replace(b, symbol='AAAUSDT') for b in base],
+            'BBBUSDT': [replace(b, symbol='BBBUSDT', open=b.open * 2, high=b.high * 2, low=b.low * 2,
+                                close=b.close * 2) for b in base],
+            'CCCUSDT': [replace(b, symbol='CCCUSDT') for b in generate_benchmark_data(300, timeframe='1h', seed=99)],
+        }
+        runtime = PaperTradingRuntime(list(bars), timeframe='1h', strategy=TurtleStrategy(TradingMode.BACKTEST))
+        asyncio.run(runtime.run(ReplayFeed(bars)))
+
+        assert runtime.correlation.count == 299
+        assert runtime.groups == {'corr:AAAUSDT': ['AAAUSDT', 'BBBUSDT']}
+        risk = runtime.strategy.risk
+        assert risk.group_of('BBBUSDT') == risk.group_of('AAAUSDT') != risk.group_of('CCCUSDT')
@@ -0,0 +1,115 @@
+"""
+거래 비용 모델 테스트 (스프레드, 거래량 기반 시장 충격, 설정별 선택)
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 파이썬 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config import BacktestConfig, TradingMode
+from frontend.backtest.backend.engines.backtest_engine import BacktestConfig_, BacktestEngine
+from strategy.backtest_core import SimulationCore, start_index
+from strategy.costs import CommissionModel, MarketImpactModel, cost_model_for
+from strategy.turtle_strategy import TurtleStrategy
+from utils.benchmark import generate_benchmark_data
+from utils.kline_store import bars_to_columns
+
+
+def _core(price_data, costs=None, leverage=3.0):
+    return SimulationCore(TurtleStrategy(TradingMode.BACKTEST), price_data, 'BTCUSDT', '1h',
+                          leverage=leverage, costs=costs)
+
+
+class TestMarketImpactModel:
+    """봉별 계수/체결가 테스트"""
+
+    def test_fill_price_grows_with_size_and_thin_volume(self):
+        """매수는 위, 매도는 아래로 체결되고, 수량이 크거나 거래량이 적은 봉일수록 슬리피지가 커야 함"""
+        n = 40
+        closes = np.full(n, 100.0)
+        highs, lows = closes * 1.01, closes * 0.99
+        volumes = np.full(n, 1000.0)
+        volumes[30:] = 10.0
+        model = MarketImpactModel(window=5)
+        model.prepare(highs, lows, closes, volumes)
+
+        assert model.fill_price(20, 100.0, 1.0, 1) > 100.0 > model.fill_price(20, 100.0, 1.0, -1)
+        assert model.fill_price(20, 100.0, 50.0, 1) > model.fill_price(20, 100.0, 1.0, 1)
+        assert model.fill_price(39, 100.0, 1.0, 1) > model.fill_price(20, 100.0, 1.0, 1)
+        assert model.fill_price(39, 100.0, 1e9, 1) == pytest.approx(100.0 * (1 + model.max_slippage))
+
+        # 반 스프레드 = 봉 범위 × 비율, 충격 = 계수 × σ × √(수량 / 평균 거래량)
+        sigma = np.log(1.01 / 0.99) / np.sqrt(4 * np.log(2))
+        expected = model.spread_range_fraction * 0.02 + sigma * np.sqrt(4.0 / 1000.0)
+        assert model.fill_price(20, 100.0, 4.0, 1) == pytest.approx(100.0 * (1 + expected))
+
+    def test_zero_cost_impact_matches_commission(self):
+        """스프레드/충격이 0이면 수수료만 부과하는 기본 모델과 결과가 같아야 함"""
+        price_data = generate_benchmark_data(3000, seed=8, timeframe='1h')
+        plain = _core(price_data)
+        plain.run()
+        free = _core(price_data, MarketImpactModel(impact_coefficient=0.0, spread_range_fraction=0.0,
+                                                   min_half_spread=0.0))
+        free.run()
+        assert free.balance == plain.balance
+        assert free.costs.slippage == 0.0
+        assert free.costs.fees == pytest.approx(plain.costs.fees)
+
+    def test_impact_costs_are_charged(self):
+        """같은 신호라도 진입가가 불리하게 체결되고 최종 잔고가 줄어야 함"""
+        price_data = generate_benchmark_data(3000, seed=8, timeframe='1h')
+        plain = _core(price_data)
+        plain.run()
+        costly = _core(price_data, MarketImpactModel())
+        costly.run()
+        assert costly.costs.slippage > 0
+        assert costly.balance < plain.balance
+        first, base = costly.strategy.trade_history[0], plain.strategy.trade_history[0]
+        assert first.entry_date == base.entry_date
+        assert (first.entry_price > base.entry_price) if first.direction == "LONG" else \
+            (first.entry_price < base.entry_price)
+
+    def test_streaming_chunks_match_in_memory(self):
+        """청크로 이어 붙여도 봉별 계수가 같아 같은 거래/잔고가 나와야 함"""
+        price_data = generate_benchmark_data(4000, seed=12, timeframe='1h')
+        memory = _core(price_data, MarketImpactModel())
+        memory.run()
+
+        columns = bars_to_columns(price_data)
+        streaming = _core(None, MarketImpactModel())
+        first = start_index('1h', len(price_data))
+        for offset in range(0, len(price_data), 700):
+            part = {name: col[offset:offset + 700] for name, col in columns.items()}
+            bars = streaming.extend(part['open_time'], part['high'], part['low'], part['close'], part['volume'])
+            for i in range(max(first, bars.start), bars.stop):
+                streaming.step(i)
+        streaming.close_all()
+
+        assert streaming.balance == memory.balance
+        assert [t.entry_price for t in streaming.strategy.trade_history] == \
+            [t.entry_price for t in memory.strategy.trade_history]
+
+
+class TestCostModelSelection:
+    def test_selected_per_config(self):
+        assert type(cost_model_for(BacktestConfig())) is CommissionModel
+        model = cost_model_for(BacktestConfig(cost_model='impact', commission_rate=0.0005))
+        assert isinstance(model, MarketImpactModel) and model.taker_rate == 0.0005
+        with pytest.raises(ValueError):
+            cost_model_for(BacktestConfig(cost_model='unknown'))
+
+    @pytest.mark.asyncio
+    async def test_engine_uses_config_cost_model(self):
+        """엔진 설정의 cost_model이 run_backtest까지 전달되어 슬리피지가 부과되어야 함"""
+        plain = await BacktestEngine(BacktestConfig_(seed=1)).run_backtest()
+        impact = await BacktestEngine(BacktestConfig_(cost_model='impact', seed=1)).run_backtest()
+        assert plain.config.cost_model == 'commission' and plain.costs['slippage'] == 0.0
+        assert impact.config.cost_model == 'impact' and impact.costs['model'] == 'impact'
+        assert impact.costs['slippage'] > 0.0
+        assert impact.final_balance != plain.final_balance
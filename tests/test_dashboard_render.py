@@ -0,0 +1,126 @@
+"""
+대시보드 렌더 스케줄러 테스트 (패널 캐시, 변경 패널만 재생성, 데이터/화면 주기 분리)
+"""
+
+import asyncio
+import pytest
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from rich.layout import Layout
+
+# 프로젝트 루트를 파이썬 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config import TradingMode, UIConfig
+from frontend.dashboard.main_dashboard import TradingDashboard
+from frontend.dashboard.render_scheduler import RenderScheduler
+from strategy.turtle_strategy import Position, TradeResult, TradingUnit, TurtleStrategy
+
+PANELS = ("header", "account", "positions", "metrics", "trades", "footer")
+
+
+@pytest.fixture
+def dashboard():
+    board = TradingDashboard(mode="paper")
+    board.strategy = TurtleStrategy(TradingMode.BACKTEST)
+    board.layout = board._create_layout()
+    return board
+
+
+def _builds(board):
+    return board.scheduler.stats()['builds']
+
+
+def _trade(pnl):
+    now = datetime(2024, 1, 2)
+    return TradeResult('BTCUSDT', "LONG", 100.0, 100.0 + pnl, 1.0, pnl, now, now, 1, 'SIGNAL')
+
+
+class TestRenderScheduler:
+    def test_rebuilds_only_changed_panels(self):
+        """키가 바뀐 패널만 다시 만들고, 정적 패널은 한 번만 만들어야 함"""
+        state = {'a': 1}
+        calls = []
+        scheduler = RenderScheduler()
+        scheduler.register("a", lambda: calls.append('a') or "A", lambda: state['a'])
+        scheduler.register("b", lambda: calls.append('b') or "B")
+        layout = Layout()
+        layout.split_column(Layout(name="a"), Layout(name="b"))
+
+        assert scheduler.render(layout) == ["a", "b"]
+        assert scheduler.render(layout) == []
+        state['a'] = 2
+        assert scheduler.dirty() == ["a"]
+        assert scheduler.render(layout) == ["a"]
+        scheduler.invalidate("b")
+        assert scheduler.render(layout) == ["b"]
+        assert calls == ['a', 'b', 'a', 'b']
+        assert scheduler.stats() == {'frames': 4, 'redraws': 3, 'builds': {'a': 2, 'b': 2}}
+
+
+class TestDashboardRender:
+    """대시보드 패널 의존 데이터 테스트"""
+
+    def test_unchanged_data_skips_panels(self, dashboard):
+        """데이터가 그대로면 헤더(시계) 외 패널은 다시 만들지 않아야 함"""
+        assert _builds(dashboard) == {name: 1 for name in PANELS}
+        for _ in range(5):
+            assert set(dashboard.scheduler.render(dashboard.layout)) <= {"header"}
+        builds = _builds(dashboard)
+        assert all(builds[name] == 1 for name in PANELS if name != "header")
+
+    def test_panels_follow_their_data(self, dashboard):
+        """거래는 거래/지표 패널, 보유 종목 가격은 포지션 패널, 잔고는 계좌 패널만 다시 만들어야 함"""
+        dashboard.current_prices["BTCUSDT"] = 70000.0  # 포지션이 없으면 가격 변화는 무관
+        assert "positions" not in dashboard.scheduler.render(dashboard.layout)
+
+        dashboard.strategy.trade_history.append(_trade(50.0))
+        assert "trades" in dashboard.scheduler.render(dashboard.layout)
+        asyncio.run(dashboard._update_data())
+        rebuilt = dashboard.scheduler.render(dashboard.layout)
+        assert "metrics" in rebuilt and "trades" not in rebuilt
+
+        unit = TradingUnit(65000.0, datetime(2024, 1, 1), 0.1, 63000.0, 1, 1)
+        dashboard.strategy.positions["BTCUSDT"] = Position("BTCUSDT", "LONG", [unit], 0.1, 65000.0)
+        assert "positions" in dashboard.scheduler.render(dashboard.layout)
+        dashboard.current_prices["BTCUSDT"] = 71000.0
+        assert "positions" in dashboard.scheduler.render(dashboard.layout)
+        assert "positions" not in dashboard.scheduler.render(dashboard.layout)
+
+        dashboard.account.update_balance(100.0)
+        assert "account" in dashboard.scheduler.render(dashboard.layout)
+
+        dashboard.handle_keyboard_input('R')
+        assert set(dashboard.scheduler.render(dashboard.layout)) == set(PANELS)
+
+    def test_data_and_redraw_intervals_are_independent(self, dashboard, monkeypatch):
+        """데이터 갱신과 화면 갱신은 각자의 주기로 돌고, 바뀐 패널이 없으면 화면을 출력하지 않아야 함"""
+        monkeypatch.setattr(UIConfig, 'DASHBOARD_DATA_INTERVAL', 0.01)
+        monkeypatch.setattr(UIConfig, 'DASHBOARD_REFRESH_RATE', 0.05)
+        updates = []
+
+        async def update_data():
+            updates.append(1)
+
+        class FakeLive:
+            refreshes = 0
+
+            def refresh(self):
+                FakeLive.refreshes += 1
+
+        async def run():
+            dashboard.is_running = True
+            dashboard.scheduler.render(dashboard.layout)  # 첫 화면은 이미 출력됨
+            loop_task = asyncio.create_task(dashboard._run_loop(FakeLive()))
+            await asyncio.sleep(0.3)
+            dashboard.stop()
+            await loop_task
+
+        monkeypatch.setattr(dashboard, '_update_data', update_data)
+        asyncio.run(run())
+        frames = dashboard.scheduler.frames - 2
+        assert 3 <= frames < len(updates)
+        assert FakeLive.refreshes <= 1  # 0.3초 동안 바뀌는 것은 헤더 시계뿐
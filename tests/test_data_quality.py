@@ -0,0 +1,117 @@
+"""
+캔들 데이터 품질 검증 테스트
+"""
+
+import numpy as np
+import pytest
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# 프로젝트 루트를 파이썬 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from utils.benchmark import generate_benchmark_data
+from utils.kline_store import KlineStore, bars_to_columns
+from utils.data_quality import KlineIngestor, inspect_columns, validate_columns
+
+HOUR_MS = 3_600_000
+
+
+@pytest.fixture
+def columns():
+    """2024-01-29부터 1시간봉 200개 (월 경계 포함)"""
+    data = generate_benchmark_data(200, timeframe='1h', seed=36, start=datetime(2024, 1, 29))
+    return bars_to_columns(data)
+
+
+def _take(columns, index):
+    return {name: col[index] for name, col in columns.items()}
+
+
+class TestValidateColumns:
+    """검증/정리 테스트"""
+
+    def test_clean_data_passes_unchanged(self, columns):
+        clean, report = inspect_columns('BTCUSDT', '1h', columns)
+        assert report.ok
+        assert report.bars == 200
+        for name in columns:
+            np.testing.assert_array_equal(clean[name], columns[name])
+
+    def test_sorts_and_keeps_last_duplicate(self, columns):
+        """역순/중복 봉은 정렬 후 나중 값만 남아야 함"""
+        index = np.concatenate([np.arange(100, 200), np.arange(0, 100), [50]])
+        shuffled = _take(columns, index)
+        shuffled['close'] = shuffled['close'].copy()
+        shuffled['close'][-1] = shuffled['high'][-1]  # 나중에 수집된 50번째 봉
+
+        clean, report = inspect_columns('BTCUSDT', '1h', shuffled)
+
+        assert (report.out_of_order, report.duplicates, report.missing) == (2, 1, 0)
+        np.testing.assert_array_equal(clean['open_time'], columns['open_time'])
+        assert clean['close'][50] == columns['high'][50]
+
+    def test_detects_missing_and_invalid_bars(self, columns):
+        """누락 구간과 OHLC 불일치/경계 불일치 봉을 찾아 제거해야 함"""
+        broken = _take(columns, np.r_[0:40, 45:200])
+        broken['high'] = broken['high'].copy()
+        broken['high'][10] = broken['low'][10] - 1
+        broken['open_time'] = broken['open_time'].copy()
+        broken['open_time'][20] += 60_000
+
+        clean, report = inspect_columns('BTCUSDT', '1h', broken)
+
+        assert (report.invalid_ohlc, report.misaligned, report.missing) == (1, 1, 7)
+        assert [columns['open_time'][40], columns['open_time'][44]] in report.gaps
+        assert len(clean['open_time']) == 200 - 7
+
+    def test_forward_fill_uses_previous_close(self, columns):
+        gapped = _take(columns, np.r_[0:40, 45:200])
+        clean, issues, filled = validate_columns(gapped, '1h', fill_gaps=True)
+
+        np.testing.assert_array_equal(clean['open_time'], columns['open_time'])
+        np.testing.assert_array_equal(filled, columns['open_time'][40:45])
+        for name in ('open', 'high', 'low', 'close'):
+            assert np.all(clean[name][40:45] == columns['close'][39])
+        assert np.all(clean['volume'][40:45] == 0)
+        assert clean['close'][45] == columns['close'][45]
+
+    def test_monthly_grid(self):
+        """월봉은 달력 월 단위로 누락을 찾아야 함"""
+        months = np.array(['2024-01', '2024-02', '2024-05'], dtype='datetime64[M]')
+        open_time = months.astype('datetime64[ms]').astype(np.int64)
+        columns = {'open_time': open_time, 'open': np.ones(3), 'high': np.full(3, 2.0),
+                   'low': np.full(3, 0.5), 'close': np.ones(3), 'volume': np.ones(3)}
+
+        _, report = inspect_columns('BTCUSDT', '1M', columns)
+        assert report.missing == 2
+
+
+class TestKlineIngestor:
+    """수집/보고서 저장 테스트"""
+
+    def test_writes_partitions_with_reports(self, columns, tmp_path):
+        store = KlineStore(str(tmp_path))
+        gapped = _take(columns, np.r_[0:40, 45:200])
+
+        clean, reports = KlineIngestor(store, fill_gaps=False).ingest('BTCUSDT', '1h', gapped)
+
+        assert set(reports) == {'2024-01', '2024-02'}
+        assert sum(r.bars for r in reports.values()) == len(clean['open_time'])
+        assert sum(r.missing for r in reports.values()) == 5
+        loaded = KlineIngestor(store).quality('BTCUSDT', '1h', '2024-01-01', '2024-02-28')
+        assert [r.to_dict() for r in loaded] == [reports[m].to_dict() for m in sorted(reports)]
+        np.testing.assert_array_equal(
+            store.load_columns('BTCUSDT', '1h', '2024-01-01', '2024-02-28')['open_time'], clean['open_time'])
+
+    def test_forward_filled_partition_is_complete(self, columns, tmp_path):
+        store = KlineStore(str(tmp_path))
+        gapped = _take(columns, np.r_[0:40, 45:200])
+
+        _, reports = KlineIngestor(store, fill_gaps=True).ingest('BTCUSDT', '1h', gapped)
+
+        assert sum(r.filled for r in reports.values()) == 5
+        stored = store.load_columns('BTCUSDT', '1h', '2024-01-01', '2024-02-28')['open_time']
+        assert np.all(np.diff(stored) == HOUR_MS)
@@ -0,0 +1,93 @@
+"""
+시뮬레이션 코어 동등성 테스트
+사전 계산 코어와 두 엔진 진입점이 리팩터링 전 엔진(기준 커밋)이 고정 시드 데이터로 만든 거래/자산 곡선/최종 잔고와
+같은지 확인 (기대값은 tests/golden/engine_parity.json에 고정)
+"""
+
+import asyncio
+import json
+import pytest
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 파이썬 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config import TradingMode
+from strategy.turtle_strategy import TurtleStrategy
+from strategy.backtest_core import SimulationCore
+from utils.benchmark import generate_benchmark_data, _load_legacy_engine_module
+
+GOLDEN = json.loads((Path(__file__).parent / 'golden' / 'engine_parity.json').read_text(encoding='utf-8'))['cases']
+CASE_IDS = [f"{case['timeframe']}-{''.join(map(str, case['systems']))}-seed{case['seed']}" for case in GOLDEN]
+
+
+def _trade_keys(trades):
+    # 거래 시각은 실행 시점 기준이므로 비교에서 제외
+    return [[t.direction, t.system, t.entry_price, t.exit_price, t.size, t.exit_reason, t.pnl] for t in trades]
+
+
+def _data(case):
+    return generate_benchmark_data(case['n_bars'], timeframe=case['timeframe'], seed=case['seed'])
+
+
+def _assert_matches_golden(case, trades, equity, final_balance):
+    assert case['trades'], "비교할 거래가 있어야 합니다"
+    assert _trade_keys(trades) == case['trades'], "거래가 기준 엔진과 같아야 합니다"
+    assert equity == case['equity'], "자산 곡선이 기준 엔진과 같아야 합니다"
+    assert final_balance == case['final_balance'], "최종 잔고가 기준 엔진과 같아야 합니다"
+
+
+class TestSimulationCoreParity:
+    """코어와 기준 엔진 결과 동등성 테스트"""
+
+    @pytest.mark.parametrize("case", GOLDEN, ids=CASE_IDS)
+    def test_core_matches_golden(self, case):
+        """같은 데이터에서 거래, 자산 곡선, 최종 잔고가 기준 엔진과 완전히 같아야 함"""
+        data = _data(case)
+        core = SimulationCore(TurtleStrategy(TradingMode.BACKTEST), data, data[0].symbol, case['timeframe'],
+                              case['systems'])
+        core.run()
+
+        _assert_matches_golden(case, core.strategy.get_trade_history(),
+                               [p['total_value'] for p in core.equity_curve], core.balance)
+
+
+class TestEngineAdapters:
+    """두 엔진 진입점과 기준 엔진 결과 동등성 테스트"""
+
+    @pytest.mark.parametrize("case", GOLDEN, ids=CASE_IDS)
+    @pytest.mark.parametrize("adapter", ['frontend', 'backend'])
+    def test_engine_matches_golden(self, adapter, case):
+        """프론트엔드 엔진과 .backend 엔진이 각각 기준 엔진과 같은 결과를 내야 함"""
+        if adapter == 'frontend':
+            from frontend.backtest.backend.engines import backtest_engine as module
+        else:
+            module = _load_legacy_engine_module()
+
+        data = _data(case)
+        config = module.BacktestConfig_(symbol=data[0].symbol, timeframe=case['timeframe'], systems=case['systems'],
+                                        start_date=data[0].date.strftime('%Y-%m-%d'),
+                                        end_date=data[-1].date.strftime('%Y-%m-%d'))
+        engine = module.BacktestEngine(config)
+
+        async def _load(*args, **kwargs):
+            return data
+
+        engine.load_historical_data = _load
+        results = asyncio.run(engine.run_backtest())
+
+        _assert_matches_golden(case, results.trades, [p['total_value'] for p in results.equity_curve],
+                               results.final_balance)
+
+    def test_legacy_engine_seeded_data_is_reproducible(self):
+        """.backend 엔진 더미 데이터는 seed 지정 시 재현 가능해야 함"""
+        legacy = _load_legacy_engine_module()
+        config = legacy.BacktestConfig_(start_date='2023-01-01', end_date='2023-06-30', seed=5)
+
+        first = asyncio.run(legacy.BacktestEngine(config).load_historical_data())
+        second = asyncio.run(legacy.BacktestEngine(config).load_historical_data())
+
+        assert [p.close for p in first] == [p.close for p in second]
+        assert len(first) == 181
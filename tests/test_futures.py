@@ -0,0 +1,170 @@
+"""
+선물 계좌 시뮬레이션 테스트 (청산가, 봉 내 강제청산, 펀딩비)
+"""
+
+import pytest
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 파이썬 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config import TradingMode
+from frontend.backtest.backend.engines.backtest_engine import BacktestConfig_, BacktestEngine
+from strategy.backtest_core import SimulationCore, start_index
+from strategy.futures import FuturesAccount, bar_funding, funding_schedule, liquidation_price
+from strategy.turtle_strategy import TurtleStrategy
+from utils.benchmark import generate_benchmark_data
+from utils.funding_store import FundingRateStore
+from utils.timeaxis import DAY_MS, HOUR_MS, to_ms
+
+
+def _run(price_data, leverage, futures, timeframe='1h'):
+    core = SimulationCore(TurtleStrategy(TradingMode.BACKTEST), price_data, 'BTCUSDT', timeframe,
+                          leverage=leverage, futures=futures)
+    core.run()
+    return core
+
+
+class TestLiquidationPrice:
+    """청산가/유지 증거금 단계 테스트"""
+
+    @pytest.mark.parametrize("direction", ["LONG", "SHORT"])
+    @pytest.mark.parametrize("leverage", [5, 20, 125])
+    def test_equity_equals_maintenance_at_liquidation(self, direction, leverage):
+        """청산가에서 마진 + 미실현 손익이 유지 증거금과 같아야 함"""
+        account = FuturesAccount(leverage)
+        entry, size = 30000.0, 12.0  # 명목 360,000 (3단계 증거금)
+        margin = entry * size / leverage
+        mm_rate, mm_amount = account.maintenance(entry * size)
+        assert (mm_rate, mm_amount) == (0.01, pytest.approx(1300.0))
+
+        price = liquidation_price(direction, entry, size, margin, mm_rate, mm_amount)
+        pnl = (price - entry) * size if direction == "LONG" else (entry - price) * size
+        assert margin + pnl == pytest.approx(price * size * mm_rate - mm_amount)
+        assert (price < entry) if direction == "LONG" else (price > entry)
+
+    def test_unleveraged_long_never_liquidates(self):
+        account = FuturesAccount(1.0)
+        mm_rate, mm_amount = account.maintenance(1000.0)
+        assert liquidation_price("LONG", 100.0, 10.0, 1000.0, mm_rate, mm_amount) == 0.0
+
+    def test_maintenance_continuous_at_bracket_caps(self):
+        """단계 경계에서 유지 증거금이 끊기지 않아야 함"""
+        account = FuturesAccount()
+        for cap in account.brackets[:-1, 0]:
+            below = account.maintenance(cap)
+            above = account.maintenance(cap + 1e-6)
+            assert cap * below[0] - below[1] == pytest.approx(cap * above[0] - above[1])
+
+
+class TestFunding:
+    """펀딩비 매핑/저장소 테스트"""
+
+    def test_bar_funding_mapping(self):
+        """펀딩 시각이 속한 봉에 비율을 합산하고, 누락 봉 구간의 펀딩은 버려야 함"""
+        start = to_ms('2024-01-01')
+        funding_times = funding_schedule(start, start + 2 * DAY_MS)
+        assert len(funding_times) == 6
+        rates = np.arange(1, 7) * 1e-4
+
+        hourly = start + np.arange(48, dtype=np.int64) * HOUR_MS
+        per_bar = bar_funding(hourly, '1h', funding_times, rates)
+        assert np.flatnonzero(per_bar).tolist() == [0, 8, 16, 24, 32, 40]
+        assert per_bar.sum() == pytest.approx(rates.sum())
+
+        daily = start + np.arange(2, dtype=np.int64) * DAY_MS
+        assert bar_funding(daily, '1d', funding_times, rates) == pytest.approx([6e-4, 15e-4])
+
+        gapped = np.delete(hourly, [16])
+        assert bar_funding(gapped, '1h', funding_times, rates).sum() == pytest.approx(rates.sum() - 3e-4)
+
+    def test_store_merge_and_range(self, tmp_path):
+        store = FundingRateStore(str(tmp_path))
+        start = to_ms('2024-01-01')
+        times = funding_schedule(start, start + DAY_MS)
+        store.write('BTCUSDT', times, [1e-4, 2e-4, 3e-4])
+        store.write('BTCUSDT', times[2:] + np.array([0, 8 * HOUR_MS]), [-3e-4, 4e-4])
+
+        loaded_times, rates = store.load('BTCUSDT')
+        assert loaded_times.tolist() == times.tolist() + [start + DAY_MS]
+        assert rates.tolist() == [1e-4, 2e-4, -3e-4, 4e-4]
+        assert store.load('BTCUSDT', '2024-01-01 08:00', start + DAY_MS)[1].tolist() == [2e-4, -3e-4]
+        assert store.load('ETHUSDT')[0].size == 0
+
+    def test_funding_charged_on_held_positions(self):
+        """펀딩비는 보유 중인 봉에만 부과되며, 강제청산 없는 계좌에서 비율 0이면 결과가 같아야 함"""
+        price_data = generate_benchmark_data(2000, seed=9, timeframe='1h')
+        start, end = to_ms(price_data[0].date), to_ms(price_data[-1].date) + HOUR_MS
+        plain = _run(price_data, 1.0, None)
+        zero = _run(price_data, 1.0, FuturesAccount(1.0, funding_schedule(start, end),
+                                                    np.zeros(len(funding_schedule(start, end)))))
+        assert zero.balance == plain.balance
+        assert len(zero.strategy.trade_history) == len(plain.strategy.trade_history)
+
+        schedule = funding_schedule(start, end)
+        charged = _run(price_data, 1.0, FuturesAccount(1.0, schedule, np.full(len(schedule), 1e-3)))
+        account = charged.futures
+        assert 0 < account.funding_events < len(schedule)
+        assert account.funding_paid != 0.0
+        assert charged.balance != plain.balance
+
+
+class TestIntrabarLiquidation:
+    """봉 내 강제청산 테스트"""
+
+    def test_wick_through_liquidation_price(self):
+        """종가가 회복해도 저가/고가가 청산가에 닿으면 청산가로 강제청산되고 마진 전액을 잃어야 함"""
+        price_data = generate_benchmark_data(1500, seed=4, timeframe='1h')
+        futures = FuturesAccount(20.0)
+        core = SimulationCore(TurtleStrategy(TradingMode.BACKTEST), price_data, 'BTCUSDT', '1h',
+                              leverage=20.0, futures=futures)
+        strategy = core.strategy
+
+        i = start_index('1h', len(price_data))
+        while not strategy.positions:
+            core.step(i)
+            i += 1
+        position = strategy.get_position('BTCUSDT')
+        liq = futures.liquidation_price(position)
+        margin = futures.margin(position)
+        # 다음 봉에 청산가를 뚫는 꼬리 (종가는 그대로)
+        if position.direction == "LONG":
+            core.lows[i] = liq * 0.99
+        else:
+            core.highs[i] = liq * 1.01
+        balance = core.balance
+
+        core.step(i)
+        trade = strategy.trade_history[-1]
+        assert trade.exit_reason == 'LIQUIDATION'
+        assert trade.exit_price == pytest.approx(liq)
+        assert core.balance == pytest.approx(balance - margin)
+        assert futures.liquidations == 1
+
+    def test_wide_wick_run_loses_at_most_margin(self):
+        """꼬리가 긴 봉에서 고배율로 실행하면 강제청산이 일어나고, 그 거래 손실은 포지션 마진보다 작아야 함"""
+        price_data = [replace(b, high=b.close + 4 * (b.high - b.close), low=b.close - 4 * (b.close - b.low))
+                      for b in generate_benchmark_data(3000, seed=17, timeframe='1h')]
+        core = _run(price_data, 20.0, FuturesAccount(20.0))
+        liquidated = [t for t in core.strategy.trade_history if t.exit_reason == 'LIQUIDATION']
+        assert len(liquidated) == core.futures.liquidations > 0
+        for trade in liquidated:
+            assert 0 < -trade.pnl < trade.entry_price * trade.size / 20.0
+
+
+class TestEngineFutures:
+    @pytest.mark.asyncio
+    async def test_futures_can_be_disabled(self):
+        """선물 회계는 기본 꺼짐이고 futures=True로만 켜지며, 펀딩/청산이 없는 구간의 손익은 같아야 함"""
+        enabled = await BacktestEngine(BacktestConfig_(seed=1, futures=True)).run_backtest()
+        disabled = await BacktestEngine(BacktestConfig_(seed=1)).run_backtest()
+        assert enabled.config.futures and enabled.futures['liquidations'] == 0
+        assert enabled.futures['funding_events'] == 0
+        assert not disabled.config.futures and disabled.futures == {}
+        assert disabled.final_balance == enabled.final_balance
+        assert len(disabled.trades) == len(enabled.trades)
@@ -0,0 +1,111 @@
+"""
+의사결정 지연 추적 테스트 (단계별 히스토그램, 주문 단계 연결, 느린 판단 기록)
+"""
+
+import asyncio
+import json
+import pytest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 파이썬 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config import TelemetryConfig, TradingMode
+from strategy.turtle_strategy import TurtleStrategy
+from utils.benchmark import generate_benchmark_data
+from utils.live_trading import LiveTradingRuntime
+from utils.order_execution import MockExchange, OrderExecutor, OrderIntent
+from utils.paper_trading import PaperTradingRuntime, ReplayFeed
+from utils.telemetry import Histogram
+
+
+class TestLatencyTracer:
+    """판단 추적 테스트"""
+
+    def test_histogram_quantile(self):
+        """버킷 보간 분위수는 실제 분위수와 같은 버킷 안에 있어야 함"""
+        rng = np.random.default_rng(1)
+        values = rng.lognormal(-7.0, 1.0, 5000)
+        histogram = Histogram(TelemetryConfig.STAGE_LATENCY_BUCKETS)
+        for value in values:
+            histogram.observe(value)
+        bounds = (0.0,) + TelemetryConfig.STAGE_LATENCY_BUCKETS
+        for q in (0.5, 0.9, 0.99):
+            exact = np.quantile(values, q)
+            k = np.searchsorted(bounds, exact)
+            assert bounds[k - 1] <= histogram.quantile(q) <= bounds[k]
+        assert Histogram((1.0,)).quantile(0.5) == 0.0
+
+    def test_paper_decisions(self):
+        """가상매매 판단은 봉마다 지표/신호/전체 단계가 기록되고, 느린 판단은 최근 N개만 남아야 함"""
+        data = generate_benchmark_data(800, timeframe='1h', seed=5)
+        symbol = data[0].symbol
+        runtime = PaperTradingRuntime([symbol], timeframe='1h', strategy=TurtleStrategy(TradingMode.BACKTEST))
+        tracer = runtime.tracer
+        tracer.slow_decision_ns = 0  # 모든 판단을 느린 판단으로
+        summary = asyncio.run(runtime.run(ReplayFeed({symbol: data})))
+
+        stages = summary['trace']['stages']
+        decisions = runtime.latency.count
+        assert stages['indicators']['count'] == stages['signal']['count'] == stages['total']['count'] == decisions
+        assert 0 < stages['risk']['count'] <= decisions
+        assert 'feed' not in stages and 'order_submit' not in stages  # 재생 피드, 즉시 체결
+        assert stages['total']['p50_ms'] <= stages['total']['p99_ms']
+
+        assert summary['trace']['slow_decisions'] == decisions
+        assert len(tracer.slow_decisions()) == TelemetryConfig.FLIGHT_RECORDER_SIZE
+        last = tracer.slow_decisions(limit=1)[0]
+        assert last['symbol'] == symbol and last['bar'].startswith(str(data[-1].date.date()))
+        assert last['action'] is None and last['total_ms'] >= last['stages_ms']['indicators']
+
+    def test_live_order_stages(self):
+        """실거래 판단이 낸 주문은 체결 확인 시 주문 단계가 채워지고, 손절 주문은 추적하지 않아야 함"""
+        data = generate_benchmark_data(400, timeframe='1h', seed=5)
+        symbol = data[0].symbol
+
+        async def scenario():
+            exchange = MockExchange({symbol: data[0].close}, latency=0.002)
+            executor = OrderExecutor(exchange)
+            await executor.start()
+            runtime = LiveTradingRuntime([symbol], executor, timeframe='1h',
+                                         strategy=TurtleStrategy(TradingMode.BACKTEST))
+            runtime.tracer.slow_order_ns = 1_000_000  # 1ms (모의 거래소 응답 2ms)
+            assert await runtime.telemetry.start(port=0)
+            runtime.warm_up(symbol, data[:20])
+            for bar in data[20:]:
+                exchange.set_price(symbol, bar.close)
+                runtime.on_bar(bar)
+                await executor.join()
+                for _ in range(20):
+                    await asyncio.sleep(0)
+
+            reader, writer = await asyncio.open_connection('127.0.0.1', runtime.telemetry.server.port)
+            writer.write(b"GET /debug/slow HTTP/1.1\r\n\r\n")
+            response = (await reader.read()).decode()
+            writer.close()
+            await runtime.telemetry.stop()
+            await executor.stop()
+            return runtime, response
+
+        runtime, response = asyncio.run(scenario())
+        decided = [o for o in runtime.executor.orders.values() if o.request.intent != OrderIntent.STOP]
+        assert decided
+        summary = runtime.tracer.summary()
+        stages = summary['stages']
+        assert summary['pending'] == 0
+        assert stages['order_submit']['count'] == stages['fill_ack']['count'] == len(decided)
+        assert stages['to_send']['count'] == len(decided)
+        assert stages['order_submit']['p50_ms'] >= 1.0
+        assert stages['total']['count'] == runtime.latency.count
+
+        records = json.loads(response.split('\r\n\r\n', 1)[1])
+        assert summary['slow_decisions'] == len(decided)
+        assert records == runtime.tracer.slow_decisions()
+        record = records[-1]
+        assert record['action'] in (OrderIntent.ENTRY, OrderIntent.PYRAMID, OrderIntent.EXIT)
+        assert record['order_id'] in runtime.executor.orders
+        assert record['total_ms'] >= record['stages_ms']['order_submit'] >= 1.0
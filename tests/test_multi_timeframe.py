@@ -0,0 +1,129 @@
+"""
+멀티 타임프레임 확인 테스트
+"""
+
+import asyncio
+import numpy as np
+import pytest
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 파이썬 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config import TradingMode
+from strategy.turtle_strategy import TurtleStrategy
+from strategy.multi_timeframe import MultiTimeframeContext, context_from_columns
+from utils.benchmark import generate_benchmark_data
+from utils.kline_store import KlineStore, bars_to_columns
+from utils.resampler import bucket_ends, resample_columns
+from frontend.backtest.backend.engines.backtest_engine import BacktestEngine, BacktestConfig_
+
+
+@pytest.fixture(scope="module")
+def hourly_data():
+    """1시간봉 약 6개월치"""
+    return generate_benchmark_data(4500, timeframe='1h', seed=35)
+
+
+@pytest.fixture
+def context(hourly_data):
+    strategy = TurtleStrategy(TradingMode.BACKTEST)
+    return context_from_columns(strategy, bars_to_columns(hourly_data), '1h', '1d', [1, 2], use_atr=True)
+
+
+class TestMultiTimeframeContext:
+    """컨텍스트/인덱스 맵 테스트"""
+
+    def test_index_map_uses_only_closed_bars(self, hourly_data, context):
+        """하위 봉은 자기 마감 시각 이전에 마감된 상위 봉만 참조해야 함"""
+        columns = bars_to_columns(hourly_data)
+        daily = resample_columns(columns, '1d')
+        base_close = bucket_ends(columns['open_time'], '1h')
+        daily_close = bucket_ends(daily['open_time'], '1d')
+
+        mapped = context.index_map
+        valid = mapped >= 0
+        assert np.all(daily_close[mapped[valid]] <= base_close[valid])
+        following = mapped + 1
+        has_next = following < len(daily_close)
+        assert np.all(daily_close[following[has_next]] > base_close[has_next])
+
+    def test_daily_bar_is_visible_from_its_last_hour(self, hourly_data, context):
+        """일봉의 마지막 1시간봉(23:00)부터 그 일봉을 참조해야 함"""
+        hours = [bar.date.hour for bar in hourly_data]
+        i = hours.index(23, 24)
+        assert context.htf_index(i) == context.htf_index(i - 1) + 1
+
+    def test_confirms_against_daily_channel(self, context):
+        """상위 채널을 넘는 가격만 확인되어야 함"""
+        period = context.confirm_periods[1]
+        i = int(np.flatnonzero(~np.isnan(context.highest[period][context.index_map.clip(0)]))[0])
+        j = context.htf_index(i)
+        high, low = context.highest[period][j], context.lowest[period][j]
+
+        assert context.confirms(i, 1, "LONG", high + 1)
+        assert not context.confirms(i, 1, "LONG", high)
+        assert context.confirms(i, 1, "SHORT", low - 1)
+        assert not context.confirms(i, 1, "SHORT", low)
+        assert not context.confirms(0, 1, "LONG", 1e12), "상위 이력이 없으면 확인하지 않아야 함"
+
+    def test_strategy_entry_signal_uses_context(self, hourly_data, context):
+        """bar_index를 넘기면 전략 진입 신호에도 상위 확인이 적용되어야 함"""
+        strategy = TurtleStrategy(TradingMode.BACKTEST)
+        for i in range(200, len(hourly_data)):
+            window = hourly_data[:i + 1]
+            if strategy.check_entry_signal('BTCUSDT', window, 2, "LONG", '1h'):
+                break
+        else:
+            pytest.fail("1시간봉 돌파가 있어야 합니다")
+
+        strategy.set_timeframe_context(context)
+        expected = context.confirms(i, 2, "LONG", hourly_data[i].close)
+        assert strategy.check_entry_signal('BTCUSDT', window, 2, "LONG", '1h', bar_index=i) == expected
+        assert strategy.check_entry_signal('BTCUSDT', window, 2, "LONG", '1h'), "bar_index가 없으면 기존 동작"
+
+    def test_higher_timeframe_must_be_coarser(self, hourly_data):
+        columns = bars_to_columns(hourly_data)
+        with pytest.raises(ValueError, match="상위 타임프레임"):
+            MultiTimeframeContext.build(columns['open_time'], '1h', resample_columns(columns, '15m'),
+                                        '15m', {1: 20}, 20)
+
+
+class TestEngineConfirmation:
+    """엔진 연동 테스트"""
+
+    def _run(self, hourly_data, tmp_path, **options):
+        store = KlineStore(str(tmp_path))
+        store.write('BTCUSDT', '1h', hourly_data)
+        config = BacktestConfig_(symbol='BTCUSDT', timeframe='1h',
+                                 start_date=hourly_data[0].date.strftime('%Y-%m-%d'),
+                                 end_date=hourly_data[-1].date.strftime('%Y-%m-%d'), **options)
+        engine = BacktestEngine(config)
+        engine.kline_store = store
+        return asyncio.run(engine.run_backtest())
+
+    def test_confirmation_filters_entries(self, hourly_data, tmp_path):
+        """상위 확인을 켜면 일봉 채널을 넘지 못한 돌파는 진입하지 않아야 함"""
+        plain = self._run(hourly_data, tmp_path / 'plain')
+        confirmed = self._run(hourly_data, tmp_path / 'confirmed', confirm_timeframe='1d')
+
+        assert 0 < len(confirmed.trades) < len(plain.trades)
+
+    def test_higher_timeframe_atr_changes_sizing(self, hourly_data, tmp_path):
+        """상위 ATR 사용 시 유닛 크기/손절 거리가 달라져야 함"""
+        confirmed = self._run(hourly_data, tmp_path / 'a', confirm_timeframe='1d')
+        with_atr = self._run(hourly_data, tmp_path / 'b', confirm_timeframe='1d', higher_timeframe_atr=True)
+
+        assert [t.size for t in confirmed.trades] != [t.size for t in with_atr.trades]
+
+    def test_streaming_rejects_confirmation(self, hourly_data, tmp_path):
+        store = KlineStore(str(tmp_path))
+        store.write('BTCUSDT', '1h', hourly_data)
+        engine = BacktestEngine(BacktestConfig_(symbol='BTCUSDT', timeframe='1h', confirm_timeframe='1d',
+                                                start_date=hourly_data[0].date.strftime('%Y-%m-%d'),
+                                                end_date=hourly_data[-1].date.strftime('%Y-%m-%d')))
+        engine.kline_store = store
+        with pytest.raises(ValueError, match="상위 타임프레임"):
+            asyncio.run(engine.run_streaming_backtest(str(tmp_path / 'out')))
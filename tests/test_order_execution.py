@@ -0,0 +1,407 @@
+"""
+주문 실행 파이프라인 테스트 (로컬 모의 거래소)
+"""
+
+import asyncio
+import pytest
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+
+# 프로젝트 루트를 파이썬 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config import BinanceConfig, ExecutionConfig, TradingMode
+from strategy.turtle_strategy import TurtleStrategy
+from utils.benchmark import generate_benchmark_data
+from utils.live_trading import LiveTradingRuntime
+from utils.paper_trading import ReplayFeed
+from utils.order_execution import (BinanceFuturesGateway, ManagedOrder, MockExchange, OrderError, OrderExecutor,
+                                   OrderIntent, OrderRateLimiter, OrderRequest, OrderStatus, OrderType, OrderUpdate,
+                                   round_to_step)
+
+
+async def _settle(executor: OrderExecutor):
+    """큐의 주문 제출과 스트림 이벤트 처리가 끝날 때까지 대기"""
+    await executor.join()
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+def _run(coro_fn, *args, **kwargs):
+    return asyncio.run(coro_fn(*args, **kwargs))
+
+
+class TestOrderExecutor:
+    """주문 실행기 테스트"""
+
+    def test_market_order_reconciled_from_user_stream(self):
+        """시장가 주문 체결은 사용자 데이터 스트림 이벤트로 반영되어야 함"""
+        async def scenario():
+            exchange = MockExchange({'BTCUSDT': 50000.0})
+            executor = OrderExecutor(exchange)
+            await executor.start()
+            order = executor.submit(OrderRequest('BTCUSDT', 'BUY', 0.5))
+            filled = await executor.wait(order.client_order_id, timeout=1)
+            await executor.stop()
+            return exchange, filled
+
+        exchange, order = _run(scenario)
+        assert order.status == OrderStatus.FILLED
+        assert order.filled_qty == 0.5
+        assert order.avg_price == 50000.0
+        assert order.commission == pytest.approx(50000.0 * 0.5 * 0.0004)
+        assert exchange.positions['BTCUSDT'] == 0.5
+
+    def test_client_order_id_idempotency(self):
+        """같은 client order id는 한 번만 주문되고, 응답 유실 시 재전송 대신 조회로 대사해야 함"""
+        async def scenario():
+            exchange = MockExchange({'BTCUSDT': 50000.0})
+            exchange.drop_acks = 1
+            executor = OrderExecutor(exchange, submit_timeout=0.5)
+            await executor.start()
+            request = OrderRequest('BTCUSDT', 'BUY', 0.1, client_order_id='tt-test-e1')
+            first = executor.submit(request)
+            again = executor.submit(replace(request))
+            await executor.wait(first.client_order_id, timeout=1)
+            await executor.stop()
+            return exchange, first, again
+
+        exchange, first, again = _run(scenario)
+        assert again is first
+        assert len(exchange.submissions) == 1, "응답이 유실되어도 주문은 한 번만 제출되어야 합니다"
+        assert first.status == OrderStatus.FILLED
+        assert exchange.positions['BTCUSDT'] == pytest.approx(0.1)
+
+    def test_rejected_order_resolves(self):
+        """거래소가 거부한 주문은 REJECTED로 종료되어야 함"""
+        async def scenario():
+            executor = OrderExecutor(MockExchange({'BTCUSDT': 50000.0}))
+            await executor.start()
+            order = executor.submit(OrderRequest('BTCUSDT', 'SELL', 1.0, intent=OrderIntent.EXIT, reduce_only=True))
+            await executor.wait(order.client_order_id, timeout=1)
+            await executor.stop()
+            return order
+
+        order = _run(scenario)
+        assert order.status == OrderStatus.REJECTED
+        assert 'ReduceOnly' in order.error
+
+    def test_rate_limit_and_cross_symbol_concurrency(self):
+        """다른 종목 주문은 동시에 나가되 초당 주문 한도를 넘지 않아야 하고, 같은 종목은 순서대로 나가야 함"""
+        symbols = [f"S{k}USDT" for k in range(8)]
+
+        async def scenario():
+            exchange = MockExchange({s: 100.0 for s in symbols}, latency=0.05)
+            executor = OrderExecutor(exchange, rate=100, burst=8, workers=8)
+            await executor.start()
+            started = time.monotonic()
+            orders = [executor.submit(OrderRequest(s, 'BUY', 1.0)) for s in symbols]
+            same = [executor.submit(OrderRequest('S0USDT', 'BUY', 1.0)) for _ in range(3)]
+            await _settle(executor)
+            elapsed = time.monotonic() - started
+            await executor.stop()
+            return exchange, orders, same, elapsed
+
+        exchange, orders, same, elapsed = _run(scenario)
+        assert all(o.status == OrderStatus.FILLED for o in orders + same)
+        assert elapsed < 8 * 0.05, "종목 간 제출이 병렬이어야 합니다"
+
+        ids = [cid for _, cid in exchange.submissions]
+        assert [ids.index(o.client_order_id) for o in same] == sorted(ids.index(o.client_order_id) for o in same)
+        times = sorted(t for t, _ in exchange.submissions)
+        for i in range(len(times)):
+            in_window = sum(1 for t in times[i:] if t - times[i] < 0.1)
+            assert in_window <= 8 + 10 + 1, "0.1초 창에서 버스트 + 한도를 넘지 않아야 합니다"
+
+    def test_rate_limiter_spacing(self):
+        """토큰이 없으면 한도 간격만큼 대기를 예약해야 함"""
+        now = [0.0]
+        limiter = OrderRateLimiter(rate=10, burst=2, clock=lambda: now[0])
+        waits = [limiter.reserve() for _ in range(5)]
+        assert waits == pytest.approx([0.0, 0.0, 0.1, 0.2, 0.3])
+        now[0] = 1.0
+        assert limiter.reserve() == 0.0
+
+    def test_stale_events_ignored(self):
+        """누적 체결 수량이 줄어드는 지난 이벤트나 중복 이벤트는 무시해야 함"""
+        async def scenario():
+            exchange = MockExchange({'BTCUSDT': 100.0})
+            executor = OrderExecutor(exchange)
+            await executor.start()
+            order = executor.submit(OrderRequest('BTCUSDT', 'BUY', 2.0))
+            await executor.wait(order.client_order_id, timeout=1)
+            await executor.stop()
+            return order
+
+        order = _run(scenario)
+        commission = order.commission
+        assert not order.apply(OrderUpdate('BTCUSDT', order.client_order_id, OrderStatus.PARTIALLY_FILLED, 1.0))
+        assert not order.apply(OrderUpdate('BTCUSDT', order.client_order_id, OrderStatus.FILLED, 2.0,
+                                           100.0, commission=1.0))
+        assert order.commission == commission
+
+
+    def test_gateway_rounds_to_exchange_filters(self):
+        """수량은 stepSize로 내림, 손절가는 tickSize로 매도는 내림/매수는 올림해야 함"""
+        gateway = BinanceFuturesGateway(testnet=True)
+        sent = []
+
+        async def call(method, **params):
+            if method == 'futures_exchange_info':
+                return {'symbols': [{'symbol': 'BTCUSDT', 'filters': [
+                    {'filterType': 'PRICE_FILTER', 'tickSize': '0.10'},
+                    {'filterType': 'LOT_SIZE', 'stepSize': '0.001'}]}]}
+            sent.append(params)
+            return {}
+
+        gateway._call = call
+
+        async def scenario():
+            for side in ('SELL', 'BUY'):
+                await gateway.submit(OrderRequest('BTCUSDT', side, 0.12345, OrderType.STOP_MARKET, OrderIntent.STOP,
+                                                  stop_price=63012.3456789, reduce_only=True))
+            await gateway.submit(OrderRequest('BTCUSDT', 'BUY', 0.3))
+
+        asyncio.run(scenario())
+        assert [p['stopPrice'] for p in sent[:2]] == [63012.3, 63012.4]
+        assert [p['quantity'] for p in sent] == [0.123, 0.123, 0.3]
+        assert 'stopPrice' not in sent[2]
+        assert round_to_step(0.3, 0.1) == 0.3 and round_to_step(1.5, 0.0) == 1.5
+
+    def test_round_to_step_absorbs_float_error(self):
+        """부동소수 합산 오차는 가장 가까운 단위로 맞추고, 실제 단위 미만 수량만 내림/올림해야 함"""
+        assert 0.7 + 0.1 != 0.8
+        assert round_to_step(0.7 + 0.1, 0.001) == 0.8
+        assert round_to_step(0.7 + 0.1, 0.001, up=True) == 0.8
+        assert round_to_step(0.8 + 1e-12, 0.001, up=True) == 0.8
+        assert round_to_step(0.7995, 0.001) == 0.799
+        assert round_to_step(0.7995, 0.001, up=True) == 0.8
+
+    def test_mock_exchange_enforces_step_size(self):
+        """모의 거래소는 수량을 LOT_SIZE 단위로 맞추고 (전량 청산은 올림) 0이 되는 주문은 거부해야 함"""
+        async def scenario():
+            exchange = MockExchange({'BTCUSDT': 50000.0}, step_sizes={'BTCUSDT': 0.001})
+            executor = OrderExecutor(exchange)
+            await executor.start()
+            entry = executor.submit(OrderRequest('BTCUSDT', 'BUY', 0.12345))
+            dust = executor.submit(OrderRequest('BTCUSDT', 'BUY', 0.0004))
+            close = executor.submit(OrderRequest('BTCUSDT', 'SELL', 0.1230001, intent=OrderIntent.EXIT,
+                                                 reduce_only=True, close_all=True))
+            await _settle(executor)
+            await executor.stop()
+            return exchange, entry, dust, close
+
+        exchange, entry, dust, close = _run(scenario)
+        assert entry.filled_qty == 0.123
+        assert dust.status == OrderStatus.REJECTED
+        assert close.status == OrderStatus.FILLED and close.filled_qty == 0.123
+        assert exchange.positions['BTCUSDT'] == 0.0
+
+    def test_stream_failure_stops_live_runtime(self, monkeypatch):
+        """사용자 데이터 스트림이 재연결 한도를 넘어 끊기면 실행기에 오류가 남고 실거래 런타임이 중지되어야 함"""
+        data = generate_benchmark_data(200, timeframe='1h', seed=4)
+        symbol = data[0].symbol
+        monkeypatch.setattr(BinanceConfig, 'RECONNECT_ATTEMPTS', 0)
+
+        class BrokenStream(MockExchange):
+            async def user_events(self):
+                raise ConnectionError("listen key expired")
+                yield
+
+        async def scenario():
+            executor = OrderExecutor(BrokenStream({symbol: data[0].close}))
+            await executor.start()
+            runtime = LiveTradingRuntime([symbol], executor, timeframe='1h',
+                                         strategy=TurtleStrategy(TradingMode.BACKTEST))
+            try:
+                with pytest.raises(ConnectionError, match="listen key expired"):
+                    await runtime.run(ReplayFeed({symbol: data}))
+            finally:
+                await executor.stop()
+            return executor, runtime
+
+        executor, runtime = _run(scenario)
+        assert isinstance(executor.error, ConnectionError)
+        assert runtime.error is executor.error and not runtime.is_running
+        assert runtime.bars_processed < len(data) - 2
+
+
+class TestLiveTradingRuntime:
+    """실거래 런타임 테스트 (모의 거래소)"""
+
+    def test_exchange_side_stops_and_reconciled_positions(self):
+        """진입 체결 후 거래소에 손절 주문이 걸리고, 손절은 거래소가 실행하며 포지션이 거래소와 일치해야 함"""
+        data = generate_benchmark_data(600, timeframe='1h', seed=5)
+        symbol = data[0].symbol
+
+        async def scenario():
+            exchange = MockExchange({symbol: data[0].close})
+            executor = OrderExecutor(exchange)
+            await executor.start()
+            runtime = LiveTradingRuntime([symbol], executor, timeframe='1h',
+                                         strategy=TurtleStrategy(TradingMode.BACKTEST))
+            runtime.warm_up(symbol, data[:20])
+            stop_checks = []
+            for bar in data[20:]:
+                exchange.set_price(symbol, bar.close)
+                await _settle(executor)
+                runtime.on_bar(bar)
+                await _settle(executor)
+                position = runtime.strategy.get_position(symbol)
+                if position is not None:
+                    stop = exchange.orders[runtime.stop_orders[symbol]]
+                    stop_checks.append((stop['stopPrice'], runtime.strategy.position_stop(position),
+                                        stop['origQty'], position.total_size))
+            await executor.stop()
+            return exchange, runtime, stop_checks
+
+        exchange, runtime, stop_checks = _run(scenario)
+        trades = runtime.strategy.get_trade_history()
+        assert stop_checks, "포지션 보유 중 손절 주문이 있어야 합니다"
+        for stop_price, expected_stop, stop_qty, size in stop_checks:
+            assert stop_price == expected_stop
+            assert stop_qty == pytest.approx(size)
+        assert any(t.exit_reason == 'STOP_LOSS' for t in trades), "거래소 손절 체결이 있어야 합니다"
+
+        position = runtime.strategy.get_position(symbol)
+        expected = 0.0 if position is None else (position.total_size if position.direction == "LONG"
+                                                 else -position.total_size)
+        assert exchange.positions.get(symbol, 0.0) == pytest.approx(expected)
+        open_stops = [o for o in exchange.open_orders(symbol) if o['type'] == OrderType.STOP_MARKET]
+        assert len(open_stops) == (0 if position is None else 1), "손절 주문은 포지션당 하나여야 합니다"
+        assert not runtime.pending
+
+    def _open_position(self, exchange, executor):
+        """진입 주문을 체결시켜 손절 주문이 걸린 LONG 포지션을 만든 런타임"""
+        runtime = LiveTradingRuntime(['BTCUSDT'], executor, timeframe='1h',
+                                     strategy=TurtleStrategy(TradingMode.BACKTEST))
+        runtime._open('BTCUSDT', "LONG", 50000.0, 1000.0, 1, 0)
+        return runtime
+
+    def test_partial_exit_resubmits_remainder(self):
+        """청산 주문이 일부만 체결되고 종료되면 남은 수량을 다시 주문하고, 전량 청산 후 평균가로 기록해야 함"""
+        async def scenario():
+            exchange = MockExchange({'BTCUSDT': 50000.0})
+            executor = OrderExecutor(exchange)
+            await executor.start()
+            runtime = self._open_position(exchange, executor)
+            await _settle(executor)
+            size = runtime.strategy.get_position('BTCUSDT').total_size
+
+            # 거래소에서 40%만 51000에 체결되고 만료된 청산 주문
+            request = OrderRequest('BTCUSDT', 'SELL', size, intent=OrderIntent.EXIT, reduce_only=True,
+                                   client_order_id='partial-exit', meta={'reason': 'SIGNAL'})
+            exchange.positions['BTCUSDT'] -= size * 0.4
+            runtime.pending['BTCUSDT'] = request.client_order_id
+            partial = ManagedOrder(request, OrderStatus.EXPIRED, filled_qty=size * 0.4, avg_price=51000.0,
+                                   commission=1.0, updated_at=1)
+            runtime._on_order_update(partial)
+            state = (runtime.strategy.get_position('BTCUSDT') is not None, len(runtime.strategy.trade_history),
+                     executor.orders[runtime.pending['BTCUSDT']].request.quantity, runtime.fills[-1].action)
+
+            exchange.set_price('BTCUSDT', 52000.0)
+            await _settle(executor)
+            await _settle(executor)
+            await executor.stop()
+            return runtime, exchange, size, state
+
+        runtime, exchange, size, (held, trades, remainder, action) = _run(scenario)
+        assert held and trades == 0 and action == 'PARTIAL_EXIT'
+        assert remainder == pytest.approx(size * 0.6)
+
+        trade = runtime.strategy.trade_history[-1]
+        assert runtime.strategy.get_position('BTCUSDT') is None and not runtime.partial_exits
+        assert trade.size == pytest.approx(size)
+        assert trade.exit_price == pytest.approx(0.4 * 51000.0 + 0.6 * 52000.0)
+        assert exchange.positions['BTCUSDT'] == pytest.approx(0.0)
+        assert not [o for o in exchange.open_orders('BTCUSDT') if o['type'] == OrderType.STOP_MARKET]
+
+    def test_float_sized_position_closes_fully(self):
+        """0.7 + 0.1처럼 부동소수 합산된 포지션도 청산 주문 한 번에 거래소와 전략 모두 전량 청산되어야 함"""
+        async def scenario():
+            exchange = MockExchange({'BTCUSDT': 50000.0}, step_sizes={'BTCUSDT': 0.001})
+            executor = OrderExecutor(exchange)
+            await executor.start()
+            runtime = LiveTradingRuntime(['BTCUSDT'], executor, timeframe='1h',
+                                         strategy=TurtleStrategy(TradingMode.BACKTEST))
+            for quantity, intent in ((0.7, OrderIntent.ENTRY), (0.1, OrderIntent.PYRAMID)):
+                runtime._submit('BTCUSDT', 'BUY', quantity, intent, direction="LONG", atr=1000.0, system=1,
+                                price=50000.0)
+                await _settle(executor)
+            position = runtime.strategy.get_position('BTCUSDT')
+            size = position.total_size
+            stop_qty = exchange.orders[runtime.stop_orders['BTCUSDT']]['origQty']
+            runtime._close('BTCUSDT', position, 50000.0, 'SIGNAL', 0)
+            await _settle(executor)
+            await _settle(executor)
+            await executor.stop()
+            return runtime, exchange, size, stop_qty
+
+        runtime, exchange, size, stop_qty = _run(scenario)
+        assert size != 0.8 and stop_qty == 0.8
+        assert runtime.strategy.get_position('BTCUSDT') is None and not runtime.pending
+        assert not runtime.partial_exits
+        assert [f.action for f in runtime.fills] == ['ENTRY', 'PYRAMID', 'EXIT']
+        assert len(runtime.strategy.trade_history) == 1
+        assert exchange.positions['BTCUSDT'] == 0.0
+
+    def test_sub_step_remainder_counts_as_closed(self):
+        """청산 체결 후 남은 수량이 거래소 단위 미만이면 다시 주문하지 않고 청산으로 기록해야 함"""
+        async def scenario():
+            exchange = MockExchange({'BTCUSDT': 50000.0}, step_sizes={'BTCUSDT': 0.001})
+            executor = OrderExecutor(exchange)
+            await executor.start()
+            runtime = LiveTradingRuntime(['BTCUSDT'], executor, timeframe='1h',
+                                         strategy=TurtleStrategy(TradingMode.BACKTEST))
+            runtime._submit('BTCUSDT', 'BUY', 0.8, OrderIntent.ENTRY, direction="LONG", atr=1000.0, system=1,
+                            price=50000.0)
+            await _settle(executor)
+            request = OrderRequest('BTCUSDT', 'SELL', 0.8, intent=OrderIntent.EXIT, reduce_only=True,
+                                   close_all=True, client_order_id='dust-exit', meta={'reason': 'SIGNAL'})
+            runtime.pending['BTCUSDT'] = request.client_order_id
+            runtime._on_order_update(ManagedOrder(request, OrderStatus.FILLED, filled_qty=0.7996,
+                                                  avg_price=51000.0, updated_at=1))
+            await _settle(executor)
+            await executor.stop()
+            return runtime
+
+        runtime = _run(scenario)
+        assert runtime.strategy.get_position('BTCUSDT') is None
+        assert not runtime.pending and not runtime.partial_exits
+        assert runtime.strategy.trade_history[-1].size == 0.8
+
+    def test_rejected_stop_is_replaced(self, monkeypatch):
+        """거래소가 거부한 손절 주문은 다시 걸고, 계속 거부되면 종가 기준 손절로 대체해야 함"""
+        async def scenario(rejections):
+            exchange = MockExchange({'BTCUSDT': 50000.0})
+            submit = exchange.submit
+            attempts = []
+
+            async def rejecting_submit(request):
+                if request.order_type == OrderType.STOP_MARKET:
+                    attempts.append(request.client_order_id)
+                    if len(attempts) <= rejections:
+                        raise OrderError("Precision is over the maximum defined for this asset.", -1111)
+                return await submit(request)
+
+            monkeypatch.setattr(exchange, 'submit', rejecting_submit)
+            executor = OrderExecutor(exchange)
+            await executor.start()
+            runtime = self._open_position(exchange, executor)
+            for _ in range(rejections + 2):
+                await _settle(executor)
+            await executor.stop()
+            return runtime, exchange, attempts
+
+        runtime, exchange, attempts = _run(scenario, 1)
+        assert len(attempts) == 2
+        assert exchange.orders[runtime.stop_orders['BTCUSDT']]['status'] == OrderStatus.NEW
+
+        runtime, exchange, attempts = _run(scenario, 10)
+        assert len(attempts) == ExecutionConfig.STOP_RETRIES + 1
+        position = runtime.strategy.get_position('BTCUSDT')
+        assert 'BTCUSDT' not in runtime.stop_orders
+        assert runtime._stop_hit(position, runtime.strategy.position_stop(position) - 1.0)
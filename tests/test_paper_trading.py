@@ -0,0 +1,178 @@
+"""
+가상매매 런타임 테스트
+"""
+
+import asyncio
+import pytest
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 파이썬 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config import PaperTradingConfig, TradingMode
+from strategy.turtle_strategy import TurtleStrategy
+from strategy.backtest_core import SimulationCore, start_index
+from strategy.futures import FuturesAccount, funding_schedule
+from utils.benchmark import generate_benchmark_data
+from utils.funding_store import FundingRateStore
+from utils.paper_trading import IncrementalIndicators, PaperTradingRuntime, ReplayFeed
+from utils.timeaxis import to_ms
+
+
+def _runtime(symbols, **kwargs):
+    return PaperTradingRuntime(symbols, timeframe='1h', strategy=TurtleStrategy(TradingMode.BACKTEST), **kwargs)
+
+
+def _trade_key(trade):
+    return (trade.symbol, trade.direction, trade.entry_price, trade.exit_price, trade.size, trade.pnl,
+            trade.exit_reason)
+
+
+class TestPaperTradingRuntime:
+    """가상매매 런타임 테스트"""
+
+    def test_matches_simulation_core(self):
+        """슬리피지 0이면 같은 봉 데이터에서 백테스트 코어와 같은 거래/잔고를 내야 함"""
+        data = generate_benchmark_data(1500, timeframe='1h', seed=5)
+        symbol = data[0].symbol
+        start = start_index('1h', len(data))
+
+        core = SimulationCore(TurtleStrategy(TradingMode.BACKTEST), data, symbol, '1h')
+        for i in range(start, len(data)):
+            core.step(i)
+
+        runtime = _runtime([symbol])
+        runtime.warm_up(symbol, data[:start])
+        for bar in data[start:]:
+            runtime.on_bar(bar)
+
+        expected = core.strategy.get_trade_history()
+        assert expected, "비교할 거래가 있어야 합니다"
+        assert [_trade_key(t) for t in runtime.strategy.get_trade_history()] == [_trade_key(t) for t in expected]
+        assert [t.exit_date for t in runtime.strategy.get_trade_history()] == [t.exit_date for t in expected]
+        assert runtime.balance == core.balance
+        assert set(runtime.strategy.positions) == set(core.strategy.positions)
+
+    def test_futures_matches_simulation_core(self, tmp_path):
+        """고레버리지에서 펀딩비/강제청산도 백테스트 코어와 같은 거래/잔고를 내야 함"""
+        data = generate_benchmark_data(1500, timeframe='1h', seed=5)
+        symbol = data[0].symbol
+        start = start_index('1h', len(data))
+        schedule = funding_schedule(to_ms(data[0].date), to_ms(data[-1].date))
+        rates = np.full(len(schedule), 5e-4)
+        store = FundingRateStore(str(tmp_path))
+        store.write(symbol, schedule, rates)
+
+        core = SimulationCore(TurtleStrategy(TradingMode.BACKTEST), data, symbol, '1h', leverage=50.0,
+                              futures=FuturesAccount(50.0, schedule, rates))
+        for i in range(start, len(data)):
+            core.step(i)
+
+        runtime = _runtime([symbol], leverage=50.0, funding_store=store)
+        runtime.warm_up(symbol, data[:start])
+        for bar in data[start:]:
+            runtime.on_bar(bar)
+
+        expected = core.strategy.get_trade_history()
+        assert 'LIQUIDATION' in [t.exit_reason for t in expected], "강제청산이 있어야 합니다"
+        assert [_trade_key(t) for t in runtime.strategy.get_trade_history()] == [_trade_key(t) for t in expected]
+        assert runtime.balance == pytest.approx(core.balance)
+        assert runtime.summary()['futures'] == pytest.approx(core.futures.summary())
+        assert runtime.summary()['futures']['funding_events'] > 0
+
+    def test_futures_account_config_flag(self):
+        """선물 계좌 시뮬레이션은 가상매매 기본값이고 설정으로 끌 수 있어야 함"""
+        assert _runtime(['BTCUSDT']).futures is not None
+        PaperTradingConfig.FUTURES_ACCOUNT = False
+        try:
+            assert _runtime(['BTCUSDT']).futures is None
+        finally:
+            PaperTradingConfig.FUTURES_ACCOUNT = True
+
+    def test_running_atr_matches_window_sum(self):
+        """누적 합 ATR은 창 재합산과 같고 상태 복원 후에도 이어져야 함"""
+        data = generate_benchmark_data(2000, timeframe='1h', seed=11)
+        indicators = IncrementalIndicators([20, 55], atr_period=20)
+        for n, bar in enumerate(data):
+            indicators.update(n, bar.high, bar.low, bar.close)
+            if n == 1000:
+                indicators = IncrementalIndicators.from_state(indicators.get_state())
+            ranges = list(indicators.true_ranges)
+            if len(ranges) < 2:
+                assert indicators.atr() is None
+                continue
+            assert indicators.atr() == pytest.approx(sum(ranges) / len(ranges), rel=1e-12)
+
+    def test_incremental_channels(self):
+        """증분 채널은 현재 봉을 제외한 직전 N봉 최고/최저여야 함"""
+        data = generate_benchmark_data(300, timeframe='1h', seed=9)
+        indicators = IncrementalIndicators([20, 55], atr_period=20)
+        for n, bar in enumerate(data):
+            indicators.update(n, bar.high, bar.low, bar.close)
+            for period in (20, 55):
+                if n < period:
+                    assert indicators.channels_high[period] is None
+                    continue
+                window = data[n - period:n]
+                assert indicators.channels_high[period] == max(p.high for p in window)
+                assert indicators.channels_low[period] == min(p.low for p in window)
+
+    def test_ignores_duplicate_and_stale_bars(self):
+        """재전송된 봉이나 과거 봉은 지표와 거래에 반영하지 않아야 함"""
+        data = generate_benchmark_data(100, timeframe='1h', seed=3)
+        runtime = _runtime([data[0].symbol])
+        runtime.warm_up(data[0].symbol, data[:50])
+
+        assert runtime.on_bar(data[50]) is True
+        assert runtime.on_bar(data[50]) is False
+        assert runtime.on_bar(data[10]) is False
+        assert runtime.indicators[data[0].symbol].bars == 51
+        assert runtime.on_bar(replace(data[0], symbol='UNKNOWN')) is False
+
+    def test_slippage_worsens_fills(self):
+        """슬리피지는 매수 체결가를 높이고 매도 체결가를 낮춰야 함"""
+        data = generate_benchmark_data(1500, timeframe='1h', seed=5)
+        runtime = _runtime([data[0].symbol], slippage_rate=0.001)
+        runtime.warm_up(data[0].symbol, data[:20])
+        for bar in data[20:]:
+            runtime.on_bar(bar)
+        closes = {to_ms(bar.date): bar.close for bar in data}
+
+        assert runtime.fills, "체결이 있어야 합니다"
+        for fill in runtime.fills:
+            close = closes[fill.time]
+            assert fill.price > close if fill.side == 'BUY' else fill.price < close
+            assert fill.commission == pytest.approx(fill.price * fill.size * runtime.commission_rate)
+
+    def test_multi_symbol_replay_latency(self):
+        """수십 종목을 이벤트 루프로 재생해도 봉당 판단 지연이 1ms 미만이어야 함"""
+        bars = {}
+        for k in range(40):
+            symbol = f"SYM{k:02d}USDT"
+            bars[symbol] = [replace(bar, symbol=symbol)
+                            for bar in generate_benchmark_data(300, timeframe='1h', seed=100 + k)]
+        runtime = _runtime(list(bars), leverage=3.0)
+
+        summary = asyncio.run(runtime.run(ReplayFeed(bars)))
+
+        assert summary['bars_processed'] == 40 * (300 - 2)  # ATR에 True Range 2개 필요
+        assert summary['total_trades'] > 0
+        assert len({t.symbol for t in runtime.strategy.get_trade_history()}) > 1, "여러 종목이 거래되어야 합니다"
+        assert summary['latency']['p50_us'] < 1000
+        assert summary['latency']['bars'] == runtime.telemetry.bar_latency.count == summary['bars_processed']
+        assert not runtime.is_running
+
+    def test_max_bars_ends_event_loop(self):
+        """max_bars만큼 처리하면 이벤트 루프가 끝나야 함"""
+        data = generate_benchmark_data(200, timeframe='1h', seed=4)
+        runtime = _runtime([data[0].symbol])
+
+        summary = asyncio.run(runtime.run(ReplayFeed({data[0].symbol: data}), max_bars=50))
+
+        assert summary['bars_processed'] == 50
+        assert runtime.indicators[data[0].symbol].bars == 52
@@ -0,0 +1,133 @@
+"""
+멀티 타임프레임 리샘플러 테스트
+"""
+
+import asyncio
+import os
+import numpy as np
+import pandas as pd
+import pytest
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# 프로젝트 루트를 파이썬 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from utils.benchmark import generate_benchmark_data
+from utils.kline_store import KlineStore
+from utils.resampler import Resampler, SUPPORTED_TIMEFRAMES, bucket_starts, resample_columns
+from frontend.backtest.backend.engines.backtest_engine import BacktestEngine, BacktestConfig_
+
+# pandas 기준 규칙 (왼쪽 닫힘/왼쪽 라벨, 주봉은 월요일 시작)
+PANDAS_RULES = {'5m': '5min', '15m': '15min', '1h': '1h', '4h': '4h', '1d': '1D', '1w': 'W-MON', '1M': 'MS'}
+
+SYMBOL = 'BTCUSDT'
+
+
+@pytest.fixture(scope="module")
+def base_data():
+    """2020-01-01(수)부터 약 41일치 1분봉 (주/월 경계 포함)"""
+    return generate_benchmark_data(60_000, seed=3, timeframe='1m', start=datetime(2020, 1, 1, 0, 7))
+
+
+def _expected(data, timeframe):
+    frame = pd.DataFrame({
+        'open': [p.open for p in data], 'high': [p.high for p in data], 'low': [p.low for p in data],
+        'close': [p.close for p in data], 'volume': [p.volume for p in data],
+    }, index=pd.DatetimeIndex([p.date for p in data]))
+    bars = frame.resample(PANDAS_RULES[timeframe], closed='left', label='left').agg(
+        {'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'}).dropna()
+    open_time = bars.index.values.astype('datetime64[ms]').astype(np.int64)
+    return open_time, bars
+
+
+def _assert_matches(columns, data, timeframe):
+    open_time, bars = _expected(data, timeframe)
+    np.testing.assert_array_equal(columns['open_time'], open_time)
+    for name in ('open', 'high', 'low', 'close'):
+        np.testing.assert_array_equal(columns[name], bars[name].to_numpy(), err_msg=f"{timeframe} {name}")
+    np.testing.assert_allclose(columns['volume'], bars['volume'].to_numpy(), rtol=1e-12)
+
+
+class TestResampleColumns:
+    """그룹 집계 테스트"""
+
+    @pytest.mark.parametrize("timeframe", list(PANDAS_RULES))
+    def test_matches_pandas_resample(self, base_data, tmp_path, timeframe):
+        """벡터화 집계 결과가 pandas 리샘플링과 같아야 함"""
+        store = KlineStore(str(tmp_path))
+        store.write(SYMBOL, '1m', base_data)
+        columns = store.load_columns(SYMBOL, '1m', '2020-01-01', '2020-03-31')
+
+        _assert_matches(resample_columns(columns, timeframe), base_data, timeframe)
+
+    def test_weekly_buckets_start_on_monday(self):
+        """주봉은 월요일 00:00 UTC에 시작해야 함"""
+        times = np.array(['2024-01-03T12:00', '2024-01-07T23:59', '2024-01-08T00:00'], dtype='datetime64[ms]')
+        starts = bucket_starts(times.astype(np.int64), '1w').astype('datetime64[ms]')
+        assert [str(s)[:10] for s in starts] == ['2024-01-01', '2024-01-01', '2024-01-08']
+
+    def test_unknown_timeframe_raises(self):
+        with pytest.raises(ValueError):
+            bucket_starts(np.zeros(1, dtype=np.int64), '3h')
+
+
+class TestResampler:
+    """리샘플 캐시 테스트"""
+
+    @pytest.mark.parametrize("timeframe", ['15m', '1d', '1w', '1M'])
+    def test_incremental_update_matches_full_build(self, base_data, tmp_path, timeframe):
+        """1분봉을 나누어 추가하며 갱신한 결과가 한 번에 만든 결과와 같아야 함"""
+        full_store = KlineStore(str(tmp_path / 'full'))
+        full_store.write(SYMBOL, '1m', base_data)
+        Resampler(full_store).update(SYMBOL, timeframe)
+
+        store = KlineStore(str(tmp_path / 'incremental'))
+        resampler = Resampler(store)
+        cuts = [0, 15_000, 30_001, 45_000, len(base_data)]
+        for cut, next_cut in zip(cuts, cuts[1:]):
+            store.write(SYMBOL, '1m', base_data[cut:next_cut])
+            resampler.update(SYMBOL, timeframe)
+
+        full = full_store.load_columns(SYMBOL, timeframe, '2019-12-01', '2020-03-31')
+        incremental = store.load_columns(SYMBOL, timeframe, '2019-12-01', '2020-03-31')
+        for name in full:
+            np.testing.assert_array_equal(full[name], incremental[name])
+        _assert_matches(full, base_data, timeframe)
+
+    def test_update_without_new_bars_does_not_rewrite(self, base_data, tmp_path):
+        """새 1분봉이 없으면 파티션을 다시 쓰지 않아야 함 (캐시 지문 유지)"""
+        store = KlineStore(str(tmp_path))
+        store.write(SYMBOL, '1m', base_data)
+        resampler = Resampler(store)
+
+        assert resampler.update(SYMBOL, '1h') > 0
+        fingerprint = store.fingerprint(SYMBOL, '1h', '2020-01-01', '2020-02-11')
+        assert resampler.update(SYMBOL, '1h') == 0
+        assert store.fingerprint(SYMBOL, '1h', '2020-01-01', '2020-02-11') == fingerprint
+
+    def test_update_all_covers_default_timeframes(self, base_data, tmp_path):
+        """1분봉 하나로 지원하는 모든 타임프레임을 만들어야 함"""
+        store = KlineStore(str(tmp_path))
+        store.write(SYMBOL, '1m', base_data)
+
+        counts = Resampler(store).update_all(SYMBOL, list(SUPPORTED_TIMEFRAMES))
+
+        assert set(counts) == set(SUPPORTED_TIMEFRAMES) - {'1m'}
+        assert all(count > 0 for count in counts.values())
+
+    def test_engine_backtests_from_resampled_base(self, base_data, tmp_path):
+        """1분봉만 저장되어 있어도 상위 타임프레임 백테스트를 로컬 데이터로 실행해야 함"""
+        store = KlineStore(str(tmp_path))
+        store.write(SYMBOL, '1m', base_data)
+
+        engine = BacktestEngine(BacktestConfig_(symbol=SYMBOL, timeframe='1h',
+                                                start_date='2020-01-02', end_date='2020-02-10'))
+        engine.kline_store = store
+        data = asyncio.run(engine.load_historical_data())
+
+        assert engine.data_source == 'kline'
+        assert len(data) == 40 * 24
+        assert os.path.exists(store.partition_path(SYMBOL, '1h', '2020-02'))
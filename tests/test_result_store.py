@@ -0,0 +1,80 @@
+"""
+백테스트 결과 저장소 테스트
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 파이썬 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from frontend.backtest.backend.engines.backtest_engine import (
+    BacktestEngine, BacktestConfig_, BacktestResultsManager
+)
+from utils.result_store import ResultStore
+
+
+@pytest.fixture(scope="module")
+def backtest_results():
+    """거래가 발생하는 고정 시드 백테스트 결과"""
+    import asyncio
+    config = BacktestConfig_(start_date="2024-01-01", end_date="2024-06-30", timeframe="1h", seed=7)
+    return asyncio.run(BacktestEngine(config).run_backtest())
+
+
+class TestResultStore:
+    """결과 저장소 테스트"""
+
+    @pytest.mark.parametrize("compress", [True, False])
+    def test_round_trip(self, tmp_path, backtest_results, compress):
+        """저장 후 로드한 결과가 원본과 같아야 함"""
+        store = ResultStore(str(tmp_path), compress=compress)
+        run_id = BacktestResultsManager.save_to_store(backtest_results, store)
+
+        loaded = BacktestResultsManager.load_run(run_id, store)
+
+        assert loaded.final_balance == backtest_results.final_balance
+        assert loaded.metrics.total_trades == backtest_results.metrics.total_trades
+        assert loaded.config.to_dict() == backtest_results.config.to_dict()
+        assert loaded.equity_curve == backtest_results.equity_curve, "자산 곡선이 같아야 합니다"
+        assert loaded.drawdown_curve == backtest_results.drawdown_curve
+        assert loaded.daily_returns == backtest_results.daily_returns
+
+        assert len(loaded.trades) == len(backtest_results.trades) > 0
+        for original, restored in zip(backtest_results.trades, loaded.trades):
+            assert restored.pnl == original.pnl
+            assert restored.direction == original.direction
+            assert restored.exit_reason == original.exit_reason
+            assert restored.exit_date == original.exit_date.replace(microsecond=0)
+
+    def test_heavy_columns_load_lazily(self, tmp_path, backtest_results):
+        """메타데이터 조회만으로는 컬럼을 읽지 않아야 함"""
+        store = ResultStore(str(tmp_path), compress=False)
+        run_id = store.save(backtest_results)
+
+        loaded = BacktestResultsManager.load_run(run_id, store)
+        _ = loaded.metrics.total_return, loaded.final_balance
+        assert loaded.run.loaded_columns == [], "지표 조회 시 컬럼을 로드하지 않아야 합니다"
+
+        _ = loaded.drawdown_curve
+        assert loaded.run.loaded_columns == ['drawdown'], "필요한 컬럼만 로드해야 합니다"
+        assert isinstance(loaded.run.column('drawdown'), np.memmap), "npy 컬럼은 메모리 맵이어야 합니다"
+
+    def test_index_listing_and_delete(self, tmp_path, backtest_results):
+        """인덱스로 목록을 조회하고 삭제 시 갱신되어야 함"""
+        store = ResultStore(str(tmp_path))
+        first = store.save(backtest_results, run_id="run_a")
+        second = store.save(backtest_results, run_id="run_b")
+
+        runs = store.list_runs()
+        assert {r['run_id'] for r in runs} == {first, second}
+        assert runs[0]['total_trades'] == len(backtest_results.trades)
+        assert runs[0]['symbol'] == "BTCUSDT"
+
+        assert store.delete(first)
+        assert [r['run_id'] for r in store.list_runs()] == [second]
+        assert store.load(first) is None
@@ -0,0 +1,186 @@
+"""
+포트폴리오 리스크 엔진 테스트
+"""
+
+import asyncio
+import random
+import pytest
+import sys
+from dataclasses import replace
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 파이썬 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config import TradingConfig, TradingMode
+from strategy.risk_engine import RiskEngine, unit_risk
+from strategy.turtle_strategy import TradingUnit, TurtleStrategy
+from utils.benchmark import generate_benchmark_data
+from utils.paper_trading import PaperTradingRuntime, ReplayFeed
+
+
+def _unit(price=100.0, atr=2.0, size=1.0, direction="LONG"):
+    stop = price - 2 * atr if direction == "LONG" else price + 2 * atr
+    return TradingUnit(entry_price=price, entry_date=datetime(2024, 1, 1), size=size, stop_loss=stop,
+                       system=1, unit_number=1)
+
+
+GROUPS = {'MAJORS': ['BTCUSDT', 'ETHUSDT'], 'ALTS': ['SOLUSDT', 'ADAUSDT', 'DOTUSDT']}
+
+
+class TestRiskEngine:
+    """리스크 엔진 한도/집계 테스트"""
+
+    def test_unit_limits(self):
+        """종목/연관 그룹/방향 유닛 한도를 넘는 유닛은 거부해야 함"""
+        engine = RiskEngine(GROUPS)
+        for _ in range(TradingConfig.MAX_UNITS_PER_MARKET):
+            assert engine.can_add('BTCUSDT', "LONG", 1.0, 1e9)
+            engine.on_entry('BTCUSDT', "LONG", _unit())
+        assert not engine.can_add('BTCUSDT', "LONG", 1.0, 1e9), "종목당 유닛 한도"
+
+        for _ in range(TradingConfig.MAX_UNITS_CORRELATED - TradingConfig.MAX_UNITS_PER_MARKET):
+            engine.on_entry('ETHUSDT', "LONG", _unit())
+        assert not engine.can_add('ETHUSDT', "LONG", 1.0, 1e9), "연관 그룹 유닛 한도"
+        assert engine.can_add('ETHUSDT', "SHORT", 1.0, 1e9), "연관 그룹 한도는 방향별"
+        assert engine.can_add('SOLUSDT', "LONG", 1.0, 1e9)
+
+        for symbol in ('SOLUSDT', 'ADAUSDT'):
+            for _ in range(3):
+                engine.on_entry(symbol, "LONG", _unit())
+        assert engine.direction_units[0] == TradingConfig.MAX_UNITS_DIRECTIONAL
+        assert not engine.can_add('XRPUSDT', "LONG", 1.0, 1e9), "방향별 유닛 한도"
+        assert engine.can_add('XRPUSDT', "SHORT", 1.0, 1e9)
+
+        engine.on_exit('BTCUSDT')
+        assert engine.can_add('XRPUSDT', "LONG", 1.0, 1e9)
+        assert engine.units('BTCUSDT') == 0
+
+    def test_total_risk_limit(self):
+        """총 유닛 리스크가 잔고 × MAX_RISK_TOTAL을 넘으면 거부해야 함"""
+        engine = RiskEngine(GROUPS)
+        unit = _unit(atr=2.0, size=5.0)
+        assert unit_risk(unit) == pytest.approx(10.0)
+        equity = 10.0 * 3 / TradingConfig.MAX_RISK_TOTAL
+        for symbol in ('BTCUSDT', 'SOLUSDT', 'XRPUSDT'):
+            assert engine.can_add(symbol, "LONG", 10.0, equity)
+            engine.on_entry(symbol, "LONG", unit)
+        assert not engine.can_add('DOGEUSDT', "SHORT", 10.0, equity)
+        assert engine.summary(equity)['risk_ratio'] == pytest.approx(TradingConfig.MAX_RISK_TOTAL)
+
+    @pytest.mark.parametrize("leverage", [1.0, 25.0, 125.0])
+    def test_unit_risk_excludes_leverage(self, leverage):
+        """고배율에서도 유닛 리스크는 N 리스크(잔고 × RISK_PER_TRADE)로 세어 20배를 넘는 레버리지를 막지 않아야 함"""
+        class OnlyRiskLimit(TradingConfig):  # 방향 유닛 한도는 이 테스트 대상이 아님
+            MAX_UNITS_DIRECTIONAL = 100
+
+        strategy = TurtleStrategy(TradingMode.BACKTEST)
+        strategy.risk = RiskEngine(config=OnlyRiskLimit)
+        balance, price, atr = 10000.0, 100.0, 2.0
+        per_unit = balance * TradingConfig.RISK_PER_TRADE
+        limit = int(round(TradingConfig.MAX_RISK_TOTAL / TradingConfig.RISK_PER_TRADE))
+        symbols = [f"S{k}USDT" for k in range(limit + 1)]
+        for symbol in symbols[:limit]:
+            assert strategy.can_add_unit(symbol, "LONG", price, atr, balance, leverage)
+            size = strategy.calculate_unit_size(symbol, balance, atr, price, leverage)
+            strategy.risk.on_entry(symbol, "LONG", _unit(price, atr, size), leverage)
+        assert strategy.risk.total_risk == pytest.approx(per_unit * limit)
+        assert not strategy.can_add_unit(symbols[-1], "SHORT", price, atr, balance, leverage)
+
+    @pytest.mark.asyncio
+    async def test_engine_trades_above_20x(self):
+        """레버리지 25배 백테스트도 진입해야 함 (레버리지가 리스크 한도를 잠식하지 않음)"""
+        from frontend.backtest.backend.engines.backtest_engine import BacktestConfig_, BacktestEngine
+
+        results = await BacktestEngine(BacktestConfig_(seed=1, leverage=25.0)).run_backtest()
+        assert len(results.trades) > 0
+        assert results.final_balance != results.initial_balance
+
+    def test_running_aggregates_match_recount(self):
+        """무작위 체결/청산/예약 후 누적 집계가 처음부터 다시 센 값과 같고, allowed()가 can_add()와 일치해야 함"""
+        rng = random.Random(7)
+        symbols = [f"S{k}USDT" for k in range(12)]
+        groups = {'A': symbols[:4], 'B': symbols[4:8]}
+        engine = RiskEngine(groups)
+        held = {}
+        reservations = {}
+        for step in range(2000):
+            symbol = rng.choice(symbols)
+            action = rng.random()
+            if action < 0.5:
+                direction = held.get(symbol, (rng.choice(("LONG", "SHORT")), []))[0]
+                unit = _unit(price=rng.uniform(10, 100), atr=rng.uniform(0.1, 3), size=rng.uniform(0.1, 2),
+                             direction=direction)
+                engine.on_entry(symbol, direction, unit)
+                held.setdefault(symbol, (direction, []))[1].append(unit)
+            elif action < 0.8:
+                engine.on_exit(symbol)
+                held.pop(symbol, None)
+            elif action < 0.9 and symbol not in held:
+                reservations[f"r{step}"] = (symbol, "LONG")
+                engine.reserve(f"r{step}", symbol, "LONG", 1.0, 10.0)
+            elif reservations:
+                key = rng.choice(list(reservations))
+                del reservations[key]
+                engine.release(key)
+
+        expected_risk = sum(unit_risk(u) for _, units in held.values() for u in units) + len(reservations)
+        assert engine.total_risk == pytest.approx(expected_risk)
+        for d, direction in enumerate(("LONG", "SHORT")):
+            count = sum(len(units) for dd, units in held.values() if dd == direction)
+            count += sum(1 for _, rd in reservations.values() if rd == direction)
+            assert engine.direction_units[d] == count
+
+        equity = engine.total_risk / TradingConfig.MAX_RISK_TOTAL + 1.5
+        risks = np.linspace(0.5, 2.5, len(symbols))
+        for direction in ("LONG", "SHORT"):
+            mask = engine.allowed(symbols, direction, risks, equity)
+            assert mask.tolist() == [engine.can_add(s, direction, r, equity) for s, r in zip(symbols, risks)]
+
+    def test_regroup_recounts_clusters(self):
+        """연관 그룹을 바꾸면 보유 유닛으로 그룹별 유닛 수를 다시 집계해야 함"""
+        engine = RiskEngine({})
+        for symbol in ('BTCUSDT', 'ETHUSDT'):
+            for _ in range(3):
+                engine.on_entry(symbol, "SHORT", _unit(direction="SHORT"))
+        assert engine.can_add('ETHUSDT', "SHORT", 1.0, 1e9)
+        engine.set_groups(GROUPS)
+        assert not engine.can_add('ETHUSDT', "SHORT", 1.0, 1e9)
+        assert engine.summary()['clusters'] == {'MAJORS': {'LONG': 0, 'SHORT': 6}}
+
+    def test_portfolio_runtime_respects_limits(self):
+        """다종목 가상매매에서 모든 봉 이후 방향별/총 리스크 한도를 넘지 않아야 함"""
+        bars = {}
+        for k in range(16):
+            symbol = f"SYM{k:02d}USDT"
+            bars[symbol] = [replace(bar, symbol=symbol)
+                            for bar in generate_benchmark_data(300, timeframe='1h', seed=200 + k)]
+        runtime = PaperTradingRuntime(list(bars), timeframe='1h', leverage=2.0,
+                                      strategy=TurtleStrategy(TradingMode.BACKTEST))
+        strategy = runtime.strategy
+        strategy.risk.set_groups({'ALL': list(bars)[:8]})
+        peak_units = [0, 0]
+
+        original = runtime.on_bar
+
+        def on_bar(bar):
+            result = original(bar)
+            units = {"LONG": 0, "SHORT": 0}
+            for position in strategy.positions.values():
+                units[position.direction] += len(position.units)
+            assert max(units.values()) <= TradingConfig.MAX_UNITS_DIRECTIONAL
+            grouped = sum(len(strategy.positions[s].units) for s in list(bars)[:8] if s in strategy.positions)
+            assert grouped <= 2 * TradingConfig.MAX_UNITS_CORRELATED
+            assert strategy.risk.total_risk <= runtime.balance * TradingConfig.MAX_RISK_TOTAL * 1.05
+            peak_units[0] = max(peak_units[0], units["LONG"])
+            peak_units[1] = max(peak_units[1], units["SHORT"])
+            return result
+
+        runtime.on_bar = on_bar
+        asyncio.run(runtime.run(ReplayFeed(bars)))
+        assert max(peak_units) > 0
+        assert strategy.risk.open_units == sum(len(p.units) for p in strategy.positions.values())
@@ -0,0 +1,145 @@
+"""
+백테스트 실행 캐시 및 캔들 파티션 저장소 테스트
+"""
+
+import pytest
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# 프로젝트 루트를 파이썬 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from frontend.backtest.backend.engines.backtest_engine import (
+    BacktestEngine, BacktestConfig_, StoredBacktestResults
+)
+from utils.benchmark import generate_benchmark_data
+from utils.kline_store import KlineStore
+from utils.run_cache import RunCache, run_key
+
+
+def _engine(config, tmp_path, kline_store=None):
+    engine = BacktestEngine(config)
+    engine.run_cache = RunCache(str(tmp_path / "cache"))
+    engine.kline_store = kline_store or KlineStore(str(tmp_path / "historical"))
+    return engine
+
+
+class TestKlineStore:
+    """캔들 파티션 저장소 테스트"""
+
+    def test_write_and_load_range(self, tmp_path):
+        """월 파티션으로 나누어 저장하고 구간을 로드해야 함"""
+        store = KlineStore(str(tmp_path))
+        bars = generate_benchmark_data(90, timeframe='1d', start=datetime(2024, 1, 1))
+        written = store.write("BTCUSDT", "1d", bars)
+
+        assert len(written) == 3, "1~3월 파티션이 생성되어야 합니다"
+        assert store.covers("BTCUSDT", "1d", "2024-01-01", "2024-03-30")
+        assert not store.covers("BTCUSDT", "1d", "2024-01-01", "2024-04-30")
+
+        loaded = store.load("BTCUSDT", "1d", "2024-02-01", "2024-02-29")
+        assert [b.date for b in loaded] == [b.date for b in bars if b.date.month == 2]
+        assert [b.close for b in loaded] == [b.close for b in bars if b.date.month == 2]
+
+    def test_rewrite_changes_fingerprint(self, tmp_path):
+        """파티션이 바뀌면 지문이 달라져야 함"""
+        store = KlineStore(str(tmp_path))
+        bars = generate_benchmark_data(31, timeframe='1d', start=datetime(2024, 1, 1))
+        store.write("BTCUSDT", "1d", bars)
+        before = store.fingerprint("BTCUSDT", "1d", "2024-01-01", "2024-01-31")
+
+        bars[5].close *= 1.01
+        time.sleep(0.01)
+        store.write("BTCUSDT", "1d", bars[5:6])
+
+        assert store.fingerprint("BTCUSDT", "1d", "2024-01-01", "2024-01-31") != before
+        assert store.load("BTCUSDT", "1d", "2024-01-01", "2024-01-31")[5].close == bars[5].close
+        assert store.fingerprint("BTCUSDT", "1d", "2024-01-01", "2024-02-29") is None
+
+
+class TestRunCache:
+    """실행 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_repeated_run_hits_cache(self, tmp_path):
+        """같은 설정 재실행 시 저장된 결과를 반환해야 함"""
+        config = BacktestConfig_(start_date="2024-01-01", end_date="2024-06-30", timeframe="1h",
+                                 seed=3, use_cache=True)
+
+        first = await _engine(config, tmp_path).run_backtest()
+        second = await _engine(config, tmp_path).run_backtest()
+
+        assert not isinstance(first, StoredBacktestResults), "첫 실행은 시뮬레이션이어야 합니다"
+        assert isinstance(second, StoredBacktestResults), "재실행은 캐시에서 반환되어야 합니다"
+        assert second.final_balance == first.final_balance
+        assert [t.pnl for t in second.trades] == [t.pnl for t in first.trades]
+
+        other = BacktestConfig_(start_date="2024-01-01", end_date="2024-06-30", timeframe="1h",
+                                seed=3, use_cache=True, initial_balance=20000.0)
+        assert not isinstance(await _engine(other, tmp_path).run_backtest(), StoredBacktestResults), \
+            "설정이 다르면 캐시를 사용하지 않아야 합니다"
+
+    @pytest.mark.asyncio
+    async def test_unseeded_simulation_not_cached(self, tmp_path):
+        """재현 불가능한 데이터는 캐시하지 않아야 함"""
+        config = BacktestConfig_(start_date="2024-01-01", end_date="2024-03-31", use_cache=True)
+        engine = _engine(config, tmp_path)
+        await engine.run_backtest()
+
+        assert engine.run_cache.manifest == {}
+
+    @pytest.mark.asyncio
+    async def test_partition_change_invalidates(self, tmp_path):
+        """캔들 파티션이 바뀌면 캐시 항목이 무효화되어야 함"""
+        kline_store = KlineStore(str(tmp_path / "historical"))
+        bars = generate_benchmark_data(91, timeframe='1d', start=datetime(2024, 1, 1))
+        kline_store.write("BTCUSDT", "1d", bars)
+        config = BacktestConfig_(start_date="2024-01-01", end_date="2024-03-31", use_cache=True)
+
+        engine = _engine(config, tmp_path, kline_store)
+        await engine.run_backtest()
+        assert engine.data_source == 'kline', "로컬 파티션에서 로드해야 합니다"
+        assert isinstance(await _engine(config, tmp_path, kline_store).run_backtest(), StoredBacktestResults)
+
+        bars[40].close *= 1.02
+        time.sleep(0.01)
+        kline_store.write("BTCUSDT", "1d", bars[40:41])
+
+        engine = _engine(config, tmp_path, kline_store)
+        results = await engine.run_backtest()
+        assert not isinstance(results, StoredBacktestResults), "파티션 변경 후에는 다시 실행해야 합니다"
+        assert len(engine.run_cache.manifest) == 1, "이전 데이터의 항목은 제거되어야 합니다"
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_by_disk_budget(self, tmp_path):
+        """디스크 예산 초과 시 가장 오래 사용하지 않은 항목부터 제거"""
+        config = BacktestConfig_(start_date="2024-01-01", end_date="2024-03-31", seed=1)
+        results = await BacktestEngine(config).run_backtest()
+
+        cache = RunCache(str(tmp_path / "cache"), max_bytes=10 ** 9)
+        cache.put("a", results)
+        size = cache.manifest["a"]["size"]
+        cache.put("b", results)
+        cache.manifest["a"]["last_access"] = cache.manifest["b"]["last_access"] + 1  # a를 최근 사용으로
+        cache.max_bytes = size * 2
+        cache.put("c", results)
+
+        assert set(cache.manifest) == {"a", "c"}, "가장 오래 사용하지 않은 b가 제거되어야 합니다"
+        assert cache.get("b") is None
+        assert not os.path.exists(tmp_path / "cache" / "runs" / "b")
+        assert cache.total_bytes <= cache.max_bytes
+
+    def test_key_depends_on_strategy_constants(self, monkeypatch):
+        """전략 상수가 바뀌면 키가 달라져야 함"""
+        from config import TradingConfig
+        config = BacktestConfig_().to_dict()
+        before = run_key(config, "sim:1")
+        monkeypatch.setattr(TradingConfig, "RISK_PER_TRADE", 0.02)
+
+        assert run_key(config, "sim:1") != before
+        assert run_key(dict(config, profiling=True), "sim:1") == run_key(config, "sim:1"), \
+            "실행 옵션은 키에 영향을 주지 않아야 합니다"
@@ -0,0 +1,142 @@
+"""
+백테스트 실행 비교 테스트 (지연 로드, 시간축 정렬, 상관계수, 순위)
+"""
+
+import pytest
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+# 프로젝트 루트를 파이썬 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from frontend.backtest.backend.engines.backtest_engine import BacktestResultsManager
+from utils.result_store import ResultStore, StoredRun
+from utils.run_comparison import RunComparison, pairwise_correlation
+from utils.timeaxis import DAY_MS, HOUR_MS, to_ms
+
+
+def _results(symbol, start, values, step=HOUR_MS, n_trades=3):
+    """자산 곡선과 거래 몇 개만 있는 최소 결과 객체"""
+    times = start + np.arange(len(values), dtype=np.int64) * step
+    trade = SimpleNamespace(pnl=1.0, direction="LONG", exit_reason="STOP", system=1,
+                            entry_date=None, exit_date=None)
+    return SimpleNamespace(
+        config=SimpleNamespace(symbol=symbol, timeframe='1h',
+                               to_dict=lambda: {'symbol': symbol, 'timeframe': '1h', 'leverage': 1.0}),
+        metrics=SimpleNamespace(to_dict=lambda: {'total_return': float(values[-1] / values[0] - 1.0)}),
+        equity_curve=[{'date': int(t), 'total_value': float(v)} for t, v in zip(times, values)],
+        drawdown_curve=[], daily_returns=[], trades=[trade] * n_trades,
+        start_date='', end_date='', initial_balance=float(values[0]), final_balance=float(values[-1]),
+        monthly_returns={}, timing={},
+    )
+
+
+def _walk(seed, n):
+    rng = np.random.default_rng(seed)
+    return 10000.0 * np.cumprod(1.0 + rng.normal(0.0, 0.002, n))
+
+
+class TestRunComparison:
+    """저장된 실행 비교 테스트"""
+
+    def test_only_equity_columns_are_read(self, tmp_path, monkeypatch):
+        """비교는 자산 곡선 컬럼만 읽고 거래 컬럼은 열지 않아야 함"""
+        store = ResultStore(str(tmp_path), compress=False)
+        start = to_ms('2024-01-01')
+        for seed in range(3):
+            store.save(_results('BTCUSDT', start, _walk(seed, 24 * 30)), run_id=f"run{seed}")
+
+        read = []
+        original = StoredRun.column
+        monkeypatch.setattr(StoredRun, 'column', lambda self, name: read.append(name) or original(self, name))
+        comparison = BacktestResultsManager.compare_runs(store=store)
+
+        assert len(comparison) == 3
+        assert set(read) == {'equity_date', 'equity_value'}
+        assert comparison.values.shape == (3, 30)
+
+    def test_alignment_of_different_ranges(self, tmp_path):
+        """기간이 다른 실행은 두 실행 버킷의 합집합에 정렬되고, 구간 밖은 NaN, 빈 버킷은 직전 값이어야 함"""
+        store = ResultStore(str(tmp_path))
+        start = to_ms('2024-01-01')
+        store.save(_results('BTCUSDT', start, np.linspace(100.0, 110.0, 24 * 10)), run_id='a')
+        store.save(_results('ETHUSDT', start + 5 * DAY_MS, np.array([50.0, 60.0, 70.0]), step=3 * DAY_MS),
+                   run_id='b')
+
+        comparison = RunComparison.from_store(store, ['a', 'b', 'missing'])
+        assert comparison.run_ids == ['a', 'b']
+        assert len(comparison.times) == 11  # 10일차는 어느 실행에도 없음
+        assert comparison.times[0] == start and comparison.times[-1] == start + 11 * DAY_MS
+
+        a, b = comparison.values
+        assert np.isnan(a[10:]).all() and a[9] == pytest.approx(110.0)
+        assert np.isnan(b[:5]).all()
+        assert b[5:].tolist() == [50.0, 50.0, 50.0, 60.0, 60.0, 70.0]
+
+        metrics = comparison.metrics()
+        assert metrics['total_return'] == pytest.approx([110.0 / a[0] - 1.0, 0.4])
+        assert metrics['excess_return'][1] == pytest.approx(0.4 - metrics['total_return'][0])
+        assert metrics['max_drawdown'][0] == 0.0
+
+    def test_correlation_matches_overlap(self, tmp_path):
+        """쌍별 상관계수는 두 실행이 모두 있는 구간의 np.corrcoef와 같아야 함"""
+        store = ResultStore(str(tmp_path))
+        start = to_ms('2024-01-01')
+        base = _walk(1, 24 * 60)
+        store.save(_results('BTCUSDT', start, base), run_id='base')
+        store.save(_results('BTCUSDT', start + 20 * DAY_MS, base[24 * 20:] * 1.5), run_id='scaled')
+        store.save(_results('ETHUSDT', start + 10 * DAY_MS, _walk(2, 24 * 30)), run_id='other')
+
+        comparison = RunComparison.from_store(store, ['base', 'scaled', 'other'])
+        returns = comparison.returns()
+        corr = comparison.correlation()
+        for i in range(3):
+            for j in range(3):
+                both = ~np.isnan(returns[i]) & ~np.isnan(returns[j])
+                assert corr[i, j] == pytest.approx(np.corrcoef(returns[i, both], returns[j, both])[0, 1])
+        assert corr[0, 1] == pytest.approx(1.0)
+
+        sparse = np.array([[0.1, np.nan, np.nan], [np.nan, 0.2, 0.3]])
+        assert np.isnan(pairwise_correlation(sparse)[0, 1])
+
+    def test_ranking(self, tmp_path):
+        """순위는 지표 방향을 따르고 NaN 지표는 맨 뒤여야 함"""
+        store = ResultStore(str(tmp_path))
+        start = to_ms('2024-01-01')
+        store.save(_results('BTCUSDT', start, np.linspace(100.0, 120.0, 24 * 20)), run_id='up')
+        store.save(_results('BTCUSDT', start, np.linspace(100.0, 90.0, 24 * 20)), run_id='down')
+        store.save(_results('BTCUSDT', start, _walk(3, 24 * 20)), run_id='noisy')
+        store.save(_results('BTCUSDT', start, np.array([100.0])), run_id='flat')
+
+        comparison = RunComparison.from_store(store, ['noisy', 'up', 'down', 'flat'], baseline='down')
+        by_return = comparison.ranked('total_return')
+        assert by_return[0]['run_id'] == 'up' and by_return[-1]['run_id'] == 'down'
+        by_sharpe = comparison.ranked('sharpe')
+        assert by_sharpe[0]['run_id'] == 'up'
+        assert by_sharpe[-1]['run_id'] == 'flat' and np.isnan(by_sharpe[-1]['sharpe'])
+
+        by_drawdown = comparison.ranked('max_drawdown', limit=2)
+        assert len(by_drawdown) == 2 and by_drawdown[0]['run_id'] in ('up', 'flat')
+        row = next(r for r in by_return if r['run_id'] == 'down')
+        assert row['baseline'] and row['excess_return'] == 0.0 and row['total_trades'] == 3
+        with pytest.raises(ValueError):
+            comparison.ranked('unknown')
+
+    def test_hundreds_of_runs(self, tmp_path):
+        """수백 개 실행도 (실행 수 × 버킷 수) 행렬 하나로 비교해야 함"""
+        store = ResultStore(str(tmp_path))
+        start = to_ms('2024-01-01')
+        for k in range(200):
+            store.save(_results('BTCUSDT', start + (k % 7) * DAY_MS, _walk(k, 24 * 30), n_trades=50),
+                       run_id=f"run{k:03d}")
+
+        comparison = RunComparison.from_store(store, unit='D')
+        assert comparison.values.shape == (200, 36)
+        assert comparison.correlation().shape == (200, 200)
+        rows = comparison.ranked('sharpe', limit=10)
+        sharpe = [row['sharpe'] for row in rows]
+        assert sharpe == sorted(sharpe, reverse=True)
@@ -0,0 +1,207 @@
+"""
+런타임 상태 영속화 테스트 (스냅샷 + WAL 웜 재시작)
+"""
+
+import asyncio
+import pytest
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 파이썬 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from config import TradingMode
+from strategy.futures import funding_schedule
+from strategy.turtle_strategy import TurtleStrategy
+from utils.benchmark import generate_benchmark_data
+from utils.funding_store import FundingRateStore
+from utils.live_trading import LiveTradingRuntime
+from utils.order_execution import MockExchange, OrderExecutor, OrderType
+from utils.paper_trading import PaperTradingRuntime
+from utils.runtime_state import RuntimeStateStore
+from utils.timeaxis import HOUR_MS, to_ms
+
+
+def _runtime(symbol, store=None, **kwargs):
+    return PaperTradingRuntime([symbol], timeframe='1h', strategy=TurtleStrategy(TradingMode.BACKTEST),
+                               state_store=store, **kwargs)
+
+
+def _trade_key(trade):
+    return (trade.direction, trade.entry_price, trade.exit_price, trade.size, trade.pnl, trade.exit_reason,
+            trade.entry_date, trade.exit_date)
+
+
+class _HistoryFeed:
+    """마지막 봉까지의 이력을 돌려주는 피드 (요청한 개수 기록)"""
+
+    def __init__(self, bars, now):
+        self.bars = bars
+        self._now = now
+        self.requests = []
+
+    def now(self):
+        return self._now
+
+    async def history(self, symbol, timeframe, limit):
+        self.requests.append(limit)
+        return self.bars[-limit:]
+
+
+class TestRuntimeState:
+    """런타임 상태 저장/복원 테스트"""
+
+    @pytest.fixture
+    def data(self):
+        return generate_benchmark_data(1200, timeframe='1h', seed=5)
+
+    @pytest.mark.parametrize('snapshot_every', [100, 10_000])
+    def test_crash_restart_matches_uninterrupted_run(self, data, tmp_path, snapshot_every):
+        """중단 후 스냅샷 + WAL로 복원하여 이어 간 결과가 중단 없는 실행과 같아야 함 (포지션 보유 중 중단)"""
+        symbol = data[0].symbol
+        reference = _runtime(symbol)
+        for bar in data:
+            reference.on_bar(bar)
+
+        store = RuntimeStateStore(str(tmp_path), 'paper', snapshot_every=snapshot_every)
+        first = _runtime(symbol, store)
+        for bar in data[:850]:
+            first.on_bar(bar)
+        assert first.strategy.positions, "포지션 보유 중 중단해야 합니다"
+        store.close()  # 종료 처리 없이 중단 (마지막 스냅샷 이후는 WAL에만 있음)
+
+        restored = _runtime(symbol, RuntimeStateStore(str(tmp_path), 'paper', snapshot_every=snapshot_every))
+        assert restored.restore_state()
+        assert restored.indicators[symbol].bars == 850, "이력 재수집 없이 지표가 복원되어야 합니다"
+        assert restored.strategy.positions.keys() == first.strategy.positions.keys()
+        for bar in data[850:]:
+            restored.on_bar(bar)
+
+        assert [_trade_key(t) for t in restored.strategy.get_trade_history()] == \
+               [_trade_key(t) for t in reference.strategy.get_trade_history()]
+        assert restored.balance == reference.balance
+        assert restored.max_drawdown == reference.max_drawdown
+        assert restored.bars_processed == reference.bars_processed
+        assert restored.indicators[symbol].get_state() == reference.indicators[symbol].get_state()
+        assert restored.strategy.active_trade_ids.keys() == reference.strategy.active_trade_ids.keys()
+        assert len(restored.fills) == len(reference.fills)
+
+    def test_crash_restart_keeps_funding(self, data, tmp_path):
+        """포지션 보유 중 부과된 펀딩비가 WAL 복원 후에도 잔고와 선물 계좌 집계에 남아야 함"""
+        symbol = data[0].symbol
+        schedule = funding_schedule(to_ms(data[0].date), to_ms(data[-1].date))
+        funding = FundingRateStore(str(tmp_path / 'funding'))
+        funding.write(symbol, schedule, np.full(len(schedule), 1e-3))
+        reference = _runtime(symbol, funding_store=funding)
+        for bar in data:
+            reference.on_bar(bar)
+
+        store = RuntimeStateStore(str(tmp_path), 'paper', snapshot_every=10_000)
+        first = _runtime(symbol, store, funding_store=funding)
+        for bar in data[:850]:
+            first.on_bar(bar)
+        assert first.futures.funding_events > 0
+        store.close()
+
+        restored = _runtime(symbol, RuntimeStateStore(str(tmp_path), 'paper'), funding_store=funding)
+        assert restored.restore_state()
+        assert restored.balance == first.balance
+        assert restored.futures.get_state() == first.futures.get_state()
+        for bar in data[850:]:
+            restored.on_bar(bar)
+
+        assert restored.balance == reference.balance
+        assert restored.futures.get_state() == reference.futures.get_state()
+
+    def test_torn_wal_tail_ignored(self, data, tmp_path):
+        """기록 중 잘린 마지막 WAL 레코드는 무시해야 함"""
+        symbol = data[0].symbol
+        store = RuntimeStateStore(str(tmp_path), 'paper', snapshot_every=10_000)
+        runtime = _runtime(symbol, store)
+        for bar in data[:300]:
+            runtime.on_bar(bar)
+        store.close()
+        with open(store.wal_path, 'a', encoding='utf-8') as f:
+            f.write('{"seq": 99999, "kind": "bar", "da')
+
+        restored = _runtime(symbol, RuntimeStateStore(str(tmp_path), 'paper'))
+        assert restored.restore_state()
+        assert restored.indicators[symbol].get_state() == runtime.indicators[symbol].get_state()
+        assert restored.balance == runtime.balance
+
+    def test_no_saved_state(self, data, tmp_path):
+        """저장된 상태가 없으면 복원하지 않아야 함"""
+        assert not _runtime(data[0].symbol, RuntimeStateStore(str(tmp_path), 'paper')).restore_state()
+        assert not _runtime(data[0].symbol).restore_state()
+
+    def test_catch_up_fetches_only_missed_bars(self, data, tmp_path):
+        """복원된 지표는 중단 구간의 봉만 받아 이어 붙여야 함"""
+        symbol = data[0].symbol
+        store = RuntimeStateStore(str(tmp_path), 'paper')
+        runtime = _runtime(symbol, store)
+        for bar in data[:500]:
+            runtime.on_bar(bar)
+        runtime.save_state()
+        store.close()
+
+        restored = _runtime(symbol, RuntimeStateStore(str(tmp_path), 'paper'))
+        restored.restore_state()
+        feed = _HistoryFeed(data[:512], now=to_ms(data[512].date) + HOUR_MS // 2)
+        asyncio.run(restored._catch_up(feed, symbol))
+
+        assert feed.requests == [12]
+        assert restored.indicators[symbol].bars == 512
+        assert restored.indicators[symbol].last_open_time == to_ms(data[511].date)
+
+    def test_live_restart_keeps_exchange_stop(self, data, tmp_path):
+        """실거래 재시작 시 기존 거래소 손절 주문을 다시 추적하고 중단 중 체결도 반영해야 함"""
+        symbol = data[0].symbol
+
+        async def settle(executor):
+            await executor.join()
+            for _ in range(20):
+                await asyncio.sleep(0)
+
+        async def scenario():
+            exchange = MockExchange({symbol: data[0].close})
+            executor = OrderExecutor(exchange)
+            await executor.start()
+            runtime = LiveTradingRuntime([symbol], executor, timeframe='1h', state_store=RuntimeStateStore(
+                str(tmp_path), 'live'), strategy=TurtleStrategy(TradingMode.BACKTEST))
+            runtime.warm_up(symbol, data[:20])
+            for bar in data[20:]:
+                exchange.set_price(symbol, bar.close)
+                await settle(executor)
+                runtime.on_bar(bar)
+                await settle(executor)
+                if symbol in runtime.strategy.positions and not runtime.pending:
+                    break
+            await executor.stop()
+            runtime.state_store.close()
+            position = runtime.strategy.get_position(symbol)
+            stop_id = runtime.stop_orders[symbol]
+
+            # 재시작 전에 손절 체결
+            exchange.set_price(symbol, exchange.orders[stop_id]['stopPrice'] * (0.99 if position.direction == "LONG"
+                                                                                else 1.01))
+            executor = OrderExecutor(exchange)
+            await executor.start()
+            restored = LiveTradingRuntime([symbol], executor, timeframe='1h', state_store=RuntimeStateStore(
+                str(tmp_path), 'live'), strategy=TurtleStrategy(TradingMode.BACKTEST))
+            assert restored.restore_state()
+            assert restored.stop_orders[symbol] == stop_id
+            assert restored.strategy.get_position(symbol).total_size == position.total_size
+            await restored._resume_orders()
+            await settle(executor)
+            await executor.stop()
+            return exchange, restored
+
+        exchange, restored = asyncio.run(scenario())
+        assert restored.strategy.get_position(symbol) is None
+        assert restored.strategy.get_trade_history()[-1].exit_reason == 'STOP_LOSS'
+        assert exchange.positions[symbol] == pytest.approx(0.0)
+        assert not [o for o in exchange.open_orders(symbol) if o['type'] == OrderType.STOP_MARKET]
+        assert not restored.stop_orders
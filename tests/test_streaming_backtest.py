@@ -0,0 +1,96 @@
+"""
+스트리밍 백테스트 테스트
+"""
+
+import asyncio
+import csv
+import pytest
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 파이썬 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config import TradingMode
+from strategy.turtle_strategy import TurtleStrategy
+from strategy.backtest_core import SimulationCore, calculate_performance_metrics, drawdown_curve
+from utils.benchmark import generate_benchmark_data
+from utils.kline_store import KlineStore
+from utils.streaming_backtest import StreamingBacktest
+from frontend.backtest.backend.engines.backtest_engine import BacktestEngine, BacktestConfig_
+
+
+@pytest.fixture
+def stored_data(tmp_path):
+    """1시간봉 약 4개월치를 월 파티션으로 저장"""
+    data = generate_benchmark_data(3000, timeframe='1h', seed=21)
+    store = KlineStore(str(tmp_path / 'klines'))
+    store.write(data[0].symbol, '1h', data)
+    config = BacktestConfig_(symbol=data[0].symbol, timeframe='1h',
+                             start_date=data[0].date.strftime('%Y-%m-%d'),
+                             end_date=data[-1].date.strftime('%Y-%m-%d'))
+    return data, store, config
+
+
+def _read_csv(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+class TestStreamingBacktest:
+    """스트리밍 백테스트 테스트"""
+
+    def test_matches_in_memory_core(self, stored_data, tmp_path):
+        """청크 경계와 무관하게 인메모리 실행과 같은 자산 곡선/거래/지표를 내야 함"""
+        data, store, config = stored_data
+
+        core = SimulationCore(TurtleStrategy(TradingMode.BACKTEST), data, config.symbol, '1h', config.systems)
+        core.run()
+        trades = core.strategy.get_trade_history()
+        expected = calculate_performance_metrics(trades, core.equity_curve, core.daily_returns,
+                                                 config.initial_balance)
+
+        result = StreamingBacktest(config, store, str(tmp_path / 'out'), chunk_bars=250).run()
+
+        equity = _read_csv(result.equity_path)
+        assert [float(row['total_value']) for row in equity] == [p['total_value'] for p in core.equity_curve]
+        assert [float(row['drawdown']) for row in equity] == drawdown_curve(core.equity_curve,
+                                                                            config.initial_balance)
+
+        streamed_trades = _read_csv(result.trades_path)
+        assert trades, "비교할 거래가 있어야 합니다"
+        assert [(r['direction'], float(r['pnl']), r['exit_reason']) for r in streamed_trades] == \
+            [(t.direction, t.pnl, t.exit_reason) for t in trades]
+
+        assert result.final_balance == core.balance
+        assert result.total_trades == len(trades)
+        assert result.metrics.keys() == expected.keys()
+        for name, value in expected.items():
+            assert result.metrics[name] == pytest.approx(value, rel=1e-9), name
+
+    def test_memory_is_bounded_by_window_and_chunk(self, stored_data, tmp_path):
+        """메모리에 올라가는 봉 수는 지표 윈도우 + 청크 크기를 넘지 않아야 함"""
+        data, store, config = stored_data
+
+        streaming = StreamingBacktest(config, store, str(tmp_path / 'out'), chunk_bars=100)
+        result = streaming.run()
+        window = SimulationCore(TurtleStrategy(TradingMode.BACKTEST), None, config.symbol, '1h').window
+
+        assert result.total_bars == len(data)
+        assert result.peak_window_bars <= window + 100
+        assert not streaming.strategy.trade_history, "기록한 거래는 메모리에서 비워야 합니다"
+
+    def test_engine_requires_local_partitions(self, stored_data, tmp_path):
+        """엔진 스트리밍 모드는 로컬 파티션이 기간 전체를 포함할 때만 실행되어야 함"""
+        data, store, config = stored_data
+
+        engine = BacktestEngine(config)
+        engine.kline_store = store
+        result = asyncio.run(engine.run_streaming_backtest(str(tmp_path / 'out'), chunk_bars=500))
+        assert result.total_bars == len(data)
+        assert engine.current_balance == result.final_balance
+
+        engine.kline_store = KlineStore(str(tmp_path / 'empty'))
+        with pytest.raises(ValueError, match="로컬 캔들 파티션"):
+            asyncio.run(engine.run_streaming_backtest(str(tmp_path / 'out2')))
@@ -0,0 +1,147 @@
+"""
+런타임 텔레메트리 테스트 (Prometheus 텍스트 형식, 로컬 엔드포인트 수집)
+"""
+
+import asyncio
+import pytest
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 파이썬 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config import TradingMode
+from strategy.turtle_strategy import TurtleStrategy
+from utils.benchmark import generate_benchmark_data
+from utils.live_trading import LiveTradingRuntime
+from utils.order_execution import MockExchange, OrderExecutor
+from utils.telemetry import MetricsRegistry, RuntimeTelemetry
+
+
+def _parse(text):
+    """지표 줄 -> 값 (주석 제외)"""
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith('#'):
+            name, value = line.rsplit(' ', 1)
+            samples[name] = float(value)
+    return samples
+
+
+async def _scrape(reader_writer, path='/metrics'):
+    reader, writer = reader_writer
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    await writer.drain()
+    response = (await reader.read()).decode()
+    writer.close()
+    head, body = response.split('\r\n\r\n', 1)
+    return head.split('\r\n')[0], body
+
+
+class TestMetricsRegistry:
+    """지표 형식 테스트"""
+
+    def test_text_exposition(self):
+        """카운터/게이지/히스토그램이 Prometheus 텍스트 형식으로 나와야 함 (버킷은 누적, le 포함)"""
+        registry = MetricsRegistry()
+        registry.counter('orders_total', "주문 수", ('status',)).labels('FILLED').inc(3)
+        registry.gauge('balance', "잔고").labels().set(10000.5)
+        histogram = registry.histogram('latency_seconds', "지연", (0.1, 0.01, 1.0)).labels()
+        for value in (0.005, 0.01, 0.5, 3.0):
+            histogram.observe(value)
+        registry.gauge('exposure', "노출", ('symbol',)).labels('A"B\\').set(1)
+
+        text = registry.render()
+        assert '# TYPE latency_seconds histogram' in text
+        samples = _parse(text)
+        assert samples['orders_total{status="FILLED"}'] == 3
+        assert samples['balance'] == 10000.5
+        assert samples['latency_seconds_bucket{le="0.01"}'] == 2   # 상한 포함
+        assert samples['latency_seconds_bucket{le="0.1"}'] == 2
+        assert samples['latency_seconds_bucket{le="1"}'] == 3
+        assert samples['latency_seconds_bucket{le="+Inf"}'] == 4
+        assert samples['latency_seconds_count'] == 4
+        assert samples['latency_seconds_sum'] == pytest.approx(3.515)
+        assert 'exposure{symbol="A\\"B\\\\"} 1' in text
+
+        assert registry.counter('orders_total', "주문 수", ('status',)) is registry.families['orders_total']
+        with pytest.raises(ValueError):
+            registry.gauge('orders_total', "주문 수")
+        with pytest.raises(ValueError):
+            registry.families['orders_total'].labels()
+
+
+class TestRuntimeTelemetry:
+    """런타임 지표 수집 테스트"""
+
+    def test_live_runtime_scrape(self):
+        """실거래 런타임의 봉/주문 지표와 계좌 상태를 로컬 엔드포인트에서 수집할 수 있어야 함"""
+        data = generate_benchmark_data(400, timeframe='1h', seed=5)
+        symbol = data[0].symbol
+
+        async def scenario():
+            exchange = MockExchange({symbol: data[0].close})
+            executor = OrderExecutor(exchange)
+            await executor.start()
+            runtime = LiveTradingRuntime([symbol], executor, timeframe='1h',
+                                         strategy=TurtleStrategy(TradingMode.BACKTEST))
+            assert executor.telemetry is runtime.telemetry
+            assert await runtime.telemetry.start(port=0, lag_interval=0.01)
+            runtime.warm_up(symbol, data[:20])
+            for bar in data[20:]:
+                exchange.set_price(symbol, bar.close)
+                runtime.on_bar(bar)
+                await executor.join()
+                await asyncio.sleep(0)
+            await asyncio.sleep(0.05)  # 이벤트 루프 지연 표본
+
+            server = runtime.telemetry.server
+            status, body = await _scrape(await asyncio.open_connection('127.0.0.1', server.port))
+            missing, _ = await _scrape(await asyncio.open_connection('127.0.0.1', server.port), '/other')
+            await runtime.telemetry.stop()
+            await executor.stop()
+            return runtime, exchange, status, body, missing
+
+        runtime, exchange, status, body, missing = asyncio.run(scenario())
+        assert status == 'HTTP/1.1 200 OK' and missing == 'HTTP/1.1 404 Not Found'
+        samples = _parse(body)
+        assert samples['turtle_balance'] == pytest.approx(runtime.balance)
+        assert samples['turtle_equity'] == pytest.approx(runtime.equity())
+        assert samples['turtle_bar_processing_seconds_count'] == runtime.latency.count
+        submitted = sum(order.attempts for order in runtime.executor.orders.values())
+        assert submitted > 0
+        assert samples['turtle_order_submit_seconds_count'] == submitted
+        assert samples['turtle_rate_limiter_wait_seconds_count'] >= submitted
+        assert samples['turtle_orders_total{status="FILLED"}'] > 0
+        assert samples['turtle_event_loop_lag_seconds_count'] > 0
+
+        position = runtime.strategy.get_position(symbol)
+        units = samples[f'turtle_open_units{{symbol="{symbol}"}}']
+        assert units == (len(position.units) if position else 0)
+        exposure = [v for k, v in samples.items() if k.startswith('turtle_exposure_notional')]
+        assert exposure == ([pytest.approx(position.total_size * runtime.last_prices[symbol])] if position else [])
+
+    def test_unix_socket_and_port_conflict(self, tmp_path):
+        """유닉스 소켓으로도 제공되고, 포트를 못 열면 트레이딩을 막지 않고 False를 반환해야 함"""
+        if not hasattr(asyncio, 'start_unix_server'):
+            pytest.skip("유닉스 소켓 미지원")
+        path = str(tmp_path / 'metrics.sock')
+
+        async def scenario():
+            telemetry = RuntimeTelemetry()
+            telemetry.bar_latency.observe(0.0002)
+            assert await telemetry.start(path=path)
+            _, body = await _scrape(await asyncio.open_unix_connection(path))
+
+            other = RuntimeTelemetry()
+            tcp = RuntimeTelemetry()
+            assert await tcp.start(port=0)
+            assert not await other.start(port=tcp.server.port)
+            await tcp.stop()
+            await telemetry.stop()
+            return body
+
+        body = asyncio.run(scenario())
+        assert _parse(body)['turtle_bar_processing_seconds_bucket{le="0.00025"}'] == 1
+        assert not Path(path).exists()
@@ -0,0 +1,121 @@
+"""
+정수 시간축 테스트
+"""
+
+import numpy as np
+import pytest
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# 프로젝트 루트를 파이썬 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config import TradingMode
+from strategy.turtle_strategy import TurtleStrategy
+from strategy.backtest_core import SimulationCore, monthly_returns
+from utils.benchmark import generate_benchmark_data
+from utils.trade_journal import TradeJournalManager
+from utils.timeaxis import (
+    bucket_labels, bucket_ms, format_ms, format_ms_array, from_ms, range_mask, to_ms, to_ms_array
+)
+
+NEW_YEAR_MS = 1_704_067_200_000  # 2024-01-01 00:00 UTC
+
+
+@pytest.fixture(scope="module")
+def core():
+    """1시간봉 2000개로 실행한 시뮬레이션 코어"""
+    data = generate_benchmark_data(2000, timeframe='1h', seed=37)
+    core = SimulationCore(TurtleStrategy(TradingMode.BACKTEST), data, data[0].symbol, '1h')
+    core.run()
+    return data, core
+
+
+class TestConversions:
+    """변환 함수 테스트"""
+
+    @pytest.mark.parametrize("value", [
+        NEW_YEAR_MS, str(NEW_YEAR_MS), datetime(2024, 1, 1), '2024-01-01', '2024-01-01 00:00:00',
+        np.datetime64('2024-01-01'), datetime(2024, 1, 1, 9, tzinfo=timezone(timedelta(hours=9))),
+    ])
+    def test_to_ms_accepts_common_inputs(self, value):
+        assert to_ms(value) == NEW_YEAR_MS
+
+    def test_round_trip_is_utc(self):
+        assert from_ms(NEW_YEAR_MS) == datetime(2024, 1, 1)
+        assert to_ms(from_ms(NEW_YEAR_MS + 1234)) == NEW_YEAR_MS + 1234
+
+    def test_array_conversion_and_formatting(self):
+        dates = [datetime(2024, 1, 1) + timedelta(hours=h) for h in range(3)]
+        times = to_ms_array(dates)
+        assert times.dtype == np.int64
+        np.testing.assert_array_equal(to_ms_array(times.tolist()), times)
+        assert format_ms_array(times, 's')[1] == '2024-01-01 01:00:00'
+        assert format_ms(times[2]) == '2024-01-01'
+        assert format_ms_array(np.zeros(0, dtype=np.int64)) == []
+
+    def test_range_and_buckets(self):
+        times = NEW_YEAR_MS + np.arange(0, 40) * 86_400_000
+        mask = range_mask(times, '2024-01-10', '2024-02-01')
+        assert mask.sum() == 22
+        assert bucket_labels(times[[0, 39]], 'M') == ['2024-01', '2024-02']
+        assert bucket_ms(times[[39]], 'M')[0] == to_ms('2024-02-01')
+
+
+class TestSimulationTimeAxis:
+    """시뮬레이션 시간축 테스트"""
+
+    def test_equity_points_use_bar_open_time(self, core):
+        data, core = core
+        first = len(data) - len(core.equity_curve)
+        assert all(isinstance(p['date'], int) for p in core.equity_curve)
+        assert core.equity_curve[0]['date'] == to_ms(data[first].date)
+        assert core.equity_curve[-1]['date'] == to_ms(data[-1].date)
+
+    def test_trades_are_stamped_with_bar_time(self, core):
+        """거래 시각은 실행 시각이 아니라 해당 봉 시각이어야 함"""
+        data, core = core
+        trades = core.strategy.get_trade_history()
+        bar_dates = {bar.date for bar in data}
+        assert trades
+        assert all(t.entry_date in bar_dates and t.exit_date in bar_dates for t in trades)
+        assert all(t.entry_date <= t.exit_date for t in trades)
+
+    def test_monthly_returns_accept_legacy_string_dates(self, core):
+        _, core = core
+        legacy = [{'date': format_ms(p['date']), 'total_value': p['total_value']} for p in core.equity_curve]
+        assert monthly_returns(legacy) == monthly_returns(core.equity_curve)
+        assert list(monthly_returns(core.equity_curve)) == sorted(
+            set(bucket_labels(np.array([p['date'] for p in core.equity_curve]), 'M')))
+
+
+class TestJournalExport:
+    """매매일지 CSV 내보내기 시각 형식 테스트"""
+
+    def test_csv_timestamp_is_formatted(self, tmp_path):
+        """CSV 시각 열은 UTC 문자열로 기록하고, 요약은 문자열과 이전 epoch ms 행을 모두 읽어야 함"""
+        journal = TradeJournalManager(TradingMode.BACKTEST)
+        journal.csv_file_path = str(tmp_path / 'journal.csv')
+        journal._ensure_csv_file_exists()
+        entry_ms = NEW_YEAR_MS + 9 * 3_600_000 + 30 * 60_000  # 2024-01-01 09:30 UTC
+        trade_id = journal.log_trade_entry('BTCUSDT', "LONG", 42000.0, 0.1, 41000.0, 500.0, 1.0, 10000.0, 1,
+                                           timestamp=entry_ms)
+        journal.log_trade_exit(trade_id, 'BTCUSDT', "LONG", 42000.0, 43000.0, 0.1, 100.0, 10100.0, 'SIGNAL',
+                               timestamp=entry_ms + 3_600_000)
+
+        rows = journal.get_trade_history()
+        assert [row['timestamp'] for row in rows] == ['2024-01-01 09:30:00', '2024-01-01 10:30:00']
+        assert to_ms(rows[1]['timestamp']) == entry_ms + 3_600_000
+        assert rows[0]['trade_id'].endswith(str(entry_ms)), "거래 ID는 epoch ms 기반 유지"
+
+        # 이전 형식(epoch ms) 행도 요약에 포함
+        journal.log_trade_exit(trade_id, 'BTCUSDT', "LONG", 42000.0, 41500.0, 0.1, -50.0, 10050.0, 'STOP_LOSS',
+                               timestamp=entry_ms + 7_200_000)
+        text = (tmp_path / 'journal.csv').read_text(encoding='utf-8')
+        (tmp_path / 'journal.csv').write_text(text.replace('2024-01-01 11:30:00', str(entry_ms + 7_200_000)),
+                                              encoding='utf-8')
+        summary = journal.get_daily_summary('2024-01-01')
+        assert summary['total_trades'] == 2 and summary['total_pnl'] == pytest.approx(50.0)
+        assert journal.get_daily_summary('2024-01-02')['total_trades'] == 0
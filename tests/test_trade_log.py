@@ -0,0 +1,103 @@
+"""
+컬럼형 거래 로그 및 슬롯 데이터 클래스 테스트
+"""
+
+import pickle
+import pytest
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 파이썬 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from strategy.turtle_strategy import Position, PriceData, TradeResult, TradingUnit
+from utils.trade_log import TradeLog
+
+
+def _trades(count):
+    base = datetime(2024, 1, 1)
+    return [TradeResult(symbol=f"S{k % 3}USDT", direction="LONG" if k % 2 else "SHORT",
+                        entry_price=100.0 + k, exit_price=101.5 + k, size=0.1 * (k + 1), pnl=(k % 5 - 2) * 1.25,
+                        entry_date=base + timedelta(hours=k), exit_date=base + timedelta(hours=k + 3),
+                        system=1 + k % 2, exit_reason='STOP_LOSS' if k % 4 == 0 else 'SIGNAL')
+            for k in range(count)]
+
+
+class TestTradeLog:
+    """거래 로그 테스트"""
+
+    def test_round_trip_across_chunks(self):
+        """청크 경계를 넘어 기록한 거래가 그대로 복원되어야 함"""
+        trades = _trades(23)
+        log = TradeLog(TradeResult, chunk_size=8)
+        log.extend(trades)
+
+        assert len(log) == 23
+        assert list(log) == trades
+        assert log[-1] == trades[-1] and log[8] == trades[8]
+        assert list(log[5:19]) == trades[5:19]
+        assert log[::7] == trades[::7]
+        assert list(reversed(log)) == trades[::-1]
+        assert log.column('pnl').tolist() == [t.pnl for t in trades]
+        assert log.column('symbol') == [t.symbol for t in trades]
+        with pytest.raises(IndexError):
+            log[23]
+
+    def test_views_are_zero_copy_snapshots(self):
+        """뷰는 만든 시점의 구간만 보이고, 한 청크 안의 컬럼은 복사 없는 읽기 전용 배열이어야 함"""
+        trades = _trades(12)
+        log = TradeLog(TradeResult, chunk_size=16)
+        log.extend(trades[:10])
+        view = log.view()
+        log.extend(trades[10:])
+
+        assert len(view) == 10 and len(log) == 12
+        pnl = view.column('pnl')
+        assert np.shares_memory(pnl, log.column('pnl'))
+        assert not pnl.flags.writeable
+
+        log.clear()
+        assert not log and len(view) == 10
+        assert list(view) == trades[:10], "clear() 이후에도 기존 뷰는 유효해야 합니다"
+
+    def test_pickle_trims_unused_rows(self):
+        """저장 시 마지막 청크의 빈 영역은 빼고, 복원 후에도 이어서 기록할 수 있어야 함"""
+        trades = _trades(5)
+        log = TradeLog(TradeResult, chunk_size=4096)
+        log.extend(trades[:3])
+        data = pickle.dumps(log)
+        assert len(data) < 4096 * 8
+
+        restored = pickle.loads(data)
+        restored.extend(trades[3:])
+        assert list(restored) == trades
+
+
+class TestCompactDataClasses:
+    """슬롯 데이터 클래스 테스트"""
+
+    def test_slotted_instances_have_no_dict(self):
+        bar = PriceData('BTCUSDT', datetime(2024, 1, 1), 1.0, 2.0, 0.5, 1.5, 10.0)
+        trade = _trades(1)[0]
+        for obj in (bar, trade):
+            assert not hasattr(obj, '__dict__')
+        assert pickle.loads(pickle.dumps(trade)) == trade
+
+    def test_running_average_price(self):
+        """피라미딩 평균 단가는 누적 진입 금액으로 갱신하며 전체 합산과 같아야 함"""
+        units = [TradingUnit(entry_price=100.0 + 3.7 * k, entry_date=datetime(2024, 1, 1), size=0.3 + 0.11 * k,
+                             stop_loss=90.0, system=1, unit_number=k + 1) for k in range(4)]
+        position = Position('BTCUSDT', 'LONG', [units[0]], units[0].size, units[0].entry_price)
+        for unit in units[1:]:
+            position.add_unit(unit)
+
+        assert position.total_size == pytest.approx(sum(u.size for u in units))
+        assert position.avg_price == sum(u.size * u.entry_price for u in units) / position.total_size
+        copied = pickle.loads(pickle.dumps(position))
+        copied.add_unit(units[0])
+        assert copied.avg_price == pytest.approx((position.avg_price * position.total_size + units[0].size *
+                                                  units[0].entry_price) / copied.total_size)
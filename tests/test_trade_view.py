@@ -0,0 +1,124 @@
+"""
+거래 목록 뷰 모델 테스트 (정렬 인덱스, 필터 마스크, 페이지)
+"""
+
+import pytest
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+# 프로젝트 루트를 파이썬 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from frontend.backtest.backend.engines.backtest_engine import BacktestResultsManager
+from utils.result_store import ResultStore
+from utils.trade_log import TradeLog
+from utils.trade_view import TradeView
+
+
+def _trades(n, seed=0):
+    rng = np.random.default_rng(seed)
+    start = datetime(2024, 1, 1)
+    trades = []
+    for k in range(n):
+        entry = start + timedelta(hours=int(k * 7))
+        trades.append(SimpleNamespace(
+            symbol='BTCUSDT', direction="LONG" if rng.random() < 0.5 else "SHORT",
+            entry_price=40000.0 + k, exit_price=40100.0 + k, size=0.1,
+            pnl=float(np.round(rng.normal(0.0, 100.0), 2)),
+            entry_date=entry, exit_date=entry + timedelta(hours=int(rng.integers(1, 24 * 9))),
+            system=int(rng.integers(1, 3)), exit_reason=str(rng.choice(['SIGNAL', 'STOP_LOSS']))))
+    return trades
+
+
+def _numbers(view):
+    return [row['number'] for page in range(1, view.page_count + 1) for row in view.page(page)]
+
+
+class TestTradeView:
+    """정렬/필터/페이지 테스트"""
+
+    def test_sort_and_filter_match_python(self):
+        """정렬/필터 결과 순서가 파이썬 정렬/리스트 필터와 같아야 함"""
+        trades = _trades(500)
+        view = TradeView.from_trades(trades, page_size=15)
+        assert len(view) == 500 and view.page_count == 34
+        assert _numbers(view) == list(range(1, 501))
+        assert _numbers(view.sort('date')) == sorted(range(1, 501), key=lambda k: trades[k - 1].exit_date)
+
+        view.sort('pnl', descending=True)
+        assert [row['pnl'] for row in view.page(1)] == sorted((t.pnl for t in trades), reverse=True)[:15]
+
+        view.sort('duration').filter(direction="SHORT", system=2, outcome='win')
+        expected = [k + 1 for k, t in enumerate(trades)
+                    if t.direction == "SHORT" and t.system == 2 and t.pnl > 0]
+        expected.sort(key=lambda k: (trades[k - 1].exit_date - trades[k - 1].entry_date).days)
+        assert _numbers(view) == expected
+        assert view.totals()['count'] == len(expected)
+        assert view.totals()['pnl'] == pytest.approx(sum(trades[k - 1].pnl for k in expected))
+
+        view.filter(system=None, direction=None)
+        assert view.totals()['win_rate'] == 1.0
+        assert view.filter(exit_reason='UNKNOWN').totals()['count'] == 0
+        assert view.reset().totals()['count'] == 500
+        with pytest.raises(ValueError):
+            view.sort('size')
+
+    def test_page_rows(self):
+        """페이지 행은 원래 거래 순번과 표시용 값을 담아야 함"""
+        trades = _trades(30)
+        view = TradeView.from_trades(trades, page_size=10)
+        row = view.page(2)[0]
+        trade = trades[10]
+        assert row['number'] == 11
+        assert row['entry_date'] == trade.entry_date.strftime('%Y-%m-%d')
+        assert row['duration'] == (trade.exit_date - trade.entry_date).days
+        assert (row['direction'], row['system'], row['exit_reason'], row['pnl']) == \
+            (trade.direction, trade.system, trade.exit_reason, trade.pnl)
+        assert view.page(4) == []
+
+    def test_indexes_are_cached(self):
+        """같은 정렬 기준/필터 값은 캐시된 인덱스와 마스크를 다시 써야 함"""
+        view = TradeView.from_trades(_trades(200))
+        view.sort('pnl')
+        index = view._sort_index['pnl']
+        view.filter(direction="LONG").sort('date').sort('pnl', descending=True)
+        assert view._sort_index['pnl'] is index
+        assert list(view._masks) == [('direction', "LONG")]
+
+    def test_stored_run_uses_columns(self, tmp_path):
+        """저장소에서 로드한 결과는 TradeResult 목록을 만들지 않고 같은 뷰를 만들어야 함"""
+        trades = _trades(120, seed=3)
+        results = SimpleNamespace(
+            config=SimpleNamespace(symbol='BTCUSDT', timeframe='1h', to_dict=lambda: {'symbol': 'BTCUSDT'}),
+            metrics=SimpleNamespace(to_dict=lambda: {}), equity_curve=[], drawdown_curve=[],
+            daily_returns=[], trades=trades, start_date='', end_date='', initial_balance=0.0,
+            final_balance=0.0, monthly_returns={}, timing={})
+        store = ResultStore(str(tmp_path))
+        loaded = BacktestResultsManager.load_run(store.save(results), store)
+
+        stored = TradeView.for_results(loaded).sort('pnl').filter(exit_reason='STOP_LOSS')
+        memory = TradeView.from_trades(trades).sort('pnl').filter(exit_reason='STOP_LOSS')
+        assert 'trades' not in loaded._lazy
+        assert stored.page_count == memory.page_count
+        for page in range(1, stored.page_count + 1):
+            assert stored.page(page) == memory.page(page)
+
+    def test_trade_log_columns(self):
+        """거래 로그는 행 객체를 만들지 않고 컬럼으로 같은 뷰를 만들어야 함"""
+        trades = _trades(2500, seed=5)
+        log = TradeLog(SimpleNamespace, chunk_size=1024)
+        log.extend(trades)
+        logged = TradeView.from_trades(log.view()).sort('duration', descending=True).filter(system=1)
+        listed = TradeView.from_trades(trades).sort('duration', descending=True).filter(system=1)
+        assert logged.page_count == listed.page_count
+        assert logged.page(7) == listed.page(7)
+
+    def test_empty(self):
+        view = TradeView.from_trades([])
+        assert len(view) == 0 and view.page_count == 1 and view.page(1) == []
+        assert view.filter(outcome='win').totals() == {'count': 0, 'pnl': 0.0, 'win_rate': 0.0}
@@ -0,0 +1,405 @@
+"""
+백테스트 벤치마크 하네스
+고정 시드 데이터셋으로 두 BacktestEngine 구현, TurtleIndicators, 매매일지 기록, 성과 지표 계산의
+처리량(bars/sec), 최대 메모리, 메모리 블록 할당량을 측정하고 JSON 이력으로 성능 회귀를 추적
+"""
+
+import asyncio
+import contextlib
+import gc
+import importlib.util
+import io
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config import DataConfig, TradingMode
+from strategy.turtle_strategy import PriceData, TradeResult, TurtleIndicators
+from utils.timeaxis import to_ms_array
+
+logger = logging.getLogger(__name__)
+
+# 기본 데이터셋 크기 (10k / 100k / 1M 봉)
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+DEFAULT_SEED = 42
+
+# 타임프레임별 봉 간격 (분)
+TIMEFRAME_MINUTES = {
+    '1m': 1, '5m': 5, '15m': 15, '1h': 60, '4h': 240,
+    '1d': 1440, '1w': 10080, '1M': 43200
+}
+
+HISTORY_FILE = os.path.join(DataConfig.BENCHMARK_DIR, 'history.json')
+BASELINE_FILE = os.path.join(DataConfig.BENCHMARK_DIR, 'baseline.json')
+
+
+@dataclass
+class BenchmarkResult:
+    """단일 벤치마크 케이스 결과"""
+    case: str
+    n_bars: int
+    seconds: float
+    bars_per_sec: float
+    peak_memory_bytes: Optional[int] = None
+    allocated_blocks: Optional[int] = None
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        """이력/기준선 비교용 키"""
+        return f"{self.case}@{self.n_bars}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def generate_benchmark_data(n_bars: int, seed: int = DEFAULT_SEED, symbol: str = 'BTCUSDT',
+                            timeframe: str = '1m',
+                            start: datetime = datetime(2020, 1, 1)) -> List[PriceData]:
+    """고정 시드 OHLCV 데이터 생성 (랜덤 워크 + 추세 구간)"""
+    rng = np.random.default_rng(seed)
+    interval = TIMEFRAME_MINUTES.get(timeframe, 1)
+
+    # 로그 수익률 랜덤 워크에 50봉 단위 상승/하락 추세를 섞어 브레이크아웃 신호가 발생하도록 함
+    trend = np.where((np.arange(n_bars) // 50) % 2 == 0, 0.0005, -0.0005)
+    returns = rng.normal(0.0, 0.005, n_bars) + trend
+    opens = 50000.0 * np.exp(np.cumsum(returns))
+    closes = opens * (1 + rng.normal(0.0, 0.002, n_bars))
+    spread = np.abs(rng.normal(0.0, 0.003, n_bars))
+    highs = np.maximum(opens * (1 + spread), np.maximum(opens, closes))
+    lows = np.minimum(opens * (1 - spread), np.minimum(opens, closes))
+    volumes = 1_000_000 * np.abs(rng.normal(1.0, 0.5, n_bars))
+
+    step = timedelta(minutes=interval)
+    return [
+        PriceData(symbol, start + step * i, o, h, l, c, v)
+        for i, (o, h, l, c, v) in enumerate(zip(opens.tolist(), highs.tolist(), lows.tolist(),
+                                                closes.tolist(), volumes.tolist()))
+    ]
+
+
+def _load_legacy_engine_module():
+    """.backend 백테스트 엔진 모듈 로드 (숨김 디렉토리라 import 경로로 접근 불가)"""
+    module_path = project_root / '.backend' / 'engines' / 'backtest_engine.py'
+    spec = importlib.util.spec_from_file_location('_legacy_backtest_engine', module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _config_dates(data: List[PriceData]) -> Dict[str, str]:
+    """데이터 구간에 맞는 설정 날짜 문자열"""
+    return {
+        'start_date': data[0].date.strftime('%Y-%m-%d'),
+        'end_date': data[-1].date.strftime('%Y-%m-%d'),
+    }
+
+
+# ---------------------------------------------------------------------------
+# 벤치마크 케이스: setup(data, timeframe) -> 측정 대상 호출 가능 객체
+# (정리할 자원이 있으면 호출 가능 객체의 cleanup 속성으로 노출, 측정 실행 후 호출됨)
+# ---------------------------------------------------------------------------
+
+def _journal_sandbox() -> contextlib.ExitStack:
+    """매매일지 CSV/로그를 임시 디렉터리로 돌린 상태 (닫으면 복원 후 디렉터리 삭제)"""
+    from utils.trade_journal import redirect_journals
+
+    stack = contextlib.ExitStack()
+    tmp_dir = stack.enter_context(tempfile.TemporaryDirectory(prefix='turtle_bench_journal_'))
+    stack.enter_context(redirect_journals(tmp_dir))
+    return stack
+
+
+def _engine_case(module, data: List[PriceData], timeframe: str) -> Callable[[], Any]:
+    """엔진 전체 실행 케이스 (엔진이 남기는 매매일지는 측정 후 삭제되는 임시 디렉터리에 기록)"""
+    with _journal_sandbox() as sandbox:
+        config = module.BacktestConfig_(symbol=data[0].symbol, timeframe=timeframe, **_config_dates(data))
+        engine = module.BacktestEngine(config)
+
+        async def _load(*args, **kwargs):
+            return data
+
+        engine.load_historical_data = _load
+
+        def _run():
+            return asyncio.run(engine.run_backtest())
+
+        _run.cleanup = sandbox.pop_all().close
+    return _run
+
+
+def _setup_frontend_engine(data: List[PriceData], timeframe: str) -> Callable[[], Any]:
+    from frontend.backtest.backend.engines import backtest_engine
+
+    return _engine_case(backtest_engine, data, timeframe)
+
+
+def _setup_backend_engine(data: List[PriceData], timeframe: str) -> Callable[[], Any]:
+    return _engine_case(_load_legacy_engine_module(), data, timeframe)
+
+
+def _setup_indicators(data: List[PriceData], timeframe: str) -> Callable[[], Any]:
+    indicators = TurtleIndicators()
+    window = 60  # 엔진과 동일한 최근 60봉 윈도우
+
+    def _run():
+        for i in range(window, len(data)):
+            recent = data[i - window:i + 1]
+            indicators.calculate_atr(recent, 20)
+            indicators.check_breakout(recent, 20, "LONG")
+            indicators.check_breakout(recent, 55, "SHORT")
+            indicators.calculate_donchian_high(recent, 20)
+            indicators.calculate_donchian_low(recent, 10)
+
+    return _run
+
+
+def _setup_journal(data: List[PriceData], timeframe: str) -> Callable[[], Any]:
+    from utils.trade_journal import TradeJournalManager
+
+    with _journal_sandbox() as sandbox:
+        journal = TradeJournalManager(TradingMode.BACKTEST)
+
+        def _run():
+            trade_id = None
+            for i, bar in enumerate(data):
+                # 봉마다 한 행: 진입과 청산을 번갈아 기록
+                if i % 2 == 0:
+                    trade_id = journal.log_trade_entry(
+                        symbol=bar.symbol, direction="LONG", entry_price=bar.close, size=0.1,
+                        stop_loss=bar.close * 0.98, atr=bar.high - bar.low, leverage=1.0,
+                        account_balance=10000.0, system=1
+                    )
+                else:
+                    journal.log_trade_exit(
+                        trade_id=trade_id, symbol=bar.symbol, direction="LONG",
+                        entry_price=data[i - 1].close, exit_price=bar.close, size=0.1,
+                        pnl=(bar.close - data[i - 1].close) * 0.1, account_balance=10000.0,
+                        reason="SIGNAL"
+                    )
+
+        _run.cleanup = sandbox.pop_all().close
+    return _run
+
+
+def _setup_metrics(data: List[PriceData], timeframe: str) -> Callable[[], Any]:
+    from frontend.backtest.backend.engines.backtest_engine import BacktestEngine, BacktestConfig_
+
+    with _journal_sandbox():  # 엔진 생성 시 만들어지는 매매일지 파일도 임시 디렉터리에
+        engine = BacktestEngine(BacktestConfig_(symbol=data[0].symbol, timeframe=timeframe,
+                                                **_config_dates(data)))
+    times = to_ms_array([bar.date for bar in data]).tolist()
+    equity_curve = [{'date': t, 'total_value': 10000.0 + bar.close - data[0].close}
+                    for t, bar in zip(times, data)]
+    engine.daily_returns = [
+        (equity_curve[i]['total_value'] - equity_curve[i - 1]['total_value']) / equity_curve[i - 1]['total_value']
+        for i in range(1, len(equity_curve))
+    ]
+
+    # 10봉당 1건의 거래를 가정
+    trades = []
+    for i in range(10, len(data), 10):
+        entry, exit_ = data[i - 10], data[i]
+        direction = "LONG" if (i // 10) % 2 == 0 else "SHORT"
+        sign = 1 if direction == "LONG" else -1
+        trades.append(TradeResult(
+            symbol=entry.symbol, direction=direction, entry_price=entry.close, exit_price=exit_.close,
+            size=0.1, pnl=sign * (exit_.close - entry.close) * 0.1, entry_date=entry.date,
+            exit_date=exit_.date, system=1 + (i // 10) % 2, exit_reason="SIGNAL"
+        ))
+
+    return lambda: engine._calculate_performance_metrics(trades, equity_curve)
+
+
+BENCHMARK_CASES: Dict[str, Callable[[List[PriceData], str], Callable[[], Any]]] = {
+    'frontend_engine': _setup_frontend_engine,
+    'backend_engine': _setup_backend_engine,
+    'indicators': _setup_indicators,
+    'journal': _setup_journal,
+    'metrics': _setup_metrics,
+}
+
+
+def _release(run: Callable[[], Any]):
+    """측정이 끝난 케이스의 자원 정리 (임시 디렉터리 등)"""
+    cleanup = getattr(run, 'cleanup', None)
+    if cleanup is not None:
+        cleanup()
+
+
+def measure(case: str, data: List[PriceData], timeframe: str = '1m',
+            measure_memory: bool = True) -> BenchmarkResult:
+    """케이스 하나를 측정
+
+    처리량은 tracemalloc 없이 측정하고, 메모리는 추적 오버헤드가 처리량을 왜곡하지 않도록
+    별도 실행에서 측정한다.
+    """
+    setup = BENCHMARK_CASES[case]
+    n_bars = len(data)
+
+    # 1) 처리량 측정
+    run = setup(data, timeframe)
+    gc.collect()
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        run()
+        seconds = time.perf_counter() - start
+    _release(run)
+    del run
+
+    result = BenchmarkResult(
+        case=case,
+        n_bars=n_bars,
+        seconds=seconds,
+        bars_per_sec=n_bars / seconds if seconds > 0 else float('inf'),
+    )
+
+    # 2) 메모리 측정
+    if measure_memory:
+        run = setup(data, timeframe)
+        gc.collect()
+        blocks_before = sys.getallocatedblocks()
+        tracemalloc.start()
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                run()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+            _release(run)
+        result.peak_memory_bytes = peak
+        result.allocated_blocks = sys.getallocatedblocks() - blocks_before
+        del run
+
+    return result
+
+
+def run_benchmarks(sizes: Optional[List[int]] = None, cases: Optional[List[str]] = None,
+                   seed: int = DEFAULT_SEED, timeframe: str = '1m',
+                   measure_memory: bool = True,
+                   on_result: Optional[Callable[[BenchmarkResult], None]] = None) -> List[BenchmarkResult]:
+    """데이터셋 크기 × 케이스 조합 전체 측정"""
+    sizes = sizes or DEFAULT_SIZES
+    cases = cases or list(BENCHMARK_CASES)
+
+    unknown = [c for c in cases if c not in BENCHMARK_CASES]
+    if unknown:
+        raise ValueError(f"알 수 없는 벤치마크 케이스: {', '.join(unknown)}")
+
+    results = []
+    for n_bars in sizes:
+        data = generate_benchmark_data(n_bars, seed=seed, timeframe=timeframe)
+        for case in cases:
+            logger.info(f"Benchmark {case} @ {n_bars} bars")
+            result = measure(case, data, timeframe, measure_memory)
+            results.append(result)
+            if on_result:
+                on_result(result)
+        del data
+    return results
+
+
+# ---------------------------------------------------------------------------
+# 이력 / 기준선 관리
+# ---------------------------------------------------------------------------
+
+def _environment_info() -> Dict[str, Any]:
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'numpy': np.__version__,
+    }
+
+
+def append_history(results: List[BenchmarkResult], path: str = HISTORY_FILE,
+                   seed: int = DEFAULT_SEED) -> Dict[str, Any]:
+    """측정 결과를 JSON 이력 파일에 추가"""
+    record = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'seed': seed,
+        'environment': _environment_info(),
+        'results': [r.to_dict() for r in results],
+    }
+
+    history = load_history(path)
+    history.append(record)
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(history, f, indent=2, ensure_ascii=False)
+    return record
+
+
+def load_history(path: str = HISTORY_FILE) -> List[Dict[str, Any]]:
+    """JSON 이력 로드"""
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_baseline(results: List[BenchmarkResult], path: str = BASELINE_FILE):
+    """현재 결과를 기준선으로 저장"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'environment': _environment_info(),
+            'results': [r.to_dict() for r in results],
+        }, f, indent=2, ensure_ascii=False)
+
+
+def load_baseline(path: str = BASELINE_FILE) -> Optional[Dict[str, BenchmarkResult]]:
+    """기준선 로드 (케이스@크기 키 → 결과)"""
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    baseline = [BenchmarkResult(**r) for r in data.get('results', [])]
+    return {r.key: r for r in baseline}
+
+
+def compare_to_baseline(results: List[BenchmarkResult], baseline: Dict[str, BenchmarkResult],
+                        tolerance: float = 0.10) -> List[Dict[str, Any]]:
+    """기준선 대비 회귀 목록 반환
+
+    처리량이 tolerance 이상 감소하거나 최대 메모리가 tolerance 이상 증가하면 회귀로 판정한다.
+    """
+    regressions = []
+    for result in results:
+        base = baseline.get(result.key)
+        if base is None:
+            continue
+
+        if base.bars_per_sec > 0:
+            change = (result.bars_per_sec - base.bars_per_sec) / base.bars_per_sec
+            if change < -tolerance:
+                regressions.append({
+                    'key': result.key, 'metric': 'bars_per_sec',
+                    'baseline': base.bars_per_sec, 'current': result.bars_per_sec, 'change': change
+                })
+
+        if base.peak_memory_bytes and result.peak_memory_bytes is not None:
+            change = (result.peak_memory_bytes - base.peak_memory_bytes) / base.peak_memory_bytes
+            if change > tolerance:
+                regressions.append({
+                    'key': result.key, 'metric': 'peak_memory_bytes',
+                    'baseline': base.peak_memory_bytes, 'current': result.peak_memory_bytes, 'change': change
+                })
+
+    return regressions
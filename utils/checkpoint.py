@@ -0,0 +1,145 @@
+"""
+백테스트 체크포인트
+장시간 백테스트의 전체 상태를 주기적으로 바이너리 스냅샷으로 저장하고 재개/취소를 지원
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+CHECKPOINT_VERSION = 5
+
+# 결과에 영향을 주지 않는 실행 옵션 (체크포인트 키에서 제외)
+RUNTIME_ONLY_KEYS = ('profiling', 'profile_output', 'checkpointing', 'checkpoint_interval', 'use_cache')
+
+
+class BacktestCancelled(Exception):
+    """사용자 요청으로 백테스트가 중단됨"""
+
+    def __init__(self, message: str, checkpoint_path: Optional[str] = None):
+        super().__init__(message)
+        self.checkpoint_path = checkpoint_path  # 재개 가능한 체크포인트 (저장된 경우)
+
+
+class CancellationToken:
+    """협조적 취소 플래그 (UI/시그널 핸들러에서 설정, 엔진 루프에서 확인)"""
+
+    def __init__(self):
+        self.cancelled = False
+
+    def cancel(self):
+        """취소 요청"""
+        self.cancelled = True
+
+    def reset(self):
+        """취소 상태 초기화"""
+        self.cancelled = False
+
+
+@dataclass
+class BacktestCheckpoint:
+    """백테스트 상태 스냅샷
+
+    cursor는 다음에 처리할 봉 인덱스이며, 재개 시 해당 봉부터 루프를 이어서 실행한다.
+    자산 곡선과 수익률은 딕셔너리 리스트 대신 numpy 배열로 보관하여 스냅샷을 작게 유지한다.
+    """
+    config_key: str
+    data_fingerprint: str
+    cursor: int
+    processed_steps: int
+    current_balance: float
+    prev_portfolio_value: float
+    strategy_state: Dict[str, Any]
+    equity_times: np.ndarray  # int64 epoch ms
+    equity_values: np.ndarray
+    daily_returns: np.ndarray
+    futures_state: Dict[str, Any] = field(default_factory=dict)  # 펀딩비/강제청산 누적 집계
+    costs_state: Dict[str, Any] = field(default_factory=dict)    # 수수료/슬리피지 누적 집계
+    created_at: float = field(default_factory=time.time)
+    version: int = CHECKPOINT_VERSION
+
+    def equity_curve(self) -> List[Dict[str, Any]]:
+        """엔진 형식의 자산 곡선으로 복원"""
+        return [{'date': t, 'total_value': v}
+                for t, v in zip(self.equity_times.tolist(), self.equity_values.tolist())]
+
+
+def config_key(config_dict: Dict[str, Any]) -> str:
+    """결과에 영향을 주는 설정만으로 만든 안정적인 해시 키"""
+    relevant = {k: v for k, v in config_dict.items() if k not in RUNTIME_ONLY_KEYS}
+    payload = json.dumps(relevant, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def data_fingerprint(price_data: List[Any]) -> str:
+    """입력 데이터 지문 (길이, 처음/마지막 봉, 종가 합계)"""
+    if not price_data:
+        return 'empty'
+    first, last = price_data[0], price_data[-1]
+    close_sum = sum(p.close for p in price_data)
+    payload = f"{len(price_data)}|{first.date}|{first.close!r}|{last.date}|{last.close!r}|{close_sum!r}"
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+class CheckpointManager:
+    """체크포인트 파일 관리 및 저장 주기 판정
+
+    매 봉 due()가 호출되지만 시계는 check_every 봉마다 한 번만 확인하므로
+    체크포인트를 쓰지 않는 봉의 비용은 비트 연산 하나다.
+    """
+
+    def __init__(self, directory: str, key: str, interval: float = 5.0, check_every: int = 256):
+        self.directory = directory
+        self.key = key
+        self.interval = interval
+        self.path = os.path.join(directory, f"{key}.ckpt")
+        self._mask = max(1, 1 << (max(1, check_every) - 1).bit_length()) - 1
+        self._last_save = time.perf_counter()
+        self.saves = 0
+
+    def due(self, step: int) -> bool:
+        """저장 주기 도래 여부"""
+        if step & self._mask:
+            return False
+        return time.perf_counter() - self._last_save >= self.interval
+
+    def save(self, checkpoint: BacktestCheckpoint) -> str:
+        """원자적으로 저장 (임시 파일 기록 후 교체하여 중단 시에도 이전 체크포인트 보존)"""
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(checkpoint, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.path)
+        self._last_save = time.perf_counter()
+        self.saves += 1
+        return self.path
+
+    def load(self) -> Optional[BacktestCheckpoint]:
+        """최신 체크포인트 로드 (없거나 손상/버전 불일치 시 None)"""
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, 'rb') as f:
+                checkpoint = pickle.load(f)
+        except Exception:
+            return None
+        if not isinstance(checkpoint, BacktestCheckpoint) or checkpoint.version != CHECKPOINT_VERSION:
+            return None
+        if checkpoint.config_key != self.key:
+            return None
+        return checkpoint
+
+    def exists(self) -> bool:
+        """체크포인트 존재 여부"""
+        return os.path.exists(self.path)
+
+    def clear(self):
+        """체크포인트 삭제 (백테스트 정상 완료 시)"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
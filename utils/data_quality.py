@@ -0,0 +1,239 @@
+"""
+캔들 데이터 품질 검증
+수집한 kline 컬럼을 한 번에 검사하여 정렬/중복/누락/OHLC 정합성 문제를 보고하고, 정리된 컬럼을 파티션에 기록
+"""
+
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from config import DataConfig
+from utils.kline_store import KlineStore, KLINE_COLUMNS, month_keys
+from utils.resampler import FIXED_TIMEFRAME_MS, WEEK_MS, bucket_starts
+from utils.timeaxis import from_ms
+
+REPORT_SUFFIX = '.quality.json'
+MAX_GAP_RANGES = 50  # 보고서에 기록할 최대 누락 구간 수
+
+# 보고서의 문제 항목 (타임스탬프 배열로 수집)
+ISSUE_FIELDS = ('duplicates', 'out_of_order', 'misaligned', 'non_finite', 'invalid_ohlc', 'missing')
+
+
+def expected_open_times(first: int, last: int, timeframe: str) -> np.ndarray:
+    """first~last(정렬된 봉 시작 시각, ms) 사이에 있어야 하는 봉 시작 시각"""
+    if timeframe in FIXED_TIMEFRAME_MS:
+        return np.arange(first, last + 1, FIXED_TIMEFRAME_MS[timeframe], dtype=np.int64)
+    if timeframe == '1w':
+        return np.arange(first, last + 1, WEEK_MS, dtype=np.int64)
+    if timeframe == '1M':
+        months = np.arange(np.datetime64(first, 'ms').astype('datetime64[M]'),
+                           np.datetime64(last, 'ms').astype('datetime64[M]') + 1)
+        return months.astype('datetime64[ms]').astype(np.int64)
+    raise ValueError(f"지원하지 않는 시간프레임: {timeframe}")
+
+
+def _gap_ranges(missing: np.ndarray, timeframe: str) -> List[List[int]]:
+    """누락 시각을 연속 구간 [시작, 끝] 목록으로 묶음"""
+    if len(missing) == 0:
+        return []
+    if timeframe in FIXED_TIMEFRAME_MS:
+        breaks = np.flatnonzero(np.diff(missing) != FIXED_TIMEFRAME_MS[timeframe]) + 1
+    else:
+        # 주/월봉은 구간을 나누지 않고 누락 봉마다 기록
+        breaks = np.arange(1, len(missing))
+    starts = np.concatenate([[0], breaks])
+    ends = np.concatenate([breaks, [len(missing)]]) - 1
+    return [[int(missing[s]), int(missing[e])] for s, e in zip(starts[:MAX_GAP_RANGES], ends[:MAX_GAP_RANGES])]
+
+
+@dataclass
+class QualityReport:
+    """캔들 품질 보고서 (시각은 UTC epoch ms)"""
+    symbol: str
+    timeframe: str
+    partition: Optional[str] = None  # 월 파티션 키 (전체 보고서는 None)
+    bars: int = 0                    # 검증 후 남은 봉 수 (채운 봉 포함)
+    first_open_time: Optional[int] = None
+    last_open_time: Optional[int] = None
+    duplicates: int = 0              # 같은 시각의 중복 봉 (마지막 값 유지)
+    out_of_order: int = 0            # 직전 봉보다 이른 시각의 봉
+    misaligned: int = 0              # 타임프레임 경계에 맞지 않는 봉 (제거)
+    non_finite: int = 0              # NaN/inf 값이 있는 봉 (제거)
+    invalid_ohlc: int = 0            # high/low가 open/close를 감싸지 않거나 음수 가격/거래량 (제거)
+    missing: int = 0                 # 누락된 봉
+    filled: int = 0                  # 직전 종가로 채운 봉
+    gaps: List[List[int]] = field(default_factory=list)  # 누락 구간 [시작, 끝]
+
+    @property
+    def ok(self) -> bool:
+        """문제 없이 수집되었는지 여부"""
+        return not any(getattr(self, name) for name in ISSUE_FIELDS)
+
+    def summary(self) -> str:
+        """문제 항목 요약"""
+        issues = [f"{name}={getattr(self, name)}" for name in ISSUE_FIELDS if getattr(self, name)]
+        if self.filled:
+            issues.append(f"filled={self.filled}")
+        scope = f"{self.symbol} {self.timeframe}" + (f" {self.partition}" if self.partition else "")
+        return f"{scope}: " + (", ".join(issues) if issues else "OK")
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'QualityReport':
+        return cls(**data)
+
+
+def _report(symbol: str, timeframe: str, columns: Dict[str, np.ndarray], issues: Dict[str, np.ndarray],
+            filled: np.ndarray, partition: Optional[str] = None,
+            bounds: Optional[Tuple[int, int]] = None) -> QualityReport:
+    """수집한 문제 시각으로 보고서 생성 (bounds가 있으면 [시작, 끝) 구간만 집계)"""
+    def select(times: np.ndarray) -> np.ndarray:
+        if bounds is None:
+            return times
+        return times[(times >= bounds[0]) & (times < bounds[1])]
+
+    open_time = select(columns['open_time'])
+    missing = select(issues['missing'])
+    counts = {name: len(select(issues[name])) for name in ISSUE_FIELDS}
+    return QualityReport(
+        symbol=symbol, timeframe=timeframe, partition=partition, bars=len(open_time),
+        first_open_time=int(open_time[0]) if len(open_time) else None,
+        last_open_time=int(open_time[-1]) if len(open_time) else None,
+        filled=len(select(filled)), gaps=_gap_ranges(missing, timeframe), **counts,
+    )
+
+
+def validate_columns(columns: Dict[str, np.ndarray], timeframe: str, fill_gaps: bool = False
+                     ) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray], np.ndarray]:
+    """kline 컬럼 검증 및 정리
+
+    정렬(안정) 후 중복 시각은 마지막 값을 남기고, 경계가 맞지 않거나 NaN/inf, OHLC가 맞지 않는 봉은
+    제거한다. 남은 봉으로 기대 시각 격자를 만들어 누락 봉을 찾고, fill_gaps이면 직전 종가로 채운
+    거래량 0 봉을 넣는다. 모든 검사는 컬럼 배열에 대한 벡터 연산이다.
+
+    Returns:
+        (정리된 컬럼, 문제 항목별 봉 시작 시각 배열, 채운 봉 시각 배열)
+    """
+    open_time = np.asarray(columns['open_time'], dtype=np.int64)
+    issues = {name: np.zeros(0, dtype=np.int64) for name in ISSUE_FIELDS}
+    if len(open_time) == 0:
+        empty = {name: np.asarray(columns[name])[:0] for name in KLINE_COLUMNS}
+        return empty, issues, np.zeros(0, dtype=np.int64)
+
+    issues['out_of_order'] = open_time[1:][np.diff(open_time) < 0]
+    order = np.argsort(open_time, kind='stable')
+    data = {name: np.asarray(columns[name])[order] for name in KLINE_COLUMNS}
+    data['open_time'] = data['open_time'].astype(np.int64)
+    open_time = data['open_time']
+
+    # 같은 시각이 이어지면 마지막 값만 유지 (수집 순서상 나중 값이 최신)
+    duplicate = np.zeros(len(open_time), dtype=bool)
+    duplicate[:-1] = open_time[:-1] == open_time[1:]
+    issues['duplicates'] = open_time[duplicate]
+
+    misaligned = bucket_starts(open_time, timeframe) != open_time
+    prices = np.stack([data['open'], data['high'], data['low'], data['close'], data['volume']])
+    non_finite = ~np.isfinite(prices).all(axis=0)
+    with np.errstate(invalid='ignore'):
+        invalid_ohlc = ~non_finite & (
+            (data['high'] < np.maximum(data['open'], data['close'])) |
+            (data['low'] > np.minimum(data['open'], data['close'])) |
+            (data['low'] <= 0) | (data['volume'] < 0))
+    keep = ~duplicate
+    issues['misaligned'] = open_time[keep & misaligned]
+    issues['non_finite'] = open_time[keep & non_finite]
+    issues['invalid_ohlc'] = open_time[keep & invalid_ohlc]
+    keep &= ~misaligned & ~non_finite & ~invalid_ohlc
+    data = {name: col[keep] for name, col in data.items()}
+    open_time = data['open_time']
+    if len(open_time) == 0:
+        return data, issues, np.zeros(0, dtype=np.int64)
+
+    expected = expected_open_times(int(open_time[0]), int(open_time[-1]), timeframe)
+    present = np.isin(expected, open_time, assume_unique=True)
+    issues['missing'] = expected[~present]
+    if not fill_gaps or len(issues['missing']) == 0:
+        return data, issues, np.zeros(0, dtype=np.int64)
+
+    # 누락 봉은 직전 봉 종가로 채움 (시가=고가=저가=종가, 거래량 0)
+    source = np.searchsorted(open_time, expected, side='right') - 1
+    prev_close = data['close'][source]
+    filled = {'open_time': expected}
+    for name in ('open', 'high', 'low', 'close'):
+        filled[name] = np.where(present, data[name][source], prev_close)
+    filled['volume'] = np.where(present, data['volume'][source], 0.0)
+    return filled, issues, issues['missing']
+
+
+def month_bounds(month: str) -> Tuple[int, int]:
+    """월 파티션 키의 [시작, 끝) epoch ms"""
+    start = np.datetime64(month, 'M')
+    return (int(start.astype('datetime64[ms]').astype(np.int64)),
+            int((start + 1).astype('datetime64[ms]').astype(np.int64)))
+
+
+class KlineIngestor:
+    """검증을 거쳐 캔들을 KlineStore 파티션에 기록
+
+    파티션마다 같은 디렉터리에 {YYYY-MM}.quality.json 보고서를 남긴다. 보고서는 해당 월에
+    마지막으로 수집한 묶음의 검증 결과이다.
+    """
+
+    def __init__(self, store: Optional[KlineStore] = None, fill_gaps: bool = DataConfig.FILL_KLINE_GAPS):
+        self.store = store or KlineStore()
+        self.fill_gaps = fill_gaps
+
+    def report_path(self, symbol: str, timeframe: str, month: str) -> str:
+        return os.path.join(self.store.root, symbol, timeframe, f"{month}{REPORT_SUFFIX}")
+
+    def load_report(self, symbol: str, timeframe: str, month: str) -> Optional[QualityReport]:
+        """파티션 품질 보고서 로드 (없으면 None)"""
+        path = self.report_path(symbol, timeframe, month)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return QualityReport.from_dict(json.load(f))
+
+    def _save_report(self, report: QualityReport):
+        path = self.report_path(report.symbol, report.timeframe, report.partition)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report.to_dict(), f, indent=2)
+
+    def ingest(self, symbol: str, timeframe: str, columns: Dict[str, np.ndarray]
+               ) -> Tuple[Dict[str, np.ndarray], Dict[str, QualityReport]]:
+        """컬럼을 검증/정리하여 기록하고 (정리된 컬럼, 월별 보고서) 반환"""
+        clean, issues, filled = validate_columns(columns, timeframe, self.fill_gaps)
+        reports: Dict[str, QualityReport] = {}
+        if len(clean['open_time']) == 0:
+            return clean, reports
+
+        self.store.write_columns(symbol, timeframe, clean)
+        first, last = (from_ms(int(t)) for t in clean['open_time'][[0, -1]])
+        for month in month_keys(first, last):
+            report = _report(symbol, timeframe, clean, issues, filled, month, month_bounds(month))
+            self._save_report(report)
+            reports[month] = report
+        return clean, reports
+
+    def quality(self, symbol: str, timeframe: str, start, end) -> List[QualityReport]:
+        """구간 파티션의 저장된 품질 보고서 목록"""
+        reports = []
+        for path in self.store.partitions(symbol, timeframe, start, end):
+            month = os.path.basename(path)[:-len('.npz')]
+            report = self.load_report(symbol, timeframe, month)
+            if report is not None:
+                reports.append(report)
+        return reports
+
+
+def inspect_columns(symbol: str, timeframe: str, columns: Dict[str, np.ndarray],
+              fill_gaps: bool = False) -> Tuple[Dict[str, np.ndarray], QualityReport]:
+    """저장 없이 컬럼을 검증하고 (정리된 컬럼, 전체 보고서) 반환"""
+    clean, issues, filled = validate_columns(columns, timeframe, fill_gaps)
+    return clean, _report(symbol, timeframe, clean, issues, filled)
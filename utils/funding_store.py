@@ -0,0 +1,70 @@
+"""
+펀딩비 이력 저장소
+심볼별 펀딩 시각(epoch ms)과 펀딩비를 컬럼으로 저장하고 구간 로드를 지원
+"""
+
+import os
+from typing import Dict, Tuple
+
+import numpy as np
+
+from config import DataConfig
+from utils.timeaxis import to_ms
+
+FUNDING_COLUMNS = ('funding_time', 'rate')
+
+
+class FundingRateStore:
+    """심볼별 펀딩비 저장소
+
+    펀딩비는 8시간마다 한 건이라 연간 약 1,100건이므로 월 파티션 없이
+    {root}/{symbol}.npz 한 파일에 funding_time(int64 epoch ms, UTC)과 rate(float64)로 저장한다.
+    """
+
+    def __init__(self, root: str = DataConfig.FUNDING_DIR):
+        self.root = root
+
+    def path(self, symbol: str) -> str:
+        return os.path.join(self.root, f"{symbol}.npz")
+
+    def fingerprint(self, symbol: str) -> str:
+        """이력 파일 지문 (크기/수정 시각, 파일이 없으면 'none')"""
+        try:
+            stat = os.stat(self.path(symbol))
+        except FileNotFoundError:
+            return 'none'
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+    def read(self, symbol: str) -> Dict[str, np.ndarray]:
+        """전체 이력 로드 (없으면 빈 컬럼)"""
+        path = self.path(symbol)
+        if not os.path.exists(path):
+            return {'funding_time': np.zeros(0, dtype=np.int64), 'rate': np.zeros(0, dtype=np.float64)}
+        with np.load(path) as data:
+            return {name: data[name] for name in FUNDING_COLUMNS}
+
+    def write(self, symbol: str, funding_time: np.ndarray, rate: np.ndarray) -> str:
+        """펀딩비 기록 (기존 이력과 병합, 같은 시각은 새 값으로 대체)"""
+        existing = self.read(symbol)
+        # 새 데이터를 앞에 두어 중복 시각은 새 값이 남도록 함
+        times = np.concatenate([np.asarray(funding_time, dtype=np.int64), existing['funding_time']])
+        rates = np.concatenate([np.asarray(rate, dtype=np.float64), existing['rate']])
+        times, first = np.unique(times, return_index=True)
+
+        path = self.path(symbol)
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = f"{path}.tmp.npz"
+        np.savez(tmp_path, funding_time=times, rate=rates[first])
+        os.replace(tmp_path, path)
+        return path
+
+    def load(self, symbol: str, start=None, end=None) -> Tuple[np.ndarray, np.ndarray]:
+        """구간 [start, end) 펀딩 시각과 펀딩비 (start/end는 datetime, 문자열 또는 epoch ms)"""
+        columns = self.read(symbol)
+        times = columns['funding_time']
+        mask = np.ones(len(times), dtype=bool)
+        if start is not None:
+            mask &= times >= to_ms(start)
+        if end is not None:
+            mask &= times < to_ms(end)
+        return times[mask], columns['rate'][mask]
@@ -0,0 +1,192 @@
+"""
+캔들(kline) 파티션 저장소
+심볼/타임프레임/월 단위 파티션으로 OHLCV 컬럼을 저장하고 구간 로드와 지문 계산을 지원
+"""
+
+import hashlib
+import os
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from config import DataConfig
+from strategy.turtle_strategy import PriceData
+from utils.timeaxis import DAY_MS, from_ms_array, to_ms
+
+KLINE_COLUMNS = ('open_time', 'open', 'high', 'low', 'close', 'volume')
+
+
+def month_keys(start: datetime, end: datetime) -> List[str]:
+    """구간에 걸친 월 파티션 키 목록 (YYYY-MM)"""
+    keys = []
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        keys.append(f"{year:04d}-{month:02d}")
+        month += 1
+        if month > 12:
+            year, month = year + 1, 1
+    return keys
+
+
+def bars_to_columns(bars: List[PriceData]) -> Dict[str, np.ndarray]:
+    """PriceData 리스트를 kline 컬럼으로 변환 (open_time은 epoch ms)"""
+    return {
+        'open_time': np.array([b.date for b in bars], dtype='datetime64[ms]').astype(np.int64),
+        'open': np.array([b.open for b in bars], dtype=np.float64),
+        'high': np.array([b.high for b in bars], dtype=np.float64),
+        'low': np.array([b.low for b in bars], dtype=np.float64),
+        'close': np.array([b.close for b in bars], dtype=np.float64),
+        'volume': np.array([b.volume for b in bars], dtype=np.float64),
+    }
+
+
+def columns_to_bars(symbol: str, columns: Dict[str, np.ndarray]) -> List[PriceData]:
+    """kline 컬럼을 PriceData 리스트로 변환 (date는 UTC naive datetime)"""
+    dates = from_ms_array(columns['open_time'])
+    return [
+        PriceData(symbol=symbol, date=d, open=o, high=h, low=l, close=c, volume=v)
+        for d, o, h, l, c, v in zip(dates, columns['open'].tolist(), columns['high'].tolist(),
+                                    columns['low'].tolist(), columns['close'].tolist(),
+                                    columns['volume'].tolist())
+    ]
+
+
+def _parse_date(value) -> datetime:
+    return value if isinstance(value, datetime) else datetime.strptime(value, '%Y-%m-%d')
+
+
+class KlineStore:
+    """월 단위 kline 파티션 저장소
+
+    파티션은 {root}/{symbol}/{timeframe}/{YYYY-MM}.npz 에 open_time(int64 epoch ms, UTC)과
+    float64 OHLCV 컬럼으로 저장된다. 지문은 파티션 파일의 크기/수정 시각으로 계산하므로
+    데이터를 읽지 않고도 파티션 변경을 감지할 수 있다.
+    """
+
+    def __init__(self, root: str = DataConfig.HISTORICAL_DIR):
+        self.root = root
+
+    def partition_path(self, symbol: str, timeframe: str, month: str) -> str:
+        return os.path.join(self.root, symbol, timeframe, f"{month}.npz")
+
+    def partitions(self, symbol: str, timeframe: str, start, end) -> List[str]:
+        """구간에 해당하는 파티션 경로 목록 (존재 여부 무관)"""
+        return [self.partition_path(symbol, timeframe, m)
+                for m in month_keys(_parse_date(start), _parse_date(end))]
+
+    def covers(self, symbol: str, timeframe: str, start, end) -> bool:
+        """구간의 모든 월 파티션이 존재하는지 여부"""
+        return all(os.path.exists(p) for p in self.partitions(symbol, timeframe, start, end))
+
+    def fingerprint(self, symbol: str, timeframe: str, start, end) -> Optional[str]:
+        """구간 파티션 지문 (파티션이 하나라도 없으면 None)"""
+        digest = hashlib.sha256(f"{symbol}|{timeframe}|{start}|{end}".encode('utf-8'))
+        for path in self.partitions(symbol, timeframe, start, end):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                return None
+            digest.update(f"|{os.path.basename(path)}:{stat.st_size}:{stat.st_mtime_ns}".encode('utf-8'))
+        return digest.hexdigest()[:16]
+
+    def read_partition(self, path: str) -> Dict[str, np.ndarray]:
+        """파티션 컬럼 로드"""
+        with np.load(path) as data:
+            return {name: data[name] for name in KLINE_COLUMNS}
+
+    def available_months(self, symbol: str, timeframe: str) -> List[str]:
+        """저장된 월 파티션 키 목록 (오름차순)"""
+        directory = os.path.join(self.root, symbol, timeframe)
+        if not os.path.isdir(directory):
+            return []
+        return sorted(name[:-len('.npz')] for name in os.listdir(directory)
+                      if name.endswith('.npz') and '.tmp' not in name)
+
+    def write(self, symbol: str, timeframe: str, bars: List[PriceData]) -> List[str]:
+        """캔들을 월 파티션으로 나누어 기록 (기존 파티션과 병합, 같은 시각은 새 값으로 대체)"""
+        if not bars:
+            return []
+
+        return self.write_columns(symbol, timeframe, bars_to_columns(bars))
+
+    def write_columns(self, symbol: str, timeframe: str, columns: Dict[str, np.ndarray]) -> List[str]:
+        """컬럼 형식 캔들 기록 (write와 같은 병합 규칙)"""
+        open_time = columns['open_time']
+        if len(open_time) == 0:
+            return []
+        months = np.datetime_as_string(open_time.astype('datetime64[ms]'), unit='M')
+
+        written = []
+        for month in np.unique(months).tolist():
+            mask = months == month
+            part = {name: col[mask] for name, col in columns.items()}
+            path = self.partition_path(symbol, timeframe, month)
+
+            if os.path.exists(path):
+                existing = self.read_partition(path)
+                # 새 데이터를 앞에 두어 중복 시각은 새 값이 남도록 함
+                merged = {name: np.concatenate([part[name], existing[name]]) for name in KLINE_COLUMNS}
+                _, first = np.unique(merged['open_time'], return_index=True)
+                part = {name: col[first] for name, col in merged.items()}
+            else:
+                order = np.argsort(part['open_time'], kind='stable')
+                part = {name: col[order] for name, col in part.items()}
+
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.tmp.npz"
+            np.savez(tmp_path, **part)
+            os.replace(tmp_path, path)
+            written.append(path)
+        return written
+
+    @staticmethod
+    def _range_ms(start, end) -> Tuple[int, int]:
+        """구간 경계 (epoch ms, 종료일 하루 포함)"""
+        start_ms = to_ms(_parse_date(start))
+        end_ms = to_ms(_parse_date(end)) + DAY_MS
+        return start_ms, end_ms
+
+    def count(self, symbol: str, timeframe: str, start, end) -> int:
+        """구간 봉 수 (파티션별 open_time 컬럼만 읽음)"""
+        start_ms, end_ms = self._range_ms(start, end)
+        total = 0
+        for path in self.partitions(symbol, timeframe, start, end):
+            if os.path.exists(path):
+                with np.load(path) as data:
+                    open_time = data['open_time']
+                total += int(np.count_nonzero((open_time >= start_ms) & (open_time < end_ms)))
+        return total
+
+    def iter_columns(self, symbol: str, timeframe: str, start, end,
+                     chunk_bars: Optional[int] = None) -> Iterator[Dict[str, np.ndarray]]:
+        """구간 컬럼을 파티션 순서대로 청크 단위로 반환 (한 번에 한 파티션만 메모리에 유지)"""
+        start_ms, end_ms = self._range_ms(start, end)
+        for path in self.partitions(symbol, timeframe, start, end):
+            if not os.path.exists(path):
+                continue
+            columns = self.read_partition(path)
+            mask = (columns['open_time'] >= start_ms) & (columns['open_time'] < end_ms)
+            columns = {name: col[mask] for name, col in columns.items()}
+            n = len(columns['open_time'])
+            step = chunk_bars or n
+            for offset in range(0, n, max(1, step)):
+                yield {name: col[offset:offset + step] for name, col in columns.items()}
+
+    def load_columns(self, symbol: str, timeframe: str, start, end) -> Dict[str, np.ndarray]:
+        """구간 컬럼 로드 (종료일 포함)"""
+        start_ms, end_ms = self._range_ms(start, end)
+
+        parts = [self.read_partition(p) for p in self.partitions(symbol, timeframe, start, end)
+                 if os.path.exists(p)]
+        if not parts:
+            return {name: np.zeros(0, dtype=np.int64 if name == 'open_time' else np.float64)
+                    for name in KLINE_COLUMNS}
+
+        columns = {name: np.concatenate([p[name] for p in parts]) for name in KLINE_COLUMNS}
+        mask = (columns['open_time'] >= start_ms) & (columns['open_time'] < end_ms)
+        return {name: col[mask] for name, col in columns.items()}
+
+    def load(self, symbol: str, timeframe: str, start, end) -> List[PriceData]:
+        """구간 캔들을 PriceData 리스트로 로드"""
+        return columns_to_bars(symbol, self.load_columns(symbol, timeframe, start, end))
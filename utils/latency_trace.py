@@ -0,0 +1,154 @@
+"""
+의사결정 지연 추적
+마감 봉 수신부터 지표 갱신, 신호 판단, 리스크 점검, 주문 제출, 체결 확인까지 단계별 지연을
+단조 시각으로 재고, 단계별 히스토그램과 최근 느린 판단 기록(flight recorder)을 유지
+"""
+
+import json
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from config import TelemetryConfig
+from utils.telemetry import RuntimeTelemetry
+from utils.timeaxis import from_ms, now_ms
+
+# 단계 (feed는 거래소 봉 마감 시각 기준 벽시계 지연, 나머지는 단조 시각)
+STAGES = ('feed', 'indicators', 'signal', 'risk', 'order_queue', 'order_submit', 'fill_ack', 'to_send', 'total')
+
+
+class DecisionTrace:
+    """마감 봉 하나의 판단 추적 (봉마다 하나 생성되므로 슬롯만 사용)"""
+    __slots__ = ('symbol', 'open_time', 'received_ns', 'indicators_ns', 'decided_ns', 'risk_ns', 'feed_ms',
+                 'action', 'order')
+
+    def __init__(self, symbol: str, open_time: int, received_ns: int, feed_ms: Optional[float] = None):
+        self.symbol = symbol
+        self.open_time = open_time
+        self.received_ns = received_ns
+        self.indicators_ns = received_ns
+        self.decided_ns = received_ns
+        self.risk_ns = 0          # 리스크 점검 누적 시간 (신호 판단 시간에서 제외)
+        self.feed_ms = feed_ms
+        self.action: Optional[str] = None
+        self.order = None         # 이 판단이 낸 주문 (ManagedOrder)
+
+
+class LatencyTracer:
+    """단계별 지연 히스토그램과 느린 판단 기록
+
+    런타임은 봉마다 begin() → (지표 갱신 후) trace.indicators_ns 기록 → 판단 후 decided()를 호출한다.
+    판단이 주문을 냈으면 attach()로 주문을 연결해 두고, 주문이 종료되면 order_done()이 실행기가 남긴
+    큐 등록/전송/첫 거래소 응답/종료 시각으로 주문 단계를 채운다. 봉당 비용은 perf_counter_ns 몇 번과
+    히스토그램 observe 몇 번이며, 느린 판단만 딕셔너리로 만들어 고정 크기 덱에 남긴다.
+    """
+
+    def __init__(self, telemetry: RuntimeTelemetry, slow_decision_ms: float = TelemetryConfig.SLOW_DECISION_MS,
+                 slow_order_ms: float = TelemetryConfig.SLOW_ORDER_MS,
+                 capacity: int = TelemetryConfig.FLIGHT_RECORDER_SIZE):
+        registry = telemetry.registry
+        family = registry.histogram('turtle_decision_stage_seconds', "봉 수신부터 체결 확인까지 단계별 지연",
+                                    TelemetryConfig.STAGE_LATENCY_BUCKETS, ('stage',))
+        self.stages = {stage: family.labels(stage) for stage in STAGES}
+        self._indicators, self._signal = self.stages['indicators'], self.stages['signal']
+        self._risk, self._total = self.stages['risk'], self.stages['total']
+        self.slow_count = registry.counter('turtle_slow_decisions_total', "느린 판단으로 기록된 수").labels()
+        self.slow_decision_ns = int(slow_decision_ms * 1e6)
+        self.slow_order_ns = int(slow_order_ms * 1e6)
+        self.recorder: Deque[Dict[str, Any]] = deque(maxlen=capacity)
+        self._open: Dict[str, DecisionTrace] = {}  # client order id -> 체결 대기 중인 판단
+        telemetry.routes['/debug/slow'] = lambda: json.dumps(self.slow_decisions(), ensure_ascii=False)
+
+    def begin(self, symbol: str, open_time: int, received_ns: int, feed_ms: Optional[float] = None) -> DecisionTrace:
+        if feed_ms is not None:
+            self.stages['feed'].observe(feed_ms * 1e-3)
+        return DecisionTrace(symbol, open_time, received_ns, feed_ms)
+
+    def attach(self, trace: Optional[DecisionTrace], order, action: str):
+        """판단이 낸 주문 연결 (주문 종료 시 order_done에서 마무리)"""
+        if trace is None:
+            return
+        trace.action = action
+        trace.order = order
+        self._open[order.client_order_id] = trace
+
+    def decided(self, trace: DecisionTrace):
+        """판단 완료 (주문이 없으면 여기서 마무리)"""
+        trace.decided_ns = decided = time.perf_counter_ns()
+        self._indicators.observe((trace.indicators_ns - trace.received_ns) * 1e-9)
+        self._signal.observe((decided - trace.indicators_ns - trace.risk_ns) * 1e-9)
+        if trace.risk_ns:
+            self._risk.observe(trace.risk_ns * 1e-9)
+        if trace.order is None:
+            self._finish(trace, decided)
+
+    def order_done(self, order) -> Optional[DecisionTrace]:
+        """판단이 낸 주문 종료 (연결된 판단이 없으면 None)"""
+        trace = self._open.pop(order.client_order_id, None)
+        if trace is None:
+            return None
+        stages = self.stages
+        done = order.done_ns or time.perf_counter_ns()
+        if order.sent_ns:
+            stages['order_queue'].observe(max(0, order.sent_ns - order.queued_ns) * 1e-9)
+            stages['to_send'].observe(max(0, order.sent_ns - trace.received_ns) * 1e-9)
+        if order.acked_ns:
+            stages['order_submit'].observe(max(0, order.acked_ns - order.sent_ns) * 1e-9)
+        stages['fill_ack'].observe(max(0, done - (order.acked_ns or order.sent_ns or done)) * 1e-9)
+        self._finish(trace, done)
+        return trace
+
+    def _finish(self, trace: DecisionTrace, end_ns: int):
+        total = end_ns - trace.received_ns
+        self._total.observe(total * 1e-9)
+        if trace.decided_ns - trace.received_ns > self.slow_decision_ns or \
+                (trace.order is not None and total > self.slow_order_ns):
+            self.slow_count.inc()
+            self.recorder.append(self._record(trace, total))
+
+    @staticmethod
+    def _record(trace: DecisionTrace, total_ns: int) -> Dict[str, Any]:
+        def ms(ns: int) -> float:
+            return round(max(0, ns) / 1e6, 3)
+
+        stages = {
+            'indicators': ms(trace.indicators_ns - trace.received_ns),
+            'signal': ms(trace.decided_ns - trace.indicators_ns - trace.risk_ns),
+            'risk': ms(trace.risk_ns),
+        }
+        order = trace.order
+        if order is not None:
+            if order.sent_ns:
+                stages['order_queue'] = ms(order.sent_ns - order.queued_ns)
+            if order.acked_ns:
+                stages['order_submit'] = ms(order.acked_ns - order.sent_ns)
+            if order.done_ns:
+                stages['fill_ack'] = ms(order.done_ns - (order.acked_ns or order.sent_ns or order.done_ns))
+        return {
+            'recorded_at': from_ms(now_ms()).isoformat(),
+            'symbol': trace.symbol,
+            'bar': from_ms(trace.open_time).isoformat(),
+            'action': trace.action,
+            'order_id': order.client_order_id if order is not None else None,
+            'status': order.status if order is not None else None,
+            'feed_ms': trace.feed_ms,
+            'stages_ms': stages,
+            'total_ms': ms(total_ns),
+        }
+
+    def slow_decisions(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """최근 느린 판단 (오래된 것부터)"""
+        records = list(self.recorder)
+        return records[-limit:] if limit else records
+
+    def summary(self) -> Dict[str, Any]:
+        """단계별 건수와 근사 p50/p99 (밀리초, 히스토그램 버킷 보간)"""
+        stages = {
+            stage: {
+                'count': histogram.count,
+                'p50_ms': histogram.quantile(0.5) * 1e3,
+                'p99_ms': histogram.quantile(0.99) * 1e3,
+            }
+            for stage, histogram in self.stages.items() if histogram.count
+        }
+        return {'stages': stages, 'slow_decisions': self.slow_count.value, 'pending': len(self._open)}
@@ -0,0 +1,273 @@
+"""
+실거래 런타임
+가상매매 런타임의 봉 마감 판단을 그대로 쓰고, 체결은 주문 실행기와 사용자 데이터 스트림으로 확인한 뒤 전략에 반영
+"""
+
+import asyncio
+import logging
+from dataclasses import asdict
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import ExecutionConfig, TradingMode
+from strategy.turtle_strategy import TurtleStrategy
+from utils.order_execution import (ManagedOrder, OrderExecutor, OrderIntent, OrderRequest, OrderStatus,
+                                   OrderType, round_to_step)
+from utils.paper_trading import PaperTradingRuntime
+
+logger = logging.getLogger(__name__)
+
+
+class LiveTradingRuntime(PaperTradingRuntime):
+    """실거래 런타임
+
+    신호 판단은 PaperTradingRuntime과 같고, 진입/피라미딩/청산은 즉시 체결 대신 OrderExecutor 주문으로
+    나간다. 사용자 데이터 스트림으로 주문이 종료되면 실제 체결가/수량/수수료로 전략 상태를 갱신하고,
+    포지션 손절가에 reduce-only STOP_MARKET 주문을 거래소에 걸어 둔다. 손절은 거래소가 실행하므로
+    봉 마감 주기와 무관하며, 종목에 미종료 주문이 있는 동안에는 그 종목 판단을 건너뛴다.
+    펀딩비와 강제청산은 거래소가 정산하므로 선물 계좌 시뮬레이션은 하지 않는다.
+
+    청산 주문과 손절 주문은 전량 청산(close_all)으로 내보내 수량을 거래소 단위로 올리므로 부동소수 오차로
+    단위 미만 잔량이 남지 않으며, 체결 후 남은 수량이 한 단위 미만이면 청산된 것으로 본다.
+    사용자 데이터 스트림이 재연결 한도를 넘어 끊기면 체결을 확인할 수 없으므로 런타임을 중지하고
+    run()이 ConnectionError로 알린다.
+    """
+
+    simulate_futures = False
+
+    def __init__(self, symbols: List[str], executor: OrderExecutor, **kwargs):
+        kwargs.setdefault('strategy', TurtleStrategy(TradingMode.LIVE))
+        super().__init__(symbols, **kwargs)
+        self.executor = executor
+        executor.on_update = self._on_order_update
+        executor.on_error = self._on_executor_error
+        self.error: Optional[Exception] = None  # 중지 원인이 된 주문 스트림 오류
+        if executor.telemetry is None:
+            executor.telemetry = self.telemetry
+        self.pending: Dict[str, str] = {}       # 종목 -> 체결 대기 중인 진입/청산 주문 id
+        self.stop_orders: Dict[str, str] = {}   # 종목 -> 거래소 손절 주문 id
+        self._restored_orders: Dict[str, OrderRequest] = {}  # 재시작 후 아직 추적 등록하지 않은 주문
+        self.partial_exits: Dict[str, Tuple[float, float]] = {}  # 종목 -> 부분 청산 누적 (수량, 체결 금액)
+        self._stop_failures: Dict[str, int] = {}  # 종목 -> 연속으로 거부된 손절 주문 수
+
+    async def run(self, feed, max_bars: Optional[int] = None):
+        self._check_stream()
+        summary = await super().run(feed, max_bars)
+        self._check_stream()
+        return summary
+
+    def _check_stream(self):
+        if self.error is not None:
+            raise ConnectionError(f"사용자 데이터 스트림이 끊겨 실거래를 중지했습니다: {self.error}") from self.error
+
+    def _on_executor_error(self, error: Exception):
+        """주문 스트림 중단 (체결을 확인할 수 없으므로 다음 봉부터 판단하지 않음)"""
+        logger.error(f"Order stream lost, stopping live runtime: {error}")
+        self.error = error
+        self.stop()
+
+    # 판단 훅
+    def _decide(self, symbol, indicators, open_time, atr):
+        if symbol in self.pending:
+            return
+        super()._decide(symbol, indicators, open_time, atr)
+
+    def _stop_hit(self, position, price: float) -> bool:
+        # 거래소 손절 주문이 걸려 있으면 종가 손절 판단은 하지 않음
+        if position.symbol in self.stop_orders:
+            return False
+        return super()._stop_hit(position, price)
+
+    def _submit(self, symbol: str, side: str, quantity: float, intent: str, **meta) -> ManagedOrder:
+        request = OrderRequest(symbol=symbol, side=side, quantity=quantity, intent=intent,
+                               reduce_only=intent == OrderIntent.EXIT, close_all=intent == OrderIntent.EXIT,
+                               meta=meta)
+        order = self.executor.submit(request)
+        self.tracer.attach(self._trace, order, intent)
+        self.pending[symbol] = order.client_order_id
+        self._persist_orders()
+        return order
+
+    def _open(self, symbol, direction, price, atr, system, open_time) -> bool:
+        quantity = self.strategy.calculate_unit_size(symbol, self.balance, atr, price, self.leverage)
+        order = self._submit(symbol, 'BUY' if direction == "LONG" else 'SELL', quantity, OrderIntent.ENTRY,
+                             direction=direction, atr=atr, system=system, price=price)
+        self._reserve(order.request)
+        return True
+
+    def _add(self, symbol, position, price, atr, open_time):
+        quantity = self.strategy.calculate_unit_size(symbol, self.balance, atr, price, self.leverage)
+        order = self._submit(symbol, 'BUY' if position.direction == "LONG" else 'SELL', quantity,
+                             OrderIntent.PYRAMID, direction=position.direction, atr=atr,
+                             system=position.units[0].system, price=price)
+        self._reserve(order.request)
+
+    def _reserve(self, request: OrderRequest):
+        """미체결 진입/피라미딩 주문을 포트폴리오 한도에 미리 반영 (같은 봉의 다른 종목 판단에 포함)"""
+        meta = request.meta
+        self.strategy.risk.reserve(request.client_order_id, request.symbol, meta['direction'],
+                                   request.quantity / self.leverage * meta['atr'],
+                                   request.quantity * meta.get('price', 0.0))
+
+    def _close(self, symbol, position, price, reason, open_time):
+        self._submit(symbol, 'SELL' if position.direction == "LONG" else 'BUY', self._remaining(symbol, position),
+                     OrderIntent.EXIT, reason=reason)
+
+    def _remaining(self, symbol: str, position) -> float:
+        """부분 청산 후 거래소에 남은 수량"""
+        return position.total_size - self.partial_exits.get(symbol, (0.0, 0.0))[0]
+
+    # 체결 반영
+    def _on_order_update(self, order: ManagedOrder):
+        """주문 종료 시 체결 내용을 전략/계좌에 반영"""
+        if not order.is_final:
+            return
+        self.tracer.order_done(order)
+        self._apply_order(order)
+        self._persist_orders()
+
+    def _apply_order(self, order: ManagedOrder):
+        request = order.request
+        symbol = request.symbol
+        if request.intent == OrderIntent.STOP:
+            current = self.stop_orders.get(symbol) == order.client_order_id
+            if current:
+                del self.stop_orders[symbol]
+            if order.filled_qty > 0:
+                self._apply_exit(order, 'STOP_LOSS')
+            elif current and order.status in (OrderStatus.REJECTED, OrderStatus.EXPIRED):
+                self._stop_rejected(symbol, order)
+            return
+
+        if self.pending.get(symbol) == order.client_order_id:
+            del self.pending[symbol]
+        self.strategy.risk.release(order.client_order_id)
+        if order.filled_qty <= 0:
+            if order.status == OrderStatus.REJECTED:
+                logger.warning(f"Order not filled: {symbol} {request.intent} ({order.error})")
+            return
+
+        if request.intent == OrderIntent.EXIT:
+            self._apply_exit(order, request.meta.get('reason', 'SIGNAL'))
+            return
+
+        self.strategy.clock = order.updated_at
+        self._stop_failures.pop(symbol, None)
+        unit = self.strategy.execute_entry(symbol, request.meta['direction'], order.avg_price, request.meta['atr'],
+                                           self.balance, request.meta['system'], self.leverage,
+                                           size=order.filled_qty)
+        if unit:
+            self.last_prices.setdefault(symbol, order.avg_price)
+            self._record(order.updated_at, symbol, request.side, request.intent, order.avg_price,
+                         order.filled_qty, commission=order.commission)
+            self._place_stop(symbol)
+
+    def _apply_exit(self, order: ManagedOrder, reason: str):
+        """청산 체결 반영 (일부만 체결되고 종료되면 남은 수량을 다시 주문하고, 전량 청산 후에 거래로 기록)"""
+        symbol = order.request.symbol
+        position = self.strategy.get_position(symbol)
+        if position is None:
+            return
+        self.strategy.clock = order.updated_at
+        filled, notional = self.partial_exits.pop(symbol, (0.0, 0.0))
+        filled += order.filled_qty
+        notional += order.filled_qty * order.avg_price
+        remaining = position.total_size - filled
+        # 거래소 수량 단위 미만 잔량은 주문할 수 없으므로 청산된 것으로 봄
+        if round_to_step(remaining, self.executor.step_size(symbol)) > position.total_size * 1e-9:
+            self.partial_exits[symbol] = (filled, notional)
+            self._record(order.updated_at, symbol, order.request.side, 'PARTIAL_EXIT', order.avg_price,
+                         order.filled_qty, reason, commission=order.commission)
+            # 교체 전 손절 주문이 먼저 체결된 경우는 현재 손절 주문(전체 수량, reduce-only)이 나머지를 청산
+            if order.request.intent == OrderIntent.EXIT or symbol not in self.stop_orders:
+                logger.warning(f"Partial exit: {symbol} {order.filled_qty} of {position.total_size} "
+                               f"({order.status}), resubmitting {remaining}")
+                self._submit(symbol, order.request.side, remaining, OrderIntent.EXIT, reason=reason)
+            return
+
+        # 전체 수량을 평균 청산가로 기록 (부분 체결 수수료는 체결 시 이미 차감)
+        trade = self.strategy.execute_exit(symbol, notional / filled, reason, self.balance, self.leverage)
+        self._stop_failures.pop(symbol, None)
+        if trade:
+            self.balance += trade.pnl
+            self._record(order.updated_at, symbol, order.request.side, 'EXIT', order.avg_price,
+                         order.filled_qty, reason, commission=order.commission)
+        stop_id = self.stop_orders.pop(symbol, None)
+        if stop_id is not None:
+            self._cancel_later(stop_id)
+
+    def _place_stop(self, symbol: str):
+        """포지션 전체 수량의 거래소 손절 주문을 새 손절가로 교체 (새 주문을 낸 뒤 기존 주문 취소)"""
+        position = self.strategy.get_position(symbol)
+        request = OrderRequest(symbol=symbol, side='SELL' if position.direction == "LONG" else 'BUY',
+                               quantity=position.total_size, order_type=OrderType.STOP_MARKET,
+                               intent=OrderIntent.STOP, stop_price=self.strategy.position_stop(position),
+                               reduce_only=True, close_all=True)
+        previous = self.stop_orders.get(symbol)
+        self.stop_orders[symbol] = self.executor.submit(request).client_order_id
+        self._persist_orders()
+        if previous is not None:
+            self._cancel_later(previous)
+
+    def _stop_rejected(self, symbol: str, order: ManagedOrder):
+        """거래소가 거부한 손절 주문 재주문 (한도를 넘으면 종가 기준 손절로 대체)"""
+        failures = self._stop_failures.get(symbol, 0) + 1
+        self._stop_failures[symbol] = failures
+        if self.strategy.get_position(symbol) is None:
+            return
+        if failures > ExecutionConfig.STOP_RETRIES:
+            logger.error(f"Exchange stop rejected {failures} times: {symbol} ({order.error}), "
+                         f"falling back to close-based stop")
+            return
+        logger.warning(f"Exchange stop rejected: {symbol} ({order.status} {order.error}), re-placing")
+        self._place_stop(symbol)
+
+    def _cancel_later(self, client_order_id: str):
+        asyncio.get_running_loop().create_task(self.executor.cancel(client_order_id))
+
+    # 주문 상태 영속화
+    def _requests(self, order_ids: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+        requests = {}
+        for symbol, client_order_id in order_ids.items():
+            order = self.executor.orders.get(client_order_id)
+            request = order.request if order is not None else self._restored_orders.get(client_order_id)
+            if request is not None:
+                requests[symbol] = asdict(request)
+        return requests
+
+    def _order_state(self) -> Dict[str, Any]:
+        """미종료 진입/청산 주문과 손절 주문 요청 (재시작 시 다시 추적), 부분 청산 누적"""
+        return {'pending': self._requests(self.pending), 'stops': self._requests(self.stop_orders),
+                'partial_exits': {s: list(v) for s, v in self.partial_exits.items()}}
+
+    def _persist_orders(self):
+        if self.state_store is not None:
+            self.state_store.append('orders', self._order_state())
+
+    def _restore_orders(self, orders: Dict[str, Any]):
+        pending = {s: OrderRequest(**d) for s, d in orders.get('pending', {}).items()}
+        stops = {s: OrderRequest(**d) for s, d in orders.get('stops', {}).items()}
+        for client_order_id in self._restored_orders:
+            self.strategy.risk.release(client_order_id)
+        self.pending = {s: r.client_order_id for s, r in pending.items()}
+        self.stop_orders = {s: r.client_order_id for s, r in stops.items()}
+        self.partial_exits = {s: tuple(v) for s, v in orders.get('partial_exits', {}).items()}
+        self._restored_orders = {r.client_order_id: r for r in list(pending.values()) + list(stops.values())}
+        for request in pending.values():
+            if request.intent in (OrderIntent.ENTRY, OrderIntent.PYRAMID):
+                self._reserve(request)
+
+    async def _resume_orders(self):
+        """재시작 전 주문을 거래소 조회로 대사하고, 손절 주문이 없는 포지션에 손절 주문을 다시 걸기"""
+        for request in self._restored_orders.values():
+            self.executor.track(request)
+        self._restored_orders = {}
+        await self.executor.reconcile()
+        for symbol in list(self.strategy.positions):
+            if symbol not in self.stop_orders:
+                self._place_stop(symbol)
+
+    def summary(self):
+        summary = super().summary()
+        summary['pending_orders'] = len(self.pending)
+        summary['stop_orders'] = len(self.stop_orders)
+        return summary
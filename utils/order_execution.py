@@ -0,0 +1,688 @@
+"""
+주문 실행 파이프라인
+비동기 주문 큐, client order id 멱등성, 초당 주문 한도 안의 종목 간 동시 제출, 사용자 데이터 스트림 체결 대사, 거래소 측 손절 주문
+"""
+
+import asyncio
+import logging
+import math
+import time
+from dataclasses import dataclass, field
+from decimal import ROUND_CEILING, ROUND_FLOOR, ROUND_HALF_EVEN, Decimal
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from config import BinanceConfig, ExecutionConfig
+from utils.timeaxis import now_ms
+
+logger = logging.getLogger(__name__)
+
+# 단위 배수와의 차이가 이 비율(단위 대비) 미만이면 부동소수 오차로 보고 그 배수로 맞춤
+STEP_TOLERANCE = Decimal('1e-6')
+
+
+class OrderStatus:
+    """주문 상태 (Binance 주문 상태 + 로컬 상태)"""
+    PENDING = 'PENDING'          # 큐 대기 (로컬)
+    SUBMITTED = 'SUBMITTED'      # 전송 후 접수 확인 전 (로컬)
+    NEW = 'NEW'
+    PARTIALLY_FILLED = 'PARTIALLY_FILLED'
+    FILLED = 'FILLED'
+    CANCELED = 'CANCELED'
+    REJECTED = 'REJECTED'
+    EXPIRED = 'EXPIRED'
+
+    FINAL = frozenset({FILLED, CANCELED, REJECTED, EXPIRED})
+
+
+class OrderType:
+    MARKET = 'MARKET'
+    STOP_MARKET = 'STOP_MARKET'
+
+
+class OrderIntent:
+    """주문 목적 (체결 시 전략 상태 갱신 방식 결정)"""
+    ENTRY = 'ENTRY'
+    PYRAMID = 'PYRAMID'
+    EXIT = 'EXIT'
+    STOP = 'STOP'
+
+
+class OrderError(Exception):
+    """거래소가 거부한 주문 요청"""
+
+    def __init__(self, message: str, code: Optional[int] = None):
+        super().__init__(message)
+        self.code = code
+
+
+class DuplicateOrderError(OrderError):
+    """이미 접수된 client order id"""
+
+
+class UnknownOrderError(OrderError):
+    """거래소에 없는 주문"""
+
+
+@dataclass
+class OrderRequest:
+    """주문 요청 (client order id는 제출 전에 정해지며 재전송 시에도 유지)"""
+    symbol: str
+    side: str                    # 'BUY' / 'SELL'
+    quantity: float
+    order_type: str = OrderType.MARKET
+    intent: str = OrderIntent.ENTRY
+    stop_price: Optional[float] = None
+    reduce_only: bool = False
+    close_all: bool = False      # 포지션 전량 청산 (수량을 단위 올림, reduce-only라 포지션만큼만 체결)
+    client_order_id: str = ''
+    meta: Dict[str, Any] = field(default_factory=dict)  # 체결 처리용 부가 정보 (방향, ATR, 시스템 등)
+
+    def to_params(self) -> Dict[str, Any]:
+        """Binance 선물 주문 파라미터"""
+        params = {
+            'symbol': self.symbol,
+            'side': self.side,
+            'type': self.order_type,
+            'quantity': self.quantity,
+            'newClientOrderId': self.client_order_id,
+        }
+        if self.order_type == OrderType.STOP_MARKET:
+            params['stopPrice'] = self.stop_price
+            params['workingType'] = ExecutionConfig.STOP_WORKING_TYPE
+        if self.reduce_only:
+            params['reduceOnly'] = 'true'
+        return params
+
+
+@dataclass
+class OrderUpdate:
+    """주문 상태 변경 (사용자 데이터 스트림 ORDER_TRADE_UPDATE 또는 주문 조회 결과)"""
+    symbol: str
+    client_order_id: str
+    status: str
+    filled_qty: float                  # 누적 체결 수량
+    avg_price: float = 0.0
+    commission: float = 0.0            # 이번 체결분 수수료
+    exchange_order_id: Optional[int] = None
+    event_time: int = 0                # epoch ms
+
+    @classmethod
+    def from_event(cls, event: Dict[str, Any]) -> Optional['OrderUpdate']:
+        """사용자 데이터 스트림 이벤트 변환 (주문 이벤트가 아니면 None)"""
+        if event.get('e') != 'ORDER_TRADE_UPDATE':
+            return None
+        o = event['o']
+        return cls(symbol=o['s'], client_order_id=o['c'], status=o['X'], filled_qty=float(o['z']),
+                   avg_price=float(o['ap']), commission=float(o.get('n', 0) or 0),
+                   exchange_order_id=o.get('i'), event_time=int(event.get('T', event.get('E', 0))))
+
+    @classmethod
+    def from_order(cls, order: Dict[str, Any]) -> 'OrderUpdate':
+        """주문 조회/응답 결과 변환 (수수료 정보 없음)"""
+        return cls(symbol=order['symbol'], client_order_id=order['clientOrderId'], status=order['status'],
+                   filled_qty=float(order.get('executedQty', 0)), avg_price=float(order.get('avgPrice', 0)),
+                   exchange_order_id=order.get('orderId'), event_time=int(order.get('updateTime', 0)))
+
+
+@dataclass
+class ManagedOrder:
+    """실행기가 추적하는 주문"""
+    request: OrderRequest
+    status: str = OrderStatus.PENDING
+    exchange_order_id: Optional[int] = None
+    filled_qty: float = 0.0
+    avg_price: float = 0.0
+    commission: float = 0.0
+    updated_at: int = 0           # 마지막 상태 변경 시각 (거래소 이벤트 시각, epoch ms)
+    attempts: int = 0             # 제출 시도 횟수
+    error: str = ''
+    done: Optional[asyncio.Future] = field(default=None, repr=False, compare=False)
+    # 단조 시각 (time.perf_counter_ns, 0이면 아직 없음): 큐 등록, 첫 전송, 첫 거래소 응답(제출 응답 또는
+    # 스트림 이벤트 중 먼저 온 것), 종료
+    queued_ns: int = field(default=0, repr=False)
+    sent_ns: int = field(default=0, repr=False)
+    acked_ns: int = field(default=0, repr=False)
+    done_ns: int = field(default=0, repr=False)
+
+    @property
+    def client_order_id(self) -> str:
+        return self.request.client_order_id
+
+    @property
+    def is_final(self) -> bool:
+        return self.status in OrderStatus.FINAL
+
+    def apply(self, update: OrderUpdate) -> bool:
+        """상태 변경 반영 (누적 체결 수량이 줄어드는 지난 이벤트와 종료 후 이벤트는 무시)"""
+        if self.is_final or update.filled_qty < self.filled_qty:
+            return False
+        if update.filled_qty == self.filled_qty and update.status == self.status:
+            return False  # 중복 이벤트
+        if update.filled_qty > self.filled_qty:
+            self.commission += update.commission
+            self.filled_qty = update.filled_qty
+            self.avg_price = update.avg_price
+        if update.exchange_order_id is not None:
+            self.exchange_order_id = update.exchange_order_id
+        self.status = update.status
+        self.updated_at = update.event_time or now_ms()
+        return True
+
+
+class ClientOrderIdFactory:
+    """client order id 생성 ({접두사}-{세션}-{목적}{순번}, 세션은 시작 시각 36진수)"""
+
+    def __init__(self, prefix: str = ExecutionConfig.CLIENT_ID_PREFIX, session: Optional[str] = None):
+        self.prefix = prefix
+        self.session = session or np.base_repr(now_ms(), 36).lower()
+        self.seq = 0
+
+    def next(self, intent: str) -> str:
+        self.seq += 1
+        return f"{self.prefix}-{self.session}-{intent[0].lower()}{self.seq}"
+
+
+class OrderRateLimiter:
+    """초당 주문 한도 토큰 버킷
+
+    토큰이 모자라면 음수로 예약하고 그만큼 기다리므로, 잠금 없이도 동시에 요청한 순서대로
+    한도 안에서 분산된다.
+    """
+
+    def __init__(self, rate: float = BinanceConfig.ORDERS_PER_SECOND, burst: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = burst if burst is not None else rate
+        self.tokens = self.capacity
+        self.clock = clock
+        self.updated = clock()
+
+    def reserve(self) -> float:
+        """토큰 하나를 예약하고 대기할 시간(초) 반환"""
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+    async def acquire(self):
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class MockExchange:
+    """로컬 모의 선물 거래소
+
+    BinanceFuturesGateway와 같은 인터페이스로 주문 응답과 ORDER_TRADE_UPDATE 이벤트를 Binance 형식으로
+    만든다. 시장가는 현재가에 즉시 체결되고, STOP_MARKET은 set_price()로 가격이 손절가를 지나면
+    그 가격에 체결된다. reduce-only 주문은 순포지션을 넘지 않게 줄이거나 거부한다.
+    step_sizes를 주면 BinanceFuturesGateway와 같이 수량을 LOT_SIZE 단위로 맞추고(전량 청산은 올림,
+    나머지는 내림), 0이 되는 주문은 거부한다.
+    """
+
+    def __init__(self, prices: Optional[Dict[str, float]] = None, commission_rate: float = 0.0004,
+                 latency: float = 0.0, step_sizes: Optional[Dict[str, float]] = None):
+        self.prices: Dict[str, float] = dict(prices or {})
+        self.step_sizes: Dict[str, float] = dict(step_sizes or {})
+        self.commission_rate = commission_rate
+        self.latency = latency
+        self.orders: Dict[str, Dict[str, Any]] = {}   # client order id -> 주문
+        self.positions: Dict[str, float] = {}         # 순포지션 (롱 +, 숏 -)
+        self.submissions: List[Tuple[float, str]] = []  # (제출 시각, client order id)
+        self.drop_acks = 0                             # 다음 N개 주문은 접수 후 응답 유실
+        self._events: Optional[asyncio.Queue] = None
+        self._next_id = 1
+
+    @property
+    def events(self) -> asyncio.Queue:
+        if self._events is None:
+            self._events = asyncio.Queue()
+        return self._events
+
+    def step_size(self, symbol: str) -> float:
+        return self.step_sizes.get(symbol, 0.0)
+
+    def open_orders(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+        return [o for o in self.orders.values()
+                if o['status'] == OrderStatus.NEW and (symbol is None or o['symbol'] == symbol)]
+
+    def _emit(self, order: Dict[str, Any], last_qty: float = 0.0, last_price: float = 0.0,
+              commission: float = 0.0):
+        self.events.put_nowait({
+            'e': 'ORDER_TRADE_UPDATE', 'T': now_ms(),
+            'o': {'s': order['symbol'], 'c': order['clientOrderId'], 'S': order['side'], 'o': order['type'],
+                  'X': order['status'], 'i': order['orderId'], 'z': order['executedQty'], 'ap': order['avgPrice'],
+                  'l': last_qty, 'L': last_price, 'n': commission, 'sp': order['stopPrice'],
+                  'R': order['reduceOnly']},
+        })
+
+    def _reduce_quantity(self, symbol: str, side: str, quantity: float) -> float:
+        """reduce-only 주문이 줄일 수 있는 수량"""
+        position = self.positions.get(symbol, 0.0)
+        if (side == 'SELL' and position > 0) or (side == 'BUY' and position < 0):
+            return min(quantity, abs(position))
+        return 0.0
+
+    def _fill(self, order: Dict[str, Any], price: float):
+        quantity = order['origQty']
+        if order['reduceOnly']:
+            quantity = self._reduce_quantity(order['symbol'], order['side'], quantity)
+            if quantity <= 0:
+                order['status'] = OrderStatus.EXPIRED
+                self._emit(order)
+                return
+        signed = quantity if order['side'] == 'BUY' else -quantity
+        position = self.positions.get(order['symbol'], 0.0) + signed
+        self.positions[order['symbol']] = 0.0 if math.isclose(position, 0.0, abs_tol=1e-12) else position
+        commission = price * quantity * self.commission_rate
+        order.update(status=OrderStatus.FILLED, executedQty=quantity, avgPrice=price)
+        self._emit(order, quantity, price, commission)
+
+    async def submit(self, request: OrderRequest) -> Dict[str, Any]:
+        await asyncio.sleep(self.latency)
+        self.submissions.append((time.monotonic(), request.client_order_id))
+        if request.client_order_id in self.orders:
+            raise DuplicateOrderError("ClientOrderId is duplicated.", -4116)
+        quantity = order_quantity(request, self.step_size(request.symbol))
+        if quantity <= 0:
+            raise OrderError("Quantity less than or equal to zero.", -4003)
+        if request.reduce_only and request.order_type == OrderType.MARKET and \
+                self._reduce_quantity(request.symbol, request.side, quantity) <= 0:
+            raise OrderError("ReduceOnly Order is rejected.", -2022)
+        if request.symbol not in self.prices:
+            raise OrderError("Invalid symbol.", -1121)
+
+        order = {
+            'symbol': request.symbol, 'clientOrderId': request.client_order_id, 'orderId': self._next_id,
+            'side': request.side, 'type': request.order_type, 'origQty': quantity,
+            'executedQty': 0.0, 'avgPrice': 0.0, 'stopPrice': request.stop_price or 0.0,
+            'reduceOnly': request.reduce_only, 'status': OrderStatus.NEW, 'updateTime': now_ms(),
+        }
+        self._next_id += 1
+        self.orders[request.client_order_id] = order
+        self._emit(order)
+        if request.order_type == OrderType.MARKET:
+            self._fill(order, self.prices[request.symbol])
+        else:
+            self._check_stop(order, self.prices[request.symbol])
+        if self.drop_acks > 0:
+            self.drop_acks -= 1
+            raise asyncio.TimeoutError()  # 접수되었지만 응답 유실
+        return {**order, 'status': OrderStatus.NEW}
+
+    async def cancel(self, symbol: str, client_order_id: str) -> Dict[str, Any]:
+        order = self.orders.get(client_order_id)
+        if order is None or order['status'] != OrderStatus.NEW:
+            raise UnknownOrderError("Unknown order sent.", -2011)
+        order['status'] = OrderStatus.CANCELED
+        self._emit(order)
+        return dict(order)
+
+    async def query(self, symbol: str, client_order_id: str) -> Dict[str, Any]:
+        order = self.orders.get(client_order_id)
+        if order is None:
+            raise UnknownOrderError("Order does not exist.", -2013)
+        return dict(order)
+
+    async def user_events(self) -> AsyncIterator[Dict[str, Any]]:
+        while True:
+            yield await self.events.get()
+
+    def _check_stop(self, order: Dict[str, Any], price: float):
+        triggered = price <= order['stopPrice'] if order['side'] == 'SELL' else price >= order['stopPrice']
+        if triggered:
+            self._fill(order, price)
+
+    def set_price(self, symbol: str, price: float):
+        """현재가 변경 (손절가를 지난 STOP_MARKET 주문 체결)"""
+        self.prices[symbol] = price
+        for order in self.open_orders(symbol):
+            if order['type'] == OrderType.STOP_MARKET:
+                self._check_stop(order, price)
+
+    async def close(self):
+        pass
+
+
+def round_to_step(value: float, step: float, up: bool = False) -> float:
+    """거래소 단위(stepSize/tickSize)의 배수로 내림 (up이면 올림)
+
+    십진수로 계산하며, 0.7 + 0.1 = 0.7999999999999999처럼 배수와의 차이가 STEP_TOLERANCE 단위 미만인
+    값은 부동소수 오차로 보고 가장 가까운 배수로 맞춘다 (한 단위 아래로 내려가 잔량이 남지 않음).
+    """
+    if not step:
+        return value
+    unit = Decimal(str(step))
+    ratio = Decimal(str(value)) / unit
+    steps = ratio.to_integral_value(ROUND_HALF_EVEN)
+    if abs(ratio - steps) > STEP_TOLERANCE:
+        steps = ratio.to_integral_value(ROUND_CEILING if up else ROUND_FLOOR)
+    return float(steps * unit)
+
+
+def order_quantity(request: OrderRequest, step: float) -> float:
+    """거래소에 보낼 수량 (LOT_SIZE 단위로 내림, 전량 청산은 올려서 단위 미만 잔량이 남지 않게 함)"""
+    return round_to_step(request.quantity, step, up=request.close_all)
+
+
+class BinanceFuturesGateway:
+    """Binance USDⓈ-M 선물 주문 게이트웨이 (python-binance AsyncClient, 필요 시 로드)"""
+
+    def __init__(self, api_key: str = BinanceConfig.API_KEY, api_secret: str = BinanceConfig.SECRET_KEY,
+                 testnet: bool = BinanceConfig.TESTNET):
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.testnet = testnet
+        self._client = None
+        self._step_sizes: Dict[str, float] = {}   # LOT_SIZE stepSize
+        self._tick_sizes: Dict[str, float] = {}   # PRICE_FILTER tickSize
+
+    async def _get_client(self):
+        if self._client is None:
+            try:
+                from binance import AsyncClient
+            except ImportError as e:
+                raise ImportError("실거래 주문에는 python-binance 패키지가 필요합니다.") from e
+            self._client = await AsyncClient.create(self.api_key, self.api_secret, testnet=self.testnet)
+        return self._client
+
+    async def _call(self, method: str, **params) -> Dict[str, Any]:
+        """API 호출 (Binance 오류 코드를 주문 예외로 변환)"""
+        from binance.exceptions import BinanceAPIException
+        client = await self._get_client()
+        try:
+            return await getattr(client, method)(**params)
+        except BinanceAPIException as e:
+            if e.code == -4116:
+                raise DuplicateOrderError(e.message, e.code) from e
+            if e.code in (-2011, -2013):
+                raise UnknownOrderError(e.message, e.code) from e
+            raise OrderError(e.message, e.code) from e
+
+    async def _load_filters(self):
+        """종목별 수량/가격 단위 (처음 한 번 조회)"""
+        if self._step_sizes:
+            return
+        info = await self._call('futures_exchange_info')
+        for s in info['symbols']:
+            for f in s['filters']:
+                if f['filterType'] == 'LOT_SIZE':
+                    self._step_sizes[s['symbol']] = float(f['stepSize'])
+                elif f['filterType'] == 'PRICE_FILTER':
+                    self._tick_sizes[s['symbol']] = float(f['tickSize'])
+
+    def step_size(self, symbol: str) -> float:
+        """LOT_SIZE 수량 단위 (아직 조회 전이거나 모르는 종목이면 0)"""
+        return self._step_sizes.get(symbol, 0.0)
+
+    async def _round_stop_price(self, symbol: str, side: str, price: float) -> float:
+        """PRICE_FILTER 단위로 반올림 방향 고정 (매도 손절은 내림, 매수 손절은 올림 - 정밀도 오류 -1111 방지)"""
+        await self._load_filters()
+        return round_to_step(price, self._tick_sizes.get(symbol), up=side == 'BUY')
+
+    async def submit(self, request: OrderRequest) -> Dict[str, Any]:
+        params = request.to_params()
+        await self._load_filters()
+        params['quantity'] = order_quantity(request, self.step_size(request.symbol))
+        if 'stopPrice' in params:
+            params['stopPrice'] = await self._round_stop_price(request.symbol, request.side, request.stop_price)
+        return await self._call('futures_create_order', **params)
+
+    async def cancel(self, symbol: str, client_order_id: str) -> Dict[str, Any]:
+        return await self._call('futures_cancel_order', symbol=symbol, origClientOrderId=client_order_id)
+
+    async def query(self, symbol: str, client_order_id: str) -> Dict[str, Any]:
+        return await self._call('futures_get_order', symbol=symbol, origClientOrderId=client_order_id)
+
+    async def user_events(self) -> AsyncIterator[Dict[str, Any]]:
+        from binance import BinanceSocketManager
+        client = await self._get_client()
+        async with BinanceSocketManager(client).futures_user_socket() as socket:
+            while True:
+                yield await socket.recv()
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.close_connection()
+            self._client = None
+
+
+class OrderExecutor:
+    """비동기 주문 실행기
+
+    submit()은 주문을 큐에 넣고 바로 반환한다. 워커들이 큐를 소비하며 토큰 버킷으로 초당 주문
+    한도를 지키는데, 같은 종목 주문은 종목별 잠금으로 넣은 순서대로, 다른 종목 주문은 동시에 제출된다.
+    client order id는 요청을 넣을 때 정해지므로 같은 id를 다시 넣어도 주문이 하나뿐이고, 응답이
+    유실되면 같은 id로 조회해 접수되지 않은 경우에만 재전송한다.
+    체결 상태는 사용자 데이터 스트림 이벤트로 갱신하며(재연결 후에는 미종료 주문을 조회로 대사),
+    상태가 바뀔 때마다 on_update 콜백을 호출한다. 스트림이 BinanceConfig.RECONNECT_ATTEMPTS번 넘게 연속으로
+    끊기면 더 이상 체결을 확인할 수 없으므로 error에 남기고 on_error 콜백으로 알린다.
+    """
+
+    def __init__(self, gateway, rate: float = BinanceConfig.ORDERS_PER_SECOND, burst: Optional[float] = None,
+                 workers: int = ExecutionConfig.WORKERS, submit_timeout: float = ExecutionConfig.SUBMIT_TIMEOUT,
+                 max_retries: int = ExecutionConfig.MAX_SUBMIT_RETRIES,
+                 on_update: Optional[Callable[[ManagedOrder], None]] = None,
+                 ids: Optional[ClientOrderIdFactory] = None, telemetry=None,
+                 on_error: Optional[Callable[[Exception], None]] = None):
+        self.gateway = gateway
+        self.limiter = OrderRateLimiter(rate, burst)
+        self.workers = workers
+        self.submit_timeout = submit_timeout
+        self.max_retries = max_retries
+        self.on_update = on_update
+        self.ids = ids or ClientOrderIdFactory()
+        self.telemetry = telemetry  # RuntimeTelemetry (주문 응답 지연, 한도 대기, 종료 상태 카운터)
+        self.on_error = on_error    # 사용자 데이터 스트림이 재연결 한도를 넘어 중단될 때 호출
+        self.error: Optional[Exception] = None
+        self.orders: Dict[str, ManagedOrder] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._tasks: List[asyncio.Task] = []
+
+    # 수명 주기
+    async def start(self):
+        """워커와 사용자 데이터 스트림 구독 시작"""
+        self._queue = asyncio.Queue()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        self._tasks.append(asyncio.create_task(self._stream()))
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def step_size(self, symbol: str) -> float:
+        """게이트웨이의 종목 수량 단위 (0이면 단위 없음)"""
+        return self.gateway.step_size(symbol)
+
+    async def join(self):
+        """큐에 넣은 주문이 모두 제출될 때까지 대기"""
+        await self._queue.join()
+
+    # 주문
+    def submit(self, request: OrderRequest) -> ManagedOrder:
+        """주문을 큐에 넣음 (이미 있는 client order id면 기존 주문 반환)"""
+        if not request.client_order_id:
+            request.client_order_id = self.ids.next(request.intent)
+        order = self.orders.get(request.client_order_id)
+        if order is not None:
+            return order
+        order = ManagedOrder(request, done=asyncio.get_running_loop().create_future(),
+                             queued_ns=time.perf_counter_ns())
+        self.orders[request.client_order_id] = order
+        self._queue.put_nowait(order)
+        return order
+
+    async def wait(self, client_order_id: str, timeout: Optional[float] = None) -> ManagedOrder:
+        """주문이 종료 상태가 될 때까지 대기"""
+        order = self.orders[client_order_id]
+        return await asyncio.wait_for(asyncio.shield(order.done), timeout)
+
+    async def cancel(self, client_order_id: str) -> bool:
+        """주문 취소 요청 (이미 종료되었거나 거래소에 없으면 False)"""
+        order = self.orders.get(client_order_id)
+        if order is None or order.is_final:
+            return False
+        if order.status == OrderStatus.PENDING:
+            # 아직 제출 전이면 큐에서 건너뛰도록 로컬에서 종료
+            self._finish(order, OrderStatus.CANCELED, "제출 전 취소")
+            return True
+        async with self._lock(order.request.symbol):
+            await self._acquire()
+            try:
+                result = await self.gateway.cancel(order.request.symbol, client_order_id)
+            except UnknownOrderError:
+                return False
+        self._apply(order, OrderUpdate.from_order(result))
+        return True
+
+    def track(self, request: OrderRequest) -> ManagedOrder:
+        """재시작 전에 제출한 주문을 다시 제출하지 않고 추적 등록 (reconcile로 상태 확인)"""
+        order = self.orders.get(request.client_order_id)
+        if order is not None:
+            return order
+        order = ManagedOrder(request, status=OrderStatus.SUBMITTED, attempts=1,
+                             done=asyncio.get_running_loop().create_future())
+        self.orders[request.client_order_id] = order
+        return order
+
+    async def reconcile(self, mark_missing: bool = True):
+        """제출한 미종료 주문을 거래소 조회로 대사 (mark_missing이면 거래소에 없는 주문은 REJECTED)"""
+        for order in [o for o in self.orders.values() if not o.is_final and o.attempts]:
+            if not await self._recover(order) and mark_missing:
+                self._finish(order, OrderStatus.REJECTED, "거래소에 없는 주문")
+
+    async def _acquire(self):
+        """주문 한도 토큰 획득 (대기 시간 기록)"""
+        wait = self.limiter.reserve()
+        if self.telemetry is not None:
+            self.telemetry.rate_limit_wait.observe(wait)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def _lock(self, symbol: str) -> asyncio.Lock:
+        lock = self._locks.get(symbol)
+        if lock is None:
+            lock = self._locks[symbol] = asyncio.Lock()
+        return lock
+
+    async def _worker(self):
+        while True:
+            order = await self._queue.get()
+            try:
+                async with self._lock(order.request.symbol):
+                    await self._send(order)
+            except Exception as e:
+                logger.error(f"Order submission failed: {order.client_order_id} {e}")
+                self._finish(order, OrderStatus.REJECTED, str(e))
+            finally:
+                self._queue.task_done()
+
+    async def _send(self, order: ManagedOrder):
+        """주문 제출 (응답 유실 시 조회로 접수 여부를 확인한 뒤에만 같은 id로 재전송)"""
+        for _ in range(self.max_retries + 1):
+            await self._acquire()
+            if order.is_final:
+                return  # 제출 전 취소됨
+            order.attempts += 1
+            if order.status == OrderStatus.PENDING:
+                order.status = OrderStatus.SUBMITTED
+            try:
+                started = time.perf_counter_ns()
+                if not order.sent_ns:
+                    order.sent_ns = started
+                ack = await asyncio.wait_for(self.gateway.submit(order.request), self.submit_timeout)
+                if self.telemetry is not None:
+                    self.telemetry.order_latency.observe((time.perf_counter_ns() - started) * 1e-9)
+            except DuplicateOrderError:
+                await self._recover(order)
+                return
+            except OrderError as e:
+                logger.warning(f"Order rejected: {order.client_order_id} [{e.code}] {e}")
+                self._finish(order, OrderStatus.REJECTED, str(e))
+                return
+            except (asyncio.TimeoutError, ConnectionError, OSError) as e:
+                logger.warning(f"Order ack lost, reconciling: {order.client_order_id} ({type(e).__name__})")
+                if await self._recover(order):
+                    return
+                continue
+            self._apply(order, OrderUpdate.from_order(ack))
+            return
+        self._finish(order, OrderStatus.REJECTED, "재시도 횟수 초과")
+
+    async def _recover(self, order: ManagedOrder) -> bool:
+        """client order id로 주문 조회 후 반영 (거래소에 없으면 False)"""
+        try:
+            await self._acquire()
+            snapshot = await self.gateway.query(order.request.symbol, order.client_order_id)
+        except UnknownOrderError:
+            return False
+        self._apply(order, OrderUpdate.from_order(snapshot))
+        return True
+
+    # 체결 대사
+    def _apply(self, order: ManagedOrder, update: OrderUpdate):
+        if not order.acked_ns:
+            order.acked_ns = time.perf_counter_ns()
+        # 제출 응답(NEW)은 스트림 이벤트보다 늦게 올 수 있으므로 진행된 상태를 되돌리지 않음
+        if update.status == OrderStatus.NEW and order.status not in (OrderStatus.PENDING, OrderStatus.SUBMITTED):
+            if update.exchange_order_id is not None:
+                order.exchange_order_id = update.exchange_order_id
+            return
+        if order.apply(update):
+            self._notify(order)
+
+    def _finish(self, order: ManagedOrder, status: str, error: str = ''):
+        if order.is_final:
+            return
+        order.status = status
+        order.error = error
+        order.updated_at = now_ms()
+        self._notify(order)
+
+    def _notify(self, order: ManagedOrder):
+        if order.is_final and not order.done.done():
+            order.done_ns = time.perf_counter_ns()
+            order.done.set_result(order)
+            if self.telemetry is not None:
+                self.telemetry.order_finished(order.status)
+        if self.on_update is not None:
+            try:
+                self.on_update(order)
+            except Exception as e:
+                logger.error(f"Order update handler failed: {order.client_order_id} {e}")
+
+    async def _stream(self):
+        """사용자 데이터 스트림 구독 (끊기면 재연결 후 미종료 주문을 조회로 대사)"""
+        failures = 0
+        while True:
+            try:
+                async for event in self.gateway.user_events():
+                    failures = 0
+                    update = OrderUpdate.from_event(event)
+                    if update is None:
+                        continue
+                    order = self.orders.get(update.client_order_id)
+                    if order is None:
+                        logger.debug(f"Untracked order event: {update.client_order_id}")
+                        continue
+                    self._apply(order, update)
+                raise ConnectionError("사용자 데이터 스트림 종료")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                failures += 1
+                if failures > BinanceConfig.RECONNECT_ATTEMPTS:
+                    logger.error(f"User data stream failed: {e}")
+                    self.error = e
+                    if self.on_error is not None:
+                        self.on_error(e)
+                    raise
+                logger.warning(f"User data stream disconnected, reconnecting ({failures}): {e}")
+                await asyncio.sleep(min(2 ** failures, BinanceConfig.WEBSOCKET_TIMEOUT))
+            await self.reconcile(mark_missing=False)
@@ -0,0 +1,765 @@
+"""
+가상매매 런타임
+봉 마감 이벤트 루프로 스트리밍 캔들을 TurtleStrategy에 전달하고, 증분 지표와 선물 마진 체결 시뮬레이션으로 여러 종목을 동시에 운용
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncIterator, Deque, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from config import BacktestConfig, PaperTradingConfig, TradingConfig, TradingMode
+from strategy.turtle_strategy import PriceData, TurtleStrategy
+from strategy.backtest_core import can_add_position
+from strategy.correlation import CorrelationService
+from strategy.futures import FuturesAccount, bar_funding
+from utils.funding_store import FundingRateStore
+from utils.resampler import FIXED_TIMEFRAME_MS
+from utils.latency_trace import DecisionTrace, LatencyTracer
+from utils.telemetry import RuntimeTelemetry
+from utils.runtime_state import (RuntimeSnapshot, RuntimeStateStore, position_from_dict, position_to_dict,
+                                 trade_from_dict, trade_to_dict)
+from utils.timeaxis import from_ms, now_ms, to_ms
+
+logger = logging.getLogger(__name__)
+
+
+class RollingExtreme:
+    """직전 period개 값의 최고/최저 (현재 값 제외, 단조 덱으로 봉당 O(1))"""
+
+    def __init__(self, period: int, highest: bool):
+        self.period = period
+        self.highest = highest
+        self._window: Deque[Tuple[int, float]] = deque()  # (봉 번호, 값), 값이 단조
+
+    def value(self, n: int) -> Optional[float]:
+        """n번째 봉 직전 period개 봉의 극값 (이력이 부족하면 None)"""
+        if n < self.period:
+            return None
+        window = self._window
+        while window[0][0] < n - self.period:
+            window.popleft()
+        return window[0][1]
+
+    def push(self, n: int, value: float):
+        window = self._window
+        if self.highest:
+            while window and window[-1][1] <= value:
+                window.pop()
+        else:
+            while window and window[-1][1] >= value:
+                window.pop()
+        window.append((n, value))
+
+    def get_state(self) -> Dict[str, Any]:
+        return {'period': self.period, 'highest': self.highest, 'window': list(self._window)}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> 'RollingExtreme':
+        extreme = cls(state['period'], state['highest'])
+        extreme._window.extend(tuple(item) for item in state['window'])
+        return extreme
+
+
+class IncrementalIndicators:
+    """종목별 증분 지표 상태
+
+    봉이 도착할 때마다 돌파 채널(직전 N봉 최고/최저)과 True Range만 갱신하므로 전체 이력을
+    다시 계산하지 않는다. ATR은 최근 atr_period개 True Range의 누적 합으로 봉당 O(1)에 구한다.
+    더하고 빼는 반올림 오차가 쌓이지 않도록 atr_period개 봉마다 창을 다시 합산하며, 그 시점의 합은
+    SimulationCore와 같은 원소를 같은 순서로 더한 값이다.
+    """
+
+    def __init__(self, periods: Iterable[int], atr_period: int):
+        self.periods = sorted(set(periods))
+        self.atr_period = atr_period
+        self.highest = {p: RollingExtreme(p, True) for p in self.periods}
+        self.lowest = {p: RollingExtreme(p, False) for p in self.periods}
+        self.true_ranges: Deque[float] = deque(maxlen=atr_period)
+        self.tr_sum = 0.0                   # true_ranges 합계
+        self._tr_pushes = 0                 # 마지막 재합산 이후 추가한 True Range 수
+        self.bars = 0                       # 지금까지 반영한 봉 수
+        self.prev_close: Optional[float] = None
+        self.last_open_time: Optional[int] = None
+
+        # 현재 봉 기준 값 (update 후 유효)
+        self.close = 0.0
+        self.channels_high: Dict[int, Optional[float]] = {}
+        self.channels_low: Dict[int, Optional[float]] = {}
+
+    def update(self, open_time: int, high: float, low: float, close: float):
+        """새 봉 반영 (채널은 이 봉을 넣기 전 값으로 계산)"""
+        n = self.bars
+        self.channels_high = {p: ext.value(n) for p, ext in self.highest.items()}
+        self.channels_low = {p: ext.value(n) for p, ext in self.lowest.items()}
+        for ext in self.highest.values():
+            ext.push(n, high)
+        for ext in self.lowest.values():
+            ext.push(n, low)
+
+        if self.prev_close is not None:
+            self._push_true_range(max(high - low, abs(high - self.prev_close), abs(low - self.prev_close)))
+        self.prev_close = close
+        self.close = close
+        self.last_open_time = open_time
+        self.bars = n + 1
+
+    def _push_true_range(self, value: float):
+        ranges = self.true_ranges
+        if len(ranges) == ranges.maxlen:
+            self.tr_sum -= ranges[0]
+        ranges.append(value)
+        self._tr_pushes += 1
+        if self._tr_pushes >= self.atr_period:
+            self.tr_sum = sum(ranges)
+            self._tr_pushes = 0
+        else:
+            self.tr_sum += value
+
+    @property
+    def index(self) -> int:
+        """현재 봉 번호 (0부터)"""
+        return self.bars - 1
+
+    def atr(self) -> Optional[float]:
+        """현재 봉 기준 ATR (True Range가 2개 미만이면 None)"""
+        # 첫 봉은 True Range가 없으므로 보관 중인 개수가 곧 min(atr_period, index)
+        period = len(self.true_ranges)
+        if period < 2:
+            return None
+        return self.tr_sum / period
+
+    def breakout(self, period: int, direction: str) -> bool:
+        """현재 봉 종가의 직전 period봉 돌파 여부"""
+        if direction == "LONG":
+            level = self.channels_high.get(period)
+            return level is not None and self.close > level
+        level = self.channels_low.get(period)
+        return level is not None and self.close < level
+
+    def get_state(self) -> Dict[str, Any]:
+        """지표 상태 (재시작 시 워밍업 없이 복원)"""
+        return {
+            'periods': self.periods,
+            'atr_period': self.atr_period,
+            'highest': [ext.get_state() for ext in self.highest.values()],
+            'lowest': [ext.get_state() for ext in self.lowest.values()],
+            'true_ranges': list(self.true_ranges),
+            'tr_sum': self.tr_sum,
+            'tr_pushes': self._tr_pushes,
+            'bars': self.bars,
+            'prev_close': self.prev_close,
+            'last_open_time': self.last_open_time,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> 'IncrementalIndicators':
+        indicators = cls(state['periods'], state['atr_period'])
+        indicators.highest = {s['period']: RollingExtreme.from_state(s) for s in state['highest']}
+        indicators.lowest = {s['period']: RollingExtreme.from_state(s) for s in state['lowest']}
+        indicators.true_ranges.extend(state['true_ranges'])
+        # 누적 합과 재합산 주기까지 복원하여 중단 없이 실행한 것과 같은 ATR을 냄
+        indicators.tr_sum = state.get('tr_sum', sum(indicators.true_ranges))
+        indicators._tr_pushes = state.get('tr_pushes', 0)
+        indicators.bars = state['bars']
+        indicators.prev_close = state['prev_close']
+        indicators.last_open_time = state['last_open_time']
+        return indicators
+
+
+@dataclass
+class PaperFill:
+    """가상 체결 기록"""
+    time: int            # 봉 시작 시각 (epoch ms)
+    symbol: str
+    side: str            # 'BUY' / 'SELL'
+    action: str          # 'ENTRY', 'PYRAMID', 'EXIT'
+    price: float
+    size: float
+    commission: float
+    reason: str = ''
+
+
+class ReplayFeed:
+    """저장된 캔들을 시간순으로 재생하는 피드 (드라이런/테스트용)"""
+
+    live = False  # 봉 마감 시각 대비 수신 지연을 재지 않음
+
+    def __init__(self, bars: Dict[str, List[PriceData]], delay: float = 0.0):
+        self.bars = bars
+        self.delay = delay
+
+    def now(self) -> int:
+        """재생 시작 시각 (가장 이른 봉 시작 시각)"""
+        firsts = [to_ms(bars[0].date) for bars in self.bars.values() if bars]
+        return min(firsts) if firsts else 0
+
+    async def history(self, symbol: str, timeframe: str, limit: int) -> List[PriceData]:
+        return []
+
+    async def stream(self, symbols: List[str], timeframe: str) -> AsyncIterator[PriceData]:
+        merged = sorted((bar for symbol in symbols for bar in self.bars.get(symbol, [])),
+                        key=lambda bar: bar.date)
+        for bar in merged:
+            yield bar
+            await asyncio.sleep(self.delay)
+
+
+class BinanceKlineFeed:
+    """Binance 선물 kline 웹소켓 피드 (마감된 봉만 전달)"""
+
+    live = True
+
+    def __init__(self, testnet: bool = False):
+        self.testnet = testnet
+        self._client = None
+
+    async def _get_client(self):
+        if self._client is None:
+            try:
+                from binance import AsyncClient
+            except ImportError as e:
+                raise ImportError("실시간 피드에는 python-binance 패키지가 필요합니다.") from e
+            self._client = await AsyncClient.create(testnet=self.testnet)
+        return self._client
+
+    @staticmethod
+    def _to_bar(symbol: str, kline: List[Any]) -> PriceData:
+        return PriceData(symbol=symbol, date=from_ms(kline[0]), open=float(kline[1]), high=float(kline[2]),
+                         low=float(kline[3]), close=float(kline[4]), volume=float(kline[5]))
+
+    def now(self) -> int:
+        return now_ms()
+
+    async def history(self, symbol: str, timeframe: str, limit: int) -> List[PriceData]:
+        """워밍업용 최근 마감 봉 (진행 중인 마지막 봉 제외)"""
+        client = await self._get_client()
+        klines = await client.futures_klines(symbol=symbol, interval=timeframe, limit=limit + 1)
+        return [self._to_bar(symbol, k) for k in klines[:-1]]
+
+    async def stream(self, symbols: List[str], timeframe: str) -> AsyncIterator[PriceData]:
+        from binance import BinanceSocketManager
+        client = await self._get_client()
+        streams = [f"{symbol.lower()}@kline_{timeframe}" for symbol in symbols]
+        async with BinanceSocketManager(client).futures_multiplex_socket(streams) as socket:
+            while True:
+                message = await socket.recv()
+                kline = message.get('data', {}).get('k')
+                if not kline or not kline.get('x'):
+                    continue  # 진행 중인 봉은 무시
+                yield PriceData(symbol=kline['s'], date=from_ms(kline['t']), open=float(kline['o']), high=float(kline['h']), low=float(kline['l']),
+                                close=float(kline['c']), volume=float(kline['v']))
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.close_connection()
+            self._client = None
+
+
+class PaperTradingRuntime:
+    """가상매매 런타임
+
+    여러 종목이 하나의 TurtleStrategy와 선물 계좌(지갑 잔고, 레버리지 마진, 수수료)를 공유한다.
+    피드에서 마감된 봉이 도착하면 on_bar()가 SimulationCore.step과 같은 순서로 펀딩비/강제청산 →
+    청산 → 신규 진입 (시스템별 LONG, SHORT) → 피라미딩을 판단한다. 판단은 종목별 증분 지표만 사용하므로
+    봉당 지연이 이력 길이와 무관하며, 이벤트 루프 한 곳에서 순서대로 처리해 계좌 상태에 잠금이 필요 없다.
+
+    펀딩비와 격리 마진 강제청산은 SimulationCore와 같은 FuturesAccount로 계산한다. 펀딩비는 종목별
+    저장 이력(FundingRateStore)에서 봉 구간에 든 펀딩 시각의 비율을 직전 종가로 부과한다.
+    실거래 런타임은 거래소가 직접 정산하므로 simulate_futures가 False이다.
+
+    봉당 지연은 텔레메트리의 turtle_bar_processing_seconds 히스토그램(self.latency) 하나로 집계한다.
+    """
+
+    simulate_futures = True
+
+    def __init__(self, symbols: List[str], timeframe: str = PaperTradingConfig.DEFAULT_TIMEFRAME,
+                 initial_balance: float = BacktestConfig.DEFAULT_INITIAL_BALANCE,
+                 leverage: float = TradingConfig.DEFAULT_LEVERAGE,
+                 commission_rate: float = BacktestConfig.DEFAULT_COMMISSION_RATE,
+                 systems: Optional[List[int]] = None,
+                 slippage_rate: float = PaperTradingConfig.SLIPPAGE_RATE,
+                 strategy: Optional[TurtleStrategy] = None,
+                 state_store: Optional[RuntimeStateStore] = None,
+                 correlation: Optional[CorrelationService] = None,
+                 telemetry: Optional[RuntimeTelemetry] = None,
+                 futures: Optional[FuturesAccount] = None,
+                 funding_store: Optional[FundingRateStore] = None):
+        self.symbols = list(symbols)
+        self.timeframe = timeframe
+        self.initial_balance = initial_balance
+        self.leverage = leverage
+        self.commission_rate = commission_rate
+        self.systems = systems or [1, 2]
+        self.slippage_rate = slippage_rate
+        self.strategy = strategy or TurtleStrategy(TradingMode.PAPER)
+
+        self.entry_periods = {s: self.strategy.entry_period(s, timeframe) for s in (1, 2)}
+        self.exit_periods = {s: self.strategy.exit_period(s, timeframe) for s in (1, 2)}
+        self.atr_period = TradingConfig.get_atr_period(timeframe)
+        periods = list(self.entry_periods.values()) + list(self.exit_periods.values())
+        self.warmup_bars = max(max(periods), self.atr_period) + 1
+        self.indicators = {s: IncrementalIndicators(periods, self.atr_period) for s in self.symbols}
+
+        # 계좌 상태
+        self.balance = initial_balance
+        self.last_prices: Dict[str, float] = {}
+        self.peak_equity = initial_balance
+        self.max_drawdown = 0.0
+        self.fills: Deque[PaperFill] = deque(maxlen=PaperTradingConfig.MAX_FILL_HISTORY)
+        self.bars_processed = 0
+        self.is_running = False
+        self.state_store = state_store
+        self.telemetry = telemetry or RuntimeTelemetry()
+        self.telemetry.bind_runtime(self)
+        self.latency = self.telemetry.bar_latency
+        self.tracer = LatencyTracer(self.telemetry)
+        self._trace: Optional[DecisionTrace] = None  # 판단 중인 봉의 추적 (주문 연결용)
+        self._live_feed = False
+
+        # 선물 계좌 (펀딩비, 강제청산)
+        if futures is None and self.simulate_futures and PaperTradingConfig.FUTURES_ACCOUNT:
+            futures = FuturesAccount(leverage)
+        self.futures = futures
+        self.funding: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}  # 종목 -> (펀딩 시각, 펀딩비)
+        if futures is not None:
+            store = funding_store or FundingRateStore()
+            self.funding = {symbol: store.load(symbol) for symbol in self.symbols}
+
+        # 롤링 상관관계 연관 그룹 (리스크 엔진의 MAX_UNITS_CORRELATED 판단에 사용)
+        if correlation is None and PaperTradingConfig.DYNAMIC_CORRELATION and len(self.symbols) > 1:
+            correlation = CorrelationService(self.symbols)
+        self.correlation = correlation
+        self.groups: Optional[Dict[str, List[str]]] = None  # 마지막으로 적용한 연관 그룹
+        self._groups_count = 0   # 그때의 상관관계 행 수
+
+    # 계좌
+    def equity(self) -> float:
+        """지갑 잔고 + 종목별 최신가 기준 미실현 손익"""
+        total = self.balance
+        for symbol in self.strategy.positions:
+            price = self.last_prices.get(symbol)
+            if price is not None:
+                total += self.strategy.calculate_unrealized_pnl(symbol, price)
+        return total
+
+    def _fill_price(self, price: float, side: str) -> float:
+        """슬리피지 반영 체결가 (매수는 높게, 매도는 낮게)"""
+        return price * (1 + self.slippage_rate) if side == 'BUY' else price * (1 - self.slippage_rate)
+
+    def _record(self, time_ms: int, symbol: str, side: str, action: str, price: float, size: float,
+                reason: str = '', commission: Optional[float] = None) -> float:
+        """체결 기록 및 수수료 차감 (수수료를 주지 않으면 수수료율로 계산)"""
+        if commission is None:
+            commission = price * size * self.commission_rate
+        self.balance -= commission
+        fill = PaperFill(time_ms, symbol, side, action, price, size, commission, reason)
+        self.fills.append(fill)
+        if self.state_store is not None:
+            self._log_symbol(fill)
+        return commission
+
+    # 봉 처리
+    def warm_up(self, symbol: str, bars: List[PriceData]):
+        """과거 봉으로 지표만 채움 (거래 없음)"""
+        indicators = self.indicators[symbol]
+        for bar in bars:
+            open_time = to_ms(bar.date)
+            if indicators.last_open_time is not None and open_time <= indicators.last_open_time:
+                continue
+            indicators.update(open_time, bar.high, bar.low, bar.close)
+        if bars:
+            self.last_prices[symbol] = bars[-1].close
+
+    def on_bar(self, bar: PriceData) -> bool:
+        """마감된 봉 하나 처리 (중복/과거 봉이거나 지표가 부족하면 False)"""
+        started = time.perf_counter_ns()
+        indicators = self.indicators.get(bar.symbol)
+        if indicators is None:
+            return False
+        open_time = to_ms(bar.date)
+        if indicators.last_open_time is not None and open_time <= indicators.last_open_time:
+            return False  # 재연결 등으로 다시 받은 봉
+
+        prev_close = indicators.prev_close
+        indicators.update(open_time, bar.high, bar.low, bar.close)
+        self.last_prices[bar.symbol] = bar.close
+        if self.correlation is not None:
+            self._observe(bar.symbol, open_time, bar.close)
+        atr = indicators.atr()
+        if atr is not None:
+            trace = self._begin_trace(bar.symbol, open_time, started)
+            if self.futures is not None and bar.symbol in self.strategy.positions:
+                self._settle_futures(bar, open_time, bar.close if prev_close is None else prev_close)
+            self._decide(bar.symbol, indicators, open_time, atr)
+            self._trace = None
+            self.tracer.decided(trace)
+            self._mark_to_market()
+        if self.state_store is not None:
+            # 판단 후 기록 (기록 전 중단되면 재시작 시 지표만 다시 채우고 같은 봉으로 두 번 거래하지 않음)
+            self.state_store.append('bar', [bar.symbol, open_time, bar.high, bar.low, bar.close])
+            if self.state_store.snapshot_due():
+                self.save_state()
+        if atr is None:
+            return False
+        self.latency.observe((time.perf_counter_ns() - started) * 1e-9)
+        return True
+
+    def _begin_trace(self, symbol: str, open_time: int, received_ns: int) -> DecisionTrace:
+        """판단 추적 시작 (received_ns는 on_bar 진입 시각, 실시간 피드면 봉 마감 대비 수신 지연 포함)"""
+        step = FIXED_TIMEFRAME_MS.get(self.timeframe) if self._live_feed else None
+        trace = self.tracer.begin(symbol, open_time, received_ns,
+                                  now_ms() - (open_time + step) if step else None)
+        trace.indicators_ns = time.perf_counter_ns()
+        self._trace = trace
+        return trace
+
+    def _observe(self, symbol: str, open_time: int, close: float):
+        """상관관계 행 갱신 후 주기마다 리스크 엔진 연관 그룹 교체"""
+        correlation = self.correlation
+        if not correlation.update(symbol, open_time, close) or not correlation.ready:
+            return
+        if self._groups_count and correlation.count - self._groups_count < TradingConfig.CORRELATION_REFRESH_BARS:
+            return
+        self._refresh_groups()
+
+    def _refresh_groups(self):
+        groups = self.correlation.groups()
+        if groups is not None:
+            self.strategy.risk.set_groups(groups)
+            self.groups = groups
+            self._groups_count = self.correlation.count
+
+    def _correlation_state(self) -> Optional[Dict[str, Any]]:
+        if self.correlation is None:
+            return None
+        return {'service': self.correlation.get_state(), 'groups': self.groups, 'groups_count': self._groups_count}
+
+    def _restore_correlation(self, state: Dict[str, Any]):
+        if not self.correlation.restore(state['service']):
+            return  # 종목 구성이 바뀌었으면 새로 계산
+        self.groups = state['groups']
+        self._groups_count = state['groups_count']
+        if self.groups is not None:
+            self.strategy.risk.set_groups(self.groups)
+
+    def _settle_futures(self, bar: PriceData, open_time: int, prev_close: float):
+        """봉 구간의 펀딩비 정산과 봉 내 강제청산 (SimulationCore.settle_futures와 같은 순서)"""
+        futures = self.futures
+        strategy = self.strategy
+        symbol = bar.symbol
+        position = strategy.positions[symbol]
+        strategy.clock = open_time
+        times, rates = self.funding.get(symbol, (None, None))
+        if times is not None and len(times):
+            rate = float(bar_funding(np.array([open_time], dtype=np.int64), self.timeframe, times, rates)[0])
+            if rate:
+                self.balance -= futures.funding(position, rate, prev_close)
+                if self.state_store is not None:
+                    self.state_store.append('funding', {'balance': self.balance, 'futures': futures.get_state()})
+        price = futures.liquidated(position, bar.high, bar.low)
+        if price is None:
+            return
+        trade = strategy.execute_exit(symbol, price, 'LIQUIDATION', self.balance, self.leverage)
+        if trade:
+            self.balance += trade.pnl
+            # 남은 마진(청산 수수료)을 체결 수수료로 기록
+            self._record(open_time, symbol, 'SELL' if position.direction == "LONG" else 'BUY', 'EXIT', price,
+                         trade.size, 'LIQUIDATION', commission=futures.on_liquidation(position, trade.pnl))
+
+    def _mark_to_market(self):
+        """평가금액 고점/최대 낙폭 갱신"""
+        value = self.equity()
+        if value > self.peak_equity:
+            self.peak_equity = value
+        elif self.peak_equity > 0:
+            self.max_drawdown = max(self.max_drawdown, (self.peak_equity - value) / self.peak_equity)
+        self.bars_processed += 1
+
+    def _decide(self, symbol: str, indicators: IncrementalIndicators, open_time: int, atr: float):
+        """청산 → 신규 진입 → 피라미딩 판단 (SimulationCore.step과 같은 순서)"""
+        strategy = self.strategy
+        strategy.clock = open_time
+        price = indicators.close
+
+        position = strategy.get_position(symbol)
+        if position is not None:
+            reason = None
+            if self._stop_hit(position, price):
+                reason = 'STOP_LOSS'
+            elif position.units and indicators.breakout(self.exit_periods[position.units[0].system],
+                                                        "SHORT" if position.direction == "LONG" else "LONG"):
+                reason = 'SIGNAL'
+            if reason:
+                self._close(symbol, position, price, reason, open_time)
+                position = strategy.get_position(symbol)
+                if position is not None:
+                    return  # 청산 주문 체결 대기 중
+
+        # 청산한 봉에서도 새 돌파가 있으면 바로 진입 (백테스트와 동일)
+        if position is None:
+            if not self._risk_check(can_add_position, strategy, self.balance, self.leverage):
+                return
+            for system in self.systems:
+                for direction in ("LONG", "SHORT"):
+                    if not self._entry_signal(symbol, indicators, system, direction):
+                        continue
+                    if not self._risk_check(strategy.can_add_unit, symbol, direction, price, atr, self.balance,
+                                            self.leverage):
+                        continue
+                    if self._open(symbol, direction, price, atr, system, open_time):
+                        return
+            return
+
+        if strategy.check_pyramid_signal(position, price, atr) and \
+                self._risk_check(strategy.can_add_unit, symbol, position.direction, price, atr, self.balance,
+                                 self.leverage):
+            self._add(symbol, position, price, atr, open_time)
+
+    def _risk_check(self, check, *args) -> bool:
+        """리스크 한도 점검 (소요 시간을 판단 추적의 리스크 단계로 분리)"""
+        trace = self._trace
+        if trace is None:
+            return check(*args)
+        started = time.perf_counter_ns()
+        allowed = check(*args)
+        trace.risk_ns += time.perf_counter_ns() - started
+        return allowed
+
+    # 체결 (가상매매는 종가에 즉시 체결, 실거래 런타임이 주문 경로로 대체)
+    def _stop_hit(self, position, price: float) -> bool:
+        """종가 기준 손절 여부"""
+        return self.strategy.check_stop_loss(position, price)
+
+    def _open(self, symbol: str, direction: str, price: float, atr: float, system: int, open_time: int) -> bool:
+        """신규 진입 (진입했거나 주문을 냈으면 True)"""
+        side = 'BUY' if direction == "LONG" else 'SELL'
+        fill = self._fill_price(price, side)
+        unit = self.strategy.execute_entry(symbol, direction, fill, atr, self.balance, system, self.leverage)
+        if unit:
+            self._record(open_time, symbol, side, 'ENTRY', fill, unit.size)
+        return unit is not None
+
+    def _add(self, symbol: str, position, price: float, atr: float, open_time: int):
+        """피라미딩 유닛 추가"""
+        side = 'BUY' if position.direction == "LONG" else 'SELL'
+        fill = self._fill_price(price, side)
+        unit = self.strategy.execute_entry(symbol, position.direction, fill, atr, self.balance,
+                                           position.units[0].system, self.leverage)
+        if unit:
+            self._record(open_time, symbol, side, 'PYRAMID', fill, unit.size)
+
+    def _close(self, symbol: str, position, price: float, reason: str, open_time: int):
+        """포지션 전체 청산"""
+        side = 'SELL' if position.direction == "LONG" else 'BUY'
+        fill = self._fill_price(price, side)
+        trade = self.strategy.execute_exit(symbol, fill, reason, self.balance, self.leverage)
+        if trade:
+            self.balance += trade.pnl
+            self._record(open_time, symbol, side, 'EXIT', fill, trade.size, reason)
+
+    def _entry_signal(self, symbol: str, indicators: IncrementalIndicators, system: int, direction: str) -> bool:
+        """진입 신호 (시스템 1 손실 후 필터 포함)"""
+        signal = indicators.breakout(self.entry_periods[system], direction)
+        if system == 1 and self.strategy.config.SYSTEM_1['USE_FILTER']:
+            signal = signal and not self.strategy.last_trade_results.get(symbol, False)
+        return signal
+
+    # 이벤트 루프
+    async def run(self, feed, max_bars: Optional[int] = None):
+        """피드의 마감 봉을 소비하는 이벤트 루프 (워밍업 포함, stop() 또는 피드 종료 시 반환)"""
+        self.is_running = True
+        self._live_feed = getattr(feed, 'live', False)
+        await self._resume_orders()
+        for symbol in self.symbols:
+            await self._catch_up(feed, symbol)
+        self.save_state()
+        logger.info(f"Paper trading started: {len(self.symbols)} symbols, {self.timeframe}")
+
+        processed = 0
+        try:
+            async for bar in feed.stream(self.symbols, self.timeframe):
+                if not self.is_running:
+                    break
+                if self.on_bar(bar):
+                    processed += 1
+                if max_bars is not None and processed >= max_bars:
+                    break
+        finally:
+            self.is_running = False
+            self.save_state()
+        return self.summary()
+
+    async def _catch_up(self, feed, symbol: str):
+        """지표 워밍업 (복원된 지표는 중단 구간의 마감 봉만 받아 이어 붙임)"""
+        indicators = self.indicators[symbol]
+        if indicators.bars >= self.warmup_bars:
+            step = FIXED_TIMEFRAME_MS.get(self.timeframe)
+            missed = (feed.now() - indicators.last_open_time) // step - 1 if step else self.warmup_bars
+            if missed <= 0:
+                return
+            if missed <= self.warmup_bars:
+                # 이미 반영한 봉은 warm_up이 건너뜀
+                self.warm_up(symbol, await feed.history(symbol, self.timeframe, missed))
+                return
+        # 처음 시작하거나 중단이 워밍업 구간보다 길면 지표를 새로 채움
+        self.indicators[symbol] = IncrementalIndicators(indicators.periods, self.atr_period)
+        self.warm_up(symbol, await feed.history(symbol, self.timeframe, self.warmup_bars))
+
+    # 상태 영속화
+    def save_state(self) -> Optional[str]:
+        """전체 상태 스냅샷 저장 (저장소가 없으면 None)"""
+        if self.state_store is None:
+            return None
+        snapshot = RuntimeSnapshot(
+            seq=self.state_store.seq, symbols=self.symbols, timeframe=self.timeframe,
+            strategy_state=self.strategy.get_state(),
+            account={'balance': self.balance, 'peak_equity': self.peak_equity, 'max_drawdown': self.max_drawdown,
+                     'bars_processed': self.bars_processed, 'last_prices': self.last_prices,
+                     'futures': self.futures.get_state() if self.futures is not None else None},
+            indicators={s: ind.get_state() for s, ind in self.indicators.items()},
+            fills=list(self.fills), orders=self._order_state(),
+            correlation=self._correlation_state())
+        return self.state_store.save_snapshot(snapshot)
+
+    def restore_state(self) -> bool:
+        """저장된 스냅샷과 WAL로 상태 복원 (저장된 상태가 없으면 False)"""
+        if self.state_store is None:
+            return False
+        snapshot, records = self.state_store.load()
+        if snapshot is None and not records:
+            return False
+        if snapshot is not None:
+            if snapshot.timeframe != self.timeframe:
+                raise ValueError(f"저장된 상태의 시간프레임({snapshot.timeframe})이 런타임({self.timeframe})과 다릅니다.")
+            self.strategy.restore_state(snapshot.strategy_state, self.leverage)
+            account = snapshot.account
+            self.balance = account['balance']
+            self.peak_equity = account['peak_equity']
+            self.max_drawdown = account['max_drawdown']
+            self.bars_processed = account['bars_processed']
+            self.last_prices.update(account['last_prices'])
+            if self.futures is not None and account.get('futures'):
+                self.futures.restore(account['futures'])
+            for symbol, state in snapshot.indicators.items():
+                # 기간 설정이 바뀌었으면 복원하지 않고 새로 워밍업
+                if symbol in self.indicators and state['periods'] == self.indicators[symbol].periods \
+                        and state['atr_period'] == self.atr_period:
+                    self.indicators[symbol] = IncrementalIndicators.from_state(state)
+            self.fills.extend(snapshot.fills)
+            self._restore_orders(snapshot.orders)
+            if self.correlation is not None and snapshot.correlation is not None:
+                self._restore_correlation(snapshot.correlation)
+        for record in records:
+            self._apply_record(record)
+        self.save_state()  # 적용한 WAL을 스냅샷으로 압축
+        logger.info(f"Runtime state restored: {len(self.strategy.positions)} positions, {len(records)} WAL records")
+        return True
+
+    def _apply_record(self, record: Dict[str, Any]):
+        kind, data = record['kind'], record['data']
+        if kind == 'bar':
+            symbol, open_time, high, low, close = data
+            indicators = self.indicators.get(symbol)
+            if indicators is None or (indicators.last_open_time is not None and open_time <= indicators.last_open_time):
+                return
+            indicators.update(open_time, high, low, close)
+            self.last_prices[symbol] = close
+            if self.correlation is not None:
+                self._observe(symbol, open_time, close)
+            if indicators.atr() is not None:
+                self._mark_to_market()
+        elif kind == 'symbol':
+            self._apply_symbol(data)
+        elif kind == 'orders':
+            self._restore_orders(data)
+        elif kind == 'funding':
+            self.balance = data['balance']
+            if self.futures is not None:
+                self.futures.restore(data['futures'])
+
+    def _log_symbol(self, fill: PaperFill):
+        """체결 직후 종목 전략 상태와 잔고를 WAL에 기록"""
+        strategy = self.strategy
+        symbol = fill.symbol
+        position = strategy.get_position(symbol)
+        trade = strategy.trade_history[-1] if fill.action == 'EXIT' and strategy.trade_history else None
+        self.state_store.append('symbol', {
+            'symbol': symbol,
+            'position': position_to_dict(position) if position else None,
+            'trade_id': strategy.active_trade_ids.get(symbol),
+            'last_loss': strategy.last_trade_results.get(symbol),
+            'trade': trade_to_dict(trade) if trade else None,
+            'fill': asdict(fill),
+            'balance': self.balance,
+            'journal_pnl': strategy.journal.cumulative_pnl,
+            'futures': self.futures.get_state() if self.futures is not None else None,
+        })
+
+    def _apply_symbol(self, data: Dict[str, Any]):
+        strategy = self.strategy
+        symbol = data['symbol']
+        if data['position'] is None:
+            strategy.positions.pop(symbol, None)
+        else:
+            strategy.positions[symbol] = position_from_dict(data['position'])
+        strategy.risk.set_position(symbol, strategy.positions.get(symbol), self.leverage)
+        if data['trade_id'] is None:
+            strategy.active_trade_ids.pop(symbol, None)
+        else:
+            strategy.active_trade_ids[symbol] = data['trade_id']
+        if data['last_loss'] is not None:
+            strategy.last_trade_results[symbol] = data['last_loss']
+        if data['trade'] is not None:
+            strategy.trade_history.append(trade_from_dict(data['trade']))
+        self.fills.append(PaperFill(**data['fill']))
+        self.balance = data['balance']
+        strategy.journal.cumulative_pnl = data['journal_pnl']
+        if self.futures is not None and data.get('futures'):
+            self.futures.restore(data['futures'])
+
+    # 주문 상태 (실거래 런타임이 재정의)
+    def _order_state(self) -> Dict[str, Any]:
+        return {}
+
+    def _restore_orders(self, orders: Dict[str, Any]):
+        pass
+
+    async def _resume_orders(self):
+        pass
+
+    def stop(self):
+        """이벤트 루프 중지 요청 (다음 봉 도착 시 종료)"""
+        self.is_running = False
+
+    def summary(self) -> Dict[str, Any]:
+        """계좌/성과/지연 요약"""
+        trades = self.strategy.trade_history
+        return {
+            'balance': self.balance,
+            'equity': self.equity(),
+            'pnl': self.equity() - self.initial_balance,
+            'max_drawdown': self.max_drawdown,
+            'open_positions': len(self.strategy.positions),
+            'total_trades': len(trades),
+            'winning_trades': int((trades.column('pnl') > 0).sum()),
+            'bars_processed': self.bars_processed,
+            'risk': self.strategy.risk.summary(self.balance),
+            'futures': self.futures.summary() if self.futures is not None else None,
+            'latency': self.latency_summary(),
+            'trace': self.tracer.summary(),
+        }
+
+    def latency_summary(self) -> Dict[str, float]:
+        """봉당 판단 지연 (마이크로초, 분위수는 히스토그램 버킷 보간 근사)"""
+        latency = self.latency
+        return {
+            'bars': latency.count,
+            'mean_us': latency.sum / latency.count * 1e6 if latency.count else 0.0,
+            'p50_us': latency.quantile(0.5) * 1e6,
+            'p99_us': latency.quantile(0.99) * 1e6,
+        }
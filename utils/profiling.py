@@ -0,0 +1,135 @@
+"""
+백테스트 핫패스 프로파일링 도구
+구간(phase)별 배타적 실행 시간과 카운터를 저비용으로 수집
+"""
+
+import cProfile
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+
+class PhaseProfiler:
+    """구간별 배타적 시간 측정기
+
+    현재 구간을 하나만 유지하고 구간이 바뀔 때마다 경과 시간을 이전 구간에 누적한다.
+    중첩 구간(enter/leave)은 부모 구간 시간에서 제외되므로 모든 구간 합이 전체 시간과 같다.
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self.totals: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self.counters: Dict[str, int] = {}
+        self._stack: List[str] = []
+        self._current = 'other'
+        self._started = time.perf_counter()
+        self._last = self._started
+
+    def _charge(self, now: float):
+        """경과 시간을 현재 구간에 누적"""
+        phase = self._current
+        self.totals[phase] = self.totals.get(phase, 0.0) + (now - self._last)
+        self._last = now
+
+    def switch(self, phase: str):
+        """현재 구간 전환 (같은 깊이의 순차 구간)"""
+        self._charge(time.perf_counter())
+        self._current = phase
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+
+    def enter(self, phase: str):
+        """중첩 구간 진입"""
+        self._charge(time.perf_counter())
+        self._stack.append(self._current)
+        self._current = phase
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+
+    def leave(self):
+        """중첩 구간 종료 (이전 구간 복귀)"""
+        self._charge(time.perf_counter())
+        self._current = self._stack.pop() if self._stack else 'other'
+
+    @contextmanager
+    def phase(self, phase: str):
+        """중첩 구간 컨텍스트 매니저"""
+        self.enter(phase)
+        try:
+            yield
+        finally:
+            self.leave()
+
+    def count(self, name: str, n: int = 1):
+        """카운터 증가"""
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def summary(self) -> Dict[str, Any]:
+        """구간별 시간/비율과 카운터 요약"""
+        self._charge(time.perf_counter())
+        total = sum(seconds for name, seconds in self.totals.items() if self.calls.get(name, 0) > 0)
+        phases = {
+            name: {
+                'seconds': seconds,
+                'calls': self.calls.get(name, 0),
+                'share': seconds / total if total > 0 else 0.0,
+            }
+            for name, seconds in sorted(self.totals.items(), key=lambda x: -x[1])
+            if self.calls.get(name, 0) > 0  # 첫 구간 진입 전 대기 시간 제외
+        }
+        return {
+            'total_seconds': total,
+            'phases': phases,
+            'counters': dict(self.counters),
+        }
+
+
+class NullProfiler:
+    """비활성 프로파일러 (모든 호출이 no-op)"""
+
+    enabled = False
+
+    def switch(self, phase: str):
+        pass
+
+    def enter(self, phase: str):
+        pass
+
+    def leave(self):
+        pass
+
+    @contextmanager
+    def phase(self, phase: str):
+        yield
+
+    def count(self, name: str, n: int = 1):
+        pass
+
+    def summary(self) -> Dict[str, Any]:
+        return {}
+
+
+NULL_PROFILER = NullProfiler()
+
+
+def create_profiler(enabled: bool):
+    """설정 플래그에 따라 프로파일러 생성"""
+    return PhaseProfiler() if enabled else NULL_PROFILER
+
+
+@contextmanager
+def cprofile_to(path: Optional[str]):
+    """cProfile 프로파일을 pstats 파일로 저장 (snakeviz, gprof2dot, speedscope 등에서 열람 가능)"""
+    if not path:
+        yield None
+        return
+
+    profile = cProfile.Profile()
+    profile.enable()
+    try:
+        yield profile
+    finally:
+        profile.disable()
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        profile.dump_stats(path)
@@ -0,0 +1,86 @@
+"""
+백테스트 진행률 스트리밍
+시뮬레이션 루프에서 발생하는 진행 상황을 최소 간격으로 병합하여 콜백으로 전달
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+
+@dataclass
+class BacktestProgress:
+    """백테스트 진행 상황 스냅샷"""
+    bars_processed: int
+    total_bars: int
+    trades: int
+    equity: float
+    elapsed: float
+    eta_seconds: Optional[float] = None
+    done: bool = False
+
+    @property
+    def fraction(self) -> float:
+        """진행 비율 (0~1)"""
+        return self.bars_processed / self.total_bars if self.total_bars > 0 else 1.0
+
+    @property
+    def bars_per_sec(self) -> float:
+        """처리 속도"""
+        return self.bars_processed / self.elapsed if self.elapsed > 0 else 0.0
+
+
+ProgressCallback = Callable[[BacktestProgress], None]
+
+
+class ProgressThrottle:
+    """진행률 업데이트 병합기
+
+    매 봉 호출되지만 시계는 check_every 봉마다 한 번만 확인하고,
+    마지막 전송 후 min_interval 초가 지났을 때만 콜백을 호출한다.
+    그 사이의 업데이트는 버려지므로(최신 값만 전달) UI가 봉 단위 업데이트로 넘치지 않는다.
+    """
+
+    def __init__(self, callback: ProgressCallback, total_bars: int,
+                 min_interval: float = 0.1, check_every: int = 64):
+        self.callback = callback
+        self.total_bars = total_bars
+        self.min_interval = min_interval
+        # 2의 거듭제곱 마스크로 나머지 연산 없이 확인 주기 판정
+        self._mask = max(1, 1 << (max(1, check_every) - 1).bit_length()) - 1
+        self._started = time.perf_counter()
+        self._last_emit = float('-inf')  # 첫 확인 시점에는 바로 전송
+        self.emitted = 0
+
+    def tick(self, bars_processed: int, trades: int, equity: float) -> bool:
+        """진행 상황 보고 (콜백이 호출되었으면 True)"""
+        if bars_processed & self._mask:
+            return False
+
+        now = time.perf_counter()
+        if now - self._last_emit < self.min_interval:
+            return False
+
+        self._emit(now, bars_processed, trades, equity, done=False)
+        return True
+
+    def finish(self, bars_processed: int, trades: int, equity: float):
+        """최종 진행 상황 보고 (간격과 무관하게 항상 전송)"""
+        self._emit(time.perf_counter(), bars_processed, trades, equity, done=True)
+
+    def _emit(self, now: float, bars_processed: int, trades: int, equity: float, done: bool):
+        elapsed = now - self._started
+        remaining = self.total_bars - bars_processed
+        eta = (elapsed / bars_processed) * remaining if bars_processed > 0 else None
+
+        self._last_emit = now
+        self.emitted += 1
+        self.callback(BacktestProgress(
+            bars_processed=bars_processed,
+            total_bars=self.total_bars,
+            trades=trades,
+            equity=equity,
+            elapsed=elapsed,
+            eta_seconds=0.0 if done else eta,
+            done=done
+        ))
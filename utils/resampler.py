@@ -0,0 +1,197 @@
+"""
+멀티 타임프레임 리샘플러
+저장된 1분봉에서 상위 타임프레임 캔들을 벡터화된 그룹 집계로 만들고 타임프레임별 파티션에 캐시
+"""
+
+import json
+import os
+import shutil
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+from utils.kline_store import KlineStore, KLINE_COLUMNS
+from utils.timeaxis import DAY_MS, MINUTE_MS
+
+BASE_TIMEFRAME = '1m'
+STATE_FILE = '_resample.json'
+
+WEEK_MS = 7 * DAY_MS
+WEEK_OFFSET_MS = 4 * DAY_MS  # 1970-01-01은 목요일이므로 첫 월요일(01-05)까지의 간격
+
+# 고정 길이 타임프레임 (ms)
+FIXED_TIMEFRAME_MS = {
+    '1m': MINUTE_MS,
+    '5m': 5 * MINUTE_MS,
+    '15m': 15 * MINUTE_MS,
+    '1h': 60 * MINUTE_MS,
+    '4h': 240 * MINUTE_MS,
+    '1d': DAY_MS,
+}
+
+SUPPORTED_TIMEFRAMES = tuple(FIXED_TIMEFRAME_MS) + ('1w', '1M')
+
+
+def bucket_starts(open_time: np.ndarray, timeframe: str) -> np.ndarray:
+    """각 1분봉이 속한 상위 타임프레임 봉의 시작 시각 (UTC epoch ms, 바이낸스 정렬 기준)"""
+    if timeframe in FIXED_TIMEFRAME_MS:
+        step = FIXED_TIMEFRAME_MS[timeframe]
+        return open_time - open_time % step
+    if timeframe == '1w':
+        # 주봉은 월요일 00:00 UTC 시작
+        return open_time - (open_time - WEEK_OFFSET_MS) % WEEK_MS
+    if timeframe == '1M':
+        months = open_time.astype('datetime64[ms]').astype('datetime64[M]')
+        return months.astype('datetime64[ms]').astype(np.int64)
+    raise ValueError(f"지원하지 않는 시간프레임: {timeframe}")
+
+
+def bucket_ends(open_time: np.ndarray, timeframe: str) -> np.ndarray:
+    """봉 시작 시각에 대응하는 마감 시각 (다음 봉 시작 시각, UTC epoch ms)"""
+    if timeframe in FIXED_TIMEFRAME_MS:
+        return open_time + FIXED_TIMEFRAME_MS[timeframe]
+    if timeframe == '1w':
+        return bucket_starts(open_time, timeframe) + WEEK_MS
+    if timeframe == '1M':
+        months = open_time.astype('datetime64[ms]').astype('datetime64[M]') + 1
+        return months.astype('datetime64[ms]').astype(np.int64)
+    raise ValueError(f"지원하지 않는 시간프레임: {timeframe}")
+
+
+def timeframe_rank(timeframe: str) -> int:
+    """타임프레임 길이 순서 (작을수록 짧음)"""
+    if timeframe not in SUPPORTED_TIMEFRAMES:
+        raise ValueError(f"지원하지 않는 시간프레임: {timeframe}")
+    return SUPPORTED_TIMEFRAMES.index(timeframe)
+
+
+def resample_columns(columns: Dict[str, np.ndarray], timeframe: str) -> Dict[str, np.ndarray]:
+    """시간순 정렬된 하위 타임프레임 컬럼을 상위 타임프레임으로 집계"""
+    open_time = columns['open_time']
+    if len(open_time) == 0:
+        return {name: col[:0] for name, col in columns.items()}
+
+    buckets = bucket_starts(open_time, timeframe)
+    starts = np.concatenate([[0], np.flatnonzero(np.diff(buckets)) + 1])
+    ends = np.concatenate([starts[1:], [len(open_time)]])
+    return {
+        'open_time': buckets[starts],
+        'open': columns['open'][starts],
+        'high': np.maximum.reduceat(columns['high'], starts),
+        'low': np.minimum.reduceat(columns['low'], starts),
+        'close': columns['close'][ends - 1],
+        'volume': np.add.reduceat(columns['volume'], starts),
+    }
+
+
+class Resampler:
+    """1분봉 기반 타임프레임 리샘플러
+
+    결과는 같은 KlineStore의 {symbol}/{timeframe}/ 파티션에 캐시된다. update()는 캐시된 마지막
+    봉(미완성일 수 있음)의 시작 시각 이후 1분봉만 다시 집계하므로, 새 1분봉이 추가될 때
+    전체 이력을 다시 읽지 않는다. 1분봉 파티션은 한 번에 하나씩 읽고, 파티션 경계에 걸친
+    마지막 그룹의 행만 다음 파티션으로 넘긴다. 마지막으로 반영한 1분봉 시각을 기록해 두어
+    새 1분봉이 없으면 파티션을 다시 쓰지 않는다(실행 캐시 지문 유지).
+    """
+
+    def __init__(self, store: Optional[KlineStore] = None, base_timeframe: str = BASE_TIMEFRAME):
+        self.store = store or KlineStore()
+        self.base_timeframe = base_timeframe
+
+    def has_base(self, symbol: str, start, end) -> bool:
+        """구간의 1분봉 파티션이 모두 있는지 여부"""
+        return self.store.covers(symbol, self.base_timeframe, start, end)
+
+    def last_open_time(self, symbol: str, timeframe: str) -> Optional[int]:
+        """캐시된 마지막 봉의 시작 시각 (없으면 None)"""
+        months = self.store.available_months(symbol, timeframe)
+        if not months:
+            return None
+        part = self.store.read_partition(self.store.partition_path(symbol, timeframe, months[-1]))
+        return int(part['open_time'][-1]) if len(part['open_time']) else None
+
+    def _state_path(self, symbol: str, timeframe: str) -> str:
+        return os.path.join(self.store.root, symbol, timeframe, STATE_FILE)
+
+    def _load_state(self, symbol: str, timeframe: str) -> Dict[str, int]:
+        path = self._state_path(symbol, timeframe)
+        if not os.path.exists(path):
+            return {}
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _save_state(self, symbol: str, timeframe: str, state: Dict[str, int]):
+        path = self._state_path(symbol, timeframe)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+
+    def _base_chunks(self, symbol: str, since: Optional[int]) -> Iterator[Dict[str, np.ndarray]]:
+        """since(ms) 이후 1분봉을 파티션 단위로 반환"""
+        months = self.store.available_months(symbol, self.base_timeframe)
+        if since is not None:
+            first_month = np.datetime_as_string(np.datetime64(since, 'ms'), unit='M')
+            months = [m for m in months if m >= first_month]
+        for month in months:
+            part = self.store.read_partition(self.store.partition_path(symbol, self.base_timeframe, month))
+            if since is not None:
+                mask = part['open_time'] >= since
+                part = {name: col[mask] for name, col in part.items()}
+            if len(part['open_time']):
+                yield part
+
+    def update(self, symbol: str, timeframe: str) -> int:
+        """캐시를 최신 1분봉까지 증분 갱신하고 기록한 봉 수 반환"""
+        if timeframe == self.base_timeframe:
+            return 0
+        if timeframe not in SUPPORTED_TIMEFRAMES:
+            raise ValueError(f"지원하지 않는 시간프레임: {timeframe}")
+
+        base_last = self.last_open_time(symbol, self.base_timeframe)
+        if base_last is None:
+            return 0
+        if self._load_state(symbol, timeframe).get('base_last_open_time') == base_last:
+            return 0
+
+        # 마지막 봉은 미완성이었을 수 있으므로 그 봉의 시작 시각부터 다시 집계
+        since = self.last_open_time(symbol, timeframe)
+        written = 0
+        carry: Optional[Dict[str, np.ndarray]] = None
+        for chunk in self._base_chunks(symbol, since):
+            if carry is not None:
+                chunk = {name: np.concatenate([carry[name], chunk[name]]) for name in KLINE_COLUMNS}
+            bars = resample_columns(chunk, timeframe)
+
+            # 마지막 그룹은 다음 파티션에 이어질 수 있으므로 원본 행을 넘겨서 다시 집계
+            last_start = bars['open_time'][-1]
+            tail = bucket_starts(chunk['open_time'], timeframe) == last_start
+            carry = {name: col[tail] for name, col in chunk.items()}
+            complete = {name: col[:-1] for name, col in bars.items()}
+            if len(complete['open_time']):
+                self.store.write_columns(symbol, timeframe, complete)
+                written += len(complete['open_time'])
+
+        if carry is not None:
+            self.store.write_columns(symbol, timeframe, resample_columns(carry, timeframe))
+            written += 1
+        self._save_state(symbol, timeframe, {'base_last_open_time': base_last})
+        return written
+
+    def rebuild(self, symbol: str, timeframe: str) -> int:
+        """캐시를 지우고 전체 1분봉에서 다시 집계 (과거 1분봉이 수정된 경우)"""
+        directory = os.path.join(self.store.root, symbol, timeframe)
+        if timeframe != self.base_timeframe and os.path.isdir(directory):
+            shutil.rmtree(directory)
+        return self.update(symbol, timeframe)
+
+    def update_all(self, symbol: str, timeframes: List[str]) -> Dict[str, int]:
+        """여러 타임프레임 일괄 갱신"""
+        return {tf: self.update(symbol, tf) for tf in timeframes
+                if tf != self.base_timeframe and tf in SUPPORTED_TIMEFRAMES}
+
+    def ensure(self, symbol: str, timeframe: str, start, end) -> bool:
+        """구간 캔들이 최신 1분봉 기준으로 캐시되어 있도록 보장 (1분봉이 구간을 포함하지 않으면 False)"""
+        if timeframe not in SUPPORTED_TIMEFRAMES or not self.has_base(symbol, start, end):
+            return False
+        self.update(symbol, timeframe)
+        return True
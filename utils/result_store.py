@@ -0,0 +1,285 @@
+"""
+백테스트 결과 저장소
+메타데이터/지표는 작은 JSON으로, 자산 곡선·드로다운·거래 배열은 압축 컬럼형 바이너리로 저장하고
+무거운 배열은 뷰가 필요로 할 때만 지연 로드
+"""
+
+import json
+import os
+import shutil
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from config import DataConfig
+from utils.timeaxis import from_ms_array, to_ms
+
+STORE_VERSION = 2
+STORE_DIR = os.path.join(DataConfig.BACKTEST_RESULTS_DIR, 'store')
+INDEX_FILE = 'index.json'
+META_FILE = 'meta.json'
+COLUMNS_FILE = 'columns.npz'
+
+# 거래 컬럼 정의 (수치형 / 범주형 / 시각)
+TRADE_FLOAT_FIELDS = ('entry_price', 'exit_price', 'size', 'pnl')
+TRADE_CATEGORY_FIELDS = ('symbol', 'direction', 'exit_reason')
+TRADE_DATE_FIELDS = ('entry_date', 'exit_date')
+
+
+def _field(record: Any, name: str, default: Any = None) -> Any:
+    """TradeResult 객체와 딕셔너리 모두에서 필드 조회"""
+    if isinstance(record, dict):
+        return record.get(name, default)
+    return getattr(record, name, default)
+
+
+NAT_MS = np.iinfo(np.int64).min  # 시각 없음 (datetime64 NaT와 같은 값)
+
+
+def _to_ms_column(values: Iterable[Any]) -> np.ndarray:
+    """datetime/문자열/epoch ms 시각을 int64 epoch ms 컬럼으로 변환 (없으면 NAT_MS)"""
+    return np.array([to_ms(v) if v is not None and v != '' else NAT_MS for v in values], dtype=np.int64)
+
+
+def _decode_times(column: np.ndarray) -> np.ndarray:
+    """시각 컬럼을 epoch ms로 정규화 (버전 1은 datetime64[s]로 저장됨)"""
+    if np.issubdtype(column.dtype, np.datetime64):
+        return column.astype('datetime64[ms]').astype(np.int64)
+    return np.asarray(column, dtype=np.int64)
+
+
+def _encode_categories(values: List[str]):
+    """범주형 문자열을 (범주 목록, int16 코드)로 인코딩"""
+    if not values:
+        return [], np.zeros(0, dtype=np.int16)
+    categories, codes = np.unique(np.array(values, dtype=str), return_inverse=True)
+    return categories.tolist(), codes.astype(np.int16)
+
+
+def _write_json(path: str, data: Any):
+    """JSON을 원자적으로 기록"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+    os.replace(tmp_path, path)
+
+
+class StoredRun:
+    """저장된 백테스트 실행 (메타데이터만 즉시 로드, 컬럼은 최초 접근 시 로드)"""
+
+    def __init__(self, path: str, meta: Dict[str, Any]):
+        self.path = path
+        self.meta = meta
+        self._columns: Dict[str, np.ndarray] = {}
+        self._npz = None
+
+    @property
+    def run_id(self) -> str:
+        return self.meta['run_id']
+
+    @property
+    def n_equity(self) -> int:
+        return self.meta['counts']['equity']
+
+    @property
+    def n_trades(self) -> int:
+        return self.meta['counts']['trades']
+
+    @property
+    def loaded_columns(self) -> List[str]:
+        """지금까지 로드된 컬럼 이름"""
+        return sorted(self._columns)
+
+    def column(self, name: str) -> np.ndarray:
+        """컬럼 지연 로드 (npy는 메모리 맵, npz는 해당 멤버만 압축 해제)"""
+        array = self._columns.get(name)
+        if array is None:
+            if self.meta['format'] == 'npz':
+                if self._npz is None:
+                    self._npz = np.load(os.path.join(self.path, COLUMNS_FILE))
+                array = self._npz[name]
+            else:
+                array = np.load(os.path.join(self.path, f"{name}.npy"), mmap_mode='r')
+            self._columns[name] = array
+        return array
+
+    def close(self):
+        """열린 파일 핸들 해제"""
+        if self._npz is not None:
+            self._npz.close()
+            self._npz = None
+        self._columns.clear()
+
+    def equity_curve(self) -> List[Dict[str, Any]]:
+        """엔진 형식의 자산 곡선 ({'date': epoch ms, 'total_value'} 리스트)"""
+        times = _decode_times(self.column('equity_date')).tolist()
+        values = self.column('equity_value').tolist()
+        return [{'date': t, 'total_value': v} for t, v in zip(times, values)]
+
+    def trade_records(self, start: int = 0, stop: Optional[int] = None) -> List[Dict[str, Any]]:
+        """거래 구간을 딕셔너리 리스트로 디코딩 (datetime 복원)"""
+        stop = self.n_trades if stop is None else min(stop, self.n_trades)
+        if start >= stop:
+            return []
+
+        columns: Dict[str, List[Any]] = {}
+        for name in TRADE_FLOAT_FIELDS:
+            columns[name] = self.column(f"trade_{name}")[start:stop].tolist()
+        columns['system'] = self.column('trade_system')[start:stop].tolist()
+        for name in TRADE_CATEGORY_FIELDS:
+            categories = self.meta['categories'][name]
+            columns[name] = [categories[c] for c in self.column(f"trade_{name}")[start:stop].tolist()]
+        for name in TRADE_DATE_FIELDS:
+            columns[name] = from_ms_array(_decode_times(self.column(f"trade_{name}")[start:stop]))
+
+        return [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+
+class ResultStore:
+    """백테스트 결과 저장소
+
+    실행마다 디렉토리를 만들어 meta.json(설정, 지표, 월별 수익률, 컬럼 정보)과
+    컬럼 파일을 저장하고, 루트의 index.json에 목록용 요약을 유지한다.
+    compress=True이면 컬럼을 하나의 압축 npz로, False이면 메모리 맵 가능한 컬럼별 npy로 저장한다.
+    """
+
+    def __init__(self, root: str = STORE_DIR, compress: bool = True):
+        self.root = root
+        self.compress = compress
+
+    def _run_path(self, run_id: str) -> str:
+        return os.path.join(self.root, run_id)
+
+    def _new_run_id(self, results: Any) -> str:
+        config = results.config
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        return f"{config.symbol}_{config.timeframe}_{timestamp}_{uuid.uuid4().hex[:6]}"
+
+    def save(self, results: Any, run_id: Optional[str] = None) -> str:
+        """결과 저장 후 실행 ID 반환"""
+        run_id = run_id or self._new_run_id(results)
+        path = self._run_path(run_id)
+        os.makedirs(path, exist_ok=True)
+
+        columns, categories = self._build_columns(results)
+        if self.compress:
+            np.savez_compressed(os.path.join(path, COLUMNS_FILE), **columns)
+        else:
+            for name, array in columns.items():
+                np.save(os.path.join(path, f"{name}.npy"), array)
+
+        metrics = results.metrics.to_dict()
+        meta = {
+            'version': STORE_VERSION,
+            'run_id': run_id,
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'format': 'npz' if self.compress else 'npy',
+            'config': results.config.to_dict(),
+            'start_date': results.start_date,
+            'end_date': results.end_date,
+            'initial_balance': results.initial_balance,
+            'final_balance': results.final_balance,
+            'metrics': metrics,
+            'monthly_returns': results.monthly_returns,
+            'timing': results.timing,
+            'futures': getattr(results, 'futures', {}),
+            'costs': getattr(results, 'costs', {}),
+            'counts': {
+                'equity': int(len(columns['equity_value'])),
+                'trades': int(len(columns['trade_pnl'])),
+            },
+            'categories': categories,
+        }
+        _write_json(os.path.join(path, META_FILE), meta)
+        self._update_index(run_id, self._summary(meta))
+        return run_id
+
+    def _build_columns(self, results: Any):
+        """결과 객체를 컬럼 배열로 변환"""
+        equity = results.equity_curve
+        if equity and isinstance(equity[0], dict):
+            dates = [p['date'] for p in equity]
+            values = [p['total_value'] for p in equity]
+        else:
+            dates = []
+            values = list(equity)
+
+        trades = results.trades
+        columns: Dict[str, np.ndarray] = {
+            'equity_date': _to_ms_column(dates),
+            'equity_value': np.asarray(values, dtype=np.float64),
+            'drawdown': np.asarray(results.drawdown_curve, dtype=np.float64),
+            'daily_returns': np.asarray(results.daily_returns, dtype=np.float64),
+            'trade_system': np.array([_field(t, 'system', 0) for t in trades], dtype=np.int8),
+        }
+        for name in TRADE_FLOAT_FIELDS:
+            columns[f"trade_{name}"] = np.array([_field(t, name, 0.0) for t in trades], dtype=np.float64)
+        for name in TRADE_DATE_FIELDS:
+            columns[f"trade_{name}"] = _to_ms_column(_field(t, name) for t in trades)
+
+        categories: Dict[str, List[str]] = {}
+        for name in TRADE_CATEGORY_FIELDS:
+            categories[name], columns[f"trade_{name}"] = _encode_categories(
+                [str(_field(t, name, '')) for t in trades])
+
+        return columns, categories
+
+    @staticmethod
+    def _summary(meta: Dict[str, Any]) -> Dict[str, Any]:
+        """목록 표시용 요약"""
+        config = meta['config']
+        metrics = meta['metrics']
+        return {
+            'run_id': meta['run_id'],
+            'created_at': meta['created_at'],
+            'symbol': config.get('symbol'),
+            'timeframe': config.get('timeframe'),
+            'start_date': meta['start_date'],
+            'end_date': meta['end_date'],
+            'initial_balance': meta['initial_balance'],
+            'final_balance': meta['final_balance'],
+            'total_return': metrics.get('total_return', 0.0),
+            'max_drawdown': metrics.get('max_drawdown', 0.0),
+            'total_trades': meta['counts']['trades'],
+        }
+
+    def _index_path(self) -> str:
+        return os.path.join(self.root, INDEX_FILE)
+
+    def _update_index(self, run_id: str, summary: Optional[Dict[str, Any]]):
+        """인덱스 항목 추가/교체 (summary가 None이면 삭제)"""
+        entries = [e for e in self.list_runs() if e['run_id'] != run_id]
+        if summary is not None:
+            entries.append(summary)
+        entries.sort(key=lambda e: e['created_at'], reverse=True)
+        os.makedirs(self.root, exist_ok=True)
+        _write_json(self._index_path(), entries)
+
+    def list_runs(self) -> List[Dict[str, Any]]:
+        """저장된 실행 목록 (최신순, 컬럼 파일은 열지 않음)"""
+        path = self._index_path()
+        if not os.path.exists(path):
+            return []
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def load(self, run_id: str) -> Optional[StoredRun]:
+        """실행 로드 (메타데이터만 읽음)"""
+        path = self._run_path(run_id)
+        meta_path = os.path.join(path, META_FILE)
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        return StoredRun(path, meta)
+
+    def delete(self, run_id: str) -> bool:
+        """실행 삭제"""
+        path = self._run_path(run_id)
+        if not os.path.isdir(path):
+            return False
+        shutil.rmtree(path)
+        self._update_index(run_id, None)
+        return True
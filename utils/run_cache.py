@@ -0,0 +1,152 @@
+"""
+백테스트 실행 캐시
+설정, 전략 상수, 입력 데이터 지문의 해시를 키로 결과를 저장하여 동일한 실행을 즉시 반환
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from typing import Any, Dict, Optional
+
+from config import BacktestConfig, DataConfig, TradingConfig
+from utils.checkpoint import RUNTIME_ONLY_KEYS
+from utils.result_store import ResultStore, StoredRun
+
+CACHE_VERSION = 3
+MANIFEST_FILE = 'manifest.json'
+
+
+def strategy_constants() -> Dict[str, Any]:
+    """결과에 영향을 주는 TradingConfig 상수"""
+    return {name: getattr(TradingConfig, name) for name in dir(TradingConfig)
+            if name.isupper() and not callable(getattr(TradingConfig, name))}
+
+
+def run_key(config_dict: Dict[str, Any], data_fingerprint: str) -> str:
+    """실행 캐시 키 (설정 + 전략 상수 + 데이터 지문)"""
+    payload = json.dumps({
+        'version': CACHE_VERSION,
+        'config': {k: v for k, v in config_dict.items() if k not in RUNTIME_ONLY_KEYS},
+        'strategy': strategy_constants(),
+        'data': data_fingerprint,
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:24]
+
+
+def _dir_size(path: str) -> int:
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for name in filenames:
+            total += os.path.getsize(os.path.join(dirpath, name))
+    return total
+
+
+class RunCache:
+    """디스크 용량 기반 LRU 실행 캐시
+
+    결과는 ResultStore 형식으로 {root}/runs/{key}/ 에 저장하고, manifest.json에
+    크기/마지막 접근 시각/데이터 범위(scope)/데이터 지문을 기록한다.
+    같은 데이터 범위의 지문이 바뀌면(파티션 갱신) 해당 범위의 이전 항목을 모두 무효화한다.
+    """
+
+    def __init__(self, root: str = DataConfig.RUN_CACHE_DIR,
+                 max_bytes: int = BacktestConfig.RUN_CACHE_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.store = ResultStore(os.path.join(root, 'runs'))
+        self._manifest_path = os.path.join(root, MANIFEST_FILE)
+        self._manifest: Optional[Dict[str, Dict[str, Any]]] = None
+
+    # 매니페스트 관리
+    @property
+    def manifest(self) -> Dict[str, Dict[str, Any]]:
+        if self._manifest is None:
+            if os.path.exists(self._manifest_path):
+                with open(self._manifest_path, 'r', encoding='utf-8') as f:
+                    self._manifest = json.load(f)
+            else:
+                self._manifest = {}
+        return self._manifest
+
+    def _save_manifest(self):
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = f"{self._manifest_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(tmp_path, self._manifest_path)
+
+    def _remove(self, key: str):
+        self.manifest.pop(key, None)
+        self.store.delete(key)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(entry['size'] for entry in self.manifest.values())
+
+    # 조회/저장
+    def get(self, key: str, scope: Optional[str] = None,
+            data_fingerprint: Optional[str] = None) -> Optional[StoredRun]:
+        """캐시 조회 (적중 시 마지막 접근 시각 갱신)"""
+        if scope is not None and data_fingerprint is not None:
+            self.invalidate_stale(scope, data_fingerprint)
+
+        if key not in self.manifest:
+            return None
+        run = self.store.load(key)
+        if run is None:
+            # 파일이 지워진 항목 정리
+            self._remove(key)
+            self._save_manifest()
+            return None
+
+        self.manifest[key]['last_access'] = time.time()
+        self.manifest[key]['hits'] = self.manifest[key].get('hits', 0) + 1
+        self._save_manifest()
+        return run
+
+    def put(self, key: str, results: Any, scope: Optional[str] = None,
+            data_fingerprint: Optional[str] = None) -> str:
+        """결과 저장 후 용량 초과분 LRU 제거"""
+        if scope is not None and data_fingerprint is not None:
+            self.invalidate_stale(scope, data_fingerprint)
+
+        self.store.save(results, run_id=key)
+        now = time.time()
+        self.manifest[key] = {
+            'size': _dir_size(os.path.join(self.store.root, key)),
+            'created_at': now,
+            'last_access': now,
+            'hits': 0,
+            'scope': scope,
+            'data_fingerprint': data_fingerprint,
+        }
+        self._evict(keep=key)
+        self._save_manifest()
+        return key
+
+    def _evict(self, keep: Optional[str] = None):
+        """디스크 예산을 넘으면 가장 오래 사용하지 않은 항목부터 제거"""
+        by_age = sorted((k for k in self.manifest if k != keep),
+                        key=lambda k: self.manifest[k]['last_access'])
+        for key in by_age:
+            if self.total_bytes <= self.max_bytes:
+                break
+            self._remove(key)
+
+    def invalidate_stale(self, scope: str, data_fingerprint: str) -> int:
+        """같은 데이터 범위에서 지문이 다른(데이터가 바뀐) 항목 무효화"""
+        stale = [k for k, e in self.manifest.items()
+                 if e.get('scope') == scope and e.get('data_fingerprint') != data_fingerprint]
+        for key in stale:
+            self._remove(key)
+        if stale:
+            self._save_manifest()
+        return len(stale)
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        if os.path.isdir(self.root):
+            shutil.rmtree(self.root)
+        self._manifest = {}
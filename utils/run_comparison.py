@@ -0,0 +1,204 @@
+"""
+백테스트 실행 비교
+저장된 여러 실행의 자산 곡선만 지연 로드하여 공통 시간축에 정렬하고, 상대 지표와 상관관계를 행렬 연산으로 계산
+"""
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from utils.result_store import ResultStore, StoredRun, _decode_times
+from utils.timeaxis import bucket_ms
+
+# 시간축 단위별 연간 구간 수 (샤프/추적오차 연환산)
+PERIODS_PER_YEAR = {'h': 365 * 24, 'D': 365, 'W': 52, 'M': 12}
+
+# 순위 기준별 정렬 방향 (True: 클수록 좋음)
+RANK_ORDER = {
+    'total_return': True,
+    'sharpe': True,
+    'volatility': False,
+    'max_drawdown': False,
+    'excess_return': True,
+    'information_ratio': True,
+    'correlation': False,
+}
+
+
+def _last_per_bucket(times: np.ndarray, values: np.ndarray, unit: str):
+    """버킷별 마지막 값 (시각 오름차순 입력)"""
+    buckets = bucket_ms(times, unit)
+    last = np.flatnonzero(np.append(buckets[1:] != buckets[:-1], True))
+    return buckets[last], values[last]
+
+
+def pairwise_correlation(returns: np.ndarray) -> np.ndarray:
+    """NaN이 있는 행별 수익률의 쌍별 상관계수 (두 행이 모두 있는 구간만 사용)
+
+    유효 마스크 M과 0으로 채운 수익률 X로 겹치는 표본 수 M·Mᵀ, 부분합 X·Mᵀ, 제곱합 X²·Mᵀ, 교차합 X·Xᵀ를
+    행렬곱 네 번으로 구해 모든 쌍을 한 번에 계산한다.
+    """
+    valid = ~np.isnan(returns)
+    mask = valid.astype(np.float64)
+    x = np.where(valid, returns, 0.0)
+    count = mask @ mask.T
+    sums = x @ mask.T                     # [i, j] = 겹치는 구간의 i 합
+    squares = (x * x) @ mask.T
+    cross = x @ x.T
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean_i = sums / count
+        mean_j = mean_i.T
+        cov = cross / count - mean_i * mean_j
+        var_i = squares / count - mean_i ** 2
+        corr = cov / np.sqrt(var_i * var_i.T)
+    corr[count < 2] = np.nan
+    np.clip(corr, -1.0, 1.0, out=corr)
+    return corr
+
+
+class RunComparison:
+    """저장된 실행 N개 비교
+
+    실행마다 메타데이터와 자산 곡선 컬럼(equity_date, equity_value)만 읽어 unit(기본 일) 버킷의 마지막
+    값으로 줄이고 컬럼 핸들을 바로 닫으므로, 거래 컬럼은 열지 않고 메모리에는 (실행 수 × 버킷 수) 행렬
+    하나만 남는다. 각 실행의 첫/마지막 버킷 사이는 직전 값으로 채우고 구간 밖은 NaN으로 둔다.
+    지표는 행렬 전체에 대해 벡터화하여 계산하며, 상대 지표는 baseline 실행(기본: 첫 실행) 기준이다.
+    """
+
+    def __init__(self, runs: List[StoredRun], unit: str = 'D', baseline: Optional[str] = None):
+        if unit not in PERIODS_PER_YEAR:
+            raise ValueError(f"지원하지 않는 단위: {unit}")
+        if not runs:
+            raise ValueError("비교할 실행이 없습니다.")
+        self.unit = unit
+        self.meta = [run.meta for run in runs]
+        self.run_ids = [run.run_id for run in runs]
+        self.baseline = self.run_ids.index(baseline) if baseline is not None else 0
+        self.times, self.values = self._align(runs)
+        self._metrics: Optional[Dict[str, np.ndarray]] = None
+
+    @classmethod
+    def from_store(cls, store: ResultStore, run_ids: Optional[List[str]] = None, unit: str = 'D',
+                   baseline: Optional[str] = None) -> 'RunComparison':
+        """저장소의 실행 비교 (run_ids를 생략하면 전체, 없는 실행은 건너뜀)"""
+        if run_ids is None:
+            run_ids = [entry['run_id'] for entry in store.list_runs()]
+        runs = [run for run in (store.load(run_id) for run_id in run_ids) if run is not None]
+        return cls(runs, unit, baseline)
+
+    def _align(self, runs: List[StoredRun]):
+        """자산 곡선을 공통 버킷 시간축 (실행 수 × 버킷 수) 행렬로 정렬"""
+        curves = []
+        for run in runs:
+            if run.n_equity:
+                times = _decode_times(run.column('equity_date'))
+                curves.append(_last_per_bucket(times, np.asarray(run.column('equity_value')), self.unit))
+            else:
+                curves.append((np.zeros(0, dtype=np.int64), np.zeros(0)))
+            run.close()
+
+        grid = np.unique(np.concatenate([b for b, _ in curves])) if curves else np.zeros(0, dtype=np.int64)
+        n, t = len(curves), len(grid)
+        values = np.full((n, t), np.nan)
+        first = np.full(n, t, dtype=np.int64)
+        last = np.full(n, -1, dtype=np.int64)
+        for k, (buckets, v) in enumerate(curves):
+            if len(buckets):
+                positions = np.searchsorted(grid, buckets)
+                values[k, positions] = v
+                first[k], last[k] = positions[0], positions[-1]
+
+        # 실행 구간 안의 빈 버킷은 직전 값으로 채움
+        columns = np.arange(t)
+        filled = np.where(~np.isnan(values), columns, 0)
+        np.maximum.accumulate(filled, axis=1, out=filled)
+        values = values[np.arange(n)[:, None], filled]
+        values[(columns < first[:, None]) | (columns > last[:, None])] = np.nan
+        self._first, self._last = first, last
+        return grid, values
+
+    def __len__(self) -> int:
+        return len(self.run_ids)
+
+    def returns(self) -> np.ndarray:
+        """버킷 수익률 행렬 (실행 수 × (버킷 수 - 1), 구간 밖은 NaN)"""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return self.values[:, 1:] / self.values[:, :-1] - 1.0
+
+    def correlation(self) -> np.ndarray:
+        """실행 간 버킷 수익률 상관행렬"""
+        return pairwise_correlation(self.returns())
+
+    def metrics(self) -> Dict[str, np.ndarray]:
+        """실행별 지표 배열 (이름 -> 길이 N 배열)"""
+        if self._metrics is not None:
+            return self._metrics
+        n = len(self.run_ids)
+        values = self.values
+        has_curve = np.flatnonzero(self._last >= 0)
+        start, end = np.full(n, np.nan), np.full(n, np.nan)
+        start[has_curve] = values[has_curve, self._first[has_curve]]
+        end[has_curve] = values[has_curve, self._last[has_curve]]
+
+        returns = self.returns()
+        annual = np.sqrt(PERIODS_PER_YEAR[self.unit])
+        with np.errstate(invalid='ignore', divide='ignore'):
+            total_return = end / start - 1.0
+            counts = (~np.isnan(returns)).sum(axis=1)
+            mean = np.where(counts > 0, np.nansum(returns, axis=1) / np.maximum(counts, 1), np.nan)
+            std = np.sqrt(np.nansum((returns - mean[:, None]) ** 2, axis=1) / np.maximum(counts, 1))
+            std[counts == 0] = np.nan
+            sharpe = np.where(std > 0, mean / std * annual, 0.0)
+            sharpe[counts == 0] = np.nan
+
+            peak = np.fmax.accumulate(values, axis=1)
+            max_drawdown = np.fmax.reduce(1.0 - values / peak, axis=1, initial=np.nan) if values.shape[1] \
+                else np.full(n, np.nan)
+
+            # baseline 대비 상대 지표
+            active = returns - returns[self.baseline]
+            active_counts = (~np.isnan(active)).sum(axis=1)
+            active_mean = np.nansum(active, axis=1) / np.maximum(active_counts, 1)
+            tracking = np.sqrt(np.nansum((active - active_mean[:, None]) ** 2, axis=1) /
+                               np.maximum(active_counts, 1)) * annual
+            information_ratio = np.where(tracking > 0, active_mean * annual ** 2 / tracking, 0.0)
+
+        self._metrics = {
+            'total_return': total_return,
+            'volatility': std * annual,
+            'sharpe': sharpe,
+            'max_drawdown': max_drawdown,
+            'excess_return': total_return - total_return[self.baseline],
+            'tracking_error': tracking,
+            'information_ratio': information_ratio,
+            'correlation': self.correlation()[:, self.baseline],
+        }
+        return self._metrics
+
+    def ranked(self, by: str = 'sharpe', limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """지표 기준 순위 행 목록 (NaN은 맨 뒤, 설정/거래 수는 메타데이터에서)"""
+        if by not in RANK_ORDER:
+            raise ValueError(f"지원하지 않는 순위 기준: {by} (가능: {', '.join(RANK_ORDER)})")
+        metrics = self.metrics()
+        key = metrics[by]
+        order = np.argsort(np.where(np.isnan(key), np.inf, -key if RANK_ORDER[by] else key), kind='stable')
+        if limit is not None:
+            order = order[:limit]
+
+        rows = []
+        for rank, k in enumerate(order.tolist(), start=1):
+            meta = self.meta[k]
+            config = meta.get('config', {})
+            row = {
+                'rank': rank,
+                'run_id': self.run_ids[k],
+                'symbol': config.get('symbol'),
+                'timeframe': config.get('timeframe'),
+                'leverage': config.get('leverage'),
+                'total_trades': meta.get('counts', {}).get('trades', 0),
+                'win_rate': meta.get('metrics', {}).get('win_rate', 0.0),
+                'baseline': k == self.baseline,
+            }
+            row.update({name: float(values[k]) for name, values in metrics.items()})
+            rows.append(row)
+        return rows
@@ -0,0 +1,175 @@
+"""
+런타임 상태 영속화
+가상매매/실거래 런타임의 전략/계좌/지표 상태를 스냅샷과 선행 기록 로그(WAL)로 저장하여 재시작 시 이력 재수집 없이 복원
+"""
+
+import json
+import os
+import pickle
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import DataConfig, PaperTradingConfig
+from strategy.turtle_strategy import Position, TradeResult, TradingUnit
+from utils.timeaxis import from_ms, to_ms
+
+STATE_VERSION = 2
+
+
+# WAL 직렬화 (날짜는 epoch ms)
+def unit_to_dict(unit: TradingUnit) -> Dict[str, Any]:
+    data = asdict(unit)
+    data['entry_date'] = to_ms(unit.entry_date)
+    return data
+
+
+def unit_from_dict(data: Dict[str, Any]) -> TradingUnit:
+    return TradingUnit(**{**data, 'entry_date': from_ms(data['entry_date'])})
+
+
+def position_to_dict(position: Position) -> Dict[str, Any]:
+    return {'symbol': position.symbol, 'direction': position.direction, 'total_size': position.total_size,
+            'avg_price': position.avg_price, 'units': [unit_to_dict(u) for u in position.units]}
+
+
+def position_from_dict(data: Dict[str, Any]) -> Position:
+    return Position(symbol=data['symbol'], direction=data['direction'], total_size=data['total_size'],
+                    avg_price=data['avg_price'], units=[unit_from_dict(u) for u in data['units']])
+
+
+def trade_to_dict(trade: TradeResult) -> Dict[str, Any]:
+    data = asdict(trade)
+    data['entry_date'] = to_ms(trade.entry_date)
+    data['exit_date'] = to_ms(trade.exit_date)
+    return data
+
+
+def trade_from_dict(data: Dict[str, Any]) -> TradeResult:
+    return TradeResult(**{**data, 'entry_date': from_ms(data['entry_date']),
+                          'exit_date': from_ms(data['exit_date'])})
+
+
+@dataclass
+class RuntimeSnapshot:
+    """런타임 전체 상태 스냅샷 (seq까지의 WAL 레코드가 반영됨)"""
+    seq: int
+    symbols: List[str]
+    timeframe: str
+    strategy_state: Dict[str, Any]
+    account: Dict[str, Any]               # 잔고, 고점, 최대 낙폭, 처리 봉 수, 최신가
+    indicators: Dict[str, Dict[str, Any]]  # 종목 -> IncrementalIndicators.get_state()
+    fills: List[Any] = field(default_factory=list)
+    orders: Dict[str, Any] = field(default_factory=dict)  # 실거래 미종료 주문 (종목 -> 주문 요청)
+    correlation: Optional[Dict[str, Any]] = None          # 상관관계 상태와 적용 중인 연관 그룹
+    created_at: float = field(default_factory=time.time)
+    version: int = STATE_VERSION
+
+
+class RuntimeStateStore:
+    """스냅샷 + WAL 상태 저장소
+
+    WAL은 순번이 붙은 JSON 레코드를 한 줄씩 추가 기록한다. 'bar' 레코드는 지표 입력이고, 'symbol'
+    레코드는 체결 직후 해당 종목 전략 상태와 잔고의 사후 이미지라서 다시 적용해도 매매일지 기록이나
+    주문 같은 부수 효과가 없다. snapshot_every개 레코드마다 전체 상태를 원자적으로 스냅샷한 뒤 WAL을
+    비우며, 로드 시에는 스냅샷 이후 순번의 레코드만 순서대로 돌려준다. 기록 중 중단되어 마지막 줄이
+    잘렸으면 그 앞까지만 사용한다.
+    """
+
+    def __init__(self, directory: str = DataConfig.RUNTIME_STATE_DIR, name: str = 'paper',
+                 snapshot_every: int = PaperTradingConfig.STATE_SNAPSHOT_EVERY,
+                 fsync: bool = PaperTradingConfig.STATE_FSYNC):
+        self.directory = directory
+        self.snapshot_path = os.path.join(directory, f"{name}.snapshot")
+        self.wal_path = os.path.join(directory, f"{name}.wal")
+        self.snapshot_every = snapshot_every
+        self.fsync = fsync
+        self.seq = 0
+        self.pending_records = 0   # 마지막 스냅샷 이후 레코드 수
+        self._wal = None
+
+    def _open_wal(self):
+        if self._wal is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._wal = open(self.wal_path, 'a', encoding='utf-8')
+        return self._wal
+
+    def append(self, kind: str, data: Any) -> int:
+        """레코드 추가 (프로세스가 죽어도 남도록 매 레코드 flush)"""
+        self.seq += 1
+        wal = self._open_wal()
+        wal.write(json.dumps({'seq': self.seq, 'kind': kind, 'data': data}, separators=(',', ':')) + '\n')
+        wal.flush()
+        if self.fsync:
+            os.fsync(wal.fileno())
+        self.pending_records += 1
+        return self.seq
+
+    def snapshot_due(self) -> bool:
+        return self.pending_records >= self.snapshot_every
+
+    def save_snapshot(self, snapshot: RuntimeSnapshot) -> str:
+        """스냅샷을 원자적으로 저장하고 WAL 비우기 (교체 직후 중단되어도 순번으로 중복 적용 방지)"""
+        os.makedirs(self.directory, exist_ok=True)
+        snapshot.seq = self.seq
+        tmp_path = f"{self.snapshot_path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        if self._wal is not None:
+            self._wal.close()
+            self._wal = None
+        open(self.wal_path, 'w').close()
+        self.pending_records = 0
+        return self.snapshot_path
+
+    def load_snapshot(self) -> Optional[RuntimeSnapshot]:
+        """스냅샷 로드 (없거나 손상/버전 불일치 시 None)"""
+        if not os.path.exists(self.snapshot_path):
+            return None
+        try:
+            with open(self.snapshot_path, 'rb') as f:
+                snapshot = pickle.load(f)
+        except Exception:
+            return None
+        if not isinstance(snapshot, RuntimeSnapshot) or snapshot.version != STATE_VERSION:
+            return None
+        return snapshot
+
+    def load(self) -> Tuple[Optional[RuntimeSnapshot], List[Dict[str, Any]]]:
+        """(스냅샷, 스냅샷 이후 WAL 레코드) 로드 후 순번 이어가기"""
+        snapshot = self.load_snapshot()
+        after = snapshot.seq if snapshot is not None else 0
+        records = []
+        if os.path.exists(self.wal_path):
+            with open(self.wal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        break  # 잘린 마지막 레코드
+                    if record['seq'] > after:
+                        records.append(record)
+        self.seq = records[-1]['seq'] if records else after
+        self.pending_records = len(records)
+        return snapshot, records
+
+    def exists(self) -> bool:
+        return os.path.exists(self.snapshot_path) or os.path.exists(self.wal_path)
+
+    def close(self):
+        if self._wal is not None:
+            self._wal.close()
+            self._wal = None
+
+    def clear(self):
+        """저장된 상태 삭제"""
+        self.close()
+        for path in (self.snapshot_path, self.wal_path):
+            if os.path.exists(path):
+                os.remove(path)
+        self.seq = 0
+        self.pending_records = 0
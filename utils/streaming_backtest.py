@@ -0,0 +1,337 @@
+"""
+스트리밍 백테스트
+kline 파티션을 청크 단위로 읽어 지표 윈도우만 메모리에 유지하고, 자산 곡선과 거래를 파일로 즉시 기록
+"""
+
+import csv
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from config import BacktestConfig, DataConfig, TradingMode
+from strategy.turtle_strategy import TurtleStrategy, TradeResult
+from strategy.backtest_core import SimulationCore, start_index
+from strategy.costs import cost_model_for
+from strategy.futures import account_for
+from utils.funding_store import FundingRateStore
+from utils.checkpoint import BacktestCancelled, CancellationToken
+from utils.kline_store import KlineStore
+from utils.profiling import NULL_PROFILER
+from utils.progress import ProgressThrottle, ProgressCallback
+from utils.timeaxis import format_ms_array, to_ms_array
+
+EQUITY_FIELDS = ('date', 'total_value', 'drawdown')
+TRADE_FIELDS = ('date', 'symbol', 'direction', 'entry_price', 'exit_price', 'size', 'pnl', 'system', 'exit_reason')
+
+
+@dataclass
+class StreamingResult:
+    """스트리밍 백테스트 결과 (자산 곡선/거래는 파일에 있고 요약만 메모리에 보관)"""
+    symbol: str
+    timeframe: str
+    start_date: str
+    end_date: str
+    initial_balance: float
+    final_balance: float
+    metrics: Dict[str, Any]
+    total_bars: int
+    equity_points: int
+    total_trades: int
+    peak_window_bars: int  # 동시에 메모리에 올라간 최대 봉 수
+    equity_path: str
+    trades_path: str
+    timing: Dict[str, Any] = field(default_factory=dict)
+    futures: Dict[str, Any] = field(default_factory=dict)  # 펀딩비/강제청산 집계
+    costs: Dict[str, Any] = field(default_factory=dict)    # 수수료/슬리피지 합계
+
+
+class RunningMetrics:
+    """청크 단위로 누적하는 성과 지표
+
+    backtest_core.calculate_performance_metrics와 같은 정의를 사용한다. 거래 통계와 드로다운은
+    같은 순서로 누적하므로 값이 같고, 수익률 표준편차는 청크별 평균/제곱편차합을 병합하여 계산한다.
+    """
+
+    def __init__(self, initial_balance: float):
+        self.initial_balance = initial_balance
+        # 자산 곡선 (지표용 고점은 첫 포인트, 드로다운 곡선용 고점은 초기 자금에서 시작)
+        self.equity_points = 0
+        self.metric_peak: Optional[float] = None
+        self.curve_peak = initial_balance
+        self.max_drawdown = 0.0
+        # 수익률
+        self.n_returns = 0
+        self.returns_mean = 0.0
+        self.returns_m2 = 0.0
+        # 거래
+        self.n_trades = 0
+        self.total_pnl = 0.0
+        self.winning_trades = 0
+        self.gross_profit = 0.0
+        self.losing_pnl = 0.0
+        self.largest_win = float('-inf')
+        self.largest_loss = float('inf')
+        self.long_trades = self.long_wins = 0
+        self.short_trades = self.short_wins = 0
+        self.current_wins = self.current_losses = 0
+        self.max_consecutive_wins = self.max_consecutive_losses = 0
+        self.duration_days = 0
+
+    def add_equity(self, values: np.ndarray) -> np.ndarray:
+        """자산 곡선 구간 반영 후 해당 구간의 드로다운 곡선 반환"""
+        if len(values) == 0:
+            return np.zeros(0)
+        if self.metric_peak is None:
+            self.metric_peak = float(values[0])
+        self.equity_points += len(values)
+
+        peaks = np.maximum.accumulate(np.concatenate([[self.curve_peak], values]))[1:]
+        self.curve_peak = float(peaks[-1])
+
+        metric_peaks = np.maximum.accumulate(np.concatenate([[self.metric_peak], values]))[1:]
+        self.metric_peak = float(metric_peaks[-1])
+        self.max_drawdown = max(self.max_drawdown, float(((metric_peaks - values) / metric_peaks).max()))
+        return (peaks - values) / peaks
+
+    def add_returns(self, returns: np.ndarray):
+        """수익률 구간 반영 (병렬 분산 병합)"""
+        n_b = len(returns)
+        if n_b == 0:
+            return
+        mean_b = float(returns.mean())
+        m2_b = float(((returns - mean_b) ** 2).sum())
+        n = self.n_returns + n_b
+        delta = mean_b - self.returns_mean
+        self.returns_mean += delta * n_b / n
+        self.returns_m2 += m2_b + delta * delta * self.n_returns * n_b / n
+        self.n_returns = n
+
+    def add_trades(self, trades: List[TradeResult]):
+        """거래 반영 (청산 순서대로)"""
+        for trade in trades:
+            pnl = trade.pnl
+            self.n_trades += 1
+            self.total_pnl += pnl
+            self.largest_win = max(self.largest_win, pnl)
+            self.largest_loss = min(self.largest_loss, pnl)
+            self.duration_days += (trade.exit_date - trade.entry_date).days
+            if pnl > 0:
+                self.winning_trades += 1
+                self.gross_profit += pnl
+                self.current_wins += 1
+                self.current_losses = 0
+                self.max_consecutive_wins = max(self.max_consecutive_wins, self.current_wins)
+            else:
+                self.losing_pnl += pnl
+                self.current_losses += 1
+                self.current_wins = 0
+                self.max_consecutive_losses = max(self.max_consecutive_losses, self.current_losses)
+            if trade.direction == "LONG":
+                self.long_trades += 1
+                self.long_wins += pnl > 0
+            elif trade.direction == "SHORT":
+                self.short_trades += 1
+                self.short_wins += pnl > 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """PerformanceMetrics 인자 딕셔너리 (거래가 없으면 빈 딕셔너리)"""
+        if not self.n_trades:
+            return {}
+        losing_trades = self.n_trades - self.winning_trades
+        total_return = self.total_pnl / self.initial_balance
+        gross_loss = abs(self.losing_pnl)
+
+        if self.n_returns > 1:
+            returns_std = np.sqrt(self.returns_m2 / self.n_returns) * np.sqrt(252)
+            sharpe_ratio = total_return / returns_std if returns_std > 0 else 0
+        else:
+            sharpe_ratio = 0
+
+        return {
+            'total_return': total_return,
+            'annualized_return': total_return,
+            'max_drawdown': self.max_drawdown,
+            'sharpe_ratio': sharpe_ratio,
+            'win_rate': self.winning_trades / self.n_trades,
+            'profit_factor': self.gross_profit / gross_loss if gross_loss > 0 else 0,
+            'total_trades': self.n_trades,
+            'winning_trades': self.winning_trades,
+            'losing_trades': losing_trades,
+            'avg_win': self.gross_profit / self.winning_trades if self.winning_trades else 0,
+            'avg_loss': self.losing_pnl / losing_trades if losing_trades else 0,
+            'largest_win': self.largest_win,
+            'largest_loss': self.largest_loss,
+            'avg_trade_duration': self.duration_days / self.n_trades,
+            'long_trades': self.long_trades,
+            'short_trades': self.short_trades,
+            'long_win_rate': self.long_wins / self.long_trades if self.long_trades else 0,
+            'short_win_rate': self.short_wins / self.short_trades if self.short_trades else 0,
+            'max_consecutive_wins': self.max_consecutive_wins,
+            'max_consecutive_losses': self.max_consecutive_losses,
+        }
+
+
+class StreamingResultWriter:
+    """자산 곡선/거래 CSV 증분 기록기"""
+
+    def __init__(self, output_dir: str):
+        os.makedirs(output_dir, exist_ok=True)
+        self.equity_path = os.path.join(output_dir, 'equity.csv')
+        self.trades_path = os.path.join(output_dir, 'trades.csv')
+        self._equity_file = open(self.equity_path, 'w', newline='', encoding='utf-8')
+        self._trades_file = open(self.trades_path, 'w', newline='', encoding='utf-8')
+        self._equity = csv.writer(self._equity_file)
+        self._trades = csv.writer(self._trades_file)
+        self._equity.writerow(EQUITY_FIELDS)
+        self._trades.writerow(TRADE_FIELDS)
+
+    def write_equity(self, points: List[Dict[str, Any]], drawdowns: np.ndarray):
+        # 시각 문자열 변환은 기록 시점에 청크 단위로 일괄 수행
+        dates = format_ms_array(to_ms_array([p['date'] for p in points]), unit='s')
+        self._equity.writerows((date, repr(p['total_value']), repr(d))
+                               for date, p, d in zip(dates, points, drawdowns.tolist()))
+
+    def write_trades(self, trades: List[TradeResult]):
+        dates = format_ms_array(to_ms_array([t.exit_date for t in trades]), unit='s')
+        self._trades.writerows(
+            (date, t.symbol, t.direction, repr(t.entry_price), repr(t.exit_price),
+             repr(t.size), repr(t.pnl), t.system, t.exit_reason)
+            for date, t in zip(dates, trades)
+        )
+
+    def flush(self):
+        self._equity_file.flush()
+        self._trades_file.flush()
+
+    def close(self):
+        self._equity_file.close()
+        self._trades_file.close()
+
+
+class StreamingBacktest:
+    """kline 파티션 스트리밍 백테스트
+
+    파티션을 chunk_bars 단위로 읽어 SimulationCore.extend()에 넘기므로 메모리에는 지표 윈도우
+    (최대 돌파 기간/ATR 기간 + 1봉)와 현재 청크만 남는다. 청크마다 자산 곡선과 거래를 CSV로
+    기록한 뒤 비우고 성과 지표는 RunningMetrics로 누적하여, 최대 메모리가 이력 길이와 무관하다.
+    """
+
+    def __init__(self, config, store: Optional[KlineStore] = None, output_dir: Optional[str] = None,
+                 chunk_bars: Optional[int] = None, profiler=NULL_PROFILER,
+                 cancel_token: Optional[CancellationToken] = None,
+                 strategy: Optional[TurtleStrategy] = None,
+                 funding_store: Optional[FundingRateStore] = None):
+        self.config = config
+        self.store = store or KlineStore()
+        self.funding_store = funding_store or FundingRateStore()
+        self.chunk_bars = chunk_bars or BacktestConfig.STREAM_CHUNK_BARS
+        self.profiler = profiler
+        self.cancel_token = cancel_token or CancellationToken()
+        self.strategy = strategy or TurtleStrategy(TradingMode.BACKTEST)
+        if output_dir is None:
+            run_name = f"{config.symbol}_{config.timeframe}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            output_dir = os.path.join(DataConfig.STREAMING_RESULTS_DIR, run_name)
+        self.output_dir = output_dir
+
+    def run(self, progress_callback: Optional[ProgressCallback] = None,
+            progress_interval: float = 0.1) -> StreamingResult:
+        """스트리밍 실행"""
+        config = self.config
+        profiler = self.profiler
+        symbol, timeframe = config.symbol, config.timeframe
+
+        profiler.switch('setup')
+        total_bars = self.store.count(symbol, timeframe, config.start_date, config.end_date)
+        if total_bars == 0:
+            raise ValueError(f"{symbol} {timeframe} 구간의 캔들 파티션이 없습니다.")
+
+        strategy = self.strategy
+        strategy.reset()
+        strategy.set_timeframe_context(None)
+        strategy.journal.profiler = profiler
+        core = SimulationCore(strategy, None, symbol, timeframe, config.systems, config.initial_balance,
+                              config.commission_rate, getattr(config, 'leverage', 1.0), profiler,
+                              account_for(config, self.funding_store), cost_model_for(config))
+        first_bar = start_index(timeframe, total_bars)
+        total_steps = total_bars - first_bar
+        processed_steps = 0
+        peak_window_bars = 0
+
+        metrics = RunningMetrics(config.initial_balance)
+        writer = StreamingResultWriter(self.output_dir)
+        throttle = ProgressThrottle(progress_callback, total_steps, progress_interval) if progress_callback else None
+        print(f"🌊 스트리밍 백테스트: 총 {total_bars}개 데이터, {first_bar}번째부터 시작 "
+              f"(청크 {self.chunk_bars}봉, 윈도우 {core.window}봉)")
+
+        try:
+            for columns in self.store.iter_columns(symbol, timeframe, config.start_date, config.end_date,
+                                                   self.chunk_bars):
+                profiler.switch('data_load')
+                bars = core.extend(columns['open_time'], columns['high'],
+                                   columns['low'], columns['close'], columns['volume'])
+                del columns
+                peak_window_bars = max(peak_window_bars, len(core.closes))
+
+                for i in range(max(first_bar, bars.start), bars.stop):
+                    profiler.switch('loop')
+                    if self.cancel_token.cancelled:
+                        self.cancel_token.reset()
+                        raise BacktestCancelled(
+                            f"스트리밍 백테스트가 중단되었습니다 ({processed_steps}/{total_steps} 봉)")
+                    profiler.count('bars')
+                    processed_steps += 1
+                    if throttle is not None:
+                        throttle.tick(processed_steps, metrics.n_trades + len(strategy.trade_history),
+                                      core.prev_value)
+                    core.step(i)
+
+                self._flush(core, metrics, writer)
+
+            profiler.switch('exits')
+            core.close_all('BACKTEST_END')
+            self._flush(core, metrics, writer)
+        finally:
+            writer.close()
+
+        if throttle is not None:
+            throttle.finish(processed_steps, metrics.n_trades, core.balance)
+        print(f"스트리밍 백테스트 완료! 총 {metrics.n_trades}개의 거래가 실행되었습니다.")
+
+        return StreamingResult(
+            symbol=symbol,
+            timeframe=timeframe,
+            start_date=config.start_date,
+            end_date=config.end_date,
+            initial_balance=config.initial_balance,
+            final_balance=core.balance,
+            metrics=metrics.to_dict(),
+            total_bars=total_bars,
+            equity_points=metrics.equity_points,
+            total_trades=metrics.n_trades,
+            peak_window_bars=peak_window_bars,
+            equity_path=writer.equity_path,
+            trades_path=writer.trades_path,
+            timing=profiler.summary(),
+            futures=core.futures.summary() if core.futures is not None else {},
+            costs=core.costs.summary()
+        )
+
+    def _flush(self, core: SimulationCore, metrics: RunningMetrics, writer: StreamingResultWriter):
+        """청크에서 쌓인 자산 곡선/수익률/거래를 기록하고 메모리에서 비움"""
+        self.profiler.switch('metrics')
+        points = core.equity_curve
+        values = np.fromiter((p['total_value'] for p in points), dtype=np.float64, count=len(points))
+        writer.write_equity(points, metrics.add_equity(values))
+        metrics.add_returns(np.asarray(core.daily_returns, dtype=np.float64))
+
+        trades = self.strategy.trade_history
+        metrics.add_trades(trades)
+        writer.write_trades(trades)
+        writer.flush()
+
+        points.clear()
+        core.daily_returns.clear()
+        trades.clear()
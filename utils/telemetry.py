@@ -0,0 +1,347 @@
+"""
+런타임 텔레메트리
+가상매매/실거래 런타임의 계좌 상태와 지연 히스토그램을 로컬 HTTP(또는 유닉스 소켓) 엔드포인트에
+Prometheus 텍스트 형식으로 노출
+"""
+
+import asyncio
+import logging
+import os
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from config import TelemetryConfig
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    if value == float('-inf'):
+        return '-Inf'
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels_text(names: Sequence[str], values: Sequence[Any], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+# 지표 값 (핫패스에서는 속성 갱신만 하며 잠금 없음)
+class Counter:
+    """단조 증가 카운터"""
+    __slots__ = ('value',)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: float = 1):
+        self.value += amount
+
+
+class Gauge:
+    """임의 값 게이지"""
+    __slots__ = ('value',)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def set(self, value: float):
+        self.value = value
+
+
+class Histogram:
+    """고정 버킷 히스토그램 (observe는 이진 탐색 한 번과 덧셈 세 번)"""
+    __slots__ = ('bounds', 'counts', 'sum', 'count')
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)  # 마지막 칸은 +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """버킷 안 선형 보간 근사 분위수 (histogram_quantile과 같은 방식, +Inf 칸이면 마지막 상한)"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        lower, seen = 0.0, 0
+        for bound, count in zip(self.bounds, self.counts):
+            if count and seen + count >= rank:
+                return lower + (bound - lower) * (rank - seen) / count
+            seen += count
+            lower = bound
+        return self.bounds[-1] if self.bounds else 0.0
+
+    def cumulative(self) -> List[int]:
+        """버킷 상한별 누적 건수 (마지막은 전체 건수)"""
+        total, result = 0, []
+        for count in self.counts:
+            total += count
+            result.append(total)
+        return result
+
+
+class MetricFamily:
+    """이름/설명/레이블이 같은 지표 묶음 (레이블 값마다 값 객체 하나)"""
+
+    def __init__(self, name: str, help: str, kind: str, labelnames: Sequence[str] = (),
+                 buckets: Optional[Sequence[float]] = None):
+        self.name = name
+        self.help = help
+        self.kind = kind
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets) if buckets is not None else None
+        self.children: Dict[Tuple[str, ...], Any] = {}
+
+    def labels(self, *values: Any) -> Any:
+        """레이블 값의 값 객체 (핫패스에서는 한 번 받아 두고 재사용)"""
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name}: 레이블 {self.labelnames}에 값 {values}")
+        key = tuple(str(v) for v in values)
+        child = self.children.get(key)
+        if child is None:
+            if self.kind == 'counter':
+                child = Counter()
+            elif self.kind == 'gauge':
+                child = Gauge()
+            else:
+                child = Histogram(self.buckets)
+            self.children[key] = child
+        return child
+
+    def clear(self):
+        """값 객체 전체 제거 (수집 시점에 다시 채우는 레이블 게이지용)"""
+        self.children.clear()
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} {self.kind}"
+        names = self.labelnames
+        for key, child in self.children.items():
+            if self.kind != 'histogram':
+                yield f"{self.name}{_labels_text(names, key)} {_format_value(child.value)}"
+                continue
+            cumulative = child.cumulative()
+            for bound, count in zip(child.bounds + (float('inf'),), cumulative):
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket{_labels_text(names, key, le)} {count}"
+            yield f"{self.name}_sum{_labels_text(names, key)} {_format_value(child.sum)}"
+            yield f"{self.name}_count{_labels_text(names, key)} {child.count}"
+
+
+class MetricsRegistry:
+    """지표 등록부
+
+    값 갱신은 모두 이벤트 루프 스레드에서 일어나고 render()도 같은 루프에서 실행되므로
+    잠금 없이도 값이 중간에 찢어지지 않는다. 계좌처럼 매번 계산하는 값은 수집기(collector)로 등록해
+    수집 요청이 올 때만 계산한다.
+    """
+
+    def __init__(self):
+        self.families: Dict[str, MetricFamily] = {}
+        self.collectors: List[Callable[[], None]] = []
+
+    def _register(self, family: MetricFamily) -> MetricFamily:
+        existing = self.families.get(family.name)
+        if existing is not None:
+            if existing.kind != family.kind or existing.labelnames != family.labelnames:
+                raise ValueError(f"이미 다른 형식으로 등록된 지표: {family.name}")
+            return existing
+        self.families[family.name] = family
+        return family
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> MetricFamily:
+        return self._register(MetricFamily(name, help, 'counter', labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> MetricFamily:
+        return self._register(MetricFamily(name, help, 'gauge', labelnames))
+
+    def histogram(self, name: str, help: str, buckets: Sequence[float],
+                  labelnames: Sequence[str] = ()) -> MetricFamily:
+        return self._register(MetricFamily(name, help, 'histogram', labelnames, sorted(buckets)))
+
+    def add_collector(self, collector: Callable[[], None]):
+        """수집 직전에 호출할 함수 등록 (게이지 값 채우기)"""
+        self.collectors.append(collector)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 (0.0.4)"""
+        for collector in self.collectors:
+            try:
+                collector()
+            except Exception as e:
+                logger.error(f"Metrics collector failed: {e}")
+        lines = []
+        for family in self.families.values():
+            lines.extend(family.render())
+        return '\n'.join(lines) + '\n'
+
+
+class TelemetryServer:
+    """GET /metrics(와 routes의 JSON 경로)만 처리하는 최소 HTTP 서버 (트레이딩과 같은 이벤트 루프에서 실행)"""
+
+    def __init__(self, registry: MetricsRegistry, host: str = TelemetryConfig.HOST,
+                 port: int = TelemetryConfig.PORT, path: str = TelemetryConfig.SOCKET_PATH,
+                 routes: Optional[Dict[str, Callable[[], str]]] = None):
+        self.registry = registry
+        self.routes = routes if routes is not None else {}
+        self.host = host
+        self.port = port
+        self.path = path
+        self.scrapes = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def address(self) -> str:
+        if self.path:
+            return f"unix:{self.path}"
+        return f"http://{self.host}:{self.port}/metrics"
+
+    async def start(self):
+        if self.path:
+            if os.path.exists(self.path):
+                os.unlink(self.path)  # 이전 실행이 남긴 소켓 파일
+            self._server = await asyncio.start_unix_server(self._handle, path=self.path)
+        else:
+            self._server = await asyncio.start_server(self._handle, self.host, self.port)
+            if not self.port:
+                self.port = self._server.sockets[0].getsockname()[1]  # 0이면 임의 포트
+
+    async def stop(self):
+        if self._server is None:
+            return
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+        if self.path and os.path.exists(self.path):
+            os.unlink(self.path)
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> List[str]:
+        request = (await reader.readline()).decode('latin-1').split()
+        while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+            pass  # 헤더는 사용하지 않음
+        return request
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request = await asyncio.wait_for(self._read_request(reader), 5.0)
+            target = request[1].split('?')[0] if len(request) >= 2 and request[0] in ('GET', 'HEAD') else None
+            content_type = CONTENT_TYPE
+            if target in ('/', '/metrics'):
+                self.scrapes += 1
+                status, body = '200 OK', self.registry.render().encode('utf-8')
+            elif target in self.routes:
+                status, body = '200 OK', self.routes[target]().encode('utf-8')
+                content_type = 'application/json; charset=utf-8'
+            else:
+                status, body = '404 Not Found', b'not found\n'
+            head = (f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                    f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n")
+            writer.write(head.encode('latin-1') + (body if request[:1] != ['HEAD'] else b''))
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+class RuntimeTelemetry:
+    """트레이딩 런타임 지표 묶음
+
+    봉 처리/주문 응답/주문 한도 대기/이벤트 루프 지연은 히스토그램 값 객체를 미리 받아 두고 핫패스에서
+    observe()만 호출한다. 잔고, 평가금액, 종목별 유닛 수와 노출 금액은 수집 요청이 올 때 런타임에서 읽는다.
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        self.registry = registry or MetricsRegistry()
+        r = self.registry
+        self.bar_latency = r.histogram('turtle_bar_processing_seconds', "마감 봉 하나의 지표 갱신부터 판단까지 걸린 시간",
+                                       TelemetryConfig.BAR_LATENCY_BUCKETS).labels()
+        self.order_latency = r.histogram('turtle_order_submit_seconds', "주문 제출 요청부터 거래소 응답까지 걸린 시간",
+                                         TelemetryConfig.ORDER_LATENCY_BUCKETS).labels()
+        self.rate_limit_wait = r.histogram('turtle_rate_limiter_wait_seconds', "초당 주문 한도로 대기한 시간",
+                                           TelemetryConfig.RATE_LIMIT_WAIT_BUCKETS).labels()
+        self.loop_lag = r.histogram('turtle_event_loop_lag_seconds', "예정 시각 대비 이벤트 루프 깨어남 지연",
+                                    TelemetryConfig.LOOP_LAG_BUCKETS).labels()
+        self.orders = r.counter('turtle_orders_total', "종료된 주문 수", ('status',))
+        self.balance = r.gauge('turtle_balance', "지갑 잔고").labels()
+        self.equity = r.gauge('turtle_equity', "잔고 + 미실현 손익").labels()
+        self.bars = r.gauge('turtle_bars_processed', "판단까지 처리한 마감 봉 수").labels()
+        self.units = r.gauge('turtle_open_units', "종목별 보유 유닛 수", ('symbol',))
+        self.exposure = r.gauge('turtle_exposure_notional', "종목별 포지션 명목 금액 (최신가 기준)",
+                                ('symbol', 'direction'))
+        self.pending = r.gauge('turtle_pending_orders', "체결 대기 중인 진입/청산 주문 수").labels()
+        self.routes: Dict[str, Callable[[], str]] = {}  # 엔드포인트에 함께 제공할 JSON 경로
+        self.server: Optional[TelemetryServer] = None
+        self._lag_task: Optional[asyncio.Task] = None
+
+    def bind_runtime(self, runtime):
+        """런타임 계좌 상태를 수집 시점에 읽도록 등록"""
+        self.registry.add_collector(lambda: self._collect(runtime))
+
+    def _collect(self, runtime):
+        self.balance.set(runtime.balance)
+        self.equity.set(runtime.equity())
+        self.bars.set(runtime.bars_processed)
+        self.pending.set(len(getattr(runtime, 'pending', ())))
+        self.units.clear()
+        self.exposure.clear()
+        for symbol in runtime.symbols:
+            self.units.labels(symbol).set(0)
+        for symbol, position in runtime.strategy.positions.items():
+            price = runtime.last_prices.get(symbol, position.avg_price)
+            self.units.labels(symbol).set(len(position.units))
+            self.exposure.labels(symbol, position.direction).set(position.total_size * price)
+
+    def order_finished(self, status: str):
+        self.orders.labels(status).inc()
+
+    # 엔드포인트
+    async def start(self, host: str = TelemetryConfig.HOST, port: int = TelemetryConfig.PORT,
+                    path: str = TelemetryConfig.SOCKET_PATH,
+                    lag_interval: float = TelemetryConfig.LOOP_LAG_INTERVAL) -> bool:
+        """엔드포인트와 이벤트 루프 지연 측정 시작 (포트 사용 중 등으로 실패해도 트레이딩은 계속, False 반환)"""
+        server = TelemetryServer(self.registry, host, port, path, self.routes)
+        try:
+            await server.start()
+        except OSError as e:
+            logger.warning(f"Telemetry endpoint not started ({server.address}): {e}")
+            return False
+        self.server = server
+        self._lag_task = asyncio.create_task(self._sample_loop_lag(lag_interval))
+        logger.info(f"Telemetry endpoint: {server.address}")
+        return True
+
+    async def stop(self):
+        if self._lag_task is not None:
+            self._lag_task.cancel()
+            await asyncio.gather(self._lag_task, return_exceptions=True)
+            self._lag_task = None
+        if self.server is not None:
+            await self.server.stop()
+            self.server = None
+
+    async def _sample_loop_lag(self, interval: float):
+        """interval마다 잠들었다 깨어난 시각과 예정 시각의 차이 (다른 작업이 루프를 막은 시간)"""
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + interval
+            await asyncio.sleep(interval)
+            self.loop_lag.observe(max(0.0, loop.time() - expected))
@@ -0,0 +1,101 @@
+"""
+정수 시간축 유틸리티
+시각을 UTC epoch 밀리초(int64)로 통일하고, 사람이 읽는 문자열 변환은 출력/내보내기 시점에만 수행
+"""
+
+import time
+from datetime import datetime, timezone
+from typing import Any, Iterable, List
+
+import numpy as np
+
+SECOND_MS = 1_000
+MINUTE_MS = 60 * SECOND_MS
+HOUR_MS = 60 * MINUTE_MS
+DAY_MS = 24 * HOUR_MS
+
+# datetime_as_string 단위 (D: 날짜, m: 분, s: 초)
+DATE_UNITS = ('D', 'm', 's')
+
+
+def now_ms() -> int:
+    """현재 시각 (UTC epoch ms)"""
+    return time.time_ns() // 1_000_000
+
+
+def to_ms(value: Any) -> int:
+    """datetime/문자열/datetime64/정수를 UTC epoch ms로 변환 (naive datetime은 UTC로 간주)"""
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return int(np.datetime64(value, 'ms').astype(np.int64))
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return int(np.datetime64(value, 'ms').astype(np.int64))
+
+
+def to_ms_array(values: Iterable[Any]) -> np.ndarray:
+    """시각 시퀀스를 int64 epoch ms 배열로 변환 (이미 정수 배열이면 복사 없이 반환)"""
+    if isinstance(values, np.ndarray):
+        if values.dtype == np.int64:
+            return values
+        if np.issubdtype(values.dtype, np.datetime64):
+            return values.astype('datetime64[ms]').astype(np.int64)
+    values = list(values)
+    if values and all(isinstance(v, (int, np.integer)) for v in values):
+        return np.array(values, dtype=np.int64)
+    if values and isinstance(values[0], datetime) and values[0].tzinfo is None:
+        return np.array(values, dtype='datetime64[ms]').astype(np.int64)
+    return np.fromiter((to_ms(v) for v in values), dtype=np.int64, count=len(values))
+
+
+def from_ms(timestamp_ms: int) -> datetime:
+    """epoch ms를 UTC 기준 naive datetime으로 변환 (로컬 시간대 영향 없음)"""
+    return datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc).replace(tzinfo=None)
+
+
+def from_ms_array(times: np.ndarray) -> List[datetime]:
+    """epoch ms 배열을 naive UTC datetime 리스트로 변환"""
+    return np.asarray(times, dtype=np.int64).astype('datetime64[ms]').astype(datetime).tolist()
+
+
+def format_ms(timestamp_ms: int, unit: str = 'D') -> str:
+    """epoch ms를 문자열로 변환 (D: YYYY-MM-DD, s: YYYY-MM-DD HH:MM:SS)"""
+    return format_ms_array(np.array([timestamp_ms], dtype=np.int64), unit)[0]
+
+
+def format_ms_array(times: np.ndarray, unit: str = 'D') -> List[str]:
+    """epoch ms 배열을 문자열 리스트로 일괄 변환"""
+    if unit not in DATE_UNITS:
+        raise ValueError(f"지원하지 않는 단위: {unit}")
+    if len(times) == 0:
+        return []
+    text = np.datetime_as_string(np.asarray(times, dtype=np.int64).astype('datetime64[ms]'), unit=unit)
+    if unit != 'D':
+        text = np.char.replace(text, 'T', ' ')
+    return text.tolist()
+
+
+def range_mask(times: np.ndarray, start: Any = None, end: Any = None) -> np.ndarray:
+    """start 이상 end 미만 시각 마스크 (None이면 해당 경계 없음)"""
+    times = np.asarray(times, dtype=np.int64)
+    mask = np.ones(len(times), dtype=bool)
+    if start is not None:
+        mask &= times >= to_ms(start)
+    if end is not None:
+        mask &= times < to_ms(end)
+    return mask
+
+
+def bucket_ms(times: np.ndarray, unit: str) -> np.ndarray:
+    """달력 단위(D: 일, M: 월, Y: 연) 버킷 시작 시각 (epoch ms)"""
+    buckets = np.asarray(times, dtype=np.int64).astype('datetime64[ms]').astype(f'datetime64[{unit}]')
+    return buckets.astype('datetime64[ms]').astype(np.int64)
+
+
+def bucket_labels(times: np.ndarray, unit: str) -> List[str]:
+    """달력 단위 버킷 라벨 (D: YYYY-MM-DD, M: YYYY-MM, Y: YYYY)"""
+    buckets = np.asarray(times, dtype=np.int64).astype('datetime64[ms]').astype(f'datetime64[{unit}]')
+    return np.datetime_as_string(buckets).tolist()
@@ -6,17 +6,20 @@
 import csv
 import os
 import logging
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional
 from dataclasses import dataclass, asdict
 from pathlib import Path
 
 from config import DataConfig, TradingMode, LoggingConfig
+from utils.profiling import NULL_PROFILER
+from utils.timeaxis import DAY_MS, format_ms, now_ms, to_ms
 
 @dataclass
 class TradeJournalEntry:
-    """매매일지 항목"""
-    timestamp: str
+    """매매일지 항목 (timestamp는 UTC epoch ms, CSV에는 UTC 'YYYY-MM-DD HH:MM:SS' 문자열로 기록)"""
+    timestamp: int
     trade_id: str
     trading_mode: str  # 'backtest', 'paper', 'live'
     symbol: str
@@ -42,6 +45,7 @@ class TradeJournalManager:
     def __init__(self, trading_mode: str = TradingMode.BACKTEST):
         self.trading_mode = trading_mode
         self.cumulative_pnl = 0.0
+        self.profiler = NULL_PROFILER  # 백테스트 프로파일링 시 엔진이 주입
         
         # 로거 설정
         self.logger = self._setup_logger()
@@ -118,13 +122,14 @@ class TradeJournalManager:
     def log_trade_entry(self, symbol: str, direction: str, entry_price: float,
                        size: float, stop_loss: float, atr: float, leverage: float,
                        account_balance: float, system: int, unit_number: int = 1,
-                       trade_id: str = None, notes: str = "") -> str:
-        """진입 거래 기록"""
+                       trade_id: str = None, notes: str = "", timestamp: Optional[int] = None) -> str:
+        """진입 거래 기록 (timestamp 생략 시 현재 시각)"""
+        timestamp = now_ms() if timestamp is None else timestamp
         if trade_id is None:
-            trade_id = self._generate_trade_id(symbol, direction)
+            trade_id = self._generate_trade_id(symbol, direction, timestamp)
         
         entry = TradeJournalEntry(
-            timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            timestamp=timestamp,
             trade_id=trade_id,
             trading_mode=self.trading_mode,
             symbol=symbol,
@@ -152,12 +157,12 @@ class TradeJournalManager:
     def log_trade_exit(self, trade_id: str, symbol: str, direction: str, 
                       entry_price: float, exit_price: float, size: float,
                       pnl: float, account_balance: float, reason: str,
-                      leverage: float = 1.0, notes: str = ""):
+                      leverage: float = 1.0, notes: str = "", timestamp: Optional[int] = None):
         """청산 거래 기록"""
         self.cumulative_pnl += pnl
         
         entry = TradeJournalEntry(
-            timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            timestamp=now_ms() if timestamp is None else timestamp,
             trade_id=trade_id,
             trading_mode=self.trading_mode,
             symbol=symbol,
@@ -184,10 +189,11 @@ class TradeJournalManager:
     def log_pyramid_entry(self, trade_id: str, symbol: str, direction: str,
                          entry_price: float, size: float, stop_loss: float,
                          atr: float, leverage: float, account_balance: float,
-                         system: int, unit_number: int, notes: str = ""):
+                         system: int, unit_number: int, notes: str = "",
+                         timestamp: Optional[int] = None):
         """피라미딩 기록"""
         entry = TradeJournalEntry(
-            timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            timestamp=now_ms() if timestamp is None else timestamp,
             trade_id=trade_id,
             trading_mode=self.trading_mode,
             symbol=symbol,
@@ -212,14 +218,19 @@ class TradeJournalManager:
         self._write_to_log(entry, "피라미딩")
     
     def _write_to_csv(self, entry: TradeJournalEntry):
-        """CSV 파일에 기록 저장"""
+        """CSV 파일에 기록 저장 (내보내기 형식이므로 시각은 문자열로 변환)"""
+        self.profiler.enter('journal_io')
+        self.profiler.count('journal_writes')
         try:
             with open(self.csv_file_path, 'a', newline='', encoding='utf-8') as file:
                 writer = csv.writer(file)
                 row = list(asdict(entry).values())
+                row[0] = format_ms(entry.timestamp, 's')
                 writer.writerow(row)
         except Exception as e:
             self.logger.error(f"CSV 파일 쓰기 오류: {e}")
+        finally:
+            self.profiler.leave()
     
     def _write_to_log(self, entry: TradeJournalEntry, action_type: str):
         """로그 파일에 기록 저장"""
@@ -237,17 +248,19 @@ class TradeJournalManager:
         else:
             message = f"{action_type} - {entry.trade_id}"
         
-        self.logger.info(message)
+        with self.profiler.phase('journal_io'):
+            self.logger.info(message)
     
-    def _generate_trade_id(self, symbol: str, direction: str) -> str:
-        """거래 ID 생성"""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    def _generate_trade_id(self, symbol: str, direction: str, timestamp: int) -> str:
+        """거래 ID 생성 (진입 시각 epoch ms 기반)"""
         return f"{self.trading_mode}_{symbol}_{direction}_{timestamp}"
     
     def get_daily_summary(self, date: str = None) -> Dict[str, Any]:
-        """일일 거래 요약 정보"""
+        """일일 거래 요약 정보 (date: YYYY-MM-DD, UTC 기준)"""
         if date is None:
-            date = datetime.now().strftime('%Y-%m-%d')
+            date = format_ms(now_ms())
+        day_start = to_ms(date)
+        day_end = day_start + DAY_MS
         
         if not os.path.exists(self.csv_file_path):
             return {
@@ -268,7 +281,8 @@ class TradeJournalManager:
             with open(self.csv_file_path, 'r', encoding='utf-8') as file:
                 reader = csv.DictReader(file)
                 for row in reader:
-                    if row['timestamp'].startswith(date) and row['action'] == 'EXIT':
+                    # 시각 문자열과 이전 형식(epoch ms) 모두 허용
+                    if row['action'] == 'EXIT' and day_start <= to_ms(row['timestamp']) < day_end:
                         pnl = float(row['pnl']) if row['pnl'] else 0.0
                         trades.append(pnl)
                         total_pnl += pnl
@@ -310,6 +324,39 @@ class TradeJournalManager:
         
         return trades[-days:] if days > 0 else trades
 
+@contextmanager
+def redirect_journals(directory: str) -> Iterator[str]:
+    """매매일지 CSV와 로그 파일을 다른 디렉터리로 돌림 (벤치마크/테스트가 실제 매매일지를 오염시키지 않도록)
+
+    블록 안에서 생성된 TradeJournalManager는 directory 아래에 기록하고, 이미 만들어진 매매일지 로거의
+    파일 핸들러는 블록 동안 떼어 두었다가 복원한다.
+    """
+    paths = {
+        (DataConfig, 'PAPER_TRADING_JOURNAL_DIR'): os.path.join(directory, 'trade_journals', 'paper_trading'),
+        (DataConfig, 'LIVE_TRADING_JOURNAL_DIR'): os.path.join(directory, 'trade_journals', 'live_trading'),
+        (DataConfig, 'BACKTEST_JOURNAL_DIR'): os.path.join(directory, 'trade_journals', 'backtest'),
+        (LoggingConfig, 'PAPER_TRADE_JOURNAL_LOG'): os.path.join(directory, 'paper_trade_journal.log'),
+        (LoggingConfig, 'LIVE_TRADE_JOURNAL_LOG'): os.path.join(directory, 'live_trade_journal.log'),
+        (LoggingConfig, 'BACKTEST_JOURNAL_LOG'): os.path.join(directory, 'backtest_journal.log'),
+    }
+    original_paths = {key: getattr(*key) for key in paths}
+    loggers = [logging.getLogger(f"trade_journal_{mode}")
+               for mode in (TradingMode.PAPER, TradingMode.LIVE, TradingMode.BACKTEST)]
+    original_handlers = [logger.handlers[:] for logger in loggers]
+    for (owner, name), path in paths.items():
+        setattr(owner, name, path)
+    for logger in loggers:
+        logger.handlers = []
+    try:
+        yield directory
+    finally:
+        for logger, handlers in zip(loggers, original_handlers):
+            for handler in logger.handlers:
+                handler.close()
+            logger.handlers = handlers
+        for (owner, name), path in original_paths.items():
+            setattr(owner, name, path)
+
 def get_trade_journal_manager(trading_mode: str = TradingMode.BACKTEST) -> TradeJournalManager:
     """거래 모드에 따른 매매일지 관리자 반환"""
     return TradeJournalManager(trading_mode)
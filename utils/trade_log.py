@@ -0,0 +1,220 @@
+"""
+컬럼형 거래 로그
+청산된 거래를 고정 크기 청크의 numpy 컬럼에 추가 기록하고, 조회는 복사 없는 구간 뷰로 제공
+"""
+
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+from utils.result_store import TRADE_CATEGORY_FIELDS, TRADE_DATE_FIELDS, TRADE_FLOAT_FIELDS
+from utils.timeaxis import from_ms_array, to_ms
+
+DEFAULT_CHUNK_SIZE = 1024
+
+# 필드 -> 컬럼 dtype (범주형은 코드, 시각은 epoch ms)
+TRADE_INT_FIELDS = ('system',)
+COLUMN_DTYPES: Dict[str, Any] = {
+    **{name: np.float64 for name in TRADE_FLOAT_FIELDS},
+    **{name: np.int64 for name in TRADE_DATE_FIELDS},
+    **{name: np.int32 for name in TRADE_CATEGORY_FIELDS},
+    **{name: np.int8 for name in TRADE_INT_FIELDS},
+}
+
+
+class TradeLogView:
+    """거래 로그의 [start, stop) 구간 뷰
+
+    만든 시점의 청크 목록과 구간을 붙잡아 두므로 이후 추가/clear()에 영향을 받지 않는다.
+    행은 접근할 때만 row_type 객체로 만들고, column()은 구간이 한 청크 안이면 복사 없는 읽기 전용 배열을 돌려준다.
+    """
+
+    __slots__ = ('_log', '_chunks', '_start', '_stop')
+
+    def __init__(self, log: 'TradeLog', chunks: List[Dict[str, np.ndarray]], start: int, stop: int):
+        self._log = log
+        self._chunks = chunks
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __bool__(self) -> bool:
+        return self._stop > self._start
+
+    def __repr__(self) -> str:
+        return f"TradeLogView({len(self)} trades)"
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return TradeLogView(self._log, self._chunks, self._start + start, self._start + max(start, stop))
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("거래 로그 인덱스 범위 초과")
+        return self._log._row(self._chunks, self._start + index)
+
+    def __iter__(self) -> Iterator[Any]:
+        for chunk, lo, hi in self._segments():
+            yield from self._log._rows(chunk, lo, hi)
+
+    def __reversed__(self) -> Iterator[Any]:
+        for i in range(len(self) - 1, -1, -1):
+            yield self[i]
+
+    def _segments(self):
+        """(청크, 청크 내 시작, 끝) 순회"""
+        size = self._log.chunk_size
+        position = self._start
+        while position < self._stop:
+            k, lo = divmod(position, size)
+            hi = min(size, lo + self._stop - position)
+            yield self._chunks[k], lo, hi
+            position += hi - lo
+
+    def chunks(self, name: str) -> Iterator[np.ndarray]:
+        """컬럼을 청크별 읽기 전용 뷰로 순회 (복사 없음)"""
+        for chunk, lo, hi in self._segments():
+            view = chunk[name][lo:hi]
+            view.flags.writeable = False
+            yield view
+
+    def column(self, name: str) -> Union[np.ndarray, List[str]]:
+        """컬럼 배열 (범주형은 문자열 리스트, 여러 청크에 걸치면 이어 붙인 사본)"""
+        if name not in COLUMN_DTYPES:
+            raise KeyError(f"알 수 없는 거래 컬럼: {name}")
+        parts = list(self.chunks(name))
+        if not parts:
+            values = np.empty(0, dtype=COLUMN_DTYPES[name])
+        else:
+            values = parts[0] if len(parts) == 1 else np.concatenate(parts)
+        if name in TRADE_CATEGORY_FIELDS:
+            return self._log.decode(name, values)
+        return values
+
+
+class TradeLog:
+    """청크형 추가 전용 거래 로그
+
+    거래 한 건을 컬럼별 numpy 청크(chunk_size행)에 기록하므로 거래당 메모리가 고정이고, 청크가 차면
+    새 청크만 할당하여 기존 데이터를 옮기지 않는다. 범주형 필드(종목/방향/청산 사유)는 정수 코드로 저장한다.
+    리스트처럼 len/인덱싱/순회/append/clear를 지원하며 view()는 현재 구간의 복사 없는 뷰를 돌려준다.
+    revision은 추가/삭제마다 증가하므로 화면 캐시 등이 내용을 읽지 않고 변경 여부를 알 수 있다.
+    """
+
+    revision = 0  # 이전 버전 체크포인트에서 복원한 로그의 기본값
+
+    def __init__(self, row_type: Callable[..., Any], chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.row_type = row_type
+        self.chunk_size = chunk_size
+        self._chunks: List[Dict[str, np.ndarray]] = []
+        self._size = 0
+        self._codes: Dict[str, Dict[str, int]] = {name: {} for name in TRADE_CATEGORY_FIELDS}
+        self._labels: Dict[str, List[str]] = {name: [] for name in TRADE_CATEGORY_FIELDS}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def __repr__(self) -> str:
+        return f"TradeLog({self._size} trades, {len(self._chunks)} chunks)"
+
+    def view(self, start: int = 0, stop: Optional[int] = None) -> TradeLogView:
+        """현재까지 기록된 거래의 복사 없는 뷰"""
+        stop = self._size if stop is None else min(stop, self._size)
+        return TradeLogView(self, self._chunks, start, max(start, stop))
+
+    def __getitem__(self, index: Union[int, slice]):
+        return self.view()[index]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.view())
+
+    def __reversed__(self) -> Iterator[Any]:
+        return reversed(self.view())
+
+    def column(self, name: str) -> Union[np.ndarray, List[str]]:
+        return self.view().column(name)
+
+    def _encode(self, name: str, label: str) -> int:
+        codes = self._codes[name]
+        code = codes.get(label)
+        if code is None:
+            code = codes[label] = len(self._labels[name])
+            self._labels[name].append(label)
+        return code
+
+    def decode(self, name: str, codes: np.ndarray) -> List[str]:
+        labels = self._labels[name]
+        return [labels[c] for c in codes.tolist()]
+
+    def append(self, trade: Any):
+        """거래 한 건 기록"""
+        k, i = divmod(self._size, self.chunk_size)
+        if k == len(self._chunks):
+            self._chunks.append({name: np.empty(self.chunk_size, dtype=dtype)
+                                 for name, dtype in COLUMN_DTYPES.items()})
+        chunk = self._chunks[k]
+        for name in TRADE_FLOAT_FIELDS:
+            chunk[name][i] = getattr(trade, name)
+        for name in TRADE_DATE_FIELDS:
+            chunk[name][i] = to_ms(getattr(trade, name))
+        for name in TRADE_CATEGORY_FIELDS:
+            chunk[name][i] = self._encode(name, getattr(trade, name))
+        for name in TRADE_INT_FIELDS:
+            chunk[name][i] = getattr(trade, name)
+        self._size += 1
+        self.revision += 1
+
+    def extend(self, trades: Sequence[Any]):
+        for trade in trades:
+            self.append(trade)
+
+    def clear(self):
+        """모든 거래 삭제 (기존 뷰는 이전 청크를 계속 참조하므로 그대로 유효)"""
+        self._chunks = []
+        self._size = 0
+        self.revision += 1
+
+    def _row(self, chunks: List[Dict[str, np.ndarray]], index: int) -> Any:
+        k, i = divmod(index, self.chunk_size)
+        return next(self._rows(chunks[k], i, i + 1))
+
+    def _rows(self, chunk: Dict[str, np.ndarray], lo: int, hi: int) -> Iterator[Any]:
+        """청크 구간을 row_type 객체로 변환 (컬럼 단위 일괄 변환)"""
+        columns = {name: chunk[name][lo:hi].tolist() for name in TRADE_FLOAT_FIELDS + TRADE_INT_FIELDS}
+        for name in TRADE_DATE_FIELDS:
+            columns[name] = from_ms_array(chunk[name][lo:hi])
+        for name in TRADE_CATEGORY_FIELDS:
+            columns[name] = self.decode(name, chunk[name][lo:hi])
+        names = list(columns)
+        for values in zip(*columns.values()):
+            yield self.row_type(**dict(zip(names, values)))
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # 마지막 청크의 빈 영역은 저장하지 않음
+        state = self.__dict__.copy()
+        if self._chunks:
+            k, i = divmod(self._size, self.chunk_size)
+            if i:
+                state['_chunks'] = self._chunks[:k] + [{name: column[:i].copy()
+                                                        for name, column in self._chunks[k].items()}]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        if self._chunks:
+            last = self._chunks[-1]
+            filled = len(next(iter(last.values())))
+            if filled < self.chunk_size:
+                for name, column in last.items():
+                    grown = np.empty(self.chunk_size, dtype=column.dtype)
+                    grown[:filled] = column
+                    last[name] = grown
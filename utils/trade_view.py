@@ -0,0 +1,191 @@
+"""
+거래 목록 뷰 모델
+컬럼형 거래 배열 위에서 정렬 인덱스와 필터 마스크를 캐시하여, 정렬/필터 변경은 한 번의 인덱스 연산으로,
+페이지 표시는 페이지 크기만큼의 행 디코딩으로 처리
+"""
+
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+from utils.result_store import (
+    NAT_MS, TRADE_CATEGORY_FIELDS, TRADE_DATE_FIELDS, TRADE_FLOAT_FIELDS,
+    StoredRun, _decode_times, _encode_categories, _field, _to_ms_column
+)
+from utils.timeaxis import DAY_MS, format_ms_array
+
+# 정렬 기준 -> 컬럼 (number: 기록 순서, date: 청산일, entry: 진입일)
+SORT_KEYS = {
+    'number': None,
+    'date': 'exit_date',
+    'entry': 'entry_date',
+    'pnl': 'pnl',
+    'duration': 'duration',
+    'system': 'system',
+}
+
+# 필터 -> 허용 값 (direction/exit_reason은 범주 목록에서)
+OUTCOMES = ('win', 'loss')
+
+
+class TradeView:
+    """거래 N건의 정렬/필터/페이지 뷰
+
+    정렬 기준별 argsort 인덱스와 (필드, 값)별 불리언 마스크는 처음 쓸 때 한 번 만들어 캐시한다.
+    정렬/필터를 바꾸면 표시 순서 order = 정렬 인덱스[마스크[정렬 인덱스]]를 다시 만들고(O(N) 한 번),
+    page()는 order의 한 구간만 디코딩하므로 거래 수와 관계없이 페이지 크기에 비례한다.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray], categories: Dict[str, List[str]], page_size: int = 10):
+        self.columns = columns
+        self.categories = categories
+        self.page_size = page_size
+        entry, exit_ = columns['entry_date'], columns['exit_date']
+        known = (entry != NAT_MS) & (exit_ != NAT_MS)
+        self.columns['duration'] = np.where(known, (exit_ - entry) // DAY_MS, 0)
+
+        self.sort_key = 'number'
+        self.descending = False
+        self.filters: Dict[str, Any] = {}
+        self._sort_index: Dict[str, np.ndarray] = {'number': np.arange(len(columns['pnl']))}
+        self._masks: Dict[tuple, np.ndarray] = {}
+        self.order = self._index('number')
+
+    @classmethod
+    def from_trades(cls, trades: Sequence[Any], page_size: int = 10) -> 'TradeView':
+        """TradeResult 객체/딕셔너리 목록 또는 거래 로그(TradeLog/TradeLogView)에서 생성 (컬럼 변환 한 번)"""
+        categories = {}
+        if hasattr(trades, 'column'):
+            columns = {name: np.array(trades.column(name)) for name in TRADE_FLOAT_FIELDS + TRADE_DATE_FIELDS}
+            columns['system'] = np.array(trades.column('system'))
+            for name in TRADE_CATEGORY_FIELDS:
+                categories[name], columns[name] = _encode_categories(trades.column(name))
+            return cls(columns, categories, page_size)
+
+        columns = {name: np.array([_field(t, name, 0.0) for t in trades], dtype=np.float64)
+                   for name in TRADE_FLOAT_FIELDS}
+        columns['system'] = np.array([_field(t, 'system', 0) for t in trades], dtype=np.int8)
+        for name in TRADE_DATE_FIELDS:
+            columns[name] = _to_ms_column(_field(t, name) for t in trades)
+        for name in TRADE_CATEGORY_FIELDS:
+            categories[name], columns[name] = _encode_categories([str(_field(t, name, '')) for t in trades])
+        return cls(columns, categories, page_size)
+
+    @classmethod
+    def from_run(cls, run: StoredRun, page_size: int = 10) -> 'TradeView':
+        """저장된 실행의 거래 컬럼을 그대로 사용 (TradeResult 객체를 만들지 않음)"""
+        columns = {name: np.asarray(run.column(f"trade_{name}")) for name in TRADE_FLOAT_FIELDS}
+        columns['system'] = np.asarray(run.column('trade_system'))
+        for name in TRADE_DATE_FIELDS:
+            columns[name] = _decode_times(run.column(f"trade_{name}"))
+        for name in TRADE_CATEGORY_FIELDS:
+            columns[name] = np.asarray(run.column(f"trade_{name}"))
+        return cls(columns, {name: list(run.meta['categories'][name]) for name in TRADE_CATEGORY_FIELDS},
+                   page_size)
+
+    @classmethod
+    def for_results(cls, results: Any, page_size: int = 10) -> 'TradeView':
+        """결과 객체의 거래 뷰 (저장소에서 로드한 결과면 거래 컬럼에서 직접)"""
+        run = getattr(results, 'run', None)
+        if isinstance(run, StoredRun):
+            return cls.from_run(run, page_size)
+        return cls.from_trades(results.trades, page_size)
+
+    def __len__(self) -> int:
+        return len(self.columns['pnl'])
+
+    # 정렬/필터
+    def _index(self, key: str) -> np.ndarray:
+        index = self._sort_index.get(key)
+        if index is None:
+            index = self._sort_index[key] = np.argsort(self.columns[SORT_KEYS[key]], kind='stable')
+        return index
+
+    def _mask(self, name: str, value: Any) -> np.ndarray:
+        mask = self._masks.get((name, value))
+        if mask is None:
+            if name == 'outcome':
+                pnl = self.columns['pnl']
+                mask = pnl > 0 if value == 'win' else pnl <= 0
+            elif name == 'system':
+                mask = self.columns['system'] == int(value)
+            else:
+                labels = self.categories[name]
+                mask = self.columns[name] == labels.index(value) if value in labels else \
+                    np.zeros(len(self), dtype=bool)
+            self._masks[(name, value)] = mask
+        return mask
+
+    def filter_values(self, name: str) -> List[str]:
+        """필터에 쓸 수 있는 값"""
+        if name == 'outcome':
+            return list(OUTCOMES)
+        if name == 'system':
+            return [str(s) for s in np.unique(self.columns['system']).tolist()]
+        return list(self.categories[name])
+
+    def sort(self, key: str, descending: bool = False) -> 'TradeView':
+        if key not in SORT_KEYS:
+            raise ValueError(f"지원하지 않는 정렬 기준: {key} (가능: {', '.join(SORT_KEYS)})")
+        self.sort_key, self.descending = key, descending
+        return self._refresh()
+
+    def filter(self, **filters: Any) -> 'TradeView':
+        """필터 설정 (direction, system, outcome, exit_reason, symbol; None이면 해제)"""
+        for name, value in filters.items():
+            if name not in ('outcome', 'system') + TRADE_CATEGORY_FIELDS:
+                raise ValueError(f"지원하지 않는 필터: {name}")
+            if value is None:
+                self.filters.pop(name, None)
+            else:
+                self.filters[name] = value
+        return self._refresh()
+
+    def reset(self) -> 'TradeView':
+        self.sort_key, self.descending, self.filters = 'number', False, {}
+        return self._refresh()
+
+    def _refresh(self) -> 'TradeView':
+        index = self._index(self.sort_key)
+        if self.descending:
+            index = index[::-1]
+        if self.filters:
+            mask = np.logical_and.reduce([self._mask(name, value) for name, value in self.filters.items()])
+            index = index[mask[index]]
+        self.order = index
+        return self
+
+    # 페이지
+    @property
+    def page_count(self) -> int:
+        return max(1, -(-len(self.order) // self.page_size))
+
+    def page(self, number: int) -> List[Dict[str, Any]]:
+        """1부터 시작하는 페이지의 행 (number는 원래 거래 순번)"""
+        positions = self.order[(number - 1) * self.page_size:number * self.page_size]
+        columns = self.columns
+        rows = {name: columns[name][positions].tolist() for name in TRADE_FLOAT_FIELDS + ('system', 'duration')}
+        for name in TRADE_DATE_FIELDS:
+            rows[name] = format_ms_array(columns[name][positions])
+        for name in TRADE_CATEGORY_FIELDS:
+            labels = self.categories[name]
+            rows[name] = [labels[c] for c in columns[name][positions].tolist()]
+        rows['number'] = (positions + 1).tolist()
+        return [dict(zip(rows, values)) for values in zip(*rows.values())]
+
+    def totals(self) -> Dict[str, Any]:
+        """현재 필터 결과의 건수/손익 합계/승률"""
+        pnl = self.columns['pnl'][self.order]
+        count = len(pnl)
+        return {
+            'count': count,
+            'pnl': float(pnl.sum()),
+            'win_rate': float((pnl > 0).sum() / count) if count else 0.0,
+        }
+
+    def describe(self) -> str:
+        """현재 정렬/필터 설명"""
+        text = f"정렬: {self.sort_key}{' ↓' if self.descending else ' ↑'}"
+        if self.filters:
+            text += " | 필터: " + ", ".join(f"{name}={value}" for name, value in self.filters.items())
+        return text